@@ -0,0 +1,14 @@
+from textual.app import App, ComposeResult
+from textual.widgets import FileLog
+
+
+class FileLogApp(App):
+    """An app which displays its own source."""
+
+    def compose(self) -> ComposeResult:
+        yield FileLog(__file__, highlight=True)
+
+
+if __name__ == "__main__":
+    app = FileLogApp()
+    app.run()
@@ -10,6 +10,7 @@ from . import constants
 from ._context import active_app
 from ._log import LogGroup, LogVerbosity
 from ._on import on
+from ._profile import startup_trace as _startup_trace  # Starts the startup trace
 from ._work_decorator import work
 
 if TYPE_CHECKING:
@@ -32,13 +32,16 @@ from rich.style import Style
 from . import errors
 from ._cells import cell_len
 from ._context import visible_screen_stack
+from ._front_buffer import FrontBuffer
 from ._loop import loop_last
+from ._sgr import SGREncoder
 from .geometry import NULL_OFFSET, NULL_SPACING, Offset, Region, Size, Spacing
 from .strip import Strip, StripRenderable
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
+    from ._layout import DockArrangeResult
     from .css.styles import RenderStyles
     from .screen import Screen
     from .widget import Widget
@@ -85,6 +88,37 @@ class MapGeometry(NamedTuple):
 CompositorMap: TypeAlias = "dict[Widget, MapGeometry]"
 
 
+class LayoutItem(NamedTuple):
+    """A widget arranged within a container, relative to the container."""
+
+    widget: Widget
+    """The widget."""
+    region: Region
+    """The region of the widget, relative to the container (before scrolling)."""
+    fixed: bool
+    """Is the widget fixed (i.e. it doesn't scroll)?"""
+    order: tuple[int, int, int]
+    """Painting order of the widget within its container."""
+    layer_order: int
+    """The order of the widget in its layer."""
+    overlay: bool
+    """Is the widget an overlay?"""
+    sizes: tuple[Size, Size] | None
+    """The virtual size and container size of a widget which may be placed without further
+    processing, or `None` if the widget must be added to the map with `add_widget`."""
+
+
+class LayoutBlock(NamedTuple):
+    """The arranged children of a container, which may be reused if the container hasn't changed."""
+
+    arrange_result: DockArrangeResult
+    """The arrangement the block was built from."""
+    key: tuple[object, ...]
+    """Additional values which must match for the block to be reused."""
+    items: list[LayoutItem]
+    """Widgets in the order they should be added to the map."""
+
+
 class CompositorUpdate:
     """An update generated by the compositor, which also doubles as console renderables."""
 
@@ -133,11 +167,13 @@ class LayoutUpdate(CompositorUpdate):
         append = sequences.append
         x = self.region.x
         move_to = Control.move_to
+        encoder = SGREncoder(console._color_system)
         for last, (y, line) in loop_last(enumerate(self.strips, self.region.y)):
             append(move_to(x, y).segment.text)
-            append(line.render(console))
+            append(line.render_sgr(encoder))
             if not last:
                 append("\n")
+        append(encoder.finish())
         return "".join(sequences)
 
     def __rich_repr__(self) -> rich.repr.Result:
@@ -231,6 +267,7 @@ class ChopsUpdate(CompositorUpdate):
         chops = self.chops
         chop_ends = self.chop_ends
         last_y = self.spans[-1][0]
+        encoder = SGREncoder(console._color_system)
 
         for y, x1, x2 in self.spans:
             line = chops[y]
@@ -244,16 +281,17 @@ class ChopsUpdate(CompositorUpdate):
 
                 if x2 > x >= x1 and end <= x2:
                     append(move_to(x, y).segment.text)
-                    append(strip.render(console))
+                    append(strip.render_sgr(encoder))
                     continue
 
                 strip = strip.crop(0, min(end, x2) - x)
                 append(move_to(x, y).segment.text)
-                append(strip.render(console))
+                append(strip.render_sgr(encoder))
 
             if y != last_y:
                 append("\n")
 
+        append(encoder.finish())
         terminal_sequences = "".join(sequences)
         return terminal_sequences
 
@@ -261,11 +299,58 @@ class ChopsUpdate(CompositorUpdate):
         yield from ()
 
 
+@rich.repr.auto(angular=True)
+class DeltaUpdate(CompositorUpdate):
+    """A renderable that writes only the cells which have changed since the last update."""
+
+    def __init__(self, runs: list[tuple[int, int, Strip]]) -> None:
+        """
+        Args:
+            runs: A list of tuples of (X, Y, STRIP) for each run of changed cells.
+        """
+        self.runs = runs
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        move_to = Control.move_to
+        for x, y, strip in self.runs:
+            yield move_to(x, y).segment
+            yield from strip
+
+    def render_segments(self, console: Console) -> str:
+        """Render the update to raw data, suitable for writing to terminal.
+
+        Args:
+            console: Console instance.
+
+        Returns:
+            Raw data with escape sequences.
+        """
+        sequences: list[str] = []
+        append = sequences.append
+        move_to = Control.move_to
+        encoder = SGREncoder(console._color_system)
+        for x, y, strip in self.runs:
+            append(move_to(x, y).segment.text)
+            append(strip.render_sgr(encoder))
+        append(encoder.finish())
+        return "".join(sequences)
+
+    def __rich_repr__(self) -> rich.repr.Result:
+        yield "runs", len(self.runs)
+
+
 @rich.repr.auto(angular=True)
 class Compositor:
     """Responsible for storing information regarding the relative positions of Widgets and rendering them."""
 
-    def __init__(self) -> None:
+    def __init__(self, damage_tracking: bool = False) -> None:
+        """
+        Args:
+            damage_tracking: Enable damage tracking, which writes only the cells that have
+                changed since the previous update.
+        """
         # A mapping of Widget on to its "render location" (absolute position / depth)
         self._full_map: CompositorMap = {}
         self._full_map_invalidated = True
@@ -294,6 +379,14 @@ class Compositor:
         # Mapping of line numbers on to lists of widget and regions
         self._layers_visible: list[list[tuple[Widget, Region, Region]]] | None = None
 
+        # The cells last written to the terminal (when damage tracking is enabled)
+        self._front_buffer: FrontBuffer | None = (
+            FrontBuffer() if damage_tracking else None
+        )
+
+        # Arranged children of containers from the last full arrangement
+        self._layout_blocks: dict[Widget, LayoutBlock] = {}
+
     @classmethod
     def _regions_to_spans(
         cls, regions: Iterable[Region]
@@ -527,6 +620,80 @@ class Compositor:
             )
         return region
 
+    @classmethod
+    def _get_layout_block(
+        cls,
+        layout_block: LayoutBlock | None,
+        container: Widget,
+        arrange_result: DockArrangeResult,
+        visible: bool,
+        layer_order: int,
+    ) -> LayoutBlock:
+        """Get the arranged children of a container, relative to the container.
+
+        Visible widgets which can be placed without further processing (i.e. they don't
+        scroll, and have no offset or constraints) store their geometry, so they may be
+        added to the map by offsetting rather than recalculating. Other widgets must be
+        added with `add_widget`.
+
+        Args:
+            layout_block: The block from the previous arrangement, or `None` if there
+                wasn't one.
+            container: The container widget.
+            arrange_result: The arrangement of the container's children.
+            visible: Whether the children should be visible by default.
+            layer_order: The order of the container in its layer.
+
+        Returns:
+            The previous block if the container hasn't changed, otherwise a new block.
+        """
+        key = (container.layers, visible, layer_order)
+        if (
+            layout_block is not None
+            and layout_block.arrange_result is arrange_result
+            and layout_block.key == key
+        ):
+            return layout_block
+
+        layers_to_index = {
+            layer_name: index for index, layer_name in enumerate(container.layers)
+        }
+        get_layer_index = layers_to_index.get
+
+        items: list[LayoutItem] = []
+        add_item = items.append
+        for sub_region, _, sub_widget, z, fixed, overlay in reversed(
+            arrange_result.placements
+        ):
+            layer_index = get_layer_index(sub_widget.layer, 0)
+            sub_order = (layer_index, z, layer_order)
+            styles = sub_widget.styles
+            sizes: tuple[Size, Size] | None = None
+            visibility = styles.get_rule("visibility")
+            if (
+                sub_widget._is_mounted
+                and not overlay
+                and not sub_widget.is_scrollable
+                and not styles.offset
+                and styles.constrain == "none"
+                and (visible if visibility is None else visibility == "visible")
+            ):
+                sizes = (sub_region.size, sub_region.shrink(styles.gutter).size)
+            add_item(
+                LayoutItem(
+                    sub_widget,
+                    sub_region,
+                    fixed,
+                    sub_order,
+                    layer_order,
+                    overlay,
+                    sizes,
+                )
+            )
+            layer_order -= 1
+
+        return LayoutBlock(arrange_result, key, items)
+
     def _arrange_root(
         self, root: Widget, size: Size, visible_only: bool = True
     ) -> tuple[CompositorMap, set[Widget]]:
@@ -542,6 +709,9 @@ class Compositor:
         ORIGIN = NULL_OFFSET
 
         map: CompositorMap = {}
+        # Blocks are only used for a full arrangement
+        old_layout_blocks = self._layout_blocks
+        layout_blocks: dict[Widget, LayoutBlock] = {}
         widgets: set[Widget] = set()
         add_new_widget = widgets.add
         layer_order: int = 0
@@ -558,6 +728,7 @@ class Compositor:
             visible: bool,
             dock_gutter: Spacing,
             _MapGeometry: type[MapGeometry] = MapGeometry,
+            _Region: type[Region] = Region,
         ) -> None:
             """Called recursively to place a widget and its children in the map.
 
@@ -611,56 +782,114 @@ class Compositor:
 
                     # Get the region that will be updated
                     sub_clip = clip.intersection(child_region)
-
-                    if visible_only:
-                        placements = arrange_result.get_visible_placements(
-                            sub_clip - child_region.offset + widget.scroll_offset
-                        )
-                    else:
-                        placements = arrange_result.placements
                     total_region = total_region.union(arrange_result.total_region)
 
                     # An offset added to all placements
                     placement_offset = container_region.offset
                     placement_scroll_offset = placement_offset - widget.scroll_offset
 
-                    layers_to_index = {
-                        layer_name: index
-                        for index, layer_name in enumerate(widget.layers)
-                    }
-
-                    get_layer_index = layers_to_index.get
-
-                    # Add all the widgets
-                    for sub_region, _, sub_widget, z, fixed, overlay in reversed(
-                        placements
-                    ):
-                        layer_index = get_layer_index(sub_widget.layer, 0)
-                        # Combine regions with children to calculate the "virtual size"
-                        if fixed:
-                            widget_region = sub_region + placement_offset
-                        else:
-                            widget_region = sub_region + placement_scroll_offset
-
-                        widget_order = order + ((layer_index, z, layer_order),)
-
-                        if overlay and sub_widget.styles.constrain != "none":
-                            widget_region = self._constrain(
-                                sub_widget.styles, widget_region, no_clip
-                            )
+                    if not visible_only:
+                        layout_block = layout_blocks[widget] = self._get_layout_block(
+                            old_layout_blocks.get(widget),
+                            widget,
+                            arrange_result,
+                            visible,
+                            layer_order,
+                        )
 
-                        add_widget(
+                        scroll_spacing = arrange_result.scroll_spacing
+                        fixed_x, fixed_y = placement_offset
+                        scroll_x, scroll_y = placement_scroll_offset
+                        for (
                             sub_widget,
                             sub_region,
-                            widget_region,
-                            ((1, 0, 0),) if overlay else widget_order,
-                            layer_order,
-                            no_clip if overlay else sub_clip,
-                            visible,
-                            arrange_result.scroll_spacing,
+                            fixed,
+                            sub_order,
+                            sub_layer_order,
+                            overlay,
+                            sub_sizes,
+                        ) in layout_block.items:
+                            x, y, width, height = sub_region
+                            if fixed:
+                                widget_region = _Region(
+                                    x + fixed_x, y + fixed_y, width, height
+                                )
+                            else:
+                                widget_region = _Region(
+                                    x + scroll_x, y + scroll_y, width, height
+                                )
+                            if (
+                                sub_sizes is not None
+                                and sub_widget._absolute_offset is None
+                                and not sub_widget._nodes
+                            ):
+                                # Offset the cached geometry
+                                map[sub_widget] = _MapGeometry(
+                                    widget_region,
+                                    order + (sub_order,),
+                                    sub_clip,
+                                    *sub_sizes,
+                                    sub_region,
+                                    scroll_spacing,
+                                )
+                                continue
+
+                            if overlay and sub_widget.styles.constrain != "none":
+                                widget_region = self._constrain(
+                                    sub_widget.styles, widget_region, no_clip
+                                )
+
+                            add_widget(
+                                sub_widget,
+                                sub_region,
+                                widget_region,
+                                ((1, 0, 0),) if overlay else order + (sub_order,),
+                                sub_layer_order,
+                                no_clip if overlay else sub_clip,
+                                visible,
+                                scroll_spacing,
+                            )
+                    else:
+                        placements = arrange_result.get_visible_placements(
+                            sub_clip - child_region.offset + widget.scroll_offset
                         )
+                        layers_to_index = {
+                            layer_name: index
+                            for index, layer_name in enumerate(widget.layers)
+                        }
 
-                        layer_order -= 1
+                        get_layer_index = layers_to_index.get
+
+                        # Add all the widgets
+                        for sub_region, _, sub_widget, z, fixed, overlay in reversed(
+                            placements
+                        ):
+                            layer_index = get_layer_index(sub_widget.layer, 0)
+                            # Combine regions with children to calculate the "virtual size"
+                            if fixed:
+                                widget_region = sub_region + placement_offset
+                            else:
+                                widget_region = sub_region + placement_scroll_offset
+
+                            widget_order = order + ((layer_index, z, layer_order),)
+
+                            if overlay and sub_widget.styles.constrain != "none":
+                                widget_region = self._constrain(
+                                    sub_widget.styles, widget_region, no_clip
+                                )
+
+                            add_widget(
+                                sub_widget,
+                                sub_region,
+                                widget_region,
+                                ((1, 0, 0),) if overlay else widget_order,
+                                layer_order,
+                                no_clip if overlay else sub_clip,
+                                visible,
+                                arrange_result.scroll_spacing,
+                            )
+
+                            layer_order -= 1
 
                 if visible:
                     # Add any scrollbars
@@ -725,6 +954,8 @@ class Compositor:
             True,
             NULL_SPACING,
         )
+        if not visible_only:
+            self._layout_blocks = layout_blocks
         return map, widgets
 
     @property
@@ -961,7 +1192,11 @@ class Compositor:
 
         visible_screen_stack.set([] if screen_stack is None else screen_stack)
         screen_region = self.size.region
-        if full or screen_region in self._dirty_regions:
+        front_buffer = self._front_buffer
+        if full or (
+            screen_region in self._dirty_regions
+            and (front_buffer is None or front_buffer.size != self.size)
+        ):
             return self.render_full_update()
         else:
             return self.render_partial_update()
@@ -977,13 +1212,18 @@ class Compositor:
         crop = screen_region
         chops = self._render_chops(crop, lambda y: True)
         render_strips = [Strip.join(chop.values()) for chop in chops]
+        front_buffer = self._front_buffer
+        if front_buffer is not None:
+            front_buffer.reset(self.size)
+            front_buffer.update_lines(0, render_strips)
         return LayoutUpdate(render_strips, screen_region)
 
-    def render_partial_update(self) -> ChopsUpdate | None:
+    def render_partial_update(self) -> ChopsUpdate | DeltaUpdate | None:
         """Render a partial update.
 
         Returns:
-            A ChopsUpdate if there is anything to update, otherwise `None`.
+            A ChopsUpdate (or a DeltaUpdate, if damage tracking is enabled) if there
+                is anything to update, otherwise `None`.
         """
         screen_region = self.size.region
         update_regions = self._dirty_regions.copy()
@@ -997,8 +1237,53 @@ class Compositor:
             return None
         chops = self._render_chops(crop, is_rendered_line)
         chop_ends = [cut_set[1:] for cut_set in self.cuts]
+        if self._front_buffer is not None:
+            return self._render_delta_update(chops, spans, chop_ends)
         return ChopsUpdate(chops, spans, chop_ends)
 
+    def _render_delta_update(
+        self,
+        chops: Sequence[Mapping[int, Strip | None]],
+        spans: list[tuple[int, int, int]],
+        chop_ends: list[list[int]],
+    ) -> DeltaUpdate | None:
+        """Render a partial update containing only the cells that differ from the front buffer.
+
+        Args:
+            chops: Chops structure.
+            spans: Spans of (Y, X1, X2) to update.
+            chop_ends: A list of the end offsets for each line.
+
+        Returns:
+            A DeltaUpdate if any cells have changed, otherwise `None`.
+        """
+        front_buffer = self._front_buffer
+        assert front_buffer is not None
+        if front_buffer.size != self.size:
+            front_buffer.reset(self.size)
+        diff = front_buffer.diff
+        runs: list[tuple[int, int, Strip]] = []
+        add_run = runs.append
+        for y, x1, x2 in spans:
+            for end, (x, strip) in zip(chop_ends[y], chops[y].items()):
+                if strip is None or x >= x2 or end <= x1:
+                    continue
+                if x < x1 or end > x2:
+                    strip = strip.crop(max(0, x1 - x), min(end, x2) - x)
+                    x = max(x, x1)
+                for run_x, run_strip in diff(x, y, strip):
+                    add_run((run_x, y, run_strip))
+        return DeltaUpdate(runs) if runs else None
+
+    def reset_front_buffer(self) -> None:
+        """Forget the cells recorded by damage tracking.
+
+        Call this when the terminal may have been written to by something other than this compositor.
+        The next update of the entire screen will be written in full.
+        """
+        if self._front_buffer is not None:
+            self._front_buffer.reset(Size(0, 0))
+
     def render_strips(self) -> list[Strip]:
         """Render to a list of strips.
 
@@ -0,0 +1,108 @@
+"""
+A Fenwick tree (binary indexed tree) of non-negative integers, used to map a y coordinate
+on to a row of variable height (and back again) in O(log n) time.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterable
+
+
+class FenwickTree:
+    """Prefix sums of a sequence of non-negative integers.
+
+    Supports updating a value, appending a value, and searching for the index
+    which contains a given offset, all in O(log n) time.
+    """
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """Build a tree in O(n) time.
+
+        Args:
+            values: Initial values.
+        """
+        self._values = array("q", values)
+        tree = array("q", [0])
+        tree.extend(self._values)
+        size = len(self._values)
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> int:
+        return self._values[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        delta = value - self._values[index]
+        if not delta:
+            return
+        self._values[index] = value
+        tree = self._tree
+        size = len(tree) - 1
+        index += 1
+        while index <= size:
+            tree[index] += delta
+            index += index & -index
+
+    @property
+    def total(self) -> int:
+        """The sum of all the values."""
+        return self.prefix_sum(len(self._values))
+
+    def append(self, value: int) -> None:
+        """Append a value.
+
+        Args:
+            value: Value to append.
+        """
+        self._values.append(value)
+        index = len(self._values)
+        # The new node covers the values in (index - lowbit(index), index]
+        lowest = index - (index & -index)
+        self._tree.append(value + self.prefix_sum(index - 1) - self.prefix_sum(lowest))
+
+    def prefix_sum(self, index: int) -> int:
+        """Get the sum of the values before an index.
+
+        Args:
+            index: Index of the value after the last value to sum.
+
+        Returns:
+            The sum of values in the range [0, index).
+        """
+        tree = self._tree
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, offset: int) -> int:
+        """Find the index of the value which contains an offset.
+
+        In other words, the index `i` such that `prefix_sum(i) <= offset < prefix_sum(i + 1)`.
+        Zero values never contain an offset.
+
+        Args:
+            offset: An offset in the range [0, total).
+
+        Returns:
+            An index, or the length of the tree if the offset is not less than the total.
+        """
+        tree = self._tree
+        size = len(tree) - 1
+        position = 0
+        bit = 1 << size.bit_length()
+        while bit:
+            next_position = position + bit
+            if next_position <= size and tree[next_position] <= offset:
+                position = next_position
+                offset -= tree[next_position]
+            bit >>= 1
+        return position
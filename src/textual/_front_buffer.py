@@ -0,0 +1,210 @@
+"""
+A front buffer records the cells most recently written to the terminal.
+
+When damage tracking is enabled, the compositor compares freshly rendered lines against the
+front buffer, and only writes the cells which differ. This can greatly reduce the number of bytes
+written to the terminal for widgets which repaint a large region to change a few cells.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from rich.cells import get_character_cell_size
+from rich.segment import Segment
+from rich.style import Style
+from typing_extensions import TypeAlias
+
+from .geometry import Size
+from .strip import Strip
+
+CellStyles: TypeAlias = "list[Optional[Style]]"
+
+WIDE_PLACEHOLDER = ""
+"""Character used in the second cell of a double width character."""
+
+UNKNOWN = "\0"
+"""Character used for cells with unknown contents, which will never match a rendered cell."""
+
+
+class FrontBuffer:
+    """Records the characters and styles of each cell on the screen.
+
+    Lines which have not yet been written are stored as `None`, and will always be
+    considered changed.
+    """
+
+    def __init__(self, run_gap: int = 4) -> None:
+        """
+        Args:
+            run_gap: Runs of changed cells separated by this many unchanged cells (or fewer)
+                will be combined, as it is cheaper to re-write a few cells than to move the cursor.
+        """
+        self.run_gap = run_gap
+        self.size = Size(0, 0)
+        self._chars: list[list[str] | None] = []
+        self._styles: list[CellStyles | None] = []
+
+    def reset(self, size: Size) -> None:
+        """Forget all recorded cells.
+
+        Args:
+            size: New size of the screen.
+        """
+        self.size = size
+        height = size.height
+        self._chars = [None] * height
+        self._styles = [None] * height
+
+    @classmethod
+    def _strip_to_cells(cls, strip: Strip) -> tuple[list[str], CellStyles]:
+        """Split a strip in to a list of characters and a list of styles, with one entry per cell.
+
+        Args:
+            strip: A strip.
+
+        Returns:
+            A tuple of characters and styles.
+        """
+        chars: list[str] = []
+        styles: CellStyles = []
+        extend_chars = chars.extend
+        extend_styles = styles.extend
+        _get_character_cell_size = get_character_cell_size
+        for text, style, control in strip:
+            if control or not text:
+                continue
+            if text.isascii() and text.isprintable():
+                extend_chars(text)
+                extend_styles([style] * len(text))
+                continue
+            for character in text:
+                cell_size = _get_character_cell_size(character)
+                if cell_size == 1:
+                    chars.append(character)
+                    styles.append(style)
+                elif cell_size == 2:
+                    chars.append(character)
+                    chars.append(WIDE_PLACEHOLDER)
+                    styles.append(style)
+                    styles.append(style)
+                elif chars:
+                    # Zero width characters combine with the previous cell
+                    chars[-1] += character
+        return chars, styles
+
+    @classmethod
+    def _cells_to_strip(cls, chars: list[str], styles: CellStyles) -> Strip:
+        """Build a strip from cells, combining cells with the same style in to segments.
+
+        Args:
+            chars: Characters for each cell.
+            styles: Styles for each cell.
+
+        Returns:
+            A new strip.
+        """
+        segments: list[Segment] = []
+        add_segment = segments.append
+        _Segment = Segment
+        if not chars:
+            return Strip([], 0)
+        run_style = styles[0]
+        run_chars: list[str] = []
+        for character, style in zip(chars, styles):
+            if style is not run_style and style != run_style:
+                add_segment(_Segment("".join(run_chars), run_style))
+                run_chars.clear()
+                run_style = style
+            run_chars.append(character)
+        add_segment(_Segment("".join(run_chars), run_style))
+        return Strip(segments, len(chars))
+
+    def update_lines(self, y: int, strips: Iterable[Strip]) -> None:
+        """Record lines which have been written in full.
+
+        Args:
+            y: The first line.
+            strips: Strips written to consecutive lines from `y`.
+        """
+        width, height = self.size
+        for line_y, strip in enumerate(strips, y):
+            if 0 <= line_y < height:
+                chars, styles = self._strip_to_cells(strip)
+                padding = width - len(chars)
+                if padding > 0:
+                    chars.extend(" " * padding)
+                    styles.extend([None] * padding)
+                self._chars[line_y] = chars[:width]
+                self._styles[line_y] = styles[:width]
+
+    def diff(self, x: int, y: int, strip: Strip) -> list[tuple[int, Strip]]:
+        """Compare a strip with the cells on the screen, and record the new cells.
+
+        Args:
+            x: X coordinate of the strip.
+            y: Y coordinate of the strip.
+            strip: The strip which will be written to the screen.
+
+        Returns:
+            A list of tuples of X coordinate and strip, covering cells which have changed.
+        """
+        width, height = self.size
+        new_chars, new_styles = self._strip_to_cells(strip)
+        end = x + len(new_chars)
+        if (
+            not (0 <= y < height)
+            or x < 0
+            or end > width
+            or len(new_chars) != strip.cell_length
+        ):
+            # Can't safely compare, so write everything
+            return [(x, strip)]
+
+        old_chars = self._chars[y]
+        old_styles = self._styles[y]
+
+        if old_chars is None or old_styles is None:
+            self._chars[y] = old_chars = [UNKNOWN] * width
+            self._styles[y] = old_styles = [None] * width
+            old_chars[x:end] = new_chars
+            old_styles[x:end] = new_styles
+            return [(x, strip)]
+
+        if old_chars[x:end] == new_chars and old_styles[x:end] == new_styles:
+            # Fast path for an unchanged line
+            return []
+
+        # Find runs of changed cells
+        runs: list[list[int]] = []
+        run_gap = self.run_gap
+        for offset, (new_char, new_style) in enumerate(zip(new_chars, new_styles)):
+            cell_x = x + offset
+            old_style = old_styles[cell_x]
+            if old_chars[cell_x] != new_char or (
+                old_style is not new_style and old_style != new_style
+            ):
+                if runs and offset - runs[-1][1] <= run_gap:
+                    runs[-1][1] = offset + 1
+                else:
+                    runs.append([offset, offset + 1])
+
+        old_chars[x:end] = new_chars
+        old_styles[x:end] = new_styles
+
+        updates: list[tuple[int, Strip]] = []
+        add_update = updates.append
+        cell_count = len(new_chars)
+        for start, stop in runs:
+            # Don't split double width characters
+            if new_chars[start] == WIDE_PLACEHOLDER and start > 0:
+                start -= 1
+            if stop < cell_count and new_chars[stop] == WIDE_PLACEHOLDER:
+                stop += 1
+            add_update(
+                (
+                    x + start,
+                    self._cells_to_strip(new_chars[start:stop], new_styles[start:stop]),
+                )
+            )
+        return updates
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar, Iterable, NamedTuple
 
-from ._spatial_map import SpatialMap
+from ._spatial_map import IntervalSpatialMap
 from .canvas import Canvas, Rectangle
 from .geometry import Offset, Region, Size, Spacing
 from .strip import StripRenderable
@@ -26,14 +26,22 @@ class DockArrangeResult:
     scroll_spacing: Spacing
     """Spacing to reduce scrollable area."""
 
-    _spatial_map: SpatialMap[WidgetPlacement] | None = None
+    _spatial_map: IntervalSpatialMap[WidgetPlacement] | None = None
     """A Spatial map to query widget placements."""
 
+    _previous: DockArrangeResult | None = None
+    """A previous arrangement, used to update the spatial map incrementally."""
+
     @property
-    def spatial_map(self) -> SpatialMap[WidgetPlacement]:
+    def spatial_map(self) -> IntervalSpatialMap[WidgetPlacement]:
         """A lazy-calculated spatial map."""
         if self._spatial_map is None:
-            self._spatial_map = SpatialMap()
+            previous = self._previous
+            self._previous = None
+            if previous is not None:
+                self._spatial_map = self._update_spatial_map(previous)
+        if self._spatial_map is None:
+            self._spatial_map = IntervalSpatialMap()
             self._spatial_map.insert(
                 (
                     placement.region.grow(placement.margin),
@@ -46,6 +54,48 @@ class DockArrangeResult:
 
         return self._spatial_map
 
+    def _update_spatial_map(
+        self, previous: DockArrangeResult
+    ) -> IntervalSpatialMap[WidgetPlacement] | None:
+        """Derive a spatial map from a previous arrangement of the same widgets.
+
+        This is faster than building a new spatial map when only a few placements have changed.
+
+        Args:
+            previous: A previous arrangement.
+
+        Returns:
+            A new spatial map, or `None` if it would be cheaper to build the map from scratch.
+        """
+        previous_map = previous._spatial_map
+        previous_placements = previous.placements
+        placements = self.placements
+        if previous_map is None or len(previous_placements) != len(placements):
+            return None
+        changed = [
+            (previous_placement, placement)
+            for previous_placement, placement in zip(previous_placements, placements)
+            if previous_placement != placement
+        ]
+        if len(changed) > len(placements) // 8:
+            return None
+        for previous_placement, placement in changed:
+            if (
+                previous_placement.widget is not placement.widget
+                or previous_placement.fixed != placement.fixed
+                or previous_placement.overlay != placement.overlay
+                or placement.fixed
+            ):
+                return None
+        spatial_map = previous_map.copy()
+        for previous_placement, placement in changed:
+            spatial_map.move(
+                previous_placement,
+                placement.region.grow(placement.margin),
+                placement,
+            )
+        return spatial_map
+
     @property
     def total_region(self) -> Region:
         """The total area occupied by the arrangement.
@@ -1,19 +1,195 @@
 """
-Timer context manager, only used in debug.
+Timer context manager, only used in debug, and a startup trace.
+
+The startup trace is enabled by setting the `TEXTUAL_STARTUP_TRACE` environment variable
+to a path. Timings of the phases of startup (up to the first frame) are written to that
+path on exit, in the Chrome trace event format (which may be loaded in `chrome://tracing`
+or https://ui.perfetto.dev).
 """
 
+from __future__ import annotations
+
 import contextlib
+import os
+from functools import wraps
 from time import perf_counter
-from typing import Generator
+from typing import Any, Callable, ContextManager, Generator, TypeVar, cast
+
+from . import constants
 
-from . import log
+CallableType = TypeVar("CallableType", bound=Callable[..., Any])
 
 
 @contextlib.contextmanager
 def timer(subject: str = "time") -> Generator[None, None, None]:
     """print the elapsed time. (only used in debugging)"""
+    from . import log
+
     start = perf_counter()
     yield
     elapsed = perf_counter() - start
     elapsed_ms = elapsed * 1000
     log(f"{subject} elapsed {elapsed_ms:.2f}ms")
+
+
+class StartupTrace:
+    """Records the timings of phases of startup, up to the first frame."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: Path to write the report.
+        """
+        self.path = path
+        self.start = perf_counter()
+        """Time the trace started (when Textual was imported)."""
+        self.first_frame: float | None = None
+        """Time of the first frame, or `None` if there hasn't been a frame."""
+        self._events: list[dict[str, object]] = []
+        self._pid = os.getpid()
+
+    @property
+    def finished(self) -> bool:
+        """Is the trace finished?"""
+        return self.first_frame is not None
+
+    def _timestamp(self, time: float) -> float:
+        """Convert a time from `perf_counter` to microseconds since the trace started."""
+        return round((time - self.start) * 1_000_000, 3)
+
+    def add_phase(self, name: str, start: float, end: float) -> None:
+        """Add a phase.
+
+        Args:
+            name: Name of the phase.
+            start: Start time, from `perf_counter`.
+            end: End time, from `perf_counter`.
+        """
+        if self.first_frame is not None and start >= self.first_frame:
+            # Only phases which started before the first frame are recorded
+            return
+        self._events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": self._timestamp(start),
+                "dur": round((end - start) * 1_000_000, 3),
+                "pid": self._pid,
+                "tid": 0,
+            }
+        )
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """A context manager to record a phase.
+
+        Args:
+            name: Name of the phase.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, start, perf_counter())
+
+    def finish(self) -> None:
+        """Mark the first frame, which finishes the trace."""
+        if self.finished:
+            return
+        first_frame = perf_counter()
+        self._events.append(
+            {
+                "name": "first frame",
+                "ph": "i",
+                "s": "g",
+                "ts": self._timestamp(first_frame),
+                "pid": self._pid,
+                "tid": 0,
+            }
+        )
+        self.first_frame = first_frame
+
+    def get_report(self) -> dict[str, object]:
+        """Get the report.
+
+        Returns:
+            A dict in the Chrome trace event format, with a summary in `otherData`.
+        """
+        phases: dict[str, float] = {}
+        for event in self._events:
+            if event["ph"] == "X":
+                name = cast(str, event["name"])
+                duration = cast(float, event["dur"]) / 1000
+                phases[name] = phases.get(name, 0) + duration
+        return {
+            "traceEvents": self._events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "time_to_first_frame_ms": (
+                    None
+                    if self.first_frame is None
+                    else (self.first_frame - self.start) * 1000
+                ),
+                "phases_ms": phases,
+            },
+        }
+
+    def save(self) -> None:
+        """Write the report. Errors writing the report are ignored."""
+        import json
+
+        try:
+            with open(self.path, "w") as report_file:
+                json.dump(self.get_report(), report_file, indent=1)
+        except OSError:
+            pass
+
+
+startup_trace: StartupTrace | None = (
+    StartupTrace(constants.STARTUP_TRACE) if constants.STARTUP_TRACE else None
+)
+"""The startup trace, if enabled."""
+
+_null_context = contextlib.nullcontext()
+
+
+def startup_phase(name: str) -> ContextManager[None]:
+    """Get a context manager to record a startup phase.
+
+    Does nothing if the startup trace is disabled or finished.
+
+    Args:
+        name: Name of the phase.
+
+    Returns:
+        A context manager.
+    """
+    if startup_trace is None or startup_trace.finished:
+        return _null_context
+    return startup_trace.phase(name)
+
+
+def trace_startup(name: str) -> Callable[[CallableType], CallableType]:
+    """A decorator to record calls to a function as a startup phase.
+
+    The function is returned unchanged if the startup trace is disabled.
+
+    Args:
+        name: Name of the phase.
+
+    Returns:
+        A decorator.
+    """
+
+    def decorator(function: CallableType) -> CallableType:
+        if startup_trace is None:
+            return function
+
+        @wraps(function)
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            with startup_phase(name):
+                return function(*args, **kwargs)
+
+        return cast(CallableType, traced)
+
+    return decorator
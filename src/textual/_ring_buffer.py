@@ -0,0 +1,163 @@
+"""
+A sequence with an optional maximum length, which discards items from the start
+as items are appended, in O(1) time.
+"""
+
+from __future__ import annotations
+
+from itertools import chain, islice
+from typing import Generic, Iterable, Iterator, Sequence, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class RingBuffer(Sequence[T], Generic[T]):
+    """A sequence which discards items from the start when it exceeds a maximum length.
+
+    Every item has an absolute index, which is its index plus the number of items
+    discarded before it (see [offset][textual._ring_buffer.RingBuffer.offset]). The
+    absolute index of an item doesn't change as items are discarded, which makes it
+    suitable as a cache key.
+    """
+
+    def __init__(self, max_length: int | None = None, items: Iterable[T] = ()) -> None:
+        """
+        Args:
+            max_length: Maximum number of items, or `None` for no maximum.
+            items: Initial items.
+        """
+        self._items: list[T] = []
+        self._head = 0
+        """Index of the first item in `_items`, which is only non-zero when full."""
+        self._max_length = max_length
+        self._offset = 0
+        self.extend(items)
+
+    def __repr__(self) -> str:
+        return f"RingBuffer({self._max_length!r}, {list(self)!r})"
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        items = self._items
+        head = self._head
+        if head:
+            return chain(islice(items, head, None), islice(items, 0, head))
+        return iter(items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (RingBuffer, list, tuple)):
+            return len(self) == len(other) and all(
+                item == other_item for item, other_item in zip(self, other)
+            )
+        return NotImplemented
+
+    def _get_index(self, index: int) -> int:
+        """Get the index in `_items` of an item.
+
+        Args:
+            index: Index of the item, which may be negative.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Returns:
+            Index in `_items`.
+        """
+        size = len(self._items)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("RingBuffer index out of range")
+        head = self._head
+        if head:
+            index = (head + index) % size
+        return index
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self[item] for item in range(*index.indices(len(self)))]
+        return self._items[self._get_index(index)]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        self._items[self._get_index(index)] = item
+
+    @property
+    def offset(self) -> int:
+        """The absolute index of the first item (the number of items discarded)."""
+        return self._offset
+
+    @property
+    def max_length(self) -> int | None:
+        """Maximum number of items, or `None` for no maximum.
+
+        Reducing the maximum length discards items from the start.
+        """
+        return self._max_length
+
+    @max_length.setter
+    def max_length(self, max_length: int | None) -> None:
+        if max_length == self._max_length:
+            return
+        items = list(self)
+        if max_length is not None and len(items) > max_length:
+            discard = len(items) - max_length
+            self._offset += discard
+            del items[:discard]
+        self._items = items
+        self._head = 0
+        self._max_length = max_length
+
+    def append(self, item: T) -> None:
+        """Append an item, discarding the first item if the buffer is full.
+
+        Args:
+            item: An item.
+        """
+        items = self._items
+        max_length = self._max_length
+        if max_length is None or len(items) < max_length:
+            items.append(item)
+        elif max_length:
+            head = self._head
+            items[head] = item
+            self._head = (head + 1) % max_length
+            self._offset += 1
+        else:
+            self._offset += 1
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append several items, discarding items from the start if the buffer is full.
+
+        Args:
+            items: Items to append.
+        """
+        max_length = self._max_length
+        if max_length is None:
+            self._items.extend(items)
+            return
+        if not isinstance(items, Sequence):
+            items = list(items)
+        if len(items) >= max_length:
+            # Every current item is discarded
+            discard = len(self._items) + len(items) - max_length
+            self._offset += discard
+            self._items = list(items[len(items) - max_length :])
+            self._head = 0
+            return
+        append = self.append
+        for item in items:
+            append(item)
+
+    def clear(self) -> None:
+        """Discard every item."""
+        self._offset += len(self._items)
+        self._items = []
+        self._head = 0
@@ -0,0 +1,254 @@
+"""
+An encoder for SGR (Select Graphic Rendition) escape sequences.
+
+Rich renders every segment with a full style sequence followed by a reset. When writing many
+small segments (as the compositor does) most of that output is redundant. The `SGREncoder`
+tracks the current state of the terminal "pen", and emits only the codes required to change
+from one style to the next.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional, Tuple
+
+from rich.color import ColorSystem
+from rich.style import Style
+from typing_extensions import TypeAlias
+
+EncodedSegments: TypeAlias = "Tuple[Optional[Style], str, Optional[Style]]"
+"""The first style, encoded text, and final style of a sequence of segments."""
+
+RESET = "\x1b[0m"
+"""Sequence to reset all attributes."""
+
+LINK_END = "\x1b]8;;\x1b\\"
+"""Sequence to end a hyperlink."""
+
+# Maps the bit of a Rich style attribute on to the SGR code which sets it
+ATTRIBUTE_ON = Style._style_map
+
+# Maps the bit of a Rich style attribute on to the SGR code which unsets it
+ATTRIBUTE_OFF = {
+    0: "22",  # bold
+    1: "22",  # dim
+    2: "23",  # italic
+    3: "24",  # underline
+    4: "25",  # blink
+    5: "25",  # blink2
+    6: "27",  # reverse
+    7: "28",  # conceal
+    8: "29",  # strike
+    9: "24",  # underline2
+    10: "54",  # frame
+    11: "54",  # encircle
+    12: "55",  # overline
+}
+
+# Maps an SGR "off" code on to the attribute bits it unsets
+OFF_GROUPS: dict[str, int] = {}
+for _bit, _code in ATTRIBUTE_OFF.items():
+    OFF_GROUPS[_code] = OFF_GROUPS.get(_code, 0) | (1 << _bit)
+
+TRANSITION_CACHE_SIZE = 4096
+"""Maximum number of transitions to cache, per color system."""
+
+# Transitions are keyed on the ids of the styles, which is faster than hashing styles.
+# The cache holds a reference to both styles (in the list), so while a transition is cached
+# no other style may have the same id.
+TransitionCache: TypeAlias = (
+    "tuple[dict[tuple[int, int], str], list[tuple[Optional[Style], Style]]]"
+)
+
+_transition_caches: dict[ColorSystem | None, TransitionCache] = {}
+
+
+class SGREncoder:
+    """Encodes styled text, emitting only the SGR codes which change the current pen.
+
+    A new encoder should be created for each sequence of writes, as it assumes the terminal
+    starts with reset attributes. Call [finish][textual._sgr.SGREncoder.finish] at the end
+    to restore the terminal pen.
+    """
+
+    def __init__(self, color_system: ColorSystem | None) -> None:
+        """
+        Args:
+            color_system: The color system of the terminal, or `None` for no styles.
+        """
+        self.color_system = color_system
+        self.pen: Style | None = None
+        """The style currently set in the terminal, or `None` if reset."""
+        self._transitions, self._transition_styles = _transition_caches.setdefault(
+            color_system, ({}, [])
+        )
+
+    def _get_codes(self, style: Style) -> tuple[int, str, str]:
+        """Get the attributes and color codes for a style.
+
+        Args:
+            style: A Rich style.
+
+        Returns:
+            A tuple of the attribute bits, foreground codes, and background codes.
+        """
+        color_system = self.color_system
+        assert color_system is not None
+        attributes = style._attributes & style._set_attributes
+        color = style._color
+        bgcolor = style._bgcolor
+        foreground = (
+            ";".join(color.downgrade(color_system).get_ansi_codes())
+            if color is not None
+            else ""
+        )
+        background = (
+            ";".join(bgcolor.downgrade(color_system).get_ansi_codes(foreground=False))
+            if bgcolor is not None
+            else ""
+        )
+        return attributes, foreground, background
+
+    def _make_transition(self, previous: Style | None, style: Style) -> str:
+        """Make the sequence to change the pen from one style to another.
+
+        Args:
+            previous: The current style, or `None` if reset.
+            style: The new style.
+
+        Returns:
+            Escape sequences.
+        """
+        color_system = self.color_system
+        assert color_system is not None
+        full_codes = style._make_ansi_codes(color_system)
+
+        link_sequence = ""
+        if (previous is not None and previous._link) != style._link:
+            if previous is not None and previous._link:
+                link_sequence = LINK_END
+            if style._link:
+                link_sequence += f"\x1b]8;id={style._link_id};{style._link}\x1b\\"
+
+        if previous is None:
+            return f"{link_sequence}\x1b[{full_codes}m" if full_codes else link_sequence
+
+        previous_attributes, previous_foreground, previous_background = self._get_codes(
+            previous
+        )
+        attributes, foreground, background = self._get_codes(style)
+
+        codes: list[str] = []
+        append = codes.append
+        removed = previous_attributes & ~attributes
+        enable = attributes & ~previous_attributes
+        if removed:
+            for off_code, group in OFF_GROUPS.items():
+                if removed & group:
+                    append(off_code)
+                    # Some attributes share an off code, so may need to be set again
+                    enable |= attributes & group
+        for bit in range(13):
+            if enable & (1 << bit):
+                append(ATTRIBUTE_ON[bit])
+        if foreground != previous_foreground:
+            append(foreground or "39")
+        if background != previous_background:
+            append(background or "49")
+
+        if not codes:
+            return link_sequence
+        delta_codes = ";".join(codes)
+        reset_codes = f"0;{full_codes}" if full_codes else "0"
+        return f"{link_sequence}\x1b[{min(delta_codes, reset_codes, key=len)}m"
+
+    def transition(self, previous: Style | None, style: Style) -> str:
+        """Get the sequence to change the pen from one style to another.
+
+        Args:
+            previous: The current style, or `None` if reset.
+            style: The new style.
+
+        Returns:
+            Escape sequences (may be empty if nothing needs to change).
+        """
+        if previous is style or self.color_system is None:
+            return ""
+        transitions = self._transitions
+        key = (id(previous), id(style))
+        sequence = transitions.get(key)
+        if sequence is None:
+            if len(transitions) >= TRANSITION_CACHE_SIZE:
+                transitions.clear()
+                self._transition_styles.clear()
+            sequence = transitions[key] = self._make_transition(previous, style)
+            self._transition_styles.append((previous, style))
+        return sequence
+
+    def encode_segments(
+        self, segments: Iterable[tuple[str, Style | None, object]]
+    ) -> EncodedSegments:
+        """Encode segments, independently of the current pen.
+
+        The result may be cached by the caller, and written with [write][textual._sgr.SGREncoder.write].
+
+        Args:
+            segments: Segments to encode. Segments without a style are skipped.
+
+        Returns:
+            The first style, the encoded text (excluding the transition to the first style),
+                and the final style.
+        """
+        sequences: list[str] = []
+        append = sequences.append
+        transition = self.transition
+        get_transition = self._transitions.get
+        first_style: Style | None = None
+        pen: Style | None = None
+        pen_id = 0
+        for text, style, _ in segments:
+            if style is None or not text:
+                continue
+            if style is not pen:
+                style_id = id(style)
+                if pen is None:
+                    first_style = style
+                else:
+                    sequence = get_transition((pen_id, style_id))
+                    append(transition(pen, style) if sequence is None else sequence)
+                pen = style
+                pen_id = style_id
+            append(text)
+        return first_style, "".join(sequences), pen
+
+    def write(self, encoded: EncodedSegments) -> str:
+        """Get the sequences to write previously encoded segments, and update the pen.
+
+        Args:
+            encoded: Result of [encode_segments][textual._sgr.SGREncoder.encode_segments].
+
+        Returns:
+            Escape sequences and text.
+        """
+        first_style, text, last_style = encoded
+        if first_style is None:
+            return ""
+        pen = self.pen
+        self.pen = last_style
+        if pen is first_style or pen == first_style:
+            return text
+        return f"{self.transition(pen, first_style)}{text}"
+
+    def finish(self) -> str:
+        """Reset the pen.
+
+        Returns:
+            Escape sequences to reset the terminal attributes.
+        """
+        pen = self.pen
+        self.pen = None
+        if pen is None or self.color_system is None:
+            return ""
+        sequence = RESET if pen._make_ansi_codes(self.color_system) else ""
+        if pen._link:
+            sequence += LINK_END
+        return sequence
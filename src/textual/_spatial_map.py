@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import defaultdict
 from itertools import product
+from operator import itemgetter
 from typing import Generic, Iterable, TypeVar
 
 from typing_extensions import TypeAlias
@@ -101,3 +103,212 @@ class SpatialMap(Generic[ValueType]):
                 add_results(grid_values)
         unique_values = list(dict.fromkeys(results))
         return unique_values
+
+
+class IntervalSpatialMap(Generic[ValueType]):
+    """A spatial map which indexes values by the vertical extent of their region.
+
+    Values are partitioned in to bands by height (heights from 2**n up to 2**(n+1)), and each band
+    keeps its values sorted by the top of their regions. To find the values under a region, each band
+    is searched with a bisect, bounded by the maximum height in that band.
+
+    Unlike [SpatialMap][textual._spatial_map.SpatialMap], values may be removed or moved individually,
+    so the map may be updated incrementally. Values must be hashable, and are returned in the order
+    they were first inserted.
+    """
+
+    def __init__(self) -> None:
+        self._bands: dict[int, list[tuple[int, int]]] = {}
+        """Maps a band number on to a sorted list of keys, where a key is (Y, SEQUENCE)."""
+        self._entries: dict[tuple[int, int], tuple[Region, ValueType]] = {}
+        """Maps a key on to the region and value."""
+        self._locations: dict[ValueType, tuple[int, tuple[int, int], bool]] = {}
+        """Maps a value on to the band, key, and overlay flag."""
+        self._fixed: dict[ValueType, None] = {}
+        """Values in fixed regions (always returned)."""
+        self._sequence = 0
+        self._total_region: Region | None = Region()
+
+    def __len__(self) -> int:
+        return len(self._locations) + len(self._fixed)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._locations or value in self._fixed
+
+    @property
+    def total_region(self) -> Region:
+        """The region which encloses all values, excluding fixed and overlay values."""
+        if self._total_region is None:
+            entries = self._entries
+            self._total_region = Region.from_union(
+                [
+                    Region(),
+                    *[
+                        entries[key][0]
+                        for _band, key, overlay in self._locations.values()
+                        if not overlay
+                    ],
+                ]
+            )
+        return self._total_region
+
+    @classmethod
+    def _get_band(cls, height: int) -> int:
+        """Get the band for a given height.
+
+        Args:
+            height: Height of a region.
+
+        Returns:
+            Band number.
+        """
+        return max(0, height - 1).bit_length()
+
+    def copy(self) -> IntervalSpatialMap[ValueType]:
+        """Copy the spatial map.
+
+        Returns:
+            A new spatial map.
+        """
+        spatial_map: IntervalSpatialMap[ValueType] = IntervalSpatialMap()
+        spatial_map._bands = {band: keys.copy() for band, keys in self._bands.items()}
+        spatial_map._entries = self._entries.copy()
+        spatial_map._locations = self._locations.copy()
+        spatial_map._fixed = self._fixed.copy()
+        spatial_map._sequence = self._sequence
+        spatial_map._total_region = self._total_region
+        return spatial_map
+
+    def insert(
+        self, regions_and_values: Iterable[tuple[Region, bool, bool, ValueType]]
+    ) -> None:
+        """Insert values into the Spatial map.
+
+        Values are associated with their region in Euclidean space, and a boolean that
+        indicates fixed regions. Fixed regions don't scroll and are always visible.
+
+        Args:
+            regions_and_values: An iterable of (REGION, FIXED, OVERLAY, VALUE).
+        """
+        new_keys: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+        entries = self._entries
+        locations = self._locations
+        fixed_values = self._fixed
+        sequence = self._sequence
+        # Bounds of new (non overlay) regions
+        x1 = y1 = 0
+        x2 = y2 = 0
+        for region, fixed, overlay, value in regions_and_values:
+            if value in locations or value in fixed_values:
+                self.remove(value)
+            if fixed:
+                fixed_values[value] = None
+                continue
+            x, y, width, height = region
+            band = (height - 1).bit_length() if height > 1 else 0
+            key = (y, sequence)
+            sequence += 1
+            entries[key] = (region, value)
+            locations[value] = (band, key, overlay)
+            new_keys[band].append(key)
+            if not overlay:
+                if x < x1:
+                    x1 = x
+                if y < y1:
+                    y1 = y
+                if x + width > x2:
+                    x2 = x + width
+                if y + height > y2:
+                    y2 = y + height
+        self._sequence = sequence
+        if self._total_region is not None:
+            self._total_region = self._total_region.union(
+                Region(x1, y1, x2 - x1, y2 - y1)
+            )
+
+        bands = self._bands
+        for band, keys in new_keys.items():
+            if band in bands:
+                keys.extend(bands[band])
+            keys.sort()
+            bands[band] = keys
+
+    def remove(self, value: ValueType) -> None:
+        """Remove a value from the spatial map.
+
+        Args:
+            value: A value previously inserted.
+
+        Raises:
+            KeyError: If the value is not in the map.
+        """
+        if value in self._fixed:
+            del self._fixed[value]
+            return
+        band, key, overlay = self._locations.pop(value)
+        keys = self._bands[band]
+        del keys[bisect_left(keys, key)]
+        del self._entries[key]
+        if not overlay:
+            self._total_region = None
+
+    def move(
+        self, value: ValueType, region: Region, new_value: ValueType | None = None
+    ) -> None:
+        """Change the region associated with a value, keeping its order.
+
+        Args:
+            value: A value previously inserted (which isn't fixed).
+            region: The new region.
+            new_value: A value to replace the existing value, or `None` to keep the same value.
+
+        Raises:
+            KeyError: If the value is not in the map.
+        """
+        band, key, overlay = self._locations.pop(value)
+        if new_value is not None:
+            value = new_value
+        keys = self._bands[band]
+        del keys[bisect_left(keys, key)]
+        del self._entries[key]
+
+        new_band = self._get_band(region.height)
+        new_key = (region.y, key[1])
+        insort(self._bands.setdefault(new_band, []), new_key)
+        self._entries[new_key] = (region, value)
+        self._locations[value] = (new_band, new_key, overlay)
+        if not overlay:
+            self._total_region = None
+
+    def get_values_in_region(self, region: Region) -> list[ValueType]:
+        """Get all the values that intersect with a given region.
+
+        Args:
+            region: A region.
+
+        Returns:
+            Values under the region.
+        """
+        x, y, width, height = region
+        x2 = x + width
+        y2 = y + height
+        entries = self._entries
+        found: list[tuple[int, int]] = []
+        for band, keys in self._bands.items():
+            if not keys:
+                continue
+            # The tallest region in this band is 2**band
+            start = bisect_left(keys, (y - (1 << band) + 1,))
+            end = bisect_left(keys, (y2,), start)
+            for key in keys[start:end]:
+                entry_x, entry_y, entry_width, entry_height = entries[key][0]
+                if (
+                    entry_y + entry_height > y
+                    and entry_x < x2
+                    and entry_x + entry_width > x
+                ):
+                    found.append(key)
+        found.sort(key=itemgetter(1))
+        results: list[ValueType] = list(self._fixed)
+        results.extend([entries[key][1] for key in found])
+        return results
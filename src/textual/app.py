@@ -79,13 +79,13 @@ from ._context import active_app, active_message_pump
 from ._context import message_hook as message_hook_context_var
 from ._event_broker import NoHandler, extract_handler_actions
 from ._path import CSSPathType, _css_path_type_as_list, _make_path_object_relative
+from ._profile import startup_phase, startup_trace
 from ._types import AnimationLevel
 from ._wait import wait_for_idle
 from ._worker_manager import WorkerManager
 from .actions import ActionParseResult, SkipAction
 from .await_remove import AwaitRemove
 from .binding import Binding, BindingType, _Bindings
-from .command import CommandPalette, Provider
 from .css.errors import StylesheetError
 from .css.query import NoMatches
 from .css.stylesheet import RulesMap, Stylesheet
@@ -125,6 +125,7 @@ if TYPE_CHECKING:
 
     from ._system_commands import SystemCommands
     from ._types import MessageTarget
+    from .command import Provider
 
     # Unused & ignored imports are needed for the docs to link to these objects:
     from .css.query import WrongType  # type: ignore  # noqa: F401
@@ -426,6 +427,8 @@ class App(Generic[ReturnType], DOMNode):
             CssPathError: When the supplied CSS path(s) are an unexpected type.
         """
         self._start_time = perf_counter()
+        if startup_trace is not None:
+            startup_trace.add_phase("imports", startup_trace.start, self._start_time)
         super().__init__()
         self.features: frozenset[FeatureFlag] = parse_features(os.getenv("TEXTUAL", ""))
 
@@ -1683,16 +1686,28 @@ class App(Generic[ReturnType], DOMNode):
         """
         return self.screen.get_child_by_type(expect_type)
 
-    def update_styles(self, node: DOMNode) -> None:
+    def update_styles(
+        self, node: DOMNode, selector_names: Iterable[str] | None = None
+    ) -> None:
         """Immediately update the styles of this node and all descendant nodes.
 
         Should be called whenever CSS classes / pseudo classes change.
         For example, when you hover over a button, the :hover pseudo class
         will be added, and this method is called to apply the corresponding
         :hover styles.
+
+        Args:
+            node: The node to update.
+            selector_names: The classes (e.g. `".active"`) or pseudo classes
+                (e.g. `":hover"`) which changed, or `None` if not known. When given,
+                only the nodes which may be matched by a rule using them are updated.
         """
-        descendants = node.walk_children(with_self=True)
-        self.stylesheet.update_nodes(descendants, animate=True)
+        nodes: Iterable[DOMNode]
+        if selector_names is None:
+            nodes = node.walk_children(with_self=True)
+        else:
+            nodes = self.stylesheet.get_restyle_nodes(node, selector_names)
+        self.stylesheet.update_nodes(nodes, animate=True)
 
     def mount(
         self,
@@ -2300,6 +2315,7 @@ class App(Generic[ReturnType], DOMNode):
         terminal_size: tuple[int, int] | None = None,
         message_hook: Callable[[Message], None] | None = None,
     ) -> None:
+        process_messages_start = perf_counter()
         self._set_active()
         active_message_pump.set(self)
 
@@ -2384,6 +2400,12 @@ class App(Generic[ReturnType], DOMNode):
 
                 finally:
                     self._running = True
+                    if startup_trace is not None:
+                        startup_trace.add_phase(
+                            "App._process_messages",
+                            process_messages_start,
+                            perf_counter(),
+                        )
                     await self._ready()
                     await invoke_ready_callback()
 
@@ -2456,14 +2478,17 @@ class App(Generic[ReturnType], DOMNode):
 
     async def _on_compose(self) -> None:
         _rich_traceback_omit = True
-        try:
-            widgets = [*self.screen._nodes, *compose(self)]
-        except TypeError as error:
-            raise TypeError(
-                f"{self!r} compose() method returned an invalid result; {error}"
-            ) from error
+        with startup_phase("App._on_compose"):
+            try:
+                with startup_phase("compose"):
+                    widgets = [*self.screen._nodes, *compose(self)]
+            except TypeError as error:
+                raise TypeError(
+                    f"{self!r} compose() method returned an invalid result; {error}"
+                ) from error
 
-        await self.mount_all(widgets)
+            with startup_phase("mount"):
+                await self.mount_all(widgets)
 
     async def _check_recompose(self) -> None:
         """Check if a recompose is required."""
@@ -2657,6 +2682,9 @@ class App(Generic[ReturnType], DOMNode):
 
         self._print_error_renderables()
 
+        if startup_trace is not None:
+            startup_trace.save()
+
         if constants.SHOW_RETURN:
             from rich.console import Console
             from rich.pretty import Pretty
@@ -2721,7 +2749,7 @@ class App(Generic[ReturnType], DOMNode):
             screen: Screen instance
             renderable: A Rich renderable.
         """
-
+        display_start = perf_counter()
         try:
             if renderable is None:
                 return
@@ -2770,6 +2798,13 @@ class App(Generic[ReturnType], DOMNode):
                 self._driver.flush()
 
         finally:
+            if (
+                startup_trace is not None
+                and renderable is not None
+                and not startup_trace.finished
+            ):
+                startup_trace.add_phase("App._display", display_start, perf_counter())
+                startup_trace.finish()
             self.post_display_hook()
 
     def post_display_hook(self) -> None:
@@ -3441,6 +3476,8 @@ class App(Generic[ReturnType], DOMNode):
 
     def action_command_palette(self) -> None:
         """Show the Textual command palette."""
+        from .command import CommandPalette
+
         if self.use_command_palette and not CommandPalette.is_open(self):
             self.push_screen(CommandPalette(), callback=self.call_next)
 
@@ -3451,6 +3488,8 @@ class App(Generic[ReturnType], DOMNode):
     @on(Driver.SignalResume)
     def _resume_signal(self) -> None:
         """Signal that the application is being resumed from a suspension."""
+        for screen in self._screen_stack:
+            screen._compositor.reset_front_buffer()
         self.app_resume_signal.publish()
 
     @contextmanager
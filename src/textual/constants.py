@@ -110,6 +110,15 @@ SHOW_RETURN: Final[bool] = _get_environ_bool("TEXTUAL_SHOW_RETURN")
 MAX_FPS: Final[int] = _get_environ_int("TEXTUAL_FPS", 60)
 """Maximum frames per second for updates."""
 
+DAMAGE_TRACKING: Final[bool] = _get_environ_bool("TEXTUAL_DAMAGE_TRACKING")
+"""Write only the cells that have changed since the previous update."""
+
+CSS_CACHE: Final[bool] = _get_environ_bool("TEXTUAL_CSS_CACHE")
+"""Store parsed CSS in the user's cache directory, to speed up subsequent runs."""
+
+STARTUP_TRACE: Final[str | None] = get_environ("TEXTUAL_STARTUP_TRACE")
+"""Path to write a trace of startup timings, in the Chrome trace event format."""
+
 COLOR_SYSTEM: Final[str | None] = get_environ("TEXTUAL_COLOR_SYSTEM", "auto")
 """Force color system override"""
 
@@ -0,0 +1,203 @@
+"""
+A cache of parsed CSS, stored on disk so that it persists between runs.
+
+Enable with the `TEXTUAL_CSS_CACHE` environment variable. Entries are keyed on a hash of
+the CSS, where it was read from, the variables used to parse it, and the versions of Textual
+(and its CSS modules) and Python. A change to any of these produces a new key, so stale entries are never read.
+
+The cache is limited in size. When it grows beyond its limit, the least recently used
+entries are removed.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from contextlib import suppress
+from functools import lru_cache
+from pathlib import Path
+
+from .model import RuleSet
+from .types import CSSLocation
+
+DEFAULT_MAX_SIZE = 16 * 1024 * 1024
+"""Default maximum size of the cache in bytes."""
+
+
+def get_cache_directory() -> Path:
+    """Get the default directory for the persistent CSS cache.
+
+    Returns:
+        A path in the user's cache directory.
+    """
+    if sys.platform == "win32":
+        cache_home = Path(
+            os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+        )
+    elif sys.platform == "darwin":
+        cache_home = Path.home() / "Library" / "Caches"
+    else:
+        cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_home / "textual" / "css"
+
+
+@lru_cache(maxsize=1)
+def _get_textual_version() -> str:
+    """Get a version string for the code which parses CSS.
+
+    Includes the modification times of the CSS modules, so that edits to Textual
+    (without a change of version) also invalidate the cache.
+
+    Returns:
+        Version string.
+    """
+    try:
+        from importlib.metadata import version
+
+        textual_version = version("textual")
+    except Exception:
+        textual_version = ""
+    modified = [
+        path.stat().st_mtime_ns for path in sorted(Path(__file__).parent.glob("*.py"))
+    ]
+    return f"{textual_version} {sys.version} {modified}"
+
+
+class PersistentParseCache:
+    """Stores parsed rules on disk."""
+
+    def __init__(self, path: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Args:
+            path: Directory to store cached rules.
+            max_size: Maximum size of the cache in bytes. When the cache grows beyond
+                this size, the least recently used entries are removed.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        """Number of rules read from the cache."""
+        self.misses = 0
+        """Number of rules not found in the cache."""
+        self._version = _get_textual_version()
+
+    def get_key(
+        self,
+        css: str,
+        read_from: CSSLocation,
+        is_default_rules: bool,
+        tie_breaker: int,
+        scope: str,
+        variables: dict[str, str],
+    ) -> str:
+        """Get a key for parsed CSS.
+
+        Args:
+            css: String containing Textual CSS.
+            read_from: Original CSS location.
+            is_default_rules: Are the rules default rules?
+            tie_breaker: Tie breaker for the rules.
+            scope: Scope of rules.
+            variables: Variables used to parse the CSS.
+
+        Returns:
+            A hex digest.
+        """
+        from hashlib import sha256
+
+        key = repr(
+            (
+                self._version,
+                read_from,
+                is_default_rules,
+                tie_breaker,
+                scope,
+                sorted(variables.items()),
+            )
+        )
+        return sha256(f"{key}\n{css}".encode("utf-8", "replace")).hexdigest()
+
+    def get(self, key: str) -> list[RuleSet] | None:
+        """Get rules from the cache.
+
+        Args:
+            key: Key from [get_key][textual.css._persistent_cache.PersistentParseCache.get_key].
+
+        Returns:
+            A list of rules, or `None` if the rules are not in the cache.
+        """
+        import pickle
+
+        cache_path = self.path / key
+        try:
+            data = cache_path.read_bytes()
+            rules = pickle.loads(data)
+        except Exception:
+            # Missing, unreadable, or from an incompatible version
+            self.misses += 1
+            return None
+        if not isinstance(rules, list) or not all(
+            isinstance(rule, RuleSet) for rule in rules
+        ):
+            self.misses += 1
+            return None
+        # The modification time records when the entry was last used
+        with suppress(OSError):
+            os.utime(cache_path)
+        self.hits += 1
+        return rules
+
+    def set(self, key: str, rules: list[RuleSet]) -> None:
+        """Store rules in the cache.
+
+        Errors writing the cache are ignored.
+
+        Args:
+            key: Key from [get_key][textual.css._persistent_cache.PersistentParseCache.get_key].
+            rules: Parsed rules.
+        """
+        import pickle
+        from tempfile import NamedTemporaryFile
+
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and replace, so readers never see a partial file
+            cache_file = NamedTemporaryFile(
+                "wb", dir=self.path, prefix=".", suffix=".tmp", delete=False
+            )
+        except OSError:
+            return
+        try:
+            with cache_file:
+                pickle.dump(rules, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(cache_file.name, self.path / key)
+        except Exception:
+            with suppress(OSError):
+                os.unlink(cache_file.name)
+            return
+        self._prune()
+
+    def _prune(self) -> None:
+        """Remove the least recently used entries, until the cache is no larger than
+        `max_size`."""
+        entries: list[tuple[int, int, str]] = []
+        try:
+            with os.scandir(self.path) as directory:
+                for entry in directory:
+                    if entry.name.startswith("."):
+                        continue
+                    with suppress(OSError):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            return
+        size = sum(entry_size for _, entry_size, _ in entries)
+        if size <= self.max_size:
+            return
+        entries.sort()
+        for _, entry_size, entry_path in entries:
+            if size <= self.max_size:
+                break
+            with suppress(OSError):
+                os.unlink(entry_path)
+            size -= entry_size
@@ -1,12 +1,86 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, NamedTuple
 
-from .model import CombinatorType, Selector, SelectorSet
+from .model import CombinatorType, Selector, SelectorSet, SelectorType
+from .types import Specificity3
 
 if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
     from ..dom import DOMNode
 
+BLOOM_BITS = 256
+"""Number of bits in the bloom filters used to reject selectors by their ancestors."""
+
+CompoundSelector: TypeAlias = "tuple[tuple[Selector, ...], bool]"
+"""Selectors which match a single node, and a flag to indicate a child combinator."""
+
+
+class CompiledSelectorSet(NamedTuple):
+    """A selector set compiled for fast matching."""
+
+    compounds: tuple[CompoundSelector, ...]
+    """Compound selectors, from right to left."""
+    bloom: int
+    """Bloom filter of names which must be present in the ancestors of a matching node."""
+    specificity: Specificity3
+    """Specificity of the selector set."""
+
+
+def get_bloom(names: Iterable[str]) -> int:
+    """Get a bloom filter for selector names.
+
+    Args:
+        names: Selector names, such as `"Label"`, `".class"`, or `"#id"`.
+
+    Returns:
+        A bloom filter (an integer with a bit set for each name).
+    """
+    bloom = 0
+    for name in names:
+        bloom |= 1 << (hash(name) % BLOOM_BITS)
+    return bloom
+
+
+def compile_selector_set(selector_set: SelectorSet) -> CompiledSelectorSet:
+    """Compile a selector set in to a form which may be matched from right to left.
+
+    Args:
+        selector_set: A selector set.
+
+    Returns:
+        A compiled selector set.
+    """
+    SAME = CombinatorType.SAME
+    CHILD = CombinatorType.CHILD
+    compounds: list[CompoundSelector] = []
+    compound: list[Selector] = []
+    for selector in selector_set.selectors:
+        if selector.combinator != SAME and compound:
+            compounds.append((tuple(compound), compound[0].combinator == CHILD))
+            compound = []
+        compound.append(selector)
+    if compound:
+        compounds.append((tuple(compound), compound[0].combinator == CHILD))
+    compounds.reverse()
+
+    # Each compound selector (other than the right-most) must match an ancestor
+    required_names: list[str] = []
+    for ancestor_compound, _ in compounds[1:]:
+        for selector in ancestor_compound:
+            selector_type = selector.type
+            if selector_type == SelectorType.TYPE:
+                required_names.append(selector.name)
+            elif selector_type == SelectorType.CLASS:
+                required_names.append(f".{selector.name}")
+            elif selector_type == SelectorType.ID:
+                required_names.append(f"#{selector.name}")
+
+    return CompiledSelectorSet(
+        tuple(compounds), get_bloom(required_names), selector_set.specificity
+    )
+
 
 def match(selector_sets: Iterable[SelectorSet], node: DOMNode) -> bool:
     """Check if a given node matches any of the given selector sets.
@@ -72,3 +146,41 @@ def _check_selectors(selectors: list[Selector], css_path_nodes: list[DOMNode]) -
                 else:
                     pop()
     return False
+
+
+def _check_compiled_selectors(
+    compounds: tuple[CompoundSelector, ...], css_path_nodes: list[DOMNode]
+) -> bool:
+    """Match compiled selectors against DOM nodes, from right to left.
+
+    Args:
+        compounds: Compound selectors from [compile_selector_set][textual.css.match.compile_selector_set].
+        css_path_nodes: The DOM nodes to check the selectors against.
+
+    Returns:
+        True if the last node in css_path_nodes matches the selectors.
+    """
+    last_compound = len(compounds) - 1
+    stack: list[tuple[int, int]] = [(0, len(css_path_nodes) - 1)]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        compound_index, node_index = pop()
+        selectors, child = compounds[compound_index]
+        path_node = css_path_nodes[node_index]
+        for selector in selectors:
+            if not selector.check(path_node):
+                break
+        else:
+            if compound_index == last_compound:
+                # A leading child combinator must match the root
+                if not child or not node_index:
+                    return True
+            elif child:
+                if node_index:
+                    push((compound_index + 1, node_index - 1))
+            else:
+                # Check the nearest ancestors first
+                for ancestor_index in range(node_index):
+                    push((compound_index + 1, ancestor_index))
+    return False
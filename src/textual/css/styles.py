@@ -357,7 +357,7 @@ class StylesBase(ABC):
     overlay = StringEnumProperty(
         VALID_OVERLAY, "none", layout=True, refresh_parent=True
     )
-    constrain = StringEnumProperty(VALID_CONSTRAIN, "none")
+    constrain = StringEnumProperty(VALID_CONSTRAIN, "none", layout=True)
 
     def __textual_animation__(
         self,
@@ -14,12 +14,20 @@ from rich.padding import Padding
 from rich.panel import Panel
 from rich.text import Text
 
+from .. import constants, log
+from .._profile import trace_startup
 from ..cache import LRUCache
 from ..dom import DOMNode
 from ..widget import Widget
+from ._persistent_cache import PersistentParseCache, get_cache_directory
 from .errors import StylesheetError
-from .match import _check_selectors
-from .model import RuleSet
+from .match import (
+    CompiledSelectorSet,
+    _check_compiled_selectors,
+    _check_selectors,
+    compile_selector_set,
+)
+from .model import RuleSet, SelectorType
 from .parse import parse
 from .styles import RulesMap, Styles
 from .tokenize import Token, tokenize_values
@@ -136,6 +144,26 @@ class CssSource(NamedTuple):
     scope: str = ""
 
 
+class CandidateRules(NamedTuple):
+    """Rules which may apply to a node, in the order they should be checked."""
+
+    rules: list[CompiledRule]
+    """Compiled rules, in reverse order of definition."""
+    has_hover: bool
+    """Does any rule have a hover pseudo class?"""
+    has_focus_within: bool
+    """Does any rule have a focus-within pseudo class?"""
+
+
+class CompiledRule(NamedTuple):
+    """A rule set, with selectors compiled for matching."""
+
+    rule: RuleSet
+    """The rule set."""
+    selector_sets: list[CompiledSelectorSet]
+    """Compiled selector sets."""
+
+
 @rich.repr.auto(angular=True)
 class Stylesheet:
     """A Stylsheet generated from Textual CSS."""
@@ -143,12 +171,18 @@ class Stylesheet:
     def __init__(self, *, variables: dict[str, str] | None = None) -> None:
         self._rules: list[RuleSet] = []
         self._rules_map: dict[str, list[RuleSet]] | None = None
+        self._selector_index: dict[str, dict[int, CompiledRule]] | None = None
         self._variables = variables or {}
         self.__variable_tokens: dict[str, list[Token]] | None = None
         self.source: dict[CSSLocation, CssSource] = {}
         self._require_parse = False
         self._invalid_css: set[str] = set()
         self._parse_cache: LRUCache[tuple, list[RuleSet]] = LRUCache(64)
+        self._candidate_rules_cache: LRUCache[tuple, CandidateRules] = LRUCache(1024)
+        self._restyle_scopes: dict[str, bool] = {}
+        self._persistent_cache: PersistentParseCache | None = (
+            PersistentParseCache(get_cache_directory()) if constants.CSS_CACHE else None
+        )
 
     def __rich_repr__(self) -> rich.repr.Result:
         yield list(self.source.keys())
@@ -187,6 +221,103 @@ class Stylesheet:
             self._rules_map = dict(rules_map)
         return self._rules_map
 
+    @property
+    def selector_index(self) -> dict[str, dict[int, CompiledRule]]:
+        """Structure that maps a selector name on to compiled rules, keyed by their position.
+
+        Returns:
+            Mapping of selector name to compiled rules.
+        """
+        if self._selector_index is None:
+            selector_index: dict[str, dict[int, CompiledRule]] = defaultdict(dict)
+            # Maps a class or pseudo class on to True if it may affect descendants
+            restyle_scopes: dict[str, bool] = {}
+            for position, rule in enumerate(self.rules):
+                compiled_rule = CompiledRule(
+                    rule,
+                    [
+                        compile_selector_set(selector_set)
+                        for selector_set in rule.selector_set
+                    ],
+                )
+                for name in rule.selector_names:
+                    selector_index[name][position] = compiled_rule
+                for compounds, _, _ in compiled_rule.selector_sets:
+                    for compound_index, (selectors, _) in enumerate(compounds):
+                        descendants = compound_index > 0
+                        for selector in selectors:
+                            names = [f":{name}" for name in selector.pseudo_classes]
+                            if selector.type == SelectorType.CLASS:
+                                names.append(f".{selector.name}")
+                            for name in names:
+                                if descendants:
+                                    restyle_scopes[name] = True
+                                else:
+                                    restyle_scopes.setdefault(name, False)
+            self._selector_index = dict(selector_index)
+            self._restyle_scopes = restyle_scopes
+            self._candidate_rules_cache.clear()
+        return self._selector_index
+
+    def get_restyle_nodes(
+        self, node: DOMNode, selector_names: Iterable[str]
+    ) -> Iterable[DOMNode]:
+        """Get the nodes which may need to be restyled when classes or pseudo classes change.
+
+        Args:
+            node: The node with changed classes or pseudo classes.
+            selector_names: The changed class names (e.g. `".active"`) or pseudo
+                classes (e.g. `":hover"`).
+
+        Returns:
+            Nodes to update.
+        """
+        self.selector_index  # Builds the restyle scopes
+        restyle_scopes = self._restyle_scopes
+        scopes = [restyle_scopes.get(name) for name in selector_names]
+        if any(scopes):
+            # A rule may match descendants
+            return node.walk_children(with_self=True)
+        if False in scopes:
+            # Rules may match only the node itself
+            return [node]
+        return []
+
+    def _get_candidate_rules(self, node: DOMNode) -> CandidateRules:
+        """Get the rules which may apply to a node, from its selector names.
+
+        Args:
+            node: A DOM node.
+
+        Returns:
+            Candidate rules.
+        """
+        selector_index = self.selector_index
+        node_id = node._id
+        cache_key = (
+            type(node),
+            node_id if f"#{node_id}" in selector_index else None,
+            node.classes,
+        )
+        candidate_rules = self._candidate_rules_cache.get(cache_key)
+        if candidate_rules is not None:
+            return candidate_rules
+        candidates: dict[int, CompiledRule] = {}
+        for name in node._selector_names:
+            indexed_rules = selector_index.get(name)
+            if indexed_rules is not None:
+                candidates.update(indexed_rules)
+        compiled_rules = [
+            candidates[position] for position in sorted(candidates, reverse=True)
+        ]
+        candidate_rules = CandidateRules(
+            compiled_rules,
+            any("hover" in rule.pseudo_classes for rule, _ in compiled_rules),
+            any("focus-within" in rule.pseudo_classes for rule, _ in compiled_rules),
+        )
+        self._candidate_rules_cache[cache_key] = candidate_rules
+        return candidate_rules
+
     @property
     def css(self) -> str:
         """The equivalent TCSS for this stylesheet.
@@ -244,6 +375,15 @@ class Stylesheet:
             return self._parse_cache[cache_key]
         except KeyError:
             pass
+        persistent_cache = self._persistent_cache
+        if persistent_cache is not None:
+            persistent_key = persistent_cache.get_key(
+                css, read_from, is_default_rules, tie_breaker, scope, self._variables
+            )
+            cached_rules = persistent_cache.get(persistent_key)
+            if cached_rules is not None:
+                self._parse_cache[cache_key] = cached_rules
+                return cached_rules
         try:
             rules = list(
                 parse(
@@ -261,6 +401,8 @@ class Stylesheet:
             raise StylesheetError(f"failed to parse css; {error}") from None
 
         self._parse_cache[cache_key] = rules
+        if persistent_cache is not None and not any(rule.errors for rule in rules):
+            persistent_cache.set(persistent_key, rules)
         return rules
 
     def read(self, filename: str | PurePath) -> None:
@@ -346,7 +488,9 @@ class Stylesheet:
         self.source[read_from] = CssSource(css, is_default_css, tie_breaker, scope)
         self._require_parse = True
         self._rules_map = None
+        self._selector_index = None
 
+    @trace_startup("Stylesheet.parse")
     def parse(self) -> None:
         """Parse the source in the stylesheet.
 
@@ -380,9 +524,17 @@ class Stylesheet:
                 self._invalid_css.add(css)
                 raise StylesheetParseError(error_renderable)
             add_rules(css_rules)
+        persistent_cache = self._persistent_cache
+        if persistent_cache is not None:
+            log.system(
+                "Persistent CSS cache",
+                hits=persistent_cache.hits,
+                misses=persistent_cache.misses,
+            )
         self._rules = rules
         self._require_parse = False
         self._rules_map = None
+        self._selector_index = None
 
     def reparse(self) -> None:
         """Re-parse source, applying new variables.
@@ -412,6 +564,7 @@ class Stylesheet:
         else:
             self._rules = stylesheet.rules
             self._rules_map = None
+            self._selector_index = None
             self.source = stylesheet.source
             self._require_parse = False
 
@@ -461,16 +614,8 @@ class Stylesheet:
         rules_map = self.rules_map
 
         # Discard rules which are not applicable early
-        limit_rules = {
-            rule
-            for name in rules_map.keys() & node._selector_names
-            for rule in rules_map[name]
-        }
-        rules = list(filter(limit_rules.__contains__, reversed(self.rules)))
-
-        node._has_hover_style = any("hover" in rule.pseudo_classes for rule in rules)
-        node._has_focus_within = any(
-            "focus-within" in rule.pseudo_classes for rule in rules
+        compiled_rules, node._has_hover_style, node._has_focus_within = (
+            self._get_candidate_rules(node)
         )
 
         cache_key: tuple | None
@@ -494,18 +639,26 @@ class Stylesheet:
         else:
             cache_key = None
 
-        _check_rule = self._check_rule
         css_path_nodes = node.css_path_nodes
 
+        # Names in the ancestors, used to reject selectors which can't match
+        ancestor_bloom = 0
+        for path_node in css_path_nodes[:-1]:
+            ancestor_bloom |= path_node._selector_bloom
+
         # Rules that may be set to the special value `initial`
         initial: set[str] = set()
         # Rules in DEFAULT_CSS set to the special value `initial`
         initial_defaults: set[str] = set()
 
-        for rule in rules:
+        for rule, compiled_selector_sets in compiled_rules:
             is_default_rules = rule.is_default_rules
             tie_breaker = rule.tie_breaker
-            for base_specificity in _check_rule(rule, css_path_nodes):
+            for compounds, bloom, base_specificity in compiled_selector_sets:
+                if bloom & ~ancestor_bloom or not _check_compiled_selectors(
+                    compounds, css_path_nodes
+                ):
+                    continue
                 for key, rule_specificity, value in rule.styles.extract_rules(
                     base_specificity, is_default_rules, tie_breaker
                 ):
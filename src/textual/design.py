@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
 from rich.console import group
 from rich.padding import Padding
-from rich.table import Table
 from rich.text import Text
 
 from .color import WHITE, Color
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
 NUMBER_OF_SHADES = 3
 
 # Where no content exists
@@ -193,6 +195,7 @@ def show_design(light: ColorSystem, dark: ColorSystem) -> Table:
     Returns:
         Table showing all colors.
     """
+    from rich.table import Table
 
     @group()
     def make_shades(system: ColorSystem):
@@ -54,7 +54,8 @@ def _detect_newline_style(text: str) -> Newline:
     Returns:
         The Newline used in the file.
     """
-    if "\r\n" in text:  # Windows newline
+    # Searching for "\r" first is much quicker when there are no carriage returns
+    if "\r" in text and "\r\n" in text:  # Windows newline
         return "\r\n"
     elif "\n" in text:  # Unix/Linux/MacOS newline
         return "\n"
@@ -367,6 +368,20 @@ class Document(DocumentBase):
                 return (line_index + 1, 0)
             column_index = next_column_index
 
+    def _row_to_byte_offset(self, row: int) -> int:
+        """Get the utf-8 byte offset of the start of a row.
+
+        Args:
+            row: A row in the document.
+
+        Returns:
+            The number of bytes before the row (including line separators).
+        """
+        end_of_line_width = len(self.newline)
+        return sum(
+            len(_utf8_encode(line)) + end_of_line_width for line in self._lines[:row]
+        )
+
     def get_line(self, index: int) -> str:
         """Returns the line with the given index from the document.
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import zlib
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -34,6 +35,13 @@ class Edit:
     _edit_result: EditResult | None = field(init=False, default=None)
     """The result of doing the edit."""
 
+    _compressed_replaced_text: bytes | None = field(init=False, default=None)
+    """The replaced text, compressed, if it was compressed by `Edit._compress`.
+
+    While the replaced text is compressed, the replaced text of the edit result is
+    empty.
+    """
+
     def do(self, text_area: TextArea, record_selection: bool = True) -> EditResult:
         """Perform the edit operation.
 
@@ -92,7 +100,11 @@ class Edit:
         else:
             self._updated_selection = Selection.cursor(edit_result.end_location)
 
-        self._edit_result = edit_result
+        if self._compressed_replaced_text is not None:
+            # A redo replaces the same text, which is already compressed.
+            self._edit_result = EditResult(edit_result.end_location, "")
+        else:
+            self._edit_result = edit_result
         return edit_result
 
     def undo(self, text_area: TextArea) -> EditResult:
@@ -106,7 +118,7 @@ class Edit:
         Returns:
             An `EditResult` containing information about the replace operation.
         """
-        replaced_text = self._edit_result.replaced_text
+        replaced_text = self._replaced_text
         edit_end = self._edit_result.end_location
 
         # Replace the span of the edit with the text that was originally there.
@@ -132,6 +144,26 @@ class Edit:
             text_area.selection = self._updated_selection
         text_area.record_cursor_width()
 
+    @property
+    def _replaced_text(self) -> str:
+        """The text that was replaced by the edit."""
+        if self._compressed_replaced_text is not None:
+            return zlib.decompress(self._compressed_replaced_text).decode(
+                "utf-8", "surrogatepass"
+            )
+        return self._edit_result.replaced_text if self._edit_result else ""
+
+    def _compress(self) -> None:
+        """Compress the replaced text, to reduce the memory used by the edit while it
+        is in the undo history."""
+        edit_result = self._edit_result
+        if edit_result is None or not edit_result.replaced_text:
+            return
+        self._compressed_replaced_text = zlib.compress(
+            edit_result.replaced_text.encode("utf-8", "surrogatepass"), 1
+        )
+        self._edit_result = EditResult(edit_result.end_location, "")
+
     @property
     def top(self) -> Location:
         """The Location impacted by this edit that is nearest the start of the document."""
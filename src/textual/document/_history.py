@@ -1,11 +1,34 @@
 from __future__ import annotations
 
+import sys
 import time
 from collections import deque
 from dataclasses import dataclass, field
 
+from textual.document._document import EditResult
 from textual.document._edit import Edit
 
+_EDIT_SIZE = 800
+"""The approximate size (in bytes) of an Edit, not including its text."""
+
+
+def _get_edit_size(edit: Edit) -> int:
+    """Get the approximate memory used by an Edit.
+
+    Args:
+        edit: An edit which has been performed.
+
+    Returns:
+        The approximate number of bytes used by the edit.
+    """
+    compressed_replaced_text = edit._compressed_replaced_text
+    replaced_text = (
+        compressed_replaced_text
+        if compressed_replaced_text is not None
+        else edit._edit_result.replaced_text if edit._edit_result else ""
+    )
+    return _EDIT_SIZE + sys.getsizeof(edit.text) + sys.getsizeof(replaced_text)
+
 
 class HistoryException(Exception):
     """Indicates misuse of the EditHistory API.
@@ -26,6 +49,20 @@ class EditHistory:
     checkpoint_max_characters: int
     """Maximum number of characters that can appear in a batch before a new batch is formed."""
 
+    max_memory: int | None = 64 * 1024 * 1024
+    """Maximum approximate number of bytes used by the history, or `None` for no limit.
+
+    When the limit is exceeded, the oldest batches are discarded. The most recent batch
+    is always kept, so it may be undone.
+    """
+
+    compress_characters: int | None = 64 * 1024
+    """Replaced text with at least this many characters is stored compressed, or `None`
+    to never compress replaced text."""
+
+    _memory_usage: int = field(init=False, default=0)
+    """The approximate number of bytes used by the Edits in the history."""
+
     _last_edit_time: float = field(init=False, default_factory=time.monotonic)
 
     _character_count: int = field(init=False, default=0)
@@ -70,6 +107,9 @@ class EditHistory:
         - The edit involves insertion or deletion of one or more newline characters.
         - An edit which inserts more than a single character (a paste) gets an isolated batch.
 
+        Adjacent insertions or deletions in the same batch (such as typing, or pressing
+        backspace repeatedly) are coalesced into a single Edit.
+
         Args:
             edit: The edit to record.
         """
@@ -99,24 +139,130 @@ class EditHistory:
             or self._character_count + edit_characters > self.checkpoint_max_characters
         ):
             # Create a new batch (creating a "checkpoint").
+            if len(undo_stack) == undo_stack.maxlen:
+                self._discard_batch(undo_stack[0])
+            compress_characters = self.compress_characters
+            if (
+                compress_characters is not None
+                and len(edit_result.replaced_text) >= compress_characters
+            ):
+                edit._compress()
             undo_stack.append([edit])
+            self._memory_usage += _get_edit_size(edit)
             self._character_count = edit_characters
             self._last_edit_time = current_time
             self._force_end_batch = False
         else:
             # Update the latest batch.
-            undo_stack[-1].append(edit)
+            batch = undo_stack[-1]
+            previous_edit = batch[-1]
+            previous_size = _get_edit_size(previous_edit)
+            if self._coalesce(previous_edit, edit):
+                self._memory_usage += _get_edit_size(previous_edit) - previous_size
+            else:
+                batch.append(edit)
+                self._memory_usage += _get_edit_size(edit)
             self._character_count += edit_characters
             self._last_edit_time = current_time
 
         self._previously_replaced = is_replacement
+        for batch in self._redo_stack:
+            self._discard_batch(batch)
         self._redo_stack.clear()
+        self._enforce_max_memory()
 
         # For some edits, we want to ensure the NEXT edit cannot be added to its batch,
         # so enforce a checkpoint now.
         if contains_newline or edit_characters > 1:
             self.checkpoint()
 
+    def _coalesce(self, previous_edit: Edit, edit: Edit) -> bool:
+        """Combine an edit with the previous edit in its batch, if they insert or
+        delete adjacent text on the same line.
+
+        Args:
+            previous_edit: The most recently recorded edit, which will be updated.
+            edit: The edit to combine with the previous edit.
+
+        Returns:
+            `True` if the edit was combined with the previous edit, or `False` if it
+                should be recorded separately.
+        """
+        previous_result = previous_edit._edit_result
+        edit_result = edit._edit_result
+        if (
+            previous_result is None
+            or edit_result is None
+            or previous_edit._compressed_replaced_text is not None
+            or previous_edit.maintain_selection_offset != edit.maintain_selection_offset
+        ):
+            return False
+        previous_top = previous_edit.top
+        previous_bottom = previous_edit.bottom
+        row = previous_top[0]
+        if not (
+            previous_bottom[0] == edit.top[0] == edit.bottom[0] == row
+            and edit_result.end_location[0] == row
+        ):
+            return False
+
+        if not edit_result.replaced_text:
+            # Text inserted at the end of the previously inserted text.
+            if (
+                previous_result.replaced_text
+                or edit.from_location != edit.to_location
+                or edit.from_location != previous_result.end_location
+            ):
+                return False
+            previous_edit.text += edit.text
+            previous_edit._edit_result = EditResult(edit_result.end_location, "")
+        elif not edit.text and not previous_edit.text:
+            replaced_text = edit_result.replaced_text
+            if edit.bottom == previous_top:
+                # Text deleted before the previously deleted text (backspace).
+                previous_edit.from_location = edit.top
+                previous_edit.to_location = previous_bottom
+                previous_edit._edit_result = EditResult(
+                    edit_result.end_location,
+                    replaced_text + previous_result.replaced_text,
+                )
+            elif edit.top == previous_top:
+                # Text deleted after the previously deleted text (delete).
+                previous_edit.from_location = previous_top
+                previous_edit.to_location = (
+                    row,
+                    previous_bottom[1] + len(replaced_text),
+                )
+                previous_edit._edit_result = EditResult(
+                    previous_result.end_location,
+                    previous_result.replaced_text + replaced_text,
+                )
+            else:
+                return False
+        else:
+            return False
+
+        previous_edit._updated_selection = edit._updated_selection
+        return True
+
+    def _discard_batch(self, batch: list[Edit]) -> None:
+        """Update the memory usage for a batch which is removed from the history.
+
+        Args:
+            batch: The batch of Edits being removed.
+        """
+        self._memory_usage -= sum(_get_edit_size(edit) for edit in batch)
+
+    def _enforce_max_memory(self) -> None:
+        """Discard the oldest batches until the history fits in `max_memory`, keeping
+        the most recent batch."""
+        max_memory = self.max_memory
+        if max_memory is None:
+            return
+        undo_stack = self._undo_stack
+        while self._memory_usage > max_memory and len(undo_stack) > 1:
+            self._discard_batch(undo_stack.popleft())
+
     def _pop_undo(self) -> list[Edit] | None:
         """Pop the latest batch from the undo stack and return it.
 
@@ -156,6 +302,7 @@ class EditHistory:
         """Completely clear the history."""
         self._undo_stack.clear()
         self._redo_stack.clear()
+        self._memory_usage = 0
         self._last_edit_time = time.monotonic()
         self._force_end_batch = False
         self._previously_replaced = False
@@ -164,6 +311,11 @@ class EditHistory:
         """Ensure the next recorded edit starts a new batch."""
         self._force_end_batch = True
 
+    @property
+    def memory_usage(self) -> int:
+        """The approximate number of bytes used by the Edits in the history."""
+        return self._memory_usage
+
     @property
     def undo_stack(self) -> list[list[Edit]]:
         """A copy of the undo stack, with references to the original Edits."""
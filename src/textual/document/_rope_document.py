@@ -0,0 +1,530 @@
+"""
+A document which stores its text in chunks, for editing large files.
+
+Chunks are strings of whole lines (of about 16KB), and the number of lines, characters,
+and bytes in each chunk are stored in Fenwick trees, so a row, index, or byte offset
+is found in O(log n) time, and an edit copies a chunk rather than the document.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from itertools import accumulate, islice, repeat
+from operator import add
+from typing import Iterator, NamedTuple, Sequence, Tuple, overload
+
+from textual._cells import cell_len
+from textual._fenwick_tree import FenwickTree
+from textual.document._document import (
+    VALID_NEWLINES,
+    Document,
+    EditResult,
+    Location,
+    Newline,
+    _detect_newline_style,
+)
+from textual.geometry import Size
+
+_CHUNK_SIZE = 16 * 1024
+"""The size of a chunk (in characters) when text is split in to chunks."""
+_MAX_CHUNK_SIZE = 2 * _CHUNK_SIZE
+"""Edited chunks larger than this are split."""
+_MIN_CHUNK_SIZE = _CHUNK_SIZE // 4
+"""Edited chunks smaller than this are merged with the next chunk."""
+
+_LINE_SEPARATORS = "\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+"""Line separators (recognized by `str.splitlines`) other than `\\n` and `\\r\\n`."""
+_LINE_SEPARATORS_PATTERN = re.compile(f"[{_LINE_SEPARATORS}]")
+
+
+def _normalize_newlines(text: str) -> str:
+    """Replace line separators with `\\n`, splitting lines like `Document` does.
+
+    Args:
+        text: Text which may contain any line separators.
+
+    Returns:
+        Text where lines are separated by `\\n`.
+    """
+    normalized = text.replace("\r\n", "\n") if "\r" in text else text
+    # Searching for each separator is much quicker than a regular expression
+    if any(separator in normalized for separator in _LINE_SEPARATORS):
+        normalized = _LINE_SEPARATORS_PATTERN.sub("\n", normalized)
+    if normalized.endswith("\n") and not text.endswith(tuple(VALID_NEWLINES)):
+        # `str.splitlines` doesn't create an empty line after other separators
+        normalized = normalized[:-1]
+    return normalized
+
+
+def _split_chunks(text: str) -> list[str]:
+    """Split text in to chunks of whole lines.
+
+    Args:
+        text: Text where lines are separated by `\\n`.
+
+    Returns:
+        Chunks, each of which ends with a newline, except (perhaps) the last.
+    """
+    chunks: list[str] = []
+    start = 0
+    size = len(text)
+    while size - start > _CHUNK_SIZE:
+        end = text.find("\n", start + _CHUNK_SIZE - 1)
+        if end == -1:
+            break
+        chunks.append(text[start : end + 1])
+        start = end + 1
+    if start < size or not chunks:
+        chunks.append(text[start:])
+    return chunks
+
+
+class _Chunk:
+    """A string of whole lines, and information about them which is calculated
+    when required."""
+
+    __slots__ = ["text", "newlines", "is_ascii", "byte_length", "_starts", "_width"]
+
+    def __init__(self, text: str) -> None:
+        """
+        Args:
+            text: The text of the chunk, where lines are separated by `\\n`.
+        """
+        self.text = text
+        self.newlines = text.count("\n")
+        self.is_ascii = text.isascii()
+        self.byte_length = len(text) if self.is_ascii else len(text.encode("utf-8"))
+        self._starts: array[int] | None = None
+        self._width: tuple[int, int] | None = None
+
+    @property
+    def starts(self) -> array[int]:
+        """The offset of the start of each line in the chunk, and an extra offset
+        (one past the end of the text) for convenience."""
+        if self._starts is None:
+            self._starts = array(
+                "q",
+                accumulate(
+                    map(add, map(len, self.text.split("\n")), repeat(1)), initial=0
+                ),
+            )
+        return self._starts
+
+    def get_line(self, index: int) -> str:
+        """Get a line of the chunk.
+
+        Args:
+            index: Index of the line in the chunk.
+
+        Returns:
+            The line, without a newline.
+        """
+        starts = self.starts
+        return self.text[starts[index] : starts[index + 1] - 1]
+
+    def get_lines(self, last: bool) -> list[str]:
+        """Get the lines which start in this chunk.
+
+        Args:
+            last: Is this the last chunk of the document? If not, the chunk ends with
+                a newline, and the empty string after it is not a line of the chunk.
+
+        Returns:
+            The lines, without newlines.
+        """
+        if last:
+            return self.text.split("\n")
+        return self.text[:-1].split("\n")
+
+    def get_byte_offset(self, offset: int) -> int:
+        """Get the number of utf-8 bytes before an offset in the chunk.
+
+        Args:
+            offset: Offset of a character.
+
+        Returns:
+            Byte offset.
+        """
+        if self.is_ascii:
+            return offset
+        return len(self.text[:offset].encode("utf-8"))
+
+    def get_width(self, tab_width: int) -> int:
+        """Get the cell width of the widest line.
+
+        Args:
+            tab_width: The width to use for tab indents.
+
+        Returns:
+            Width in cells.
+        """
+        if self._width is None or self._width[0] != tab_width:
+            text = self.text
+            if "\t" in text:
+                text = text.expandtabs(tab_width)
+            lines = text.split("\n")
+            if self.is_ascii:
+                width = max(map(len, lines))
+            else:
+                width = max(map(cell_len, lines))
+            self._width = (tab_width, width)
+        return self._width[1]
+
+
+class RopeSnapshot(NamedTuple):
+    """The content of a `RopeDocument` at a point in time, which may be restored."""
+
+    chunks: Tuple[_Chunk, ...]
+    """The chunks of the document (which are never modified)."""
+
+
+class _RopeLines(Sequence[str]):
+    """The lines of a rope document."""
+
+    def __init__(self, document: RopeDocument) -> None:
+        self._document = document
+
+    def __len__(self) -> int:
+        return self._document.line_count
+
+    def __iter__(self) -> Iterator[str]:
+        return self._document._iter_lines(0)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (_RopeLines, list, tuple)):
+            return len(self) == len(other) and all(
+                line == other_line for line, other_line in zip(self, other)
+            )
+        return NotImplemented
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        document = self._document
+        size = document.line_count
+        if isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            if step == 1:
+                if start >= stop:
+                    return []
+                return list(islice(document._iter_lines(start), stop - start))
+            return [self[line] for line in range(start, stop, step)]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("line index out of range")
+        chunk_index, line_index = document._find_row(index)
+        return document._chunks[chunk_index].get_line(line_index)
+
+
+class RopeDocument(Document):
+    """A document which stores its text in chunks, for editing large files.
+
+    Rows, indexes, and byte offsets are found in O(log n) time, and an edit copies
+    the chunks it changes (of about 16KB) rather than the list of lines. Lines are
+    only split when they are accessed, so large documents load quickly.
+
+    Use with a [TextArea][textual.widgets.TextArea] by constructing it with
+    `storage="rope"`.
+    """
+
+    def __init__(self, text: str) -> None:
+        self._newline: Newline = _detect_newline_style(text)
+        """The type of newline used in the text."""
+        self._newline_length = len(self._newline)
+        self._chunks: list[_Chunk] = []
+        """The chunks of the document, which are replaced (not modified) by edits."""
+        self._line_counts = FenwickTree()
+        """The number of newlines in each chunk."""
+        self._lengths = FenwickTree()
+        """The length of each chunk in the document's text (with its newlines)."""
+        self._byte_lengths = FenwickTree()
+        """The length of each chunk in utf-8 bytes (with the document's newlines)."""
+        self._lines = _RopeLines(self)  # type: ignore[assignment]
+        self._set_chunks(
+            [_Chunk(chunk) for chunk in _split_chunks(_normalize_newlines(text))]
+        )
+
+    def _set_chunks(self, chunks: list[_Chunk]) -> None:
+        """Replace the chunks, and rebuild the indexes.
+
+        Args:
+            chunks: New chunks.
+        """
+        extra = self._newline_length - 1
+        self._chunks = chunks
+        self._line_counts = FenwickTree([chunk.newlines for chunk in chunks])
+        self._lengths = FenwickTree(
+            [len(chunk.text) + chunk.newlines * extra for chunk in chunks]
+        )
+        self._byte_lengths = FenwickTree(
+            [chunk.byte_length + chunk.newlines * extra for chunk in chunks]
+        )
+
+    def snapshot(self) -> RopeSnapshot:
+        """Get a snapshot of the document, which may be restored.
+
+        Chunks are shared with the document (edits replace chunks rather than
+        modify them), so this takes time proportional to the number of chunks, not
+        the size of the text.
+
+        Returns:
+            A snapshot of the document.
+        """
+        return RopeSnapshot(tuple(self._chunks))
+
+    def restore(self, snapshot: RopeSnapshot) -> None:
+        """Restore the content of the document from a snapshot.
+
+        Args:
+            snapshot: A snapshot from `RopeDocument.snapshot`.
+        """
+        self._set_chunks(list(snapshot.chunks))
+
+    @property
+    def lines(self) -> Sequence[str]:  # type: ignore[override]
+        """Get the lines of the document, as a read-only sequence of strings.
+
+        Lines are split from the text of their chunk when they are accessed.
+        """
+        return self._lines
+
+    @property
+    def text(self) -> str:
+        """Get the text from the document."""
+        text = "".join([chunk.text for chunk in self._chunks])
+        if self._newline != "\n":
+            text = text.replace("\n", self._newline)
+        return text
+
+    @property
+    def line_count(self) -> int:
+        """Returns the number of lines in the document."""
+        return self._line_counts.total + 1
+
+    def get_size(self, tab_width: int) -> Size:
+        """The Size of the document, taking into account the tab rendering width.
+
+        The width of each chunk is cached, so only edited chunks are measured.
+
+        Args:
+            tab_width: The width to use for tab indents.
+
+        Returns:
+            The size (width, height) of the document.
+        """
+        width = max(chunk.get_width(tab_width) for chunk in self._chunks)
+        return Size(width, self.line_count)
+
+    def _find_row(self, row: int) -> tuple[int, int]:
+        """Find the chunk which contains a row.
+
+        Args:
+            row: A row in the range [0, line_count).
+
+        Returns:
+            The index of the chunk, and the index of the line in the chunk.
+        """
+        line_counts = self._line_counts
+        chunk_index = min(line_counts.find(row), len(self._chunks) - 1)
+        return chunk_index, row - line_counts.prefix_sum(chunk_index)
+
+    def _iter_lines(self, row: int) -> Iterator[str]:
+        """Iterate over the lines of the document.
+
+        Args:
+            row: The first row.
+
+        Returns:
+            An iterator of lines.
+        """
+        chunk_index, line_index = self._find_row(row)
+        chunks = self._chunks
+        last_index = len(chunks) - 1
+        yield from islice(
+            chunks[chunk_index].get_lines(chunk_index == last_index), line_index, None
+        )
+        for index in range(chunk_index + 1, len(chunks)):
+            yield from chunks[index].get_lines(index == last_index)
+
+    def _clamp_location(self, location: Location) -> Location:
+        """Clamp a location to the document.
+
+        Args:
+            location: A location which may be outside the document.
+
+        Returns:
+            A location within the document.
+        """
+        row, column = location
+        last_row = self.line_count - 1
+        if row > last_row:
+            return (last_row, len(self._lines[last_row]))
+        return (row, max(0, min(column, len(self._lines[row]))))
+
+    def _get_offset(self, location: Location) -> tuple[int, int]:
+        """Get the chunk which contains a location, and its offset in the chunk.
+
+        Args:
+            location: A location within the document.
+
+        Returns:
+            The index of the chunk, and an offset in the chunk's (normalized) text.
+        """
+        row, column = location
+        chunk_index, line_index = self._find_row(row)
+        return chunk_index, self._chunks[chunk_index].starts[line_index] + column
+
+    def replace_range(self, start: Location, end: Location, text: str) -> EditResult:
+        """Replace text at the given range.
+
+        This is the only method by which a document may be updated.
+
+        Args:
+            start: A tuple (row, column) where the edit starts.
+            end: A tuple (row, column) where the edit ends.
+            text: The text to insert between start and end.
+
+        Returns:
+            The EditResult containing information about the completed
+                replace operation.
+        """
+        top, bottom = sorted((self._clamp_location(start), self._clamp_location(end)))
+        replaced_text = self.get_text_range(top, bottom)
+        insert = _normalize_newlines(text)
+
+        top_chunk, top_offset = self._get_offset(top)
+        bottom_chunk, bottom_offset = self._get_offset(bottom)
+        chunks = self._chunks
+        new_text = (
+            chunks[top_chunk].text[:top_offset]
+            + insert
+            + chunks[bottom_chunk].text[bottom_offset:]
+        )
+        if len(new_text) < _MIN_CHUNK_SIZE and bottom_chunk < len(chunks) - 1:
+            # Merge small chunks, so edits don't leave many small chunks
+            bottom_chunk += 1
+            new_text += chunks[bottom_chunk].text
+        if len(new_text) > _MAX_CHUNK_SIZE:
+            new_chunks = [_Chunk(chunk) for chunk in _split_chunks(new_text)]
+        else:
+            new_chunks = [_Chunk(new_text)]
+
+        if len(new_chunks) == 1 and top_chunk == bottom_chunk:
+            chunk = new_chunks[0]
+            extra = self._newline_length - 1
+            chunks[top_chunk] = chunk
+            self._line_counts[top_chunk] = chunk.newlines
+            self._lengths[top_chunk] = len(chunk.text) + chunk.newlines * extra
+            self._byte_lengths[top_chunk] = chunk.byte_length + chunk.newlines * extra
+        else:
+            chunks[top_chunk : bottom_chunk + 1] = new_chunks
+            self._set_chunks(chunks)
+
+        top_row, top_column = top
+        insert_rows = insert.count("\n")
+        if insert_rows:
+            end_location = (top_row + insert_rows, len(insert) - insert.rfind("\n") - 1)
+        else:
+            end_location = (top_row, top_column + len(insert))
+        return EditResult(end_location, replaced_text)
+
+    def get_text_range(self, start: Location, end: Location) -> str:
+        """Get the text that falls between the start and end locations.
+
+        Args:
+            start: The start location of the selection.
+            end: The end location of the selection.
+
+        Returns:
+            The text between start (inclusive) and end (exclusive).
+        """
+        if start == end:
+            return ""
+        top, bottom = sorted((self._clamp_location(start), self._clamp_location(end)))
+        top_chunk, top_offset = self._get_offset(top)
+        bottom_chunk, bottom_offset = self._get_offset(bottom)
+        chunks = self._chunks
+        if top_chunk == bottom_chunk:
+            text = chunks[top_chunk].text[top_offset:bottom_offset]
+        else:
+            text = "".join(
+                [
+                    chunks[top_chunk].text[top_offset:],
+                    *[chunk.text for chunk in chunks[top_chunk + 1 : bottom_chunk]],
+                    chunks[bottom_chunk].text[:bottom_offset],
+                ]
+            )
+        if self._newline != "\n":
+            text = text.replace("\n", self._newline)
+        return text
+
+    def get_index_from_location(self, location: Location) -> int:
+        """Given a location, returns the index from the document's text.
+
+        Args:
+            location: The location in the document.
+
+        Returns:
+            The index in the document's text.
+        """
+        row, column = location
+        chunk_index, line_index = self._find_row(row)
+        start = self._chunks[chunk_index].starts[line_index]
+        return (
+            self._lengths.prefix_sum(chunk_index)
+            + start
+            + line_index * (self._newline_length - 1)
+            + column
+        )
+
+    def get_location_from_index(self, index: int) -> Location:
+        """Given an index in the document's text, returns the corresponding location.
+
+        Args:
+            index: The index in the document's text.
+
+        Returns:
+            The corresponding location.
+        """
+        lengths = self._lengths
+        chunk_index = min(lengths.find(index), len(self._chunks) - 1)
+        offset = index - lengths.prefix_sum(chunk_index)
+        chunk = self._chunks[chunk_index]
+        starts = chunk.starts
+        extra = self._newline_length - 1
+        # Find the last line which starts at or before the offset
+        low = 0
+        high = chunk.newlines
+        while low < high:
+            middle = (low + high + 1) // 2
+            if starts[middle] + middle * extra <= offset:
+                low = middle
+            else:
+                high = middle - 1
+        row = self._line_counts.prefix_sum(chunk_index) + low
+        return (row, offset - starts[low] - low * extra)
+
+    def _row_to_byte_offset(self, row: int) -> int:
+        """Get the utf-8 byte offset of the start of a row.
+
+        Args:
+            row: A row in the document.
+
+        Returns:
+            The number of bytes before the row (including line separators).
+        """
+        if row >= self.line_count:
+            return self._byte_lengths.total + self._newline_length
+        chunk_index, line_index = self._find_row(row)
+        chunk = self._chunks[chunk_index]
+        return (
+            self._byte_lengths.prefix_sum(chunk_index)
+            + chunk.get_byte_offset(chunk.starts[line_index])
+            + line_index * (self._newline_length - 1)
+        )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import List, NamedTuple, Tuple
+
 try:
     from tree_sitter import Language, Node, Parser, Tree
     from tree_sitter.binding import Query
@@ -11,12 +13,31 @@ except ImportError:
 
 from textual.document._document import Document, EditResult, Location, _utf8_encode
 from textual.document._languages import BUILTIN_LANGUAGES
+from textual.document._rope_document import RopeDocument, RopeSnapshot
 
 
 class SyntaxAwareDocumentError(Exception):
     """General error raised when SyntaxAwareDocument is used incorrectly."""
 
 
+class SyntaxChange(NamedTuple):
+    """An edit to a SyntaxAwareDocument, and the rows whose syntax it changed."""
+
+    top: int
+    """The first row of the edit."""
+    old_bottom: int
+    """The last row of the replaced text (before the edit)."""
+    new_bottom: int
+    """The last row of the inserted text (after the edit)."""
+    changed_rows: List[Tuple[int, int]]
+    """The first and last rows (after the edit) of each range whose syntax changed,
+    as reported by tree-sitter."""
+
+
+_MAX_SYNTAX_CHANGES = 1000
+"""Maximum number of changes which are recorded before they must be popped."""
+
+
 class SyntaxAwareDocument(Document):
     """A wrapper around a Document which also maintains a tree-sitter syntax
     tree when the document is edited.
@@ -76,6 +97,9 @@ class SyntaxAwareDocument(Document):
         self._syntax_tree: Tree = self._parser.parse(self._read_callable)  # type: ignore
         """The tree-sitter Tree (syntax tree) built from the document."""
 
+        self._syntax_changes: list[SyntaxChange] | None = []
+        """Changes since they were last popped, or `None` if there were too many."""
+
     @property
     def language_name(self) -> str | None:
         return self.language.name if self.language else None
@@ -140,6 +164,20 @@ class SyntaxAwareDocument(Document):
         captures = query.captures(self._syntax_tree.root_node, **captures_kwargs)
         return captures
 
+    def pop_syntax_changes(self) -> list[SyntaxChange] | None:
+        """Get the changes made by edits since this method was last called.
+
+        Changes are in the order they were made, so the rows of each change refer to
+        the document after the changes before it.
+
+        Returns:
+            The changes, or `None` if there were too many to record (in which case
+                the syntax of any row may have changed).
+        """
+        changes = self._syntax_changes
+        self._syntax_changes = []
+        return changes
+
     def replace_range(self, start: Location, end: Location, text: str) -> EditResult:
         """Replace text at the given range.
 
@@ -175,10 +213,29 @@ class SyntaxAwareDocument(Document):
             new_end_point=self._location_to_point(end_location),
         )
         # Incrementally parse the document.
+        old_syntax_tree = self._syntax_tree
         self._syntax_tree = self._parser.parse(
-            self._read_callable, self._syntax_tree  # type: ignore[arg-type]
+            self._read_callable, old_syntax_tree  # type: ignore[arg-type]
         )
 
+        changes = self._syntax_changes
+        if changes is not None:
+            if len(changes) >= _MAX_SYNTAX_CHANGES:
+                self._syntax_changes = None
+            else:
+                changed_ranges = old_syntax_tree.changed_ranges(self._syntax_tree)
+                changes.append(
+                    SyntaxChange(
+                        top[0],
+                        bottom[0],
+                        end_location[0],
+                        [
+                            (changed_range.start_point[0], changed_range.end_point[0])
+                            for changed_range in changed_ranges
+                        ],
+                    )
+                )
+
         return replace_result
 
     def get_line(self, line_index: int) -> str:
@@ -203,18 +260,10 @@ class SyntaxAwareDocument(Document):
         Returns:
             An integer byte offset for the given location.
         """
-        lines = self._lines
         row, column = location
-        lines_above = lines[:row]
-        end_of_line_width = len(self.newline)
-        bytes_lines_above = sum(
-            len(_utf8_encode(line)) + end_of_line_width for line in lines_above
-        )
-        if row < len(lines):
-            bytes_on_left = len(_utf8_encode(lines[row][:column]))
-        else:
-            bytes_on_left = 0
-        byte_offset = bytes_lines_above + bytes_on_left
+        byte_offset = self._row_to_byte_offset(row)
+        if row < self.line_count:
+            byte_offset += len(_utf8_encode(self._lines[row][:column]))
         return byte_offset
 
     def _location_to_point(self, location: Location) -> tuple[int, int]:
@@ -274,3 +323,21 @@ class SyntaxAwareDocument(Document):
                 return b"\n"
 
         return b""
+
+
+class SyntaxAwareRopeDocument(SyntaxAwareDocument, RopeDocument):
+    """A `RopeDocument` which also maintains a tree-sitter syntax tree when the
+    document is edited."""
+
+    def restore(self, snapshot: RopeSnapshot) -> None:
+        """Restore the content of the document from a snapshot.
+
+        The syntax tree is parsed again, so the syntax of any row may have changed.
+
+        Args:
+            snapshot: A snapshot from `RopeDocument.snapshot`.
+        """
+        super().restore(snapshot)
+        assert self._parser is not None
+        self._syntax_tree = self._parser.parse(self._read_callable)  # type: ignore
+        self._syntax_changes = None
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from array import array
 from bisect import bisect_right
+from itertools import accumulate
 
 from rich.text import Text
 
 from textual._cells import cell_len, cell_width_to_column_index
+from textual._fenwick_tree import FenwickTree
 from textual._wrap import compute_wrap_offsets
 from textual.document._document import DocumentBase, Location
 from textual.expand_tabs import expand_tabs_inline, get_tab_widths
@@ -14,12 +17,26 @@ VerticalOffset = int
 LineIndex = int
 SectionOffset = int
 
+_BLOCK_SIZE = 1024
+"""The number of lines in each block of line heights (when blocks are built)."""
+_MAX_BLOCK_SIZE = 2 * _BLOCK_SIZE
+"""Blocks with more lines than this are split."""
+
+_NO_WRAP_OFFSETS: list[int] = []
+"""The wrap offsets of lines which don't wrap (shared, and never modified)."""
+
 
 class WrappedDocument:
     """A view into a Document which wraps the document at a certain
     width and can be queried to retrieve lines from the *wrapped* version
     of the document.
 
+    Lines are wrapped lazily. When the width changes, the height of each line is
+    estimated from its length, and lines are wrapped when they are queried (or by
+    `wrap_pending`), which corrects their height. Heights are stored in an array,
+    and the sums of blocks of heights in a Fenwick tree, so offsets are mapped to
+    lines (and back again) without a list entry for every wrapped line.
+
     Allows for incremental updates, ensuring that we only re-wrap ranges of the document
     that were influenced by edits.
     """
@@ -43,20 +60,25 @@ class WrappedDocument:
         self.document = document
         """The document wrapping is performed on."""
 
-        self._wrap_offsets: list[list[int]] = []
+        self._wrap_offsets: list[list[int] | None] = []
         """Maps line indices to the offsets within the line where wrapping
-        breaks should be added."""
+        breaks should be added, or `None` if the line hasn't been wrapped yet."""
+
+        self._blocks: list[array[int]] = []
+        """The number of sections of each line (which is an estimate if the line
+        hasn't been wrapped yet), in blocks of consecutive lines."""
+
+        self._block_lines = FenwickTree()
+        """The number of lines in each block."""
 
-        self._tab_width_cache: list[list[int]] = []
-        """Maps line indices to a list of tab widths. `[[2, 4]]` means that on line 0, the first
-        tab has width 2, and the second tab has width 4."""
+        self._block_heights = FenwickTree()
+        """The sum of the heights of the lines in each block."""
 
-        self._offset_to_line_info: list[tuple[LineIndex, SectionOffset]] = []
-        """Maps y_offsets (from the top of the document) to line_index and the offset
-        of the section within the line."""
+        self._unwrapped_count = 0
+        """The number of lines which haven't been wrapped yet."""
 
-        self._line_index_to_offsets: list[list[VerticalOffset]] = []
-        """Maps line indices to all the vertical offsets which correspond to that line."""
+        self._pending_index = 0
+        """Where to start looking for lines which haven't been wrapped yet."""
 
         self._width: int = width
         """The width the document is currently wrapped at. This will correspond with
@@ -75,10 +97,24 @@ class WrappedDocument:
 
         In other words, this is True if the length of any line in the document is greater
         than the available width."""
-        return len(self._line_index_to_offsets) == len(self._offset_to_line_info)
+        return self._block_lines.total == self.height
+
+    @property
+    def width(self) -> int:
+        """The width the document is wrapped at (0 for no wrapping)."""
+        return self._width
+
+    @property
+    def unwrapped_line_count(self) -> int:
+        """The number of lines which haven't been wrapped yet (and whose heights are
+        estimated)."""
+        return self._unwrapped_count
 
     def wrap(self, width: int, tab_width: int | None = None) -> None:
-        """Wrap and cache all lines in the document.
+        """Wrap the document at a new width.
+
+        Lines are wrapped when they are queried, or by `wrap_pending`. Until then,
+        their heights are estimated from their length.
 
         Args:
             width: The width to wrap at. 0 for no wrapping.
@@ -89,43 +125,123 @@ class WrappedDocument:
         if tab_width:
             self._tab_width = tab_width
 
-        # We're starting wrapping from scratch
-        new_wrap_offsets: list[list[int]] = []
-        offset_to_line_info: list[tuple[LineIndex, SectionOffset]] = []
-        line_index_to_offsets: list[list[VerticalOffset]] = []
-        line_tab_widths: list[list[int]] = []
+        line_count = self.document.line_count
+        if width:
+            heights = array(
+                "q",
+                [
+                    (length - 1) // width + 1 if length > width else 1
+                    for length in map(len, self.document.lines)
+                ],
+            )
+            self._wrap_offsets = [None] * line_count
+            self._unwrapped_count = line_count
+        else:
+            heights = array("q", [1]) * line_count
+            self._wrap_offsets = [_NO_WRAP_OFFSETS] * line_count
+            self._unwrapped_count = 0
+        self._pending_index = 0
+        self._build_blocks(
+            [
+                heights[start : start + _BLOCK_SIZE]
+                for start in range(0, line_count, _BLOCK_SIZE)
+            ]
+        )
 
-        append_wrap_offset = new_wrap_offsets.append
-        append_line_info = offset_to_line_info.append
-        append_line_offsets = line_index_to_offsets.append
-        append_line_tab_widths = line_tab_widths.append
+    def wrap_pending(self, max_lines: int) -> bool:
+        """Wrap lines which haven't been wrapped yet, correcting their heights.
 
-        current_offset = 0
-        tab_width = self._tab_width
-        for line_index, line in enumerate(self.document.lines):
-            tab_sections = get_tab_widths(line, tab_width)
-            wrap_offsets = (
-                compute_wrap_offsets(
-                    line,
-                    width,
-                    tab_size=tab_width,
-                    precomputed_tab_sections=tab_sections,
-                )
-                if width
-                else []
+        Args:
+            max_lines: The maximum number of lines to wrap.
+
+        Returns:
+            True if every line is wrapped, otherwise False.
+        """
+        wrap_offsets = self._wrap_offsets
+        index = self._pending_index
+        while max_lines > 0 and self._unwrapped_count:
+            try:
+                index = wrap_offsets.index(None, index)
+            except ValueError:
+                index = wrap_offsets.index(None)
+            self._wrap_line(index)
+            max_lines -= 1
+        self._pending_index = index
+        return not self._unwrapped_count
+
+    def _build_blocks(self, blocks: list[array[int]]) -> None:
+        """Replace the blocks of line heights, and rebuild their sums.
+
+        Args:
+            blocks: Blocks of line heights.
+        """
+        self._blocks = blocks or [array("q")]
+        self._block_lines = FenwickTree([len(block) for block in self._blocks])
+        self._block_heights = FenwickTree([sum(block) for block in self._blocks])
+
+    def _locate(self, line_index: int) -> tuple[int, int]:
+        """Find the block which contains a line.
+
+        Args:
+            line_index: The index of a line in the document.
+
+        Returns:
+            The index of the block, and the index of the line in the block.
+        """
+        block_lines = self._block_lines
+        block = min(block_lines.find(line_index), len(self._blocks) - 1)
+        return block, line_index - block_lines.prefix_sum(block)
+
+    def _set_height(self, line_index: int, height: int) -> None:
+        """Set the height of a line.
+
+        Args:
+            line_index: The index of the line.
+            height: The number of sections in the line.
+        """
+        block, index = self._locate(line_index)
+        heights = self._blocks[block]
+        delta = height - heights[index]
+        if delta:
+            heights[index] = height
+            self._block_heights[block] = self._block_heights[block] + delta
+
+    def _compute_offsets(self, line: str) -> list[int]:
+        """Compute the wrap offsets of a line.
+
+        Args:
+            line: A line of the document.
+
+        Returns:
+            The offsets within the line where wrapping breaks should be added.
+        """
+        width = self._width
+        if not width or (len(line) <= width and line.isascii() and "\t" not in line):
+            return _NO_WRAP_OFFSETS
+        tab_sections = get_tab_widths(line, self._tab_width)
+        return (
+            compute_wrap_offsets(
+                line, width, self._tab_width, precomputed_tab_sections=tab_sections
             )
-            append_line_tab_widths([width for _, width in tab_sections])
-            append_wrap_offset(wrap_offsets)
-            append_line_offsets([])
-            for section_y_offset in range(len(wrap_offsets) + 1):
-                append_line_info((line_index, section_y_offset))
-                line_index_to_offsets[line_index].append(current_offset)
-                current_offset += 1
-
-        self._wrap_offsets = new_wrap_offsets
-        self._offset_to_line_info = offset_to_line_info
-        self._line_index_to_offsets = line_index_to_offsets
-        self._tab_width_cache = line_tab_widths
+            or _NO_WRAP_OFFSETS
+        )
+
+    def _wrap_line(self, line_index: int) -> list[int]:
+        """Wrap a line (if it hasn't been wrapped yet), correcting its height.
+
+        Args:
+            line_index: The index of the line.
+
+        Returns:
+            The offsets within the line where wrapping breaks should be added.
+        """
+        offsets = self._wrap_offsets[line_index]
+        if offsets is None:
+            offsets = self._compute_offsets(self.document[line_index])
+            self._wrap_offsets[line_index] = offsets
+            self._unwrapped_count -= 1
+            self._set_height(line_index, len(offsets) + 1)
+        return offsets
 
     @property
     def lines(self) -> list[list[str]]:
@@ -135,23 +251,70 @@ class WrappedDocument:
         document. The list[str] at each index is the content of the raw document line
         split into multiple lines via wrapping.
 
-        Note that this is expensive to compute and is not cached.
+        Note that this is expensive to compute (and wraps every line) and is not cached.
 
         Returns:
             A list of lines from the wrapped version of the document.
         """
         wrapped_lines: list[list[str]] = []
         append = wrapped_lines.append
+        wrap_line = self._wrap_line
         for line_index, line in enumerate(self.document.lines):
-            divided = Text(line).divide(self._wrap_offsets[line_index])
+            divided = Text(line).divide(wrap_line(line_index))
             append([section.plain for section in divided])
 
         return wrapped_lines
 
     @property
     def height(self) -> int:
-        """The height of the wrapped document."""
-        return sum(len(offsets) + 1 for offsets in self._wrap_offsets)
+        """The height of the wrapped document (which includes estimated heights of
+        lines which haven't been wrapped yet)."""
+        return self._block_heights.total
+
+    def get_line_offset(self, line_index: int) -> VerticalOffset:
+        """Get the vertical offset of the first section of a line.
+
+        Args:
+            line_index: The index of the line in the document.
+
+        Returns:
+            The y-offset of the line.
+        """
+        block, index = self._locate(line_index)
+        return self._block_heights.prefix_sum(block) + sum(self._blocks[block][:index])
+
+    def get_line_info(
+        self, y_offset: VerticalOffset
+    ) -> tuple[LineIndex, SectionOffset] | None:
+        """Get the line at a vertical offset, and the section of the line.
+
+        The line is wrapped (if it hasn't been already), so its height is exact,
+        although lines above it may have estimated heights.
+
+        Args:
+            y_offset: The y-offset within the wrapped document.
+
+        Returns:
+            A tuple of the line index and the section offset, or `None` if the offset
+                is outside of the document.
+        """
+        if y_offset < 0:
+            return None
+        block_heights = self._block_heights
+        while y_offset < block_heights.total:
+            block = block_heights.find(y_offset)
+            heights = self._blocks[block]
+            line_offsets = list(
+                accumulate(heights, initial=block_heights.prefix_sum(block))
+            )
+            index = bisect_right(line_offsets, y_offset) - 1
+            line_index = self._block_lines.prefix_sum(block) + index
+            # Wrapping the line corrects its height, but not the offset of its top
+            self._wrap_line(line_index)
+            section_offset = y_offset - line_offsets[index]
+            if section_offset < heights[index]:
+                return line_index, section_offset
+        return None
 
     def wrap_range(
         self,
@@ -176,7 +339,7 @@ class WrappedDocument:
         #  programmers can pass whatever they wish to the edit API, so we need to clamp
         #  the edit ranges here to ensure we only attempt to update within the bounds
         #  of the wrapped document.
-        old_max_index = len(self._line_index_to_offsets) - 1
+        old_max_index = self._block_lines.total - 1
         new_max_index = self.document.line_count - 1
 
         start_line_index = clamp(
@@ -190,89 +353,39 @@ class WrappedDocument:
         )
         new_bottom_line_index = max((start_line_index, new_end_line_index))
 
-        top_y_offset = self._line_index_to_offsets[top_line_index][0]
-        old_bottom_y_offset = self._line_index_to_offsets[old_bottom_line_index][-1]
-
-        # Get the new range of the edit from top to bottom.
+        # Get the new range of the edit from top to bottom, and wrap it.
         new_lines = self.document.lines[top_line_index : new_bottom_line_index + 1]
-
-        new_wrap_offsets: list[list[int]] = []
-        new_line_index_to_offsets: list[list[VerticalOffset]] = []
-        new_offset_to_line_info: list[tuple[LineIndex, SectionOffset]] = []
-        new_tab_widths: list[list[int]] = []
-
-        append_wrap_offsets = new_wrap_offsets.append
-        append_tab_widths = new_tab_widths.append
-
-        width = self._width
-        tab_width = self._tab_width
-
-        # Add the new offsets between the top and new bottom (the new post-edit offsets)
-        current_y_offset = top_y_offset
-        for line_index, line in enumerate(new_lines, top_line_index):
-            tab_sections = get_tab_widths(line, tab_width)
-            wrap_offsets = (
-                compute_wrap_offsets(
-                    line, width, tab_width, precomputed_tab_sections=tab_sections
-                )
-                if width
-                else []
+        compute_offsets = self._compute_offsets
+        new_wrap_offsets = [compute_offsets(line) for line in new_lines]
+
+        replaced = slice(top_line_index, old_bottom_line_index + 1)
+        self._unwrapped_count -= self._wrap_offsets[replaced].count(None)
+        self._wrap_offsets[replaced] = new_wrap_offsets
+        new_heights = array("q", [len(offsets) + 1 for offsets in new_wrap_offsets])
+
+        top_block, top_index = self._locate(top_line_index)
+        bottom_block, bottom_index = self._locate(old_bottom_line_index)
+        blocks = self._blocks
+        if top_block == bottom_block:
+            heights = blocks[top_block]
+            delta = sum(new_heights) - sum(heights[top_index : bottom_index + 1])
+            heights[top_index : bottom_index + 1] = new_heights
+            if 0 < len(heights) <= _MAX_BLOCK_SIZE:
+                self._block_lines[top_block] = len(heights)
+                self._block_heights[top_block] = self._block_heights[top_block] + delta
+                return
+        else:
+            heights = (
+                blocks[top_block][:top_index]
+                + new_heights
+                + blocks[bottom_block][bottom_index + 1 :]
             )
-            append_tab_widths([width for _, width in tab_sections])
-            append_wrap_offsets(wrap_offsets)
-
-            # Collect up the new y offsets for this document line
-            y_offsets_for_line: list[int] = []
-            for section_offset in range(len(wrap_offsets) + 1):
-                y_offsets_for_line.append(current_y_offset)
-                new_offset_to_line_info.append((line_index, section_offset))
-                current_y_offset += 1
-
-            # Save the new y offsets for this line
-            new_line_index_to_offsets.append(y_offsets_for_line)
-
-        # Replace the range start -> old with the new wrapped lines
-        self._offset_to_line_info[top_y_offset : old_bottom_y_offset + 1] = (
-            new_offset_to_line_info
-        )
-
-        self._line_index_to_offsets[top_line_index : old_bottom_line_index + 1] = (
-            new_line_index_to_offsets
-        )
-
-        self._tab_width_cache[top_line_index : old_bottom_line_index + 1] = (
-            new_tab_widths
-        )
-
-        # How much did the edit/rewrap alter the offsets?
-        old_height = old_bottom_y_offset - top_y_offset + 1
-        new_height = len(new_offset_to_line_info)
-
-        offset_shift = new_height - old_height
-        line_shift = new_bottom_line_index - old_bottom_line_index
-
-        # Update the line info at all offsets below the edit region.
-        if line_shift:
-            for y_offset in range(
-                top_y_offset + new_height, len(self._offset_to_line_info)
-            ):
-                old_line_index, section_offset = self._offset_to_line_info[y_offset]
-                new_line_index = old_line_index + line_shift
-                new_line_info = (new_line_index, section_offset)
-                self._offset_to_line_info[y_offset] = new_line_info
-
-        # Update the offsets at all lines below the edit region
-        if offset_shift:
-            for line_index in range(
-                top_line_index + len(new_lines), len(self._line_index_to_offsets)
-            ):
-                old_offsets = self._line_index_to_offsets[line_index]
-                new_offsets = [offset + offset_shift for offset in old_offsets]
-                self._line_index_to_offsets[line_index] = new_offsets
-
-        self._wrap_offsets[top_line_index : old_bottom_line_index + 1] = (
-            new_wrap_offsets
-        )
+        # The edit changed the number of blocks, so rebuild their sums
+        blocks[top_block : bottom_block + 1] = [
+            heights[start : start + _BLOCK_SIZE]
+            for start in range(0, len(heights), _BLOCK_SIZE)
+        ]
+        self._build_blocks(blocks)
 
     def offset_to_location(self, offset: Offset) -> Location:
         """Given an offset within the wrapped/visual display of the document,
@@ -301,11 +414,7 @@ class WrappedDocument:
         # Find the line corresponding to the given y offset in the wrapped document.
         get_target_document_column = self.get_target_document_column
 
-        try:
-            offset_data = self._offset_to_line_info[y]
-        except IndexError:
-            # y-offset is too large
-            offset_data = self._offset_to_line_info[-1]
+        offset_data = self.get_line_info(y)
 
         if offset_data is not None:
             line_index, section_y = offset_data
@@ -315,11 +424,10 @@ class WrappedDocument:
                 section_y,
             )
         else:
-            location = len(self._wrap_offsets) - 1, get_target_document_column(
-                -1, x, -1
-            )
+            # Offset doesn't match any line => land on bottom wrapped line
+            line_index = len(self._wrap_offsets) - 1
+            location = line_index, get_target_document_column(line_index, x, -1)
 
-        # Offset doesn't match any line => land on bottom wrapped line
         return location
 
     def location_to_offset(self, location: Location) -> Offset:
@@ -335,15 +443,15 @@ class WrappedDocument:
         line_index, column_index = location
 
         # Clamp the line index to the bounds of the document
-        line_index = clamp(line_index, 0, len(self._line_index_to_offsets))
+        line_index = clamp(line_index, 0, len(self._wrap_offsets))
 
         # Find the section index of this location, so that we know which y_offset to use
         wrap_offsets = self.get_offsets(line_index)
         section_start_columns = [0, *wrap_offsets]
         section_index = bisect_right(wrap_offsets, column_index)
 
-        # Get the y-offsets corresponding to this line index
-        y_offsets = self._line_index_to_offsets[line_index]
+        # Get the y-offset of the section
+        y_offset = self.get_line_offset(line_index) + section_index
         section_column_index = column_index - section_start_columns[section_index]
 
         section = self.get_sections(line_index)[section_index]
@@ -351,7 +459,7 @@ class WrappedDocument:
             expand_tabs_inline(section[:section_column_index], self._tab_width)
         )
 
-        return Offset(x_offset, y_offsets[section_index])
+        return Offset(x_offset, y_offset)
 
     def get_target_document_column(
         self,
@@ -414,7 +522,7 @@ class WrappedDocument:
         Returns:
             The wrapped line as a list of strings.
         """
-        line_offsets = self._wrap_offsets[line_index]
+        line_offsets = self._wrap_line(line_index)
         wrapped_lines = Text(self.document[line_index], end="").divide(line_offsets)
         return [line.plain for line in wrapped_lines]
 
@@ -431,14 +539,14 @@ class WrappedDocument:
         Returns:
             The offsets within the line where wrapping should occur.
         """
-        wrap_offsets = self._wrap_offsets
-        out_of_bounds = line_index < 0 or line_index >= len(wrap_offsets)
+        line_count = len(self._wrap_offsets)
+        out_of_bounds = line_index < 0 or line_index >= line_count
         if out_of_bounds:
             raise ValueError(
                 f"The document line index {line_index!r} is out of bounds. "
-                f"The document contains {len(wrap_offsets)!r} lines."
+                f"The document contains {line_count!r} lines."
             )
-        return wrap_offsets[line_index]
+        return self._wrap_line(line_index)
 
     def get_tab_widths(self, line_index: int) -> list[int]:
         """Return a list of the tab widths for the given line index.
@@ -449,4 +557,5 @@ class WrappedDocument:
         Returns:
             An ordered list of the expanded width of the tabs in the line.
         """
-        return self._tab_width_cache[line_index]
+        line = self.document[line_index]
+        return [width for _, width in get_tab_widths(line, self._tab_width)]
@@ -37,6 +37,7 @@ from .color import BLACK, WHITE, Color
 from .css._error_tools import friendly_list
 from .css.constants import VALID_DISPLAY, VALID_VISIBILITY
 from .css.errors import DeclarationError, StyleValueError
+from .css.match import get_bloom
 from .css.parse import parse_declarations
 from .css.styles import RenderStyles, Styles
 from .css.tokenize import IDENTIFIER
@@ -117,8 +118,10 @@ class _ClassesDescriptor:
         else:
             class_names = set(classes)
         check_identifiers("class name", *class_names)
+        changed_classes = obj._classes ^ class_names
         obj._classes = class_names
-        obj._update_styles()
+        obj._selector_bloom_cache = None
+        obj._update_styles(f".{class_name}" for class_name in changed_classes)
 
 
 @rich.repr.auto
@@ -174,6 +177,7 @@ class DOMNode(MessagePump):
         classes: str | None = None,
     ) -> None:
         self._classes: set[str] = set()
+        self._selector_bloom_cache: int | None = None
         self._name = name
         self._id = None
         if id is not None:
@@ -695,6 +699,7 @@ class DOMNode(MessagePump):
                 f"Node 'id' attribute may not be changed once set (current id={self._id!r})"
             )
         self._id = new_id
+        self._selector_bloom_cache = None
         return new_id
 
     @property
@@ -767,6 +772,22 @@ class DOMNode(MessagePump):
             selectors.add(f"#{self._id}")
         return selectors
 
+    @property
+    def _selector_bloom(self) -> int:
+        """A bloom filter of the selector names applicable to this node.
+
+        Used to quickly reject selectors which require an ancestor that isn't present.
+
+        Returns:
+            A bloom filter.
+        """
+        selector_bloom = self._selector_bloom_cache
+        if selector_bloom is None:
+            selector_bloom = self._selector_bloom_cache = get_bloom(
+                self._selector_names
+            )
+        return selector_bloom
+
     @property
     def display(self) -> bool:
         """Should the DOM node be displayed?
@@ -1150,6 +1171,7 @@ class DOMNode(MessagePump):
             if isinstance(node, Widget):
                 node._set_dirty()
                 node._layout_required = True
+                node._layout_updates += 1
 
     def _add_child(self, node: Widget) -> None:
         """Add a new child node.
@@ -1361,13 +1383,18 @@ class DOMNode(MessagePump):
         self.classes = classes
         return self
 
-    def _update_styles(self) -> None:
+    def _update_styles(self, selector_names: Iterable[str] | None = None) -> None:
         """Request an update of this node's styles.
 
         Should be called whenever CSS classes / pseudo classes change.
+
+        Args:
+            selector_names: The classes (e.g. `".active"`) or pseudo classes
+                (e.g. `":hover"`) which changed, or `None` to update the node and
+                all its descendants.
         """
         try:
-            self.app.update_styles(self)
+            self.app.update_styles(self, selector_names)
         except NoActiveAppError:
             pass
 
@@ -1386,8 +1413,11 @@ class DOMNode(MessagePump):
         self._classes.update(class_names)
         if old_classes == self._classes:
             return self
+        self._selector_bloom_cache = None
         if update:
-            self._update_styles()
+            self._update_styles(
+                f".{class_name}" for class_name in self._classes ^ old_classes
+            )
         return self
 
     def remove_class(self, *class_names: str, update: bool = True) -> Self:
@@ -1405,8 +1435,11 @@ class DOMNode(MessagePump):
         self._classes.difference_update(class_names)
         if old_classes == self._classes:
             return self
+        self._selector_bloom_cache = None
         if update:
-            self._update_styles()
+            self._update_styles(
+                f".{class_name}" for class_name in self._classes ^ old_classes
+            )
         return self
 
     def toggle_class(self, *class_names: str) -> Self:
@@ -1423,7 +1456,10 @@ class DOMNode(MessagePump):
         self._classes.symmetric_difference_update(class_names)
         if old_classes == self._classes:
             return self
-        self._update_styles()
+        self._selector_bloom_cache = None
+        self._update_styles(
+            f".{class_name}" for class_name in self._classes ^ old_classes
+        )
         return self
 
     def has_pseudo_class(self, class_name: str) -> bool:
@@ -32,6 +32,7 @@ from ._callback import invoke
 from ._compositor import Compositor, MapGeometry
 from ._context import active_message_pump, visible_screen_stack
 from ._path import CSSPathType, _css_path_type_as_list, _make_path_object_relative
+from ._profile import trace_startup
 from ._types import CallbackType
 from .binding import Binding
 from .css.match import match
@@ -192,7 +193,7 @@ class Screen(Generic[ScreenResultType], Widget):
         """
         self._modal = False
         super().__init__(name=name, id=id, classes=classes)
-        self._compositor = Compositor()
+        self._compositor = Compositor(damage_tracking=constants.DAMAGE_TRACKING)
         self._dirty_widgets: set[Widget] = set()
         self.__update_timer: Timer | None = None
         self._callbacks: list[tuple[CallbackType, MessagePump]] = []
@@ -751,6 +752,7 @@ class Screen(Generic[ScreenResultType], Widget):
         """Remove the latest result callback from the stack."""
         self._result_callbacks.pop()
 
+    @trace_startup("Screen._refresh_layout")
     def _refresh_layout(self, size: Size | None = None, scroll: bool = False) -> None:
         """Refresh the layout (can change size and positions of widgets)."""
         size = self.outer_size if size is None else size
@@ -874,6 +876,7 @@ class Screen(Generic[ScreenResultType], Widget):
         self.app._set_mouse_over(None)
         self._clear_tooltip()
         self.stack_updates += 1
+        self._compositor.reset_front_buffer()
 
     async def _on_resize(self, event: events.Resize) -> None:
         event.stop()
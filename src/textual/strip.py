@@ -6,7 +6,7 @@ See [line API](/guide/widgets#line-api) for how to use Strips.
 from __future__ import annotations
 
 from itertools import chain
-from typing import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
 
 import rich.repr
 from rich.cells import cell_len, set_cell_size
@@ -21,6 +21,11 @@ from .color import Color
 from .constants import DEBUG
 from .filter import LineFilter
 
+if TYPE_CHECKING:
+    from rich.color import ColorSystem
+
+    from ._sgr import EncodedSegments, SGREncoder
+
 
 def get_line_length(segments: Iterable[Segment]) -> int:
     """Get the line length (total length of all segments).
@@ -79,6 +84,7 @@ class Strip:
         "_style_cache",
         "_filter_cache",
         "_render_cache",
+        "_sgr_cache",
         "_line_length_cache",
         "_crop_extend_cache",
         "_link_ids",
@@ -102,6 +108,7 @@ class Strip:
             Strip,
         ] = FIFOCache(4)
         self._render_cache: str | None = None
+        self._sgr_cache: tuple[ColorSystem | None, EncodedSegments] | None = None
         self._link_ids: set[str] | None = None
 
         if DEBUG and cell_length is not None:
@@ -484,3 +491,22 @@ class Strip:
                 ]
             )
         return self._render_cache
+
+    def render_sgr(self, encoder: SGREncoder) -> str:
+        """Render the strip into terminal sequences, emitting only the style changes required
+        from the encoder's current pen.
+
+        Args:
+            encoder: An SGR encoder.
+
+        Returns:
+            Rendered sequences.
+        """
+        color_system = encoder.color_system
+        cached = self._sgr_cache
+        if cached is None or cached[0] != color_system:
+            cached = self._sgr_cache = (
+                color_system,
+                encoder.encode_segments(self._segments),
+            )
+        return encoder.write(cached[1])
@@ -2,17 +2,31 @@
 
 Timer objects are created by [set_interval][textual.message_pump.MessagePump.set_interval] or
     [set_timer][textual.message_pump.MessagePump.set_timer].
+
+Timers don't run in tasks of their own. All the timers for an event loop are driven by a single
+[TimerScheduler][textual.timer.TimerScheduler], which sleeps until the next timer is due.
 """
 
 from __future__ import annotations
 
 import weakref
-from asyncio import CancelledError, Event, Task, create_task
-from typing import Any, Awaitable, Callable, Union
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    Future,
+    Task,
+    create_task,
+    get_running_loop,
+)
+from contextvars import Context, copy_context
+from heapq import heappop, heappush
+from inspect import isawaitable
+from itertools import count as counter
+from typing import Any, Awaitable, Callable, NamedTuple, Union
 
 from rich.repr import Result, rich_repr
 
-from . import _time, events
+from . import _time, constants, events
 from ._callback import invoke
 from ._context import active_app
 from ._time import sleep
@@ -21,11 +35,195 @@ from ._types import MessageTarget
 TimerCallback = Union[Callable[[], Awaitable[Any]], Callable[[], Any]]
 """Type of valid callbacks to be used with timers."""
 
+COALESCE_TIME = 1 / (constants.MAX_FPS * 4)
+"""Timers due within this many seconds of each other are run in the same wakeup."""
+
 
 class EventTargetGone(Exception):
     pass
 
 
+class TimerStats(NamedTuple):
+    """Statistics from a [TimerScheduler][textual.timer.TimerScheduler]."""
+
+    active_timers: int
+    """Number of timers which have been started, and not stopped or finished."""
+    wakeups: int
+    """Total number of times the scheduler woke up to run timers."""
+    ticks: int
+    """Total number of timer ticks."""
+    wakeups_per_second: float
+    """Wakeups per second, measured over the last second."""
+
+
+def _set_wakeup(wakeup: Future[None]) -> None:
+    """Wake the scheduler, if it isn't already awake."""
+    if not wakeup.done():
+        wakeup.set_result(None)
+
+
+class TimerScheduler:
+    """Runs all the timers for an event loop from a single task.
+
+    Due times are stored in a heap. The scheduler task sleeps until the earliest is due, then
+    runs every timer due within [COALESCE_TIME][textual.timer.COALESCE_TIME].
+    """
+
+    def __init__(self) -> None:
+        self._queue: list[tuple[float, int, Timer]] = []
+        """Heap of (due time, sequence, timer). Entries are stale if the sequence doesn't match the timer's."""
+        self._sequence = counter()
+        self._timers: set[Timer] = set()
+        """Timers which have been started, and not stopped or finished."""
+        self._task: Task[None] | None = None
+        self._wakeup: Future[None] | None = None
+        self._wakeup_time: float | None = None
+        """Time the scheduler will next wake up, or `None` if it is awake."""
+        self._wakeups = 0
+        self._ticks = 0
+        self._window_start = _time.get_time()
+        self._window_wakeups = 0
+        self._wakeups_per_second = 0.0
+
+    @property
+    def stats(self) -> TimerStats:
+        """Statistics for diagnosing timers."""
+        return TimerStats(
+            len(self._timers), self._wakeups, self._ticks, self._wakeups_per_second
+        )
+
+    def _add(self, timer: Timer) -> None:
+        """Add a started timer."""
+        self._timers.add(timer)
+
+    def _remove(self, timer: Timer) -> None:
+        """Remove a stopped or finished timer."""
+        self._timers.discard(timer)
+        timer._sequence = None
+        if not self._timers and self._wakeup is not None:
+            # Let the task exit
+            _set_wakeup(self._wakeup)
+
+    def _schedule(self, timer: Timer, due: float) -> None:
+        """Schedule a timer tick.
+
+        Args:
+            timer: The timer.
+            due: Time the timer is due.
+        """
+        sequence = next(self._sequence)
+        timer._sequence = sequence
+        heappush(self._queue, (due, sequence, timer))
+        if self._task is None:
+            self._task = create_task(self._run(), name="TimerScheduler")
+        elif (
+            self._wakeup is not None
+            and self._wakeup_time is not None
+            and due < self._wakeup_time
+        ):
+            _set_wakeup(self._wakeup)
+
+    def _wait(self, loop: AbstractEventLoop, delay: float) -> Future[None]:
+        """Get a future which completes after a delay, or when the scheduler is woken.
+
+        Args:
+            loop: The event loop.
+            delay: Delay in seconds.
+
+        Returns:
+            A future.
+        """
+        wakeup = loop.create_future()
+        if delay <= COALESCE_TIME:
+            loop.call_soon(_set_wakeup, wakeup)
+        elif _time.WINDOWS:
+            # Use Textual's sleep, which is more accurate than asyncio on Windows
+            sleep_task = create_task(sleep(delay))
+            sleep_task.add_done_callback(lambda _: _set_wakeup(wakeup))
+            wakeup.add_done_callback(lambda _: sleep_task.cancel())
+        else:
+            # asyncio tends to oversleep by half a millisecond
+            handle = loop.call_later(delay - 0.0005, _set_wakeup, wakeup)
+            wakeup.add_done_callback(lambda _: handle.cancel())
+        return wakeup
+
+    async def _run(self) -> None:
+        """Run the scheduler task, until there are no more scheduled timers."""
+        loop = get_running_loop()
+        queue = self._queue
+        try:
+            while True:
+                while queue and queue[0][1] != queue[0][2]._sequence:
+                    heappop(queue)
+                if not queue or not self._timers:
+                    queue.clear()
+                    break
+                due = queue[0][0]
+                self._wakeup_time = due
+                self._wakeup = self._wait(loop, due - _time.get_time())
+                await self._wakeup
+                self._wakeup = self._wakeup_time = None
+                self._process()
+        finally:
+            self._wakeup = self._wakeup_time = None
+            self._task = None
+
+    def _process(self) -> None:
+        """Run all the timers which are due."""
+        now = _time.get_time()
+        self._wakeups += 1
+        self._window_wakeups += 1
+        if now - self._window_start >= 1:
+            self._wakeups_per_second = self._window_wakeups / (now - self._window_start)
+            self._window_start = now
+            self._window_wakeups = 0
+
+        queue = self._queue
+        due_time = now + COALESCE_TIME
+        due_timers: list[Timer] = []
+        while queue and queue[0][0] <= due_time:
+            _, sequence, timer = heappop(queue)
+            if sequence == timer._sequence:
+                timer._sequence = None
+                due_timers.append(timer)
+        for timer in due_timers:
+            if timer._sequence is None and timer in self._timers:
+                self._ticks += 1
+                try:
+                    timer._on_due()
+                except Exception as error:
+                    # Don't let one timer stop the scheduler, or the timers due after it
+                    timer.stop()
+                    timer._handle_exception(error)
+
+
+_schedulers: weakref.WeakKeyDictionary[AbstractEventLoop, TimerScheduler] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_timer_scheduler() -> TimerScheduler:
+    """Get the timer scheduler for the running event loop.
+
+    Returns:
+        A timer scheduler.
+    """
+    loop = get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = TimerScheduler()
+    return scheduler
+
+
+def get_timer_stats() -> TimerStats:
+    """Get statistics for the timers in the running event loop.
+
+    Returns:
+        Timer statistics.
+    """
+    return get_timer_scheduler().stats
+
+
 @rich_repr
 class Timer:
     """A class to send timer-based events.
@@ -61,11 +259,22 @@ class Timer:
         self._callback = callback
         self._repeat = repeat
         self._skip = skip
-        self._active = Event()
-        self._task: Task | None = None
+        self._active = not pause
         self._reset: bool = False
-        if not pause:
-            self._active.set()
+        self._scheduler: TimerScheduler | None = None
+        self._context: Context | None = None
+        """Context the timer was started in, which callbacks are run in."""
+        self._task: Task | None = None
+        """Task running an async callback."""
+        self._sequence: int | None = None
+        """Sequence number of the scheduled tick, or `None` if no tick is scheduled."""
+        self._started = False
+        """Has the timer started counting?"""
+        self._pending = False
+        """Is there a tick waiting for the timer to be resumed?"""
+        self._start_time = 0.0
+        self._next_time = 0.0
+        self._count = 0
 
     def __rich_repr__(self) -> Result:
         yield self._interval
@@ -81,79 +290,143 @@ class Timer:
 
     def _start(self) -> None:
         """Start the timer."""
-        self._task = create_task(self._run_timer(), name=self.name)
+        self._context = copy_context()
+        self._scheduler = scheduler = get_timer_scheduler()
+        scheduler._add(self)
+        if self._active:
+            self._begin()
 
     def stop(self) -> None:
         """Stop the timer."""
-        if self._task is not None:
-            self._active.set()
-            self._task.cancel()
-            self._task = None
+        if self._scheduler is not None:
+            self._active = True
+            self._scheduler._remove(self)
+            self._scheduler = None
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
 
     def pause(self) -> None:
         """Pause the timer.
 
         A paused timer will not send events until it is resumed.
         """
-        self._active.clear()
+        self._active = False
 
     def reset(self) -> None:
         """Reset the timer, so it starts from the beginning."""
-        self._active.set()
         self._reset = True
+        self.resume()
 
     def resume(self) -> None:
         """Resume a paused timer."""
-        self._active.set()
+        self._active = True
+        if self._scheduler is None:
+            return
+        if not self._started:
+            self._begin()
+        elif self._pending and self._sequence is None and self._task is None:
+            self._scheduler._schedule(self, _time.get_time())
 
-    async def _run_timer(self) -> None:
-        """Run the timer task."""
-        try:
-            await self._run()
-        except CancelledError:
-            pass
+    def _begin(self) -> None:
+        """Start counting intervals from now."""
+        self._started = True
+        self._start_time = _time.get_time()
+        self._count = 0
+        self._schedule_next()
 
-    async def _run(self) -> None:
-        """Run the timer."""
-        count = 0
-        _repeat = self._repeat
-        _interval = self._interval
-        await self._active.wait()
-        start = _time.get_time()
-
-        while _repeat is None or count <= _repeat:
-            next_timer = start + ((count + 1) * _interval)
-            now = _time.get_time()
+    def _schedule_next(self) -> None:
+        """Schedule the next tick, or finish the timer if there are no more repeats."""
+        scheduler = self._scheduler
+        if scheduler is None:
+            return
+        count = self._count
+        repeat = self._repeat
+        interval = self._interval
+        now = _time.get_time()
+        while repeat is None or count <= repeat:
+            next_timer = self._start_time + ((count + 1) * interval)
             if self._skip and next_timer < now:
                 count += 1
                 continue
-            now = _time.get_time()
-            wait_time = max(0, next_timer - now)
-            await sleep(wait_time)
-            count += 1
-            await self._active.wait()
-            if self._reset:
-                start = _time.get_time()
-                count = 0
-                self._reset = False
-                continue
-            try:
-                await self._tick(next_timer=next_timer, count=count)
-            except EventTargetGone:
-                break
+            self._count = count
+            self._next_time = next_timer
+            scheduler._schedule(self, next_timer)
+            return
+        scheduler._remove(self)
+        self._scheduler = None
 
-    async def _tick(self, *, next_timer: float, count: int) -> None:
-        """Triggers the Timer's action: either call its callback, or sends an event to its target"""
+    def _on_due(self) -> None:
+        """Called by the scheduler when the timer is due."""
+        if not self._pending:
+            self._count += 1
+        if not self._active:
+            # Tick when resumed
+            self._pending = True
+            return
+        self._pending = False
+        if self._reset:
+            self._reset = False
+            self._begin()
+            return
+        assert self._context is not None
+        try:
+            awaitable = self._context.run(
+                self._tick, next_timer=self._next_time, count=self._count
+            )
+        except EventTargetGone:
+            self.stop()
+            return
+        if awaitable is None:
+            self._schedule_next()
+        else:
+            self._task = self._context.run(
+                create_task, self._run_callback(awaitable), name=self.name
+            )
+
+    async def _run_callback(self, awaitable: Awaitable[Any]) -> None:
+        """Await the result of an async callback, then schedule the next tick."""
+        try:
+            await awaitable
+        except CancelledError:
+            return
+        except Exception as error:
+            self._handle_exception(error)
+        self._task = None
+        self._schedule_next()
+
+    def _handle_exception(self, error: Exception) -> None:
+        """Report an exception to the app the timer was started in, or to the event loop
+        if there is no app.
+
+        Args:
+            error: The exception.
+        """
+        app = None if self._context is None else self._context.get(active_app)
+        if app is None:
+            get_running_loop().call_exception_handler(
+                {"message": f"Exception in {self.name}", "exception": error}
+            )
+        else:
+            app._handle_exception(error)
+
+    def _tick(self, *, next_timer: float, count: int) -> Awaitable[Any] | None:
+        """Triggers the Timer's action: either call its callback, or sends an event to its target.
+
+        Returns:
+            An awaitable if the callback is async, otherwise `None`.
+        """
         if self._callback is not None:
+            app = active_app.get(None)
+            if app is not None and "debug" in app.features:
+                # Invoke warns about callbacks which are slow to complete
+                return invoke(self._callback)
             try:
-                await invoke(self._callback)
-            except CancelledError:
-                # https://github.com/Textualize/textual/pull/2895
-                # Re-raise CancelledErrors that would be caught by the following exception block in Python 3.7
-                raise
+                result = self._callback()
             except Exception as error:
-                app = active_app.get()
-                app._handle_exception(error)
+                self._handle_exception(error)
+                return None
+            return result if isawaitable(result) else None
         else:
             event = events.Timer(
                 timer=self,
@@ -162,3 +435,4 @@ class Timer:
                 callback=self._callback,
             )
             self.target.post_message(event)
+            return None
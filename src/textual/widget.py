@@ -358,6 +358,12 @@ class Widget(DOMNode):
         self._arrangement_cache: FIFOCache[tuple[Size, int], DockArrangeResult] = (
             FIFOCache(4)
         )
+        # The most recent arrangement (survives clearing the cache)
+        self._previous_arrangement: DockArrangeResult | None = None
+
+        # Incremented when the layout of this widget (or a descendant) may have changed
+        self._layout_updates = 0
+        self._box_model_cache: FIFOCache[tuple[object, ...], BoxModel] = FIFOCache(4)
 
         self._styles_cache = StylesCache()
         self._rich_style_cache: dict[str, tuple[Style, Style]] = {}
@@ -602,6 +608,7 @@ class Widget(DOMNode):
         """
         self._content_width_cache = (None, 0)
         self._content_height_cache = (None, 0)
+        self._layout_updates += 1
 
     def get_loading_widget(self) -> Widget:
         """Get a widget to display a loading indicator.
@@ -794,6 +801,13 @@ class Widget(DOMNode):
         arrangement = self._arrangement_cache[cache_key] = arrange(
             self, self._nodes, size, self.screen.size
         )
+        previous_arrangement = self._previous_arrangement
+        if (
+            previous_arrangement is not None
+            and previous_arrangement._spatial_map is not None
+        ):
+            arrangement._previous = previous_arrangement
+        self._previous_arrangement = arrangement
 
         return arrangement
 
@@ -1116,6 +1130,19 @@ class Widget(DOMNode):
         Returns:
             The size and margin for this widget.
         """
+        cache_key = (
+            container,
+            viewport,
+            width_fraction,
+            height_fraction,
+            self._layout_updates,
+            self._nodes._updates,
+            self.styles._cache_key,
+        )
+        cached_model = self._box_model_cache.get(cache_key)
+        if cached_model is not None:
+            return cached_model
+
         styles = self.styles
         _content_width, _content_height = container
         content_width = Fraction(_content_width)
@@ -1218,7 +1245,7 @@ class Widget(DOMNode):
 
         content_height = max(Fraction(0), content_height)
 
-        model = BoxModel(
+        model = self._box_model_cache[cache_key] = BoxModel(
             content_width + gutter.width, content_height + gutter.height, margin
         )
         return model
@@ -3125,11 +3152,11 @@ class Widget(DOMNode):
     def watch_mouse_over(self, value: bool) -> None:
         """Update from CSS if mouse over state changes."""
         if self._has_hover_style:
-            self._update_styles()
+            self._update_styles([":hover"])
 
     def watch_has_focus(self, value: bool) -> None:
         """Update from CSS if has focus state changes."""
-        self._update_styles()
+        self._update_styles([":focus", ":blur"])
 
     def watch_disabled(self) -> None:
         """Update the styles of the widget and its children when disabled is toggled."""
@@ -3328,9 +3355,11 @@ class Widget(DOMNode):
             return self
         if layout:
             self._layout_required = True
+            self._layout_updates += 1
             for ancestor in self.ancestors:
                 if not isinstance(ancestor, Widget):
                     break
+                ancestor._layout_updates += 1
                 ancestor._clear_arrangement_cache()
 
         if recompose:
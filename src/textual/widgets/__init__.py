@@ -17,6 +17,7 @@ if typing.TYPE_CHECKING:
     from ._data_table import DataTable
     from ._digits import Digits
     from ._directory_tree import DirectoryTree
+    from ._file_log import FileLog
     from ._footer import Footer
     from ._header import Header
     from ._input import Input
@@ -54,6 +55,7 @@ __all__ = [
     "DataTable",
     "Digits",
     "DirectoryTree",
+    "FileLog",
     "Footer",
     "Header",
     "Input",
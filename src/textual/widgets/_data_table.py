@@ -1,10 +1,24 @@
 from __future__ import annotations
 
 import functools
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from itertools import chain, zip_longest
 from operator import itemgetter
-from typing import Any, Callable, ClassVar, Generic, Iterable, NamedTuple, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
 import rich.repr
 from rich.console import RenderableType
@@ -15,7 +29,8 @@ from rich.style import Style
 from rich.text import Text, TextType
 from typing_extensions import Literal, Self, TypeAlias
 
-from .. import events
+from .. import events, work
+from .._fenwick_tree import FenwickTree
 from .._segment_tools import line_crop
 from .._two_way_dict import TwoWayDict
 from .._types import SegmentLines
@@ -31,6 +46,7 @@ from ..renderables.styled import Styled
 from ..scroll_view import ScrollView
 from ..strip import Strip
 from ..widget import PseudoClasses
+from ..worker import Worker, get_current_worker
 
 CellCacheKey: TypeAlias = (
     "tuple[RowKey, ColumnKey, Style, bool, bool, bool, int, PseudoClasses]"
@@ -211,6 +227,328 @@ class RowRenderables(NamedTuple):
     cells: list[RenderableType]
 
 
+def _get_row_values(
+    row_data: dict[ColumnKey, Any], columns: tuple[ColumnKey | str, ...]
+) -> Any:
+    """Get the values to sort or filter a row by.
+
+    Args:
+        row_data: The cells in a row.
+        columns: Columns to get values from, or an empty tuple for all columns.
+
+    Returns:
+        A single value if there is one column, otherwise a tuple of values.
+    """
+    if columns:
+        return itemgetter(*columns)(row_data)
+    return tuple(row_data.values())
+
+
+class _RowSort(NamedTuple):
+    """A sort applied to the rows of a DataTable."""
+
+    columns: tuple[ColumnKey | str, ...]
+    key: Callable[[Any], Any] | None
+    reverse: bool
+
+    def get_key(self, row_data: dict[ColumnKey, Any]) -> Any:
+        """Get the sort key for a row."""
+        result = _get_row_values(row_data, self.columns)
+        if self.key is not None:
+            return self.key(result)
+        return result
+
+    def uses_column(self, column_key: ColumnKey) -> bool:
+        """Does the sort use values from the given column?"""
+        return not self.columns or column_key in self.columns
+
+
+class _RowFilter(NamedTuple):
+    """A filter applied to the rows of a DataTable."""
+
+    columns: tuple[ColumnKey | str, ...]
+    predicate: Callable[[Any], bool]
+
+    def matches(self, row_data: dict[ColumnKey, Any]) -> bool:
+        """Check if a row should be displayed."""
+        return bool(self.predicate(_get_row_values(row_data, self.columns)))
+
+    def uses_column(self, column_key: ColumnKey) -> bool:
+        """Does the filter use values from the given column?"""
+        return not self.columns or column_key in self.columns
+
+
+def _order_rows(
+    rows: list[tuple[RowKey, dict[ColumnKey, Any]]],
+    row_sort: _RowSort | None,
+    row_filter: _RowFilter | None,
+    worker: Worker | None = None,
+) -> tuple[list[RowKey], list[RowKey]] | None:
+    """Sort and filter rows.
+
+    This doesn't access the DataTable, so that it may be run in a thread.
+
+    Args:
+        rows: Pairs of row key and row data.
+        row_sort: Sort to apply, or `None` to keep the current order.
+        row_filter: Filter to apply, or `None` to display every row.
+        worker: The worker running the sort, to check for cancellation.
+
+    Returns:
+        A list of every row key in order, and a list of the row keys to display, or
+            `None` if the worker was cancelled.
+    """
+    if row_sort is not None:
+        get_key = row_sort.get_key
+        rows = sorted(rows, key=lambda row: get_key(row[1]), reverse=row_sort.reverse)
+    if worker is not None and worker.is_cancelled:
+        return None
+    row_order = [row_key for row_key, _ in rows]
+    if row_filter is None:
+        return row_order, row_order
+    matches = row_filter.matches
+    visible_rows: list[RowKey] = []
+    for row_index, (row_key, row_data) in enumerate(rows):
+        if worker is not None and not row_index % 1000 and worker.is_cancelled:
+            return None
+        if matches(row_data):
+            visible_rows.append(row_key)
+    return row_order, visible_rows
+
+
+class ReadOnlyRows(Exception):
+    """Raised when attempting to add, remove, update, or sort the rows of a
+    DataTable which has a source (see [`DataTable.set_source`][textual.widgets.DataTable.set_source]).
+    """
+
+
+class DataTableSource(ABC, Generic[CellType]):
+    """Provides the rows of a DataTable in virtual mode.
+
+    Rows are requested in pages, as they are displayed, so a source may
+    be backed by a large (or remote) data set without loading it in to the DataTable.
+    """
+
+    @property
+    @abstractmethod
+    def row_count(self) -> int:
+        """The number of rows."""
+
+    @abstractmethod
+    def get_rows(self, start: int, stop: int) -> Sequence[Sequence[CellType]]:
+        """Get a range of rows.
+
+        Args:
+            start: Index of the first row.
+            stop: Index of the row after the last row.
+
+        Returns:
+            A sequence of rows, each of which is a sequence of cells (one per column).
+        """
+
+    def get_column_widths(self) -> Sequence[int] | None:
+        """Get the widths of the content of the columns, if known.
+
+        Override this method to set the widths of auto-width columns. If this
+        method returns `None`, column widths are measured from the rows which have
+        been fetched (so they may grow as the table is scrolled).
+
+        Returns:
+            A sequence of widths (one per column), or `None` if the widths aren't known.
+        """
+        return None
+
+    def get_column(self, column_index: int) -> Iterable[CellType] | None:
+        """Get all the cells in a column, if the source can do so efficiently.
+
+        Override this method if the source stores columns rather than rows. If this
+        method returns `None`, the column is read from pages of rows.
+
+        Args:
+            column_index: Index of the column.
+
+        Returns:
+            The cells in the column (one per row), or `None` to read the column from rows.
+        """
+        return None
+
+
+class _SourceRows(Generic[CellType]):
+    """Fetches rows from a source in pages, and caches the most recent pages."""
+
+    def __init__(
+        self,
+        source: DataTableSource[CellType],
+        row_height: int,
+        get_column_keys: Callable[[], list[ColumnKey]],
+        on_fetch: Callable[[Sequence[Sequence[CellType]]], None],
+        page_size: int = 256,
+        max_pages: int = 64,
+    ) -> None:
+        """
+        Args:
+            source: Source of rows.
+            row_height: The height of every row.
+            get_column_keys: Callable which returns the column keys, in order.
+            on_fetch: Callable invoked with each page of rows fetched from the source.
+            page_size: Number of rows in a page.
+            max_pages: Maximum number of pages to cache.
+        """
+        self.source = source
+        self.row_height = row_height
+        self.row_count = source.row_count
+        self.get_column_keys = get_column_keys
+        self.on_fetch = on_fetch
+        self.page_size = page_size
+        self._pages: LRUCache[int, Sequence[Sequence[CellType]]] = LRUCache(max_pages)
+
+    def reset(self) -> None:
+        """Re-read the row count, and discard cached pages."""
+        self.row_count = self.source.row_count
+        self._pages.clear()
+
+    def get_index(self, row_key: object) -> int | None:
+        """Get the index of a row from its key.
+
+        Args:
+            row_key: A row key, or a string.
+
+        Returns:
+            The index of the row, or `None` if there is no row with that key.
+        """
+        value = row_key.value if isinstance(row_key, StringKey) else row_key
+        if not isinstance(value, str) or not value.isdigit():
+            return None
+        row_index = int(value)
+        return row_index if row_index < self.row_count else None
+
+    def get_row(self, row_index: int) -> Sequence[CellType]:
+        """Get the cells in a row.
+
+        Args:
+            row_index: Index of the row.
+
+        Returns:
+            Cells in the row.
+        """
+        page_index, offset = divmod(row_index, self.page_size)
+        page = self._pages.get(page_index)
+        if page is None:
+            start = page_index * self.page_size
+            stop = min(start + self.page_size, self.row_count)
+            page = self.source.get_rows(start, stop)
+            self._pages[page_index] = page
+            self.on_fetch(page)
+        return page[offset] if offset < len(page) else ()
+
+
+class _SourceRowLocations(TwoWayDict[RowKey, int]):
+    """Maps row keys to row indices, for a DataTable with a source.
+
+    Row keys are generated from the row index, and can't change.
+    """
+
+    def __init__(self, rows: _SourceRows[Any]) -> None:
+        super().__init__({})
+        self._rows = rows
+
+    def __setitem__(self, key: RowKey, value: int) -> None:
+        raise ReadOnlyRows("Rows can't be changed in a DataTable with a source.")
+
+    def __delitem__(self, key: RowKey) -> None:
+        raise ReadOnlyRows("Rows can't be changed in a DataTable with a source.")
+
+    def __contains__(self, item: object) -> bool:
+        return self._rows.get_index(item) is not None
+
+    def __iter__(self) -> Iterator[RowKey]:
+        return (RowKey(str(row_index)) for row_index in range(self._rows.row_count))
+
+    def __len__(self) -> int:
+        return self._rows.row_count
+
+    def get(self, key: object) -> int | None:
+        return self._rows.get_index(key)
+
+    def get_key(self, value: int) -> RowKey | None:
+        if 0 <= value < self._rows.row_count:
+            return RowKey(str(value))
+        return None
+
+    def contains_value(self, value: int) -> bool:
+        return 0 <= value < self._rows.row_count
+
+
+SourceValueType = TypeVar("SourceValueType")
+
+
+class _SourceRowDict(Dict[RowKey, SourceValueType]):
+    """A read-only dict of rows for a DataTable with a source.
+
+    Nothing is stored in the dict itself: keys are generated from the row index, and
+    values are created as required.
+    """
+
+    def __init__(self, rows: _SourceRows[Any]) -> None:
+        super().__init__()
+        self._rows = rows
+
+    def _get_value(self, row_index: int) -> SourceValueType:
+        """Create the value for a row.
+
+        Args:
+            row_index: Index of the row.
+
+        Returns:
+            The value.
+        """
+        raise NotImplementedError
+
+    def __setitem__(self, key: RowKey, value: SourceValueType) -> None:
+        raise ReadOnlyRows("Rows can't be changed in a DataTable with a source.")
+
+    def __delitem__(self, key: RowKey) -> None:
+        raise ReadOnlyRows("Rows can't be changed in a DataTable with a source.")
+
+    def __getitem__(self, row_key: RowKey) -> SourceValueType:
+        row_index = self._rows.get_index(row_key)
+        if row_index is None:
+            raise KeyError(row_key)
+        return self._get_value(row_index)
+
+    def get(self, row_key: RowKey, default: Any = None) -> Any:
+        row_index = self._rows.get_index(row_key)
+        return default if row_index is None else self._get_value(row_index)
+
+    def __contains__(self, row_key: object) -> bool:
+        return self._rows.get_index(row_key) is not None
+
+    def __iter__(self) -> Iterator[RowKey]:
+        return (RowKey(str(row_index)) for row_index in range(self._rows.row_count))
+
+    def __len__(self) -> int:
+        return self._rows.row_count
+
+
+class _SourceRowMetadata(_SourceRowDict[Row]):
+    """Row metadata for a DataTable with a source, created as required."""
+
+    def _get_value(self, row_index: int) -> Row:
+        return Row(RowKey(str(row_index)), self._rows.row_height)
+
+
+class _SourceRowData(_SourceRowDict["dict[ColumnKey, Any]"]):
+    """Cell data for a DataTable with a source, fetched as required."""
+
+    def _get_value(self, row_index: int) -> dict[ColumnKey, Any]:
+        cells = self._rows.get_row(row_index)
+        cell_count = len(cells)
+        return {
+            column_key: cells[column_index] if column_index < cell_count else None
+            for column_index, column_key in enumerate(self._rows.get_column_keys())
+        }
+
+
 class DataTable(ScrollView, Generic[CellType], can_focus=True):
     """A tabular widget that contains data."""
 
@@ -668,9 +1006,9 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         """Cache for individual cells."""
         self._line_cache: LRUCache[LineCacheKey, Strip] = LRUCache(1000)
         """Cache for lines within rows."""
-        self._offset_cache: LRUCache[int, list[tuple[RowKey, int]]] = LRUCache(1)
-        """Cached y_offset - key is update_count - see y_offsets property for more
-        information """
+        self._row_heights: FenwickTree | None = None
+        """Heights of the rows, in the order they appear on screen. Set to `None` when rows
+        are reordered or removed, so that it is rebuilt. See the `_row_height_index` property."""
         self._ordered_row_cache: LRUCache[tuple[int, int], list[Row]] = LRUCache(1)
         """Caches row ordering - key is (num_rows, update_count)."""
 
@@ -698,6 +1036,31 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         """Whether or not the user has supplied any rows with labels."""
         self._label_column = Column(self._label_column_key, Text(), auto_width=True)
         """The largest content width out of all row labels in the table."""
+        self._source: DataTableSource[CellType] | None = None
+        """The source of rows in virtual mode, or `None` if rows are stored in the table."""
+        self._source_rows: _SourceRows[CellType] | None = None
+        """Fetches and caches rows from the source."""
+        self._source_column_widths: Sequence[int] | None = None
+        """Column widths reported by the source."""
+        self._row_order: list[RowKey] | None = None
+        """The order of all rows, including rows hidden by a filter, or `None` for the
+        order the rows were added. Set by sorting and filtering. May also contain rows
+        which have since been removed (see `_get_row_order`)."""
+        self._row_order_positions: dict[RowKey, int] = {}
+        """The index of each row in `_row_order`. Removed rows are deleted from here,
+        so they don't need to be found in (and removed from) the list."""
+        self._row_sort: _RowSort | None = None
+        """The sort applied to the rows, while the rows remain in sorted order."""
+        self._row_filter: _RowFilter | None = None
+        """The filter applied to the rows, if any."""
+        self._hidden_new_rows: set[RowKey] = set()
+        """New rows which were hidden by the filter before their dimensions were calculated."""
+        self._order_request = 0
+        """Incremented for each sort or filter, so that stale results may be discarded."""
+        self._sort_pending = False
+        """Is a sort being calculated in the background?"""
+        self._order_updates: set[RowKey] | None = None
+        """Rows updated while a sort or filter is calculated in the background."""
 
         self.show_header = show_header
         """Show/hide the header row (the row of column labels)."""
@@ -746,28 +1109,172 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
 
     @property
     def row_count(self) -> int:
-        """The number of rows currently present in the DataTable."""
-        return len(self.rows)
+        """The number of rows currently present in the DataTable.
+
+        Rows hidden by a [filter][textual.widgets.DataTable.filter] aren't counted.
+        """
+        return len(self._row_locations)
 
     @property
-    def _y_offsets(self) -> list[tuple[RowKey, int]]:
-        """Contains a 2-tuple for each line (not row!) of the DataTable. Given a
-        y-coordinate, we can index into this list to find which row that y-coordinate
-        lands on, and the y-offset *within* that row. The length of the returned list
-        is therefore the total height of all rows within the DataTable."""
-        y_offsets = []
-        if self._update_count in self._offset_cache:
-            y_offsets = self._offset_cache[self._update_count]
+    def source(self) -> DataTableSource[CellType] | None:
+        """The source of rows, if the table is in virtual mode."""
+        return self._source
+
+    def set_source(
+        self, source: DataTableSource[CellType] | None, *, row_height: int = 1
+    ) -> Self:
+        """Set a source of rows, which puts the table in to virtual mode.
+
+        In virtual mode, rows are fetched from the source (in pages) as they are
+        displayed, and aren't stored in the table. Cells are assigned to columns by
+        position, and rows can't be added, removed, updated, or sorted. Use
+        [`refresh_source`][textual.widgets.DataTable.refresh_source] when the data
+        in the source changes.
+
+        Args:
+            source: A source of rows, or `None` to remove the source (and all rows).
+            row_height: The height of every row, in lines.
+
+        Returns:
+            The `DataTable` instance.
+        """
+        self._clear_caches()
+        self._new_rows.clear()
+        self._updated_cells.clear()
+        self._source = source
+        self._row_heights = None
+        self._reset_row_order()
+        if source is None:
+            self._source_rows = None
+            self._source_column_widths = None
+            self._data = {}
+            self.rows = {}
+            self._row_locations = TwoWayDict({})
         else:
-            for row in self.ordered_rows:
-                y_offsets += [(row.key, y) for y in range(row.height)]
-            self._offset_cache[self._update_count] = y_offsets
-        return y_offsets
+            source_rows = self._source_rows = _SourceRows(
+                source,
+                row_height,
+                lambda: [column.key for column in self.ordered_columns],
+                self._measure_source_rows,
+            )
+            self._source_column_widths = source.get_column_widths()
+            self._data = _SourceRowData(source_rows)
+            self.rows = _SourceRowMetadata(source_rows)
+            self._row_locations = _SourceRowLocations(source_rows)
+        self._labelled_row_exists = False
+        self._label_column = Column(self._label_column_key, Text(), auto_width=True)
+        self._source_updated()
+        return self
+
+    def refresh_source(self) -> Self:
+        """Update the table after the data in the source has changed.
+
+        The row count and column widths are read from the source again, and cached rows
+        are discarded.
+
+        Returns:
+            The `DataTable` instance.
+        """
+        if self._source is not None and self._source_rows is not None:
+            self._source_rows.reset()
+            self._source_column_widths = self._source.get_column_widths()
+            self._source_updated()
+        return self
+
+    def _source_updated(self) -> None:
+        """Called when the source or the data in the source changes."""
+        self._update_count += 1
+        self._require_update_dimensions = True
+        self.cursor_coordinate = self.cursor_coordinate
+        self.hover_coordinate = self.hover_coordinate
+        self.check_idle()
+        self.refresh()
+
+    def _measure_source_rows(self, rows: Sequence[Sequence[CellType]]) -> None:
+        """Grow auto-width columns to fit rows fetched from the source.
+
+        Args:
+            rows: Rows fetched from the source.
+        """
+        if self._source_column_widths is not None or not self.is_attached:
+            return
+        console = self.app.console
+        columns = self.ordered_columns
+        changed = False
+        for row in rows:
+            for column, cell in zip(columns, row):
+                if cell is None or not column.auto_width:
+                    continue
+                content_width = measure(console, default_cell_formatter(cell), 1)
+                if content_width > column.content_width:
+                    column.content_width = content_width
+                    changed = True
+        if changed:
+            self._update_count += 1
+            self._require_update_dimensions = True
+            self.check_idle()
+            self.refresh()
+
+    def _check_rows_writable(self) -> None:
+        """Check the rows may be changed.
+
+        Raises:
+            ReadOnlyRows: If the table has a source.
+        """
+        if self._source is not None:
+            raise ReadOnlyRows("Rows can't be changed in a DataTable with a source.")
+
+    @property
+    def _row_height_index(self) -> FenwickTree:
+        """The heights of the rows, in the order they appear on screen. Given a
+        y-coordinate, we can search this to find which row that y-coordinate
+        lands on, and the y-offset *within* that row.
+
+        This is updated when rows are added or change height, and rebuilt
+        when rows are reordered or removed."""
+        if self._row_heights is None:
+            self._row_heights = FenwickTree(row.height for row in self.ordered_rows)
+        return self._row_heights
 
     @property
     def _total_row_height(self) -> int:
         """The total height of all rows within the DataTable"""
-        return len(self._y_offsets)
+        if self._source_rows is not None:
+            return self._source_rows.row_count * self._source_rows.row_height
+        return self._row_height_index.total
+
+    def _get_row_y(self, row_index: int) -> int:
+        """Get the offset of a row from the top of the first row.
+
+        Args:
+            row_index: Index of the row.
+
+        Returns:
+            The sum of the heights of the rows above the row.
+        """
+        if self._source_rows is not None:
+            return row_index * self._source_rows.row_height
+        return self._row_height_index.prefix_sum(row_index)
+
+    def _iter_ordered_rows(self, start: int, stop: int | None = None) -> Iterable[Row]:
+        """Iterate over a range of rows, in the order they appear on screen.
+
+        Unlike `ordered_rows`, this doesn't fetch every row in virtual mode.
+
+        Args:
+            start: Index of the first row.
+            stop: Index after the last row, or `None` for the last row.
+
+        Returns:
+            An iterable of rows.
+        """
+        if self._source_rows is None:
+            return self.ordered_rows[start:stop]
+        rows = self.rows
+        get_key = self._row_locations.get_key
+        row_count = self.row_count if stop is None else min(stop, self.row_count)
+        row_keys = (get_key(row_index) for row_index in range(start, row_count))
+        return (rows[row_key] for row_key in row_keys if row_key is not None)
 
     def update_cell(
         self,
@@ -789,22 +1296,26 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         Raises:
             CellDoesNotExist: When the supplied `row_key` and `column_key`
                 cannot be found in the table.
+            ReadOnlyRows: If the table has a source.
         """
+        self._check_rows_writable()
         if isinstance(row_key, str):
             row_key = RowKey(row_key)
         if isinstance(column_key, str):
             column_key = ColumnKey(column_key)
 
-        if (
-            row_key not in self._row_locations
-            or column_key not in self._column_locations
-        ):
+        if row_key not in self.rows or column_key not in self._column_locations:
             raise CellDoesNotExist(
                 f"No cell exists for row_key={row_key!r}, column_key={column_key!r}."
             )
 
         self._data[row_key][column_key] = value
         self._update_count += 1
+        if self._order_updates is not None:
+            # Repositioned when the background sort or filter completes
+            self._order_updates.add(row_key)
+        else:
+            self._reposition_row(row_key, column_key)
 
         # Recalculate widths if necessary
         if update_width:
@@ -901,7 +1412,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         Raises:
             RowDoesNotExist: When there is no row corresponding to the key.
         """
-        if row_key not in self._row_locations:
+        if row_key not in self.rows:
             raise RowDoesNotExist(f"Row key {row_key!r} is not valid.")
         cell_mapping: dict[ColumnKey, CellType] = self._data.get(row_key, {})
         ordered_row: list[CellType] = [
@@ -959,8 +1470,14 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         if column_key not in self._column_locations:
             raise ColumnDoesNotExist(f"Column key {column_key!r} is not valid.")
 
+        if self._source is not None:
+            cells = self._source.get_column(self.get_column_index(column_key))
+            if cells is not None:
+                yield from cells
+                return
+
         data = self._data
-        for row_metadata in self.ordered_rows:
+        for row_metadata in self._iter_ordered_rows(0):
             row_key = row_metadata.key
             yield data[row_key][column_key]
 
@@ -1003,7 +1520,6 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         self._cell_render_cache.clear()
         self._line_cache.clear()
         self._styles_cache.clear()
-        self._offset_cache.clear()
         self._ordered_row_cache.clear()
         self._get_styles_to_render_cell.cache_clear()
 
@@ -1180,7 +1696,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
     def _highlight_row(self, row_index: int) -> None:
         """Apply highlighting to the row at the given index, and post event."""
         self.refresh_row(row_index)
-        is_valid_row = row_index < len(self._data)
+        is_valid_row = row_index < self.row_count
         if is_valid_row:
             row_key = self._row_locations.get_key(row_index)
             self.post_message(DataTable.RowHighlighted(self, row_index, row_key))
@@ -1287,6 +1803,9 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             # The row could have been removed before on_idle was called, so we
             # need to be quite defensive here and don't assume that the row exists.
             if row_index is None:
+                if row_key in self.rows:
+                    # Hidden by a filter, so calculate when it is displayed
+                    self._hidden_new_rows.add(row_key)
                 continue
 
             row = self.rows.get(row_key)
@@ -1353,6 +1872,8 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
                     height = max(height, cell_height)
 
                 row.height = height
+                if self._row_heights is not None:
+                    self._row_heights[row_index] = height
                 # Do surgery on the cache for cells that were rendered with the incorrect
                 # height during the first pass.
                 for cell_renderable, cell_height, column_width in rendered_cells:
@@ -1365,6 +1886,15 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
                             ]
                         )
 
+        if self._source_column_widths is not None:
+            for column, content_width in zip(
+                self.ordered_columns, self._source_column_widths
+            ):
+                if column.auto_width:
+                    column.content_width = max(
+                        measure(console, column.label, 1), content_width
+                    )
+
         data_cells_width = sum(
             column.get_render_width(self) for column in self.columns.values()
         )
@@ -1396,7 +1926,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         column_key = self._column_locations.get_key(column_index)
         width = self.columns[column_key].get_render_width(self)
         height = row.height
-        y = sum(ordered_row.height for ordered_row in self.ordered_rows[:row_index])
+        y = self._get_row_y(row_index)
         if self.show_header:
             y += self.header_height
         cell_region = Region(x, y, width, height)
@@ -1414,7 +1944,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             sum(column.get_render_width(self) for column in self.columns.values())
             + self._row_label_column_width
         )
-        y = sum(ordered_row.height for ordered_row in self.ordered_rows[:row_index])
+        y = self._get_row_y(row_index)
         if self.show_header:
             y += self.header_height
         row_region = Region(0, y, row_width, row.height)
@@ -1449,11 +1979,14 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         Returns:
             The `DataTable` instance.
         """
+        if self._source is not None:
+            self.set_source(None)
         self._clear_caches()
-        self._y_offsets.clear()
+        self._row_heights = None
         self._data.clear()
         self.rows.clear()
         self._row_locations = TwoWayDict({})
+        self._reset_row_order()
         if columns:
             self.columns.clear()
             self._column_locations = TwoWayDict({})
@@ -1517,9 +2050,11 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         self._column_locations[column_key] = column_index
 
         # Update pre-existing rows to account for the new column.
-        for row_key in self.rows.keys():
-            self._data[row_key][column_key] = default
-            self._updated_cells.add(CellKey(row_key, column_key))
+        # Rows from a source are assigned to columns by position, so don't need updating.
+        if self._source is None:
+            for row_key in self.rows.keys():
+                self._data[row_key][column_key] = default
+                self._updated_cells.add(CellKey(row_key, column_key))
 
         self._require_update_dimensions = True
         self.check_idle()
@@ -1547,9 +2082,13 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             Unique identifier for this row. Can be used to retrieve this row regardless
                 of its current location in the DataTable (it could have moved after
                 being added due to sorting or insertion/deletion of other rows).
+
+        Raises:
+            ReadOnlyRows: If the table has a source.
         """
+        self._check_rows_writable()
         row_key = RowKey(key)
-        if row_key in self._row_locations:
+        if row_key in self.rows:
             raise DuplicateKey(f"The row key {row_key!r} already exists.")
 
         # TODO: If there are no columns: do we generate them here?
@@ -1557,12 +2096,21 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         #  Before they call add_row.
 
         row_index = self.row_count
-        # Map the key of this row to its current index
-        self._row_locations[row_key] = row_index
         self._data[row_key] = {
             column.key: cell
             for column, cell in zip_longest(self.ordered_columns, cells)
         }
+        # New rows are added to the bottom, so the rows are no longer sorted
+        self._row_sort = None
+        if self._row_order is not None:
+            self._row_order_positions[row_key] = len(self._row_order)
+            self._row_order.append(row_key)
+        visible = self._row_filter is None or self._row_filter.matches(
+            self._data[row_key]
+        )
+        if visible:
+            # Map the key of this row to its current index
+            self._row_locations[row_key] = row_index
         label = Text.from_markup(label) if isinstance(label, str) else label
         # Rows with auto-height get a height of 0 because 1) we need an integer height
         # to do some intermediate computations and 2) because 0 doesn't impact the data
@@ -1573,7 +2121,12 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             label,
             height is None,
         )
-        self._new_rows.add(row_key)
+        if not visible:
+            self._hidden_new_rows.add(row_key)
+        else:
+            if self._row_heights is not None:
+                self._row_heights.append(height or 0)
+            self._new_rows.add(row_key)
         self._require_update_dimensions = True
         self.cursor_coordinate = self.cursor_coordinate
 
@@ -1632,23 +2185,31 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
 
         Raises:
             RowDoesNotExist: If the row key does not exist.
+            ReadOnlyRows: If the table has a source.
         """
-        if row_key not in self._row_locations:
+        if row_key not in self.rows:
             raise RowDoesNotExist(f"Row key {row_key!r} is not valid.")
+        self._check_rows_writable()
+        if isinstance(row_key, str):
+            row_key = RowKey(row_key)
 
         self._require_update_dimensions = True
         self.check_idle()
 
-        index_to_delete = self._row_locations.get(row_key)
-        new_row_locations = TwoWayDict({})
-        for row_location_key in self._row_locations:
-            row_index = self._row_locations.get(row_location_key)
-            if row_index > index_to_delete:
-                new_row_locations[row_location_key] = row_index - 1
-            elif row_index < index_to_delete:
-                new_row_locations[row_location_key] = row_index
-
-        self._row_locations = new_row_locations
+        if row_key in self._row_locations:
+            index_to_delete = self._row_locations.get(row_key)
+            new_row_locations = TwoWayDict({})
+            for row_location_key in self._row_locations:
+                row_index = self._row_locations.get(row_location_key)
+                if row_index > index_to_delete:
+                    new_row_locations[row_location_key] = row_index - 1
+                elif row_index < index_to_delete:
+                    new_row_locations[row_location_key] = row_index
+
+            self._row_locations = new_row_locations
+            self._row_heights = None
+        self._row_order_positions.pop(row_key, None)
+        self._hidden_new_rows.discard(row_key)
 
         # Prevent the removed cells from triggering dimension updates
         for column_key in self._data.get(row_key):
@@ -1691,9 +2252,10 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
 
         del self.columns[column_key]
 
-        for row_key in self._data:
-            self._updated_cells.discard(CellKey(row_key, column_key))
-            del self._data[row_key][column_key]
+        if self._source is None:
+            for row_key in self._data:
+                self._updated_cells.discard(CellKey(row_key, column_key))
+                del self._data[row_key][column_key]
 
         self.cursor_coordinate = self.cursor_coordinate
         self.hover_coordinate = self.hover_coordinate
@@ -1794,7 +2356,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         Returns:
             True if the row index is within the bounds of the table.
         """
-        return 0 <= row_index < len(self.rows)
+        return 0 <= row_index < self.row_count
 
     def is_valid_column_index(self, column_index: int) -> bool:
         """Return a boolean indicating whether the column_index is within table bounds.
@@ -2179,15 +2741,23 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             Row key and line (y) offset within cell.
         """
         header_height = self.header_height
-        y_offsets = self._y_offsets
         if self.show_header:
             if y < header_height:
                 return self._header_row_key, y
             y -= header_height
-        if y > len(y_offsets):
+        if self._source_rows is not None:
+            row_index, y_offset = divmod(y, self._source_rows.row_height)
+            row_key = self._row_locations.get_key(row_index)
+            if row_key is None:
+                raise LookupError("Y coord {y!r} is greater than total height")
+            return row_key, y_offset
+        row_heights = self._row_height_index
+        row_index = row_heights.find(y)
+        if y < 0 or row_index >= len(row_heights):
             raise LookupError("Y coord {y!r} is greater than total height")
-
-        return y_offsets[y]
+        row_key = self._row_locations.get_key(row_index)
+        assert row_key is not None
+        return row_key, y - row_heights.prefix_sum(row_index)
 
     def _render_line(self, y: int, x1: int, x2: int, base_style: Style) -> Strip:
         """Render a (possibly cropped) line in to a Strip (a list of segments
@@ -2351,7 +2921,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         that is occupied by fixed rows and columns respectively. Fixed rows and columns
         are rows and columns that do not participate in scrolling."""
         top = self.header_height if self.show_header else 0
-        top += sum(row.height for row in self.ordered_rows[: self.fixed_rows])
+        top += self._get_row_y(min(self.fixed_rows, self.row_count))
         left = (
             sum(
                 column.get_render_width(self)
@@ -2366,42 +2936,305 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         *columns: ColumnKey | str,
         key: Callable[[Any], Any] | None = None,
         reverse: bool = False,
+        background: bool = False,
     ) -> Self:
         """Sort the rows in the `DataTable` by one or more column keys or a
         key function (or other callable). If both columns and a key function
         are specified, only data from those columns will sent to the key function.
 
+        While the rows remain sorted (i.e. until a row is added), updating a cell
+        moves its row to keep the rows in order.
+
         Args:
             columns: One or more columns to sort by the values in.
             key: A function (or other callable) that returns a key to
                 use for sorting purposes.
             reverse: If True, the sort order will be reversed.
+            background: Sort in a thread, and update the table when the sort is
+                complete. A sort or filter requested before then cancels the sort.
 
         Returns:
             The `DataTable` instance.
+
+        Raises:
+            ReadOnlyRows: If the table has a source.
         """
+        self._check_rows_writable()
+        self._row_sort = _RowSort(columns, key, reverse)
+        self._request_row_order(sort=True, background=background)
+        return self
 
-        def key_wrapper(row: tuple[RowKey, dict[ColumnKey | str, CellType]]) -> Any:
-            _, row_data = row
-            if columns:
-                result = itemgetter(*columns)(row_data)
-            else:
-                result = tuple(row_data.values())
-            if key is not None:
-                return key(result)
-            return result
-
-        ordered_rows = sorted(
-            self._data.items(),
-            key=key_wrapper,
-            reverse=reverse,
-        )
+    def filter(
+        self,
+        *columns: ColumnKey | str,
+        predicate: Callable[[Any], bool] | None = None,
+        background: bool = False,
+    ) -> Self:
+        """Display only the rows which match a predicate.
+
+        The predicate is called with the value from the given column (or a tuple
+        of values if there are several columns, or no columns for all the values),
+        and should return `True` to display the row. Hidden rows keep their data,
+        and aren't included in `row_count` or in the row indices. Rows which are
+        added or updated are checked against the filter.
+
+        Args:
+            columns: Columns whose values are passed to the predicate.
+            predicate: A callable which returns `True` to display a row, or `None` to
+                remove the filter and display every row.
+            background: Filter in a thread, and update the table when the filter is
+                complete. A sort or filter requested before then cancels the filter.
+
+        Returns:
+            The `DataTable` instance.
+
+        Raises:
+            ReadOnlyRows: If the table has a source.
+        """
+        self._check_rows_writable()
+        self._row_filter = None if predicate is None else _RowFilter(columns, predicate)
+        self._request_row_order(sort=False, background=background)
+        return self
+
+    def _reset_row_order(self) -> None:
+        """Remove any sort or filter, and cancel background calculations."""
+        self._row_order = None
+        self._row_order_positions = {}
+        self._row_sort = None
+        self._row_filter = None
+        self._hidden_new_rows.clear()
+        self._order_request += 1
+        self._sort_pending = False
+        self._order_updates = None
+
+    def _request_row_order(self, sort: bool, background: bool) -> None:
+        """Sort and / or filter the rows.
+
+        Args:
+            sort: Sort the rows with the current sort.
+            background: Calculate the order in a thread.
+        """
+        self._order_request += 1
+        # If a background sort is pending, this request replaces it
+        sort = sort or self._sort_pending
+        data = self._data
+        if sort:
+            # The sort is stable, and starts from the order the rows were added
+            rows = list(data.items())
+        else:
+            row_order = self._get_row_order()
+            row_keys = data if row_order is None else row_order
+            rows = [(row_key, data[row_key]) for row_key in row_keys]
+        row_sort = self._row_sort if sort else None
+        if background:
+            self._sort_pending = sort
+            if self._order_updates is None:
+                self._order_updates = set()
+            self._order_rows_in_background(
+                self._order_request, rows, row_sort, self._row_filter
+            )
+        else:
+            self._sort_pending = False
+            self._order_updates = None
+            row_order_result = _order_rows(rows, row_sort, self._row_filter)
+            assert row_order_result is not None
+            self._apply_row_order(self._order_request, *row_order_result)
+
+    @work(thread=True, exclusive=True, group="data_table_order")
+    def _order_rows_in_background(
+        self,
+        request: int,
+        rows: list[tuple[RowKey, dict[ColumnKey, Any]]],
+        row_sort: _RowSort | None,
+        row_filter: _RowFilter | None,
+    ) -> None:
+        """A thread worker to sort and filter rows.
+
+        Args:
+            request: The order request at the time of invocation.
+            rows: Pairs of row key and row data.
+            row_sort: Sort to apply, or `None` to keep the current order.
+            row_filter: Filter to apply, or `None` to display every row.
+        """
+        worker = get_current_worker()
+        row_order_result = _order_rows(rows, row_sort, row_filter, worker)
+        if row_order_result is not None and not worker.is_cancelled:
+            self.app.call_from_thread(self._apply_row_order, request, *row_order_result)
+
+    def _apply_row_order(
+        self, request: int, row_order: list[RowKey], visible_rows: list[RowKey]
+    ) -> None:
+        """Update the table with a new order of rows.
+
+        Args:
+            request: The order request the order was calculated for.
+            row_order: Every row key, in order.
+            visible_rows: The row keys to display, in order.
+        """
+        if request != self._order_request:
+            # A newer sort or filter has been requested
+            return
+        self._sort_pending = False
+        updated_rows = self._order_updates
+        self._order_updates = None
+
+        rows = self.rows
+        if len(row_order) != len(rows) or updated_rows:
+            # Rows were added, removed, or updated while ordering in the background
+            row_order = [row_key for row_key in row_order if row_key in rows]
+            visible_rows = [row_key for row_key in visible_rows if row_key in rows]
+            ordered = set(row_order)
+            added_rows = [row_key for row_key in rows if row_key not in ordered]
+            if added_rows:
+                self._row_sort = None
+                row_order.extend(added_rows)
+                row_filter = self._row_filter
+                data = self._data
+                visible_rows.extend(
+                    row_key
+                    for row_key in added_rows
+                    if row_filter is None or row_filter.matches(data[row_key])
+                )
+
+        self._row_order = row_order
+        self._row_order_positions = {
+            row_key: row_index for row_index, row_key in enumerate(row_order)
+        }
         self._row_locations = TwoWayDict(
-            {row_key: new_index for new_index, (row_key, _) in enumerate(ordered_rows)}
+            {row_key: row_index for row_index, row_key in enumerate(visible_rows)}
         )
+        self._row_heights = None
+        if self._hidden_new_rows:
+            # Calculate the dimensions of new rows which are now displayed
+            displayed_rows = {
+                row_key
+                for row_key in self._hidden_new_rows
+                if row_key in self._row_locations
+            }
+            self._hidden_new_rows -= displayed_rows
+            self._new_rows.update(displayed_rows)
         self._update_count += 1
+        self._require_update_dimensions = True
+        self.cursor_coordinate = self.cursor_coordinate
+        self.hover_coordinate = self.hover_coordinate
+        self.check_idle()
         self.refresh()
-        return self
+
+        if updated_rows:
+            for row_key in updated_rows:
+                if row_key in rows:
+                    self._reposition_row(row_key)
+
+    def _get_row_order(self) -> list[RowKey] | None:
+        """Get the order of all rows, without any rows which have been removed.
+
+        Returns:
+            Every row key in order, or `None` for the order the rows were added.
+        """
+        row_order = self._row_order
+        positions = self._row_order_positions
+        if row_order is not None and len(row_order) != len(positions):
+            row_order = self._row_order = [
+                row_key
+                for row_index, row_key in enumerate(row_order)
+                if positions.get(row_key) == row_index
+            ]
+            self._row_order_positions = {
+                row_key: row_index for row_index, row_key in enumerate(row_order)
+            }
+        return row_order
+
+    def _reposition_row(
+        self, row_key: RowKey, column_key: ColumnKey | None = None
+    ) -> None:
+        """Move a row which has been updated, to keep it sorted and filtered.
+
+        Args:
+            row_key: Key of the row.
+            column_key: Key of the column which was updated, or `None` if unknown.
+        """
+        row_sort = self._row_sort
+        row_filter = self._row_filter
+        if self._row_order is None:
+            return
+        sorted_by_column = row_sort is not None and (
+            column_key is None or row_sort.uses_column(column_key)
+        )
+        filtered_by_column = row_filter is not None and (
+            column_key is None or row_filter.uses_column(column_key)
+        )
+        if not (sorted_by_column or filtered_by_column):
+            return
+
+        row_order = self._get_row_order()
+        assert row_order is not None
+        positions = self._row_order_positions
+        data = self._data
+        old_index = positions[row_key]
+        new_index = old_index
+        if sorted_by_column:
+            assert row_sort is not None
+            # Binary search for the new position, after any rows with an equal key
+            get_key = row_sort.get_key
+            del row_order[old_index]
+            sort_key = get_key(data[row_key])
+            low = 0
+            high = len(row_order)
+            while low < high:
+                middle = (low + high) // 2
+                other_key = get_key(data[row_order[middle]])
+                before = (
+                    other_key < sort_key if row_sort.reverse else sort_key < other_key
+                )
+                if before:
+                    high = middle
+                else:
+                    low = middle + 1
+            new_index = low
+            row_order.insert(new_index, row_key)
+
+        # Only the rows between the old and new positions have moved
+        start, end = sorted((old_index, new_index))
+        for row_index in range(start, end + 1):
+            positions[row_order[row_index]] = row_index
+
+        row_locations = self._row_locations
+        if row_filter is None:
+            # Every row is displayed, so only the moved rows need new indices.
+            row_heights = self._row_heights
+            for row_index in range(start, end + 1):
+                moved_row_key = row_order[row_index]
+                row_locations[moved_row_key] = row_index
+                if row_heights is not None:
+                    row_heights[row_index] = self.rows[moved_row_key].height
+        else:
+            visible = row_filter.matches(data[row_key])
+            was_visible = row_key in row_locations
+            if visible == was_visible and new_index == old_index:
+                return
+            self._row_locations = TwoWayDict(
+                {
+                    visible_row_key: row_index
+                    for row_index, visible_row_key in enumerate(
+                        ordered_row_key
+                        for ordered_row_key in row_order
+                        if (
+                            visible
+                            if ordered_row_key == row_key
+                            else ordered_row_key in row_locations
+                        )
+                    )
+                }
+            )
+            self._row_heights = None
+            if visible and row_key in self._hidden_new_rows:
+                self._hidden_new_rows.discard(row_key)
+                self._new_rows.add(row_key)
+                self._require_update_dimensions = True
+            elif visible != was_visible:
+                self._require_update_dimensions = True
+            self.cursor_coordinate = self.cursor_coordinate
+            self.check_idle()
 
     def _scroll_cursor_into_view(self, animate: bool = False) -> None:
         """When the cursor is at a boundary of the DataTable and moves out
@@ -2456,9 +3289,12 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             )
             self.post_message(message)
         elif is_row_label_click:
-            row = self.ordered_rows[row_index]
+            row_key = self._row_locations.get_key(row_index)
+            if row_key is None:
+                return
+            row = self.rows[row_key]
             message = DataTable.RowLabelSelected(
-                self, row.key, row_index, label=row.label
+                self, row.key, row_index, label=row.label or Text()
             )
             self.post_message(message)
         elif self.show_cursor and self.cursor_type != "none":
@@ -2478,7 +3314,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             offset = 0
             rows_to_scroll = 0
             row_index, column_index = self.cursor_coordinate
-            for ordered_row in self.ordered_rows[row_index:]:
+            for ordered_row in self._iter_ordered_rows(row_index):
                 offset += ordered_row.height
                 if offset > height:
                     break
@@ -2500,7 +3336,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             offset = 0
             rows_to_scroll = 0
             row_index, column_index = self.cursor_coordinate
-            for ordered_row in self.ordered_rows[: row_index + 1]:
+            for ordered_row in self._iter_ordered_rows(0, row_index + 1):
                 offset += ordered_row.height
                 if offset > height:
                     break
@@ -2577,7 +3413,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         """Post the appropriate message for a selection based on the `cursor_type`."""
         cursor_coordinate = self.cursor_coordinate
         cursor_type = self.cursor_type
-        if len(self._data) == 0:
+        if self.row_count == 0:
             return
         cell_key = self.coordinate_to_cell_key(cursor_coordinate)
         if cursor_type == "cell":
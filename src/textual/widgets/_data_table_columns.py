@@ -0,0 +1,386 @@
+"""
+Column-oriented storage for the cells of a DataTable.
+
+Numbers and booleans are stored in typed arrays (a few bytes per cell, rather than a
+Python object and a dict entry), and are formatted and measured a column at a time.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from array import array
+from math import isfinite
+from typing import Generic, Iterable, Sequence, TypeVar
+
+from rich.cells import cell_len
+from rich.console import RenderableType
+from rich.text import Text
+
+from ._data_table import DataTableSource
+
+ValueType = TypeVar("ValueType")
+NumberType = TypeVar("NumberType", int, float)
+
+
+def _measure_markup(value: str) -> int:
+    """Measure the width of a string, which may contain markup.
+
+    Args:
+        value: A string, as it would be added to a DataTable.
+
+    Returns:
+        The width of the widest line, in cells.
+    """
+    if "[" in value or "\n" in value:
+        return max(
+            (cell_len(line) for line in Text.from_markup(value).plain.splitlines()),
+            default=0,
+        )
+    return cell_len(value)
+
+
+class TypedColumn(ABC, Generic[ValueType]):
+    """The values in a column of a
+    [ColumnarSource][textual.widgets.data_table.ColumnarSource]."""
+
+    def __init__(self) -> None:
+        self._content_width: int | None = 0
+        """The width of the widest formatted value, or `None` if it must be measured."""
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def __getitem__(self, index: int) -> ValueType: ...
+
+    def __setitem__(self, index: int, value: ValueType) -> None:
+        content_width = self._content_width
+        if content_width is not None:
+            new_width = self._measure_value(value)
+            if new_width >= content_width:
+                self._content_width = new_width
+            elif self._measure_value(self[index]) == content_width:
+                # The old value may have been the widest
+                self._content_width = None
+        self._set_value(index, value)
+
+    @property
+    def content_width(self) -> int:
+        """The width of the widest formatted value, in cells."""
+        if self._content_width is None:
+            self._content_width = self._measure(0, len(self))
+        return self._content_width
+
+    def append(self, value: ValueType) -> None:
+        """Append a value.
+
+        Args:
+            value: Value to append.
+        """
+        self._append_values((value,))
+        if self._content_width is not None:
+            self._content_width = max(self._content_width, self._measure_value(value))
+
+    def extend(self, values: Iterable[ValueType]) -> None:
+        """Append several values.
+
+        Args:
+            values: Values to append.
+        """
+        start = len(self)
+        self._append_values(values)
+        if self._content_width is not None:
+            self._content_width = max(
+                self._content_width, self._measure(start, len(self))
+            )
+
+    @abstractmethod
+    def values(self, start: int = 0, stop: int | None = None) -> Sequence[ValueType]:
+        """Get a range of values.
+
+        Args:
+            start: Index of the first value.
+            stop: Index of the value after the last value, or `None` for all values.
+
+        Returns:
+            A sequence of values.
+        """
+
+    @abstractmethod
+    def render(self, start: int, stop: int) -> Sequence[RenderableType]:
+        """Format a range of values for display.
+
+        Args:
+            start: Index of the first value.
+            stop: Index of the value after the last value.
+
+        Returns:
+            A renderable for each value.
+        """
+
+    @abstractmethod
+    def _append_values(self, values: Iterable[ValueType]) -> None:
+        """Append values to the storage."""
+
+    @abstractmethod
+    def _set_value(self, index: int, value: ValueType) -> None:
+        """Replace a value in the storage."""
+
+    @abstractmethod
+    def _measure_value(self, value: ValueType) -> int:
+        """Get the width of a single formatted value."""
+
+    @abstractmethod
+    def _measure(self, start: int, stop: int) -> int:
+        """Get the width of the widest formatted value in a range."""
+
+
+class _ArrayColumn(TypedColumn[NumberType]):
+    """A column of numbers stored in an array."""
+
+    def __init__(
+        self,
+        storage: array[NumberType],
+        values: Iterable[NumberType] = (),
+        format_spec: str = "",
+    ) -> None:
+        """
+        Args:
+            storage: An empty array to store the values in.
+            values: Initial values.
+            format_spec: A format specification for the values (as used by `format`).
+        """
+        super().__init__()
+        self._array: array[NumberType] = storage
+        self._format = f"{{:{format_spec}}}".format
+        presentation = format_spec[-1:]
+        if not (presentation.isalpha() or presentation == "%"):
+            presentation = ""
+        self._fixed_point = presentation in ("d", "f", "F", "%") or (
+            presentation == "" and storage.typecode != "d"
+        )
+        """Are the values formatted with a fixed number of decimal places?"""
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __getitem__(self, index: int) -> NumberType:
+        return self._array[index]
+
+    def values(self, start: int = 0, stop: int | None = None) -> Sequence[NumberType]:
+        return self._array[start:stop]
+
+    def render(self, start: int, stop: int) -> Sequence[RenderableType]:
+        return list(map(Text, map(self._format, self._array[start:stop])))
+
+    def _append_values(self, values: Iterable[NumberType]) -> None:
+        self._array.extend(values)
+
+    def _set_value(self, index: int, value: NumberType) -> None:
+        self._array[index] = value
+
+    def _measure_value(self, value: NumberType) -> int:
+        return len(self._format(value))
+
+    def _measure(self, start: int, stop: int) -> int:
+        if start >= stop:
+            return 0
+        values = self._array[start:stop]
+        if self._fixed_point and (self._array.typecode != "d" or isfinite(sum(values))):
+            # Numbers with a fixed number of decimal places are widest at the
+            # extremes, so only the smallest and largest values need to be formatted.
+            return max(
+                self._measure_value(min(values)), self._measure_value(max(values))
+            )
+        return max(map(len, map(self._format, values)))
+
+
+class IntColumn(_ArrayColumn[int]):
+    """A column of integers, stored as 64 bit signed integers."""
+
+    def __init__(self, values: Iterable[int] = (), format_spec: str = "") -> None:
+        """
+        Args:
+            values: Initial values.
+            format_spec: A format specification for the values (as used by `format`).
+        """
+        super().__init__(array("q"), values, format_spec)
+
+
+class FloatColumn(_ArrayColumn[float]):
+    """A column of floats, stored as doubles."""
+
+    def __init__(self, values: Iterable[float] = (), format_spec: str = ".2f") -> None:
+        """
+        Args:
+            values: Initial values.
+            format_spec: A format specification for the values (as used by `format`).
+        """
+        super().__init__(array("d"), values, format_spec)
+
+
+class BoolColumn(TypedColumn[bool]):
+    """A column of booleans, stored as bytes."""
+
+    def __init__(self, values: Iterable[bool] = ()) -> None:
+        """
+        Args:
+            values: Initial values.
+        """
+        super().__init__()
+        self._array: array[int] = array("b")
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self._array[index])
+
+    def values(self, start: int = 0, stop: int | None = None) -> Sequence[bool]:
+        return list(map(bool, self._array[start:stop]))
+
+    def render(self, start: int, stop: int) -> Sequence[RenderableType]:
+        return [Text("True" if value else "False") for value in self._array[start:stop]]
+
+    def _append_values(self, values: Iterable[bool]) -> None:
+        self._array.extend(map(bool, values))
+
+    def _set_value(self, index: int, value: bool) -> None:
+        self._array[index] = bool(value)
+
+    def _measure_value(self, value: bool) -> int:
+        return 4 if value else 5
+
+    def _measure(self, start: int, stop: int) -> int:
+        if start >= stop:
+            return 0
+        return 5 if 0 in self._array[start:stop] else 4
+
+
+class StrColumn(TypedColumn[str]):
+    """A column of strings, which may contain markup."""
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        """
+        Args:
+            values: Initial values.
+        """
+        super().__init__()
+        self._values: list[str] = []
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> str:
+        return self._values[index]
+
+    def values(self, start: int = 0, stop: int | None = None) -> Sequence[str]:
+        return self._values[start:stop]
+
+    def render(self, start: int, stop: int) -> Sequence[RenderableType]:
+        return self._values[start:stop]
+
+    def _append_values(self, values: Iterable[str]) -> None:
+        self._values.extend(values)
+
+    def _set_value(self, index: int, value: str) -> None:
+        self._values[index] = value
+
+    def _measure_value(self, value: str) -> int:
+        return _measure_markup(value)
+
+    def _measure(self, start: int, stop: int) -> int:
+        return max(map(_measure_markup, self._values[start:stop]), default=0)
+
+
+class ColumnarSource(DataTableSource[RenderableType]):
+    """A source which stores the cells of a DataTable in typed columns.
+
+    Use with [DataTable.set_source][textual.widgets.DataTable.set_source], and call
+    [DataTable.refresh_source][textual.widgets.DataTable.refresh_source] after
+    changing the data. Rows are formatted a column at a time, so the cells read from
+    the table are renderables; read the values from
+    [columns][textual.widgets.data_table.ColumnarSource.columns].
+
+    ```python
+    source = ColumnarSource(StrColumn(), FloatColumn())
+    source.add_rows([("AAPL", 171.48), ("MSFT", 420.72)])
+    table.add_columns("Symbol", "Price")
+    table.set_source(source)
+    ```
+    """
+
+    def __init__(self, *columns: TypedColumn) -> None:
+        """
+        Args:
+            *columns: The columns, which should contain the same number of values.
+        """
+        self._columns = columns
+
+    @property
+    def columns(self) -> tuple[TypedColumn, ...]:
+        """The columns, in order."""
+        return self._columns
+
+    @property
+    def row_count(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def add_row(self, *cells: object) -> None:
+        """Add a row.
+
+        Args:
+            *cells: A value for each column.
+
+        Raises:
+            ValueError: If the number of cells doesn't match the number of columns.
+        """
+        if len(cells) != len(self._columns):
+            raise ValueError(
+                f"Expected {len(self._columns)} cells; received {len(cells)}"
+            )
+        for column, cell in zip(self._columns, cells):
+            column.append(cell)
+
+    def add_rows(self, rows: Iterable[Sequence[object]]) -> None:
+        """Add several rows, a column at a time.
+
+        Args:
+            rows: Rows containing a value for each column.
+
+        Raises:
+            ValueError: If the number of cells in a row doesn't match the number of
+                columns.
+        """
+        columns = self._columns
+        rows = list(rows)
+        for row in rows:
+            if len(row) != len(columns):
+                raise ValueError(f"Expected {len(columns)} cells; received {len(row)}")
+        if rows:
+            for column, values in zip(columns, zip(*rows)):
+                column.extend(values)
+
+    def update_cell(self, row_index: int, column_index: int, value: object) -> None:
+        """Update the value of a cell.
+
+        Args:
+            row_index: Index of the row.
+            column_index: Index of the column.
+            value: New value.
+        """
+        self._columns[column_index][row_index] = value
+
+    def get_rows(self, start: int, stop: int) -> Sequence[Sequence[RenderableType]]:
+        stop = min(stop, self.row_count)
+        return list(zip(*[column.render(start, stop) for column in self._columns]))
+
+    def get_column_widths(self) -> Sequence[int]:
+        return [column.content_width for column in self._columns]
+
+    def get_column(self, column_index: int) -> Iterable[RenderableType] | None:
+        column = self._columns[column_index]
+        return column.render(0, len(column))
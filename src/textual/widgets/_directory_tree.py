@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import os
 from asyncio import Queue
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
-from typing import TYPE_CHECKING, Callable, ClassVar, Iterable, Iterator
+from pathlib import Path, PosixPath, WindowsPath
+from time import monotonic, time
+from typing import TYPE_CHECKING, Callable, ClassVar, Dict, Iterable, Iterator
 
 from rich.style import Style
 from rich.text import Text, TextType
@@ -16,7 +19,112 @@ from ..worker import Worker, WorkerCancelled, WorkerFailed, get_current_worker
 from ._tree import TOGGLE_STYLE, Tree, TreeNode
 
 if TYPE_CHECKING:
-    from typing_extensions import Self
+    from typing_extensions import Self, TypeAlias
+
+DirectoryEntries: TypeAlias = Dict[Path, bool]
+"""The entries of a directory, mapped on to whether they are directories."""
+
+_MIN_BATCH_SIZE = 64
+"""Entries in the first batch added to a node, which is small so it appears quickly."""
+_MAX_BATCH_SIZE = 4096
+"""Maximum number of entries in a batch."""
+_BATCH_INTERVAL = 0.1
+"""Maximum seconds between adding batches, for slow file systems."""
+_RACY_INTERVAL = 2.0
+"""Listings of directories modified more recently than this (in seconds) aren't
+re-used, as a change in the same tick of the file system's clock wouldn't change
+the modification time."""
+_MAX_CACHED_DIRECTORIES = 1024
+"""Maximum number of directory listings in a stat cache."""
+
+
+class _StatCache:
+    """Caches the entries of directories (and whether they are directories).
+
+    A listing is re-used, until it expires, if the modification time of its directory
+    hasn't changed, which requires a single `stat` rather than scanning the directory.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        Args:
+            ttl: Seconds before a listing expires.
+        """
+        self.ttl = ttl
+        self._listings: dict[Path, tuple[float, int | None, DirectoryEntries]] = {}
+        """Expiry time, modification time, and entries, keyed by directory."""
+
+    def get_listing(self, location: Path) -> DirectoryEntries | None:
+        """Get the entries of a directory, if they haven't changed.
+
+        Args:
+            location: Path to a directory.
+
+        Returns:
+            The entries, or `None` if the directory must be scanned.
+        """
+        cached = self._listings.get(location)
+        if cached is None:
+            return None
+        expires, mtime, entries = cached
+        if mtime is None or monotonic() >= expires:
+            return None
+        if get_mtime(location) != mtime:
+            return None
+        return entries
+
+    def set_listing(
+        self, location: Path, mtime: int | None, entries: DirectoryEntries
+    ) -> None:
+        """Store the entries of a directory.
+
+        Args:
+            location: Path to a directory.
+            mtime: The modification time of the directory before it was scanned (in
+                nanoseconds), or `None` if the listing shouldn't be re-used.
+            entries: The entries of the directory.
+        """
+        if mtime is not None and time() - mtime / 1e9 < _RACY_INTERVAL:
+            mtime = None
+        listings = self._listings
+        listings.pop(location, None)
+        if len(listings) >= _MAX_CACHED_DIRECTORIES:
+            # Discard the oldest listing
+            del listings[next(iter(listings))]
+        listings[location] = (monotonic() + self.ttl, mtime, entries)
+
+    def get_is_dir(self, path: Path) -> bool | None:
+        """Get whether a path is a directory, from the listing of its parent.
+
+        Args:
+            path: A path.
+
+        Returns:
+            `True` if the path is a directory, `False` if not, or `None` if unknown.
+        """
+        cached = self._listings.get(path.parent)
+        if cached is None or monotonic() >= cached[0]:
+            return None
+        return cached[2].get(path)
+
+    def clear(self) -> None:
+        """Discard every listing."""
+        self._listings.clear()
+
+
+def get_mtime(path: Path) -> int | None:
+    """Get the modification time of a path.
+
+    Args:
+        path: A path.
+
+    Returns:
+        The modification time in nanoseconds, or `None` if it couldn't be read.
+    """
+    try:
+        return getattr(path.stat(), "st_mtime_ns", None)
+    except OSError:
+        return None
 
 
 @dataclass
@@ -66,6 +174,16 @@ class DirectoryTree(Tree[DirEntry]):
     PATH: Callable[[str | Path], Path] = Path
     """Callable that returns a fresh path object."""
 
+    STAT_CACHE_TTL: ClassVar[float] = 10.0
+    """Seconds that the listing of a directory may be re-used for, if the
+    modification time of the directory hasn't changed."""
+
+    PREFETCH_WORKERS: ClassVar[int] = 4
+    """Maximum number of threads which prefetch directories."""
+
+    PREFETCH_LIMIT: ClassVar[int] = 16
+    """Maximum number of sub-directories to prefetch after a directory is loaded."""
+
     class FileSelected(Message):
         """Posted when a file is selected.
 
@@ -128,6 +246,7 @@ class DirectoryTree(Tree[DirEntry]):
         self,
         path: str | Path,
         *,
+        prefetch: bool = False,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -137,12 +256,19 @@ class DirectoryTree(Tree[DirEntry]):
 
         Args:
             path: Path to directory.
+            prefetch: Read the sub-directories of a directory in the background
+                after it is loaded, so they expand quickly.
             name: The name of the widget, or None for no name.
             id: The ID of the widget in the DOM, or None for no ID.
             classes: A space-separated list of classes, or None for no classes.
             disabled: Whether the directory tree is disabled or not.
         """
         self._load_queue: Queue[TreeNode[DirEntry]] = Queue()
+        self.prefetch = prefetch
+        """Read the sub-directories of a directory after it is loaded?"""
+        self._stat_cache = _StatCache(self.STAT_CACHE_TTL)
+        self._prefetch_pool: ThreadPoolExecutor | None = None
+        self._prefetches: set[Future[DirectoryEntries]] = set()
         super().__init__(
             str(path),
             data=DirEntry(self.PATH(path)),
@@ -259,12 +385,20 @@ class DirectoryTree(Tree[DirEntry]):
                 if reopening.allow_expand and (
                     reopening.data.path in currently_open or reopening == node
                 ):
+                    # Entries are added (and the node expanded) as they are
+                    # read, so the node must not be queued for loading.
+                    reopening.data.loaded = True
                     try:
-                        content = await self._load_directory(reopening).wait()
+                        content = await self._load_directory(
+                            reopening, stream=True
+                        ).wait()
                     except (WorkerCancelled, WorkerFailed):
+                        reopening.data.loaded = False
                         continue
-                    reopening.data.loaded = True
-                    self._populate_node(reopening, content)
+                    if content:
+                        self._sort_node(reopening)
+                        if self.prefetch:
+                            self._prefetch_children(reopening)
                     to_reopen.extend(reopening.children)
                     reopening.expand()
 
@@ -345,6 +479,9 @@ class DirectoryTree(Tree[DirEntry]):
             A Rich Text object.
         """
         if isinstance(label, str):
+            if "\n" not in label:
+                # Most labels are file names, which needn't be split
+                return Text(label)
             text_label = Text(label)
         else:
             text_label = label
@@ -400,6 +537,25 @@ class DirectoryTree(Tree[DirEntry]):
         text = Text.assemble(prefix, node_label)
         return text
 
+    def get_label_width(self, node: TreeNode[DirEntry]) -> int:
+        """Get the width of the nodes label.
+
+        Calculated from the width of the label, rather than by rendering it, unless
+        `render_label` has been overridden.
+
+        Args:
+            node: A node.
+
+        Returns:
+            Width in cells.
+        """
+        if type(self).render_label is not DirectoryTree.render_label:
+            return super().get_label_width(node)
+        if not self.is_mounted:
+            return node._label.cell_len
+        # Every prefix is an emoji (two cells) and a space
+        return 3 + node._label.cell_len
+
     def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
         """Filter the paths before adding them to the tree.
 
@@ -436,6 +592,20 @@ class DirectoryTree(Tree[DirEntry]):
             # tree.
             return False
 
+    def _is_dir(self, path: Path) -> bool:
+        """Check if a path is a directory, using the listing of its parent if cached.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            `True` if the path is for a directory, `False` if not.
+        """
+        is_dir = self._stat_cache.get_is_dir(path)
+        if is_dir is None:
+            is_dir = self._safe_is_dir(path)
+        return is_dir
+
     def _populate_node(self, node: TreeNode[DirEntry], content: Iterable[Path]) -> None:
         """Populate the given tree node with the given directory content.
 
@@ -448,45 +618,208 @@ class DirectoryTree(Tree[DirEntry]):
             node.add(
                 path.name,
                 data=DirEntry(path),
-                allow_expand=self._safe_is_dir(path),
+                allow_expand=self._is_dir(path),
             )
         node.expand()
 
-    def _directory_content(self, location: Path, worker: Worker) -> Iterator[Path]:
-        """Load the content of a given directory.
+    def _add_entries(
+        self,
+        node: TreeNode[DirEntry],
+        paths: Iterable[Path],
+        entries: DirectoryEntries,
+        first: bool,
+    ) -> None:
+        """Add a batch of directory entries to a node, as the directory is read.
+
+        Args:
+            node: The Tree node to add to.
+            paths: The paths to add.
+            entries: The entries of the directory read so far.
+            first: Is this the first batch for the node?
+        """
+        if self._tree_nodes.get(node.id) is not node:
+            # The node was removed while the directory was read
+            return
+        if first:
+            node._remove_children()
+        for path in paths:
+            is_dir = entries.get(path)
+            node._add(
+                path.name,
+                data=DirEntry(path),
+                allow_expand=self._safe_is_dir(path) if is_dir is None else is_dir,
+            )
+        self._invalidate()
+        if first:
+            node.expand()
+
+    def _sort_node(self, node: TreeNode[DirEntry]) -> None:
+        """Sort the children of a node which were added in batches.
+
+        Args:
+            node: The Tree node to sort.
+        """
+
+        def sort_key(node: TreeNode[DirEntry]) -> tuple[bool, str]:
+            assert node.data is not None
+            return (not node.allow_expand, node.data.path.name.lower())
+
+        node._sort_children(sort_key)
+        self._invalidate()
+
+    def _scan_directory(
+        self, location: Path, worker: Worker | None = None
+    ) -> Iterator[tuple[Path, bool]]:
+        """Read the entries of a directory.
+
+        Local directories are read with `os.scandir`, which gets the type of each
+        entry with the directory (on most file systems), rather than with a `stat`.
 
         Args:
             location: The location to load from.
-            worker: The worker that the loading is taking place in.
+            worker: The worker that the loading is taking place in, if any.
 
         Yields:
-            Path: An entry within the location.
+            An entry within the location, and whether it is a directory.
         """
         try:
-            for entry in location.iterdir():
-                if worker.is_cancelled:
-                    break
-                yield entry
+            if isinstance(location, (PosixPath, WindowsPath)):
+                with os.scandir(location) as scan:
+                    for entry in scan:
+                        if worker is not None and worker.is_cancelled:
+                            break
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        yield location / entry.name, is_dir
+            else:
+                for path in location.iterdir():
+                    if worker is not None and worker.is_cancelled:
+                        break
+                    yield path, self._safe_is_dir(path)
         except PermissionError:
             pass
 
+    def _read_directory(self, location: Path) -> DirectoryEntries:
+        """Read the entries of a directory, and cache them.
+
+        Args:
+            location: The location to load from.
+
+        Returns:
+            The entries within the location.
+        """
+        entries = self._stat_cache.get_listing(location)
+        if entries is None:
+            mtime = get_mtime(location)
+            entries = dict(self._scan_directory(location))
+            self._stat_cache.set_listing(location, mtime, entries)
+        return entries
+
     @work(thread=True, exit_on_error=False)
-    def _load_directory(self, node: TreeNode[DirEntry]) -> list[Path]:
+    def _load_directory(
+        self, node: TreeNode[DirEntry], stream: bool = False
+    ) -> list[Path]:
         """Load the directory contents for a given node.
 
         Args:
             node: The node to load the directory contents for.
+            stream: Add entries to the node in batches, as they are read.
 
         Returns:
             The list of entries within the directory associated with the node.
         """
         assert node.data is not None
-        return sorted(
-            self.filter_paths(
-                self._directory_content(node.data.path, get_current_worker())
-            ),
-            key=lambda path: (not self._safe_is_dir(path), path.name.lower()),
-        )
+        worker = get_current_worker()
+        location = node.data.path
+        entries = self._stat_cache.get_listing(location)
+        content: list[Path] = []
+        first = True
+        # An overridden filter is called once with every entry in the directory, so
+        # the entries can't be added in batches as they are read
+        batched = type(self).filter_paths is DirectoryTree.filter_paths
+
+        def add_batch(batch: list[Path], entries: DirectoryEntries) -> None:
+            """Filter a batch of entries, and add them to the node if streaming."""
+            nonlocal first
+            paths = list(self.filter_paths(batch))
+            content.extend(paths)
+            if stream and paths and not worker.is_cancelled:
+                paths.sort(key=lambda path: self._sort_key(path, entries))
+                self.app.call_from_thread(
+                    self._add_entries, node, paths, entries, first
+                )
+                first = False
+
+        if entries is None:
+            mtime = get_mtime(location)
+            entries = {}
+            batch: list[Path] = []
+            batch_size = _MIN_BATCH_SIZE
+            batch_time = monotonic() + _BATCH_INTERVAL
+            for path, is_dir in self._scan_directory(location, worker):
+                entries[path] = is_dir
+                batch.append(path)
+                if batched and (len(batch) >= batch_size or monotonic() >= batch_time):
+                    add_batch(batch, entries)
+                    batch = []
+                    batch_size = min(batch_size * 2, _MAX_BATCH_SIZE)
+                    batch_time = monotonic() + _BATCH_INTERVAL
+            if worker.is_cancelled:
+                return []
+            add_batch(batch, entries)
+            self._stat_cache.set_listing(location, mtime, entries)
+        else:
+            add_batch(list(entries), entries)
+        return sorted(content, key=lambda path: self._sort_key(path, entries))
+
+    def _sort_key(self, path: Path, entries: DirectoryEntries) -> tuple[bool, str]:
+        """Get the key to sort an entry by (directories first, then by name).
+
+        Args:
+            path: The path of the entry.
+            entries: The entries of the directory.
+
+        Returns:
+            Sort key.
+        """
+        is_dir = entries.get(path)
+        if is_dir is None:
+            is_dir = self._safe_is_dir(path)
+        return (not is_dir, path.name.lower())
+
+    def _prefetch_children(self, node: TreeNode[DirEntry]) -> None:
+        """Read the sub-directories of a node in the background.
+
+        Prefetches which haven't started are cancelled, so the sub-directories of
+        the most recently loaded node are read first.
+
+        Args:
+            node: A node which has been loaded.
+        """
+        for future in list(self._prefetches):
+            future.cancel()
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                self.PREFETCH_WORKERS, thread_name_prefix="DirectoryTree prefetch"
+            )
+        paths = [
+            child.data.path
+            for child in node.children
+            if child.allow_expand and child.data is not None and not child.data.loaded
+        ]
+        for path in paths[: self.PREFETCH_LIMIT]:
+            future = self._prefetch_pool.submit(self._read_directory, path)
+            self._prefetches.add(future)
+            future.add_done_callback(self._prefetches.discard)
+
+    def _on_unmount(self) -> None:
+        for future in list(self._prefetches):
+            future.cancel()
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False)
+            self._prefetch_pool = None
 
     @work(exclusive=True)
     async def _loader(self) -> None:
@@ -501,7 +834,7 @@ class DirectoryTree(Tree[DirEntry]):
                 try:
                     # Spin up a short-lived thread that will load the content of
                     # the directory associated with that node.
-                    content = await self._load_directory(node).wait()
+                    content = await self._load_directory(node, stream=True).wait()
                 except WorkerCancelled:
                     # The worker was cancelled, that would suggest we're all
                     # done here and we should get out of the loader in general.
@@ -511,10 +844,12 @@ class DirectoryTree(Tree[DirEntry]):
                     # reason so let's no-op that (for now anyway).
                     pass
                 else:
-                    # We're still here and we have directory content, get it into
-                    # the tree.
+                    # We're still here and the directory content has been added
+                    # to the tree, in batches; put it in order.
                     if content:
-                        self._populate_node(node, content)
+                        self._sort_node(node)
+                        if self.prefetch:
+                            self._prefetch_children(node)
                 finally:
                     # Mark this iteration as done.
                     self._load_queue.task_done()
@@ -524,7 +859,7 @@ class DirectoryTree(Tree[DirEntry]):
         dir_entry = event.node.data
         if dir_entry is None:
             return
-        if self._safe_is_dir(dir_entry.path):
+        if self._is_dir(dir_entry.path):
             await self._add_to_load_queue(event.node)
         else:
             self.post_message(self.FileSelected(event.node, dir_entry.path))
@@ -534,7 +869,7 @@ class DirectoryTree(Tree[DirEntry]):
         dir_entry = event.node.data
         if dir_entry is None:
             return
-        if self._safe_is_dir(dir_entry.path):
+        if self._is_dir(dir_entry.path):
             self.post_message(self.DirectorySelected(event.node, dir_entry.path))
         else:
             self.post_message(self.FileSelected(event.node, dir_entry.path))
@@ -0,0 +1,342 @@
+"""Provides a widget to display (and follow) a file, without reading it in to memory."""
+
+from __future__ import annotations
+
+import os
+from array import array
+from itertools import accumulate, count
+from operator import add
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Sequence, overload
+
+from .. import events, work
+from ..geometry import Size
+from ..timer import Timer
+from ..worker import get_current_worker
+from ._log import _LogView
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_MIN_CHUNK_SIZE = 64 * 1024
+"""Bytes indexed by the first chunk, which is small so that the first page is fast."""
+_MAX_CHUNK_SIZE = 4 * 1024 * 1024
+"""Maximum number of bytes indexed in a chunk."""
+
+
+class _FileLines(Sequence[str]):
+    """The lines of a file, which are read and decoded as they are displayed."""
+
+    def __init__(self, encoding: str) -> None:
+        """
+        Args:
+            encoding: Encoding of the file.
+        """
+        self.encoding = encoding
+        self.file: BinaryIO | None = None
+        """The open file."""
+        self.line_starts = array("q", [0])
+        """Offset of the start of each line."""
+        self.end = 0
+        """Offset of the end of the indexed data."""
+
+    @property
+    def offset(self) -> int:
+        """The absolute line number of the first line (lines are never discarded)."""
+        return 0
+
+    def __len__(self) -> int:
+        return len(self.line_starts) if self.end else 0
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[line] for line in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("line index out of range")
+        assert self.file is not None
+        line_starts = self.line_starts
+        start = line_starts[index]
+        end = line_starts[index + 1] - 1 if index + 1 < size else self.end
+        # The file may have been truncated since it was indexed, in which case
+        # fewer bytes (or none) are read
+        self.file.seek(start)
+        line = self.file.read(end - start)
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        return line.decode(self.encoding, "replace")
+
+    def clear(self) -> None:
+        """Remove the index (and close the file)."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.line_starts = array("q", [0])
+        self.end = 0
+
+
+class FileLog(_LogView):
+    """A widget to display the lines of a file, which may be larger than memory.
+
+    Only the lines which are displayed are read from the file. Lines are indexed by
+    a thread, and are displayed as they are indexed, so the first page is displayed
+    quickly regardless of the size of the file.
+    """
+
+    DEFAULT_CSS = """
+    FileLog {
+        background: $surface;
+        color: $text;
+        overflow: scroll;
+    }
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        follow: bool = False,
+        poll_interval: float = 0.5,
+        encoding: str = "utf-8",
+        highlight: bool = False,
+        auto_scroll: bool = False,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Create a FileLog widget.
+
+        Args:
+            path: Path to the file.
+            follow: Display data which is appended to the file (like `tail -f`).
+            poll_interval: Seconds between checking the size of the file, if following.
+            encoding: Encoding of the file (invalid data is replaced).
+            highlight: Enable highlighting.
+            auto_scroll: Scroll to the end as lines are indexed.
+            name: The name of the file log.
+            id: The ID of the file log in the DOM.
+            classes: The CSS classes of the file log.
+            disabled: Whether the file log is disabled or not.
+        """
+        super().__init__(
+            highlight=highlight,
+            auto_scroll=auto_scroll,
+            name=name,
+            id=id,
+            classes=classes,
+            disabled=disabled,
+        )
+        self._path = Path(path)
+        self.follow = follow
+        """Display data which is appended to the file."""
+        self._poll_interval = poll_interval
+        self._lines: _FileLines = _FileLines(encoding)
+        self._file_size = 0
+        """The size of the file when it was last checked."""
+        self._file_id: tuple[int, int] | None = None
+        """The device and inode of the open file, to detect a replaced file."""
+        self._generation = 0
+        """Incremented when the file is reloaded, so stale indexes are discarded."""
+        self._indexing = False
+        """Are lines being indexed?"""
+        self._poll_timer: Timer | None = None
+
+    @property
+    def path(self) -> Path:
+        """The path to the file."""
+        return self._path
+
+    @property
+    def lines(self) -> Sequence[str]:
+        """The lines of the file which have been indexed.
+
+        Note that this attribute is read only.
+        """
+        return self._lines
+
+    @property
+    def indexing(self) -> bool:
+        """Are lines being indexed? If `True`, not every line is displayed yet."""
+        return self._indexing
+
+    def _on_mount(self, event: events.Mount) -> None:
+        self.reload()
+        self._poll_timer = self.set_interval(
+            self._poll_interval, self._check_file, name="check file size"
+        )
+
+    def _on_unmount(self) -> None:
+        self._lines.clear()
+
+    def reload(self) -> Self:
+        """Index the file again (e.g. because it was replaced).
+
+        If the file can't be read, the log is empty.
+
+        Returns:
+            The `FileLog` instance.
+        """
+        self._generation += 1
+        self._indexing = False
+        self._lines.clear()
+        self._file_size = 0
+        self._file_id = None
+        self._width = 0
+        self._render_line_cache.clear()
+        self.virtual_size = Size(0, 0)
+        try:
+            file = open(self._path, "rb")
+        except OSError:
+            pass
+        else:
+            self._lines.file = file
+            stat = os.fstat(file.fileno())
+            self._file_id = (stat.st_dev, stat.st_ino)
+            self._index_file(0, stat.st_size)
+        self.refresh()
+        return self
+
+    def _index_file(self, start: int, file_size: int) -> None:
+        """Index any new data in the file.
+
+        Args:
+            start: Offset of the data to index.
+            file_size: The current size of the file.
+        """
+        self._file_size = file_size
+        if file_size > start:
+            self._indexing = True
+            self._index_lines(self._generation, start, file_size)
+
+    def _check_file(self) -> None:
+        """Check the size of the file, and index appended data if following."""
+        if not self.follow or self._indexing:
+            return
+        try:
+            stat = self._path.stat()
+        except OSError:
+            # The file may be being replaced, so check again later
+            return
+        if (stat.st_dev, stat.st_ino) != self._file_id:
+            # The file was replaced (e.g. by log rotation), or was created
+            self.reload()
+        elif stat.st_size < self._file_size:
+            # The file was truncated
+            self.reload()
+        elif stat.st_size > self._file_size:
+            self._index_file(self._lines.end, stat.st_size)
+
+    @work(thread=True, exclusive=True, group="file_log")
+    def _index_lines(self, generation: int, start: int, end: int) -> None:
+        """A thread worker to find the start of every line in a range of the file.
+
+        Args:
+            generation: The generation at the time of invocation.
+            start: Offset of the first byte to index.
+            end: Offset of the byte after the last byte to index.
+        """
+        worker = get_current_worker()
+        chunk_size = _MIN_CHUNK_SIZE
+        position = start
+        try:
+            with open(self._path, "rb") as file:
+                file.seek(start)
+                while position < end:
+                    if worker.is_cancelled:
+                        return
+                    chunk = file.read(min(chunk_size, end - position))
+                    if not chunk:
+                        # The file was truncated
+                        break
+                    lines = chunk.split(b"\n")
+                    # Lines start after each new line character (none of which
+                    # is in the last item), i.e. at `position + len(lines so far)`
+                    # plus a byte for every new line so far.
+                    line_starts = array(
+                        "q",
+                        map(
+                            add,
+                            accumulate(map(len, lines[:-1])),
+                            count(position + 1),
+                        ),
+                    )
+                    width = max(map(len, lines))
+                    position += len(chunk)
+                    self.app.call_from_thread(
+                        self._add_lines,
+                        generation,
+                        line_starts,
+                        position,
+                        width,
+                        position >= end,
+                    )
+                    chunk_size = min(chunk_size * 2, _MAX_CHUNK_SIZE)
+        except OSError:
+            pass
+        if position < end:
+            # The file couldn't be read to the end, so stop indexing
+            self.app.call_from_thread(
+                self._add_lines, generation, array("q"), position, 0, True
+            )
+
+    def _add_lines(
+        self,
+        generation: int,
+        line_starts: Iterable[int],
+        end: int,
+        width: int,
+        complete: bool,
+    ) -> None:
+        """Add lines which have been indexed.
+
+        Args:
+            generation: The generation the lines were indexed for.
+            line_starts: Offsets of the start of new lines.
+            end: Offset of the end of the indexed data.
+            width: Estimated width of the new lines (their length in bytes).
+            complete: Is this the last chunk of the data being indexed?
+        """
+        if generation != self._generation:
+            return
+        lines = self._lines
+        # The last line may have been extended
+        first_line = max(0, len(lines) - 1)
+        lines.line_starts.extend(line_starts)
+        lines.end = end
+        if complete:
+            self._indexing = False
+            self._file_size = end
+        self._width = max(self._width, width)
+        self.virtual_size = Size(self._width, self.line_count)
+        self.refresh_lines(first_line, len(lines) - first_line)
+        if self.auto_scroll and not self.is_vertical_scrollbar_grabbed:
+            self.scroll_end(animate=False)
+
+    def clear(self) -> Self:
+        """Clear the log.
+
+        The file is displayed again when it is
+        [reloaded][textual.widgets.FileLog.reload], or when the size of the file is
+        next checked (if following).
+
+        Returns:
+            The `FileLog` instance.
+        """
+        self._generation += 1
+        self._indexing = False
+        self._lines.clear()
+        self._file_size = 0
+        self._file_id = None
+        self._width = 0
+        self._render_line_cache.clear()
+        self.virtual_size = Size(0, 0)
+        return self
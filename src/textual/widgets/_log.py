@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Protocol, Sequence
 
 from rich.cells import cell_len
 from rich.highlighter import ReprHighlighter
@@ -9,21 +9,181 @@ from rich.segment import Segment
 from rich.style import Style
 from rich.text import Text
 
-from .. import work
+from .. import constants, work
 from .._line_split import line_split
+from .._ring_buffer import RingBuffer
 from ..cache import LRUCache
 from ..geometry import Size
 from ..reactive import var
 from ..scroll_view import ScrollView
 from ..strip import Strip
+from ..timer import Timer
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
 _sub_escape = re.compile("[\u0000-\u0014]").sub
+_split_lines = re.compile("\r\n|\r|\n").split
 
 
-class Log(ScrollView, can_focus=True):
+class LogStats(NamedTuple):
+    """Counts of lines written with
+    [`Log.write_many`][textual.widgets.Log.write_many]."""
+
+    written: int
+    """Lines written to the log (including lines which were dropped)."""
+    queued: int
+    """Lines waiting to be added to the log."""
+    dropped: int
+    """Lines removed (or never added) because of `max_lines`."""
+
+
+class _LogLines(Protocol):
+    """The lines displayed by a log."""
+
+    @property
+    def offset(self) -> int:
+        """The absolute line number of the first line."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int) -> str: ...
+
+
+class _LogView(ScrollView, can_focus=True):
+    """The base class for widgets which display lines of text, and cache the
+    rendered lines."""
+
+    auto_scroll: var[bool] = var(True)
+    """Automatically scroll to new lines."""
+
+    _lines: _LogLines
+
+    def __init__(
+        self,
+        highlight: bool = False,
+        auto_scroll: bool = True,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """
+        Args:
+            highlight: Enable highlighting.
+            auto_scroll: Scroll to end on new lines.
+            name: The name of the log.
+            id: The ID of the log in the DOM.
+            classes: The CSS classes of the log.
+            disabled: Whether the log is disabled or not.
+        """
+        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self.highlight = highlight
+        """Enable highlighting."""
+        self.auto_scroll = auto_scroll
+        self._width = 0
+        self._render_line_cache: LRUCache[int, Strip] = LRUCache(1024)
+        """Rendered lines, keyed by absolute line number (which doesn't change as
+        lines are pruned)."""
+        self.highlighter = ReprHighlighter()
+        """The Rich Highlighter object to use, if `highlight=True`"""
+
+    def notify_style_update(self) -> None:
+        """Called by Textual when styles update."""
+        self._render_line_cache.clear()
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines of content."""
+        if self._lines:
+            return len(self._lines) - (self._lines[-1] == "")
+        return 0
+
+    @classmethod
+    def _process_line(cls, line: str) -> str:
+        """Process a line before it is rendered to remove control codes.
+
+        Args:
+            line: A string.
+
+        Returns:
+            New string with no control codes.
+        """
+        return _sub_escape("�", line.expandtabs())
+
+    def render_line(self, y: int) -> Strip:
+        """Render a line of content.
+
+        Args:
+            y: Y Coordinate of line.
+
+        Returns:
+            A rendered line.
+        """
+        scroll_x, scroll_y = self.scroll_offset
+        strip = self._render_line(scroll_y + y, scroll_x, self.size.width)
+        return strip
+
+    def _render_line(self, y: int, scroll_x: int, width: int) -> Strip:
+        """Render a line in to a cropped strip.
+
+        Args:
+            y: Y offset of line.
+            scroll_x: Current horizontal scroll.
+            width: Width of the widget.
+
+        Returns:
+            A Strip suitable for rendering.
+        """
+        rich_style = self.rich_style
+        if y >= len(self._lines):
+            return Strip.blank(width, rich_style)
+
+        line = self._render_line_strip(y, rich_style)
+        assert line._cell_length is not None
+        line = line.crop_extend(scroll_x, scroll_x + width, rich_style)
+        return line
+
+    def _render_line_strip(self, y: int, rich_style: Style) -> Strip:
+        """Render a line in to a Strip.
+
+        Args:
+            y: Y offset of line.
+            rich_style: Rich style of line.
+
+        Returns:
+            An uncropped Strip.
+        """
+        cache_key = y + self._lines.offset
+        if cache_key in self._render_line_cache:
+            return self._render_line_cache[cache_key]
+
+        _line = self._process_line(self._lines[y])
+
+        if self.highlight:
+            line_text = self.highlighter(Text(_line, style=rich_style, no_wrap=True))
+            line = Strip(line_text.render(self.app.console), cell_len(_line))
+        else:
+            line = Strip([Segment(_line, rich_style)], cell_len(_line))
+
+        self._render_line_cache[cache_key] = line
+        return line
+
+    def refresh_lines(self, y_start: int, line_count: int = 1) -> None:
+        """Refresh one or more lines.
+
+        Args:
+            y_start: First line to refresh.
+            line_count: Total number of lines to refresh.
+        """
+        offset = self._lines.offset
+        for y in range(y_start + offset, y_start + offset + line_count):
+            self._render_line_cache.discard(y)
+        super().refresh_lines(y_start, line_count=line_count)
+
+
+class Log(_LogView):
     """A widget to log text."""
 
     DEFAULT_CSS = """
@@ -37,9 +197,6 @@ class Log(ScrollView, can_focus=True):
     max_lines: var[int | None] = var[Optional[int]](None)
     """Maximum number of lines to show"""
 
-    auto_scroll: var[bool] = var(True)
-    """Automatically scroll to new lines."""
-
     def __init__(
         self,
         highlight: bool = False,
@@ -61,17 +218,25 @@ class Log(ScrollView, can_focus=True):
             classes: The CSS classes of the text log.
             disabled: Whether the text log is disabled or not.
         """
-        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
-        self.highlight = highlight
-        """Enable highlighting."""
+        super().__init__(
+            highlight=highlight,
+            auto_scroll=auto_scroll,
+            name=name,
+            id=id,
+            classes=classes,
+            disabled=disabled,
+        )
         self.max_lines = max_lines
-        self.auto_scroll = auto_scroll
-        self._lines: list[str] = []
-        self._width = 0
+        self._lines: RingBuffer[str] = RingBuffer(max_lines)
         self._updates = 0
-        self._render_line_cache: LRUCache[int, Strip] = LRUCache(1024)
-        self.highlighter = ReprHighlighter()
-        """The Rich Highlighter object to use, if `highlight=True`"""
+        self._pending: list[str] = []
+        """Data written with `write_many`, waiting for the next flush."""
+        self._pending_scroll_end: bool | None = None
+        """The `scroll_end` argument for the pending data."""
+        self._flush_timer: Timer | None = None
+        self._written_lines = 0
+        self._queued_lines = 0
+        self._dropped_lines = 0
 
     @property
     def lines(self) -> Sequence[str]:
@@ -83,9 +248,11 @@ class Log(ScrollView, can_focus=True):
         """
         return self._lines
 
-    def notify_style_update(self) -> None:
-        """Called by Textual when styles update."""
-        self._render_line_cache.clear()
+    @property
+    def stats(self) -> LogStats:
+        """Counts of lines written with
+        [`write_many`][textual.widgets.Log.write_many]."""
+        return LogStats(self._written_lines, self._queued_lines, self._dropped_lines)
 
     def _update_maximum_width(self, updates: int, size: int) -> None:
         """Update the virtual size width.
@@ -98,25 +265,6 @@ class Log(ScrollView, can_focus=True):
             self._width = max(size, self._width)
             self.virtual_size = Size(self._width, self.line_count)
 
-    @property
-    def line_count(self) -> int:
-        """Number of lines of content."""
-        if self._lines:
-            return len(self._lines) - (self._lines[-1] == "")
-        return 0
-
-    @classmethod
-    def _process_line(cls, line: str) -> str:
-        """Process a line before it is rendered to remove control codes.
-
-        Args:
-            line: A string.
-
-        Returns:
-            New string with no control codes.
-        """
-        return _sub_escape("�", line.expandtabs())
-
     @work(thread=True)
     def _update_size(self, updates: int, lines: list[str]) -> None:
         """A thread worker to update the width in the background.
@@ -131,23 +279,9 @@ class Log(ScrollView, can_focus=True):
             self.app.call_from_thread(self._update_maximum_width, updates, max_length)
 
     def _prune_max_lines(self) -> None:
-        """Prune lines if there are more than the maximum."""
-        if self.max_lines is None:
-            return
-        remove_lines = len(self._lines) - self.max_lines
-        if remove_lines > 0:
-            _cache = self._render_line_cache
-            # We've removed some lines, which means the y values in the cache are out of sync
-            # Calculated a new dict of cache values
-            updated_cache = {
-                y - remove_lines: _cache[y] for y in _cache.keys() if y > remove_lines
-            }
-            # Clear the cache
-            _cache.clear()
-            # Update the cache with previously calculated values
-            for y, line in updated_cache.items():
-                _cache[y] = line
-            del self._lines[:remove_lines]
+        """Set the maximum number of lines stored, which prunes any lines over the
+        maximum, and any lines over the maximum as lines are added."""
+        self._lines.max_length = self.max_lines
 
     def write(
         self,
@@ -163,8 +297,10 @@ class Log(ScrollView, can_focus=True):
         Returns:
             The `Log` instance.
         """
-
-        if data:
+        # Data from write_many goes first, to keep the writes in order
+        self.flush()
+        self._prune_max_lines()
+        if data and self.max_lines != 0:
             if not self._lines:
                 self._lines.append("")
             for line, ending in line_split(data):
@@ -177,12 +313,91 @@ class Log(ScrollView, can_focus=True):
                     self._lines.append("")
             self.virtual_size = Size(self._width, self.line_count)
 
-        if self.max_lines is not None and len(self._lines) > self.max_lines:
-            self._prune_max_lines()
+        auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
+        if auto_scroll and not self.is_vertical_scrollbar_grabbed:
+            self.scroll_end(animate=False)
+        return self
+
+    def write_many(
+        self,
+        chunks: Iterable[str],
+        scroll_end: bool | None = None,
+    ) -> Self:
+        """Write chunks of data to the log, at most once per frame.
+
+        The data is buffered and added to the log by the next flush, which splits
+        and measures every line in one batch and refreshes the log once. This is
+        considerably faster than calling [`write`][textual.widgets.Log.write] for
+        each chunk, when a lot of data is being written (e.g. tailing a busy process).
+
+        Chunks are joined, so a chunk may end part way through a line.
+        See [`stats`][textual.widgets.Log.stats] for counts of lines written.
 
+        Args:
+            chunks: Chunks of data to write.
+            scroll_end: Scroll to the end after writing, or `None` to use `self.auto_scroll`.
+
+        Returns:
+            The `Log` instance.
+        """
+        pending = self._pending
+        for chunk in chunks:
+            if chunk:
+                pending.append(chunk)
+                self._queued_lines += chunk.count("\n")
+        if scroll_end is not None:
+            self._pending_scroll_end = scroll_end
+        if pending and self._flush_timer is None:
+            self._flush_timer = self.set_timer(
+                1 / constants.MAX_FPS, self.flush, name="flush log"
+            )
+        return self
+
+    def flush(self) -> Self:
+        """Add any data written with [`write_many`][textual.widgets.Log.write_many]
+        to the log now, rather than on the next frame.
+
+        Returns:
+            The `Log` instance.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if not self._pending:
+            return self
+        data = "".join(self._pending)
+        self._pending.clear()
+        self._queued_lines = 0
+        scroll_end = self._pending_scroll_end
+        self._pending_scroll_end = None
+
+        self._prune_max_lines()
+        lines = self._lines
+        offset = lines.offset
+        if lines:
+            # The data continues the last line
+            new_lines = _split_lines(lines[-1] + data)
+            lines[-1] = new_lines[0]
+            lines.extend(new_lines[1:])
+        else:
+            new_lines = _split_lines(data)
+            lines.extend(new_lines)
+        self._written_lines += len(new_lines) - 1
+        self._dropped_lines += lines.offset - offset
+        if len(new_lines) > len(lines):
+            # Lines which were pruned immediately aren't measured
+            del new_lines[: len(new_lines) - len(lines)]
+        start_line = len(lines) - len(new_lines)
+
+        self.virtual_size = Size(self._width, self.line_count)
+        self._update_size(self._updates, new_lines)
+        # Discard the cached strip for the line which was continued
+        self.refresh_lines(start_line, len(new_lines))
         auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
         if auto_scroll and not self.is_vertical_scrollbar_grabbed:
             self.scroll_end(animate=False)
+        else:
+            self.refresh()
         return self
 
     def write_line(self, line: str) -> Self:
@@ -211,14 +426,14 @@ class Log(ScrollView, can_focus=True):
         Returns:
             The `Log` instance.
         """
+        self.flush()
         auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
         new_lines = []
         for line in lines:
             new_lines.extend(line.splitlines())
-        start_line = len(self._lines)
+        self._prune_max_lines()
         self._lines.extend(new_lines)
-        if self.max_lines is not None and len(self._lines) > self.max_lines:
-            self._prune_max_lines()
+        start_line = max(0, len(self._lines) - len(new_lines))
         self.virtual_size = Size(self._width, len(self._lines))
         self._update_size(self._updates, new_lines)
         self.refresh_lines(start_line, len(new_lines))
@@ -234,77 +449,10 @@ class Log(ScrollView, can_focus=True):
         Returns:
             The `Log` instance.
         """
+        self.flush()
         self._lines.clear()
         self._width = 0
         self._render_line_cache.clear()
         self._updates += 1
         self.virtual_size = Size(0, 0)
         return self
-
-    def render_line(self, y: int) -> Strip:
-        """Render a line of content.
-
-        Args:
-            y: Y Coordinate of line.
-
-        Returns:
-            A rendered line.
-        """
-        scroll_x, scroll_y = self.scroll_offset
-        strip = self._render_line(scroll_y + y, scroll_x, self.size.width)
-        return strip
-
-    def _render_line(self, y: int, scroll_x: int, width: int) -> Strip:
-        """Render a line in to a cropped strip.
-
-        Args:
-            y: Y offset of line.
-            scroll_x: Current horizontal scroll.
-            width: Width of the widget.
-
-        Returns:
-            A Strip suitable for rendering.
-        """
-        rich_style = self.rich_style
-        if y >= len(self._lines):
-            return Strip.blank(width, rich_style)
-
-        line = self._render_line_strip(y, rich_style)
-        assert line._cell_length is not None
-        line = line.crop_extend(scroll_x, scroll_x + width, rich_style)
-        return line
-
-    def _render_line_strip(self, y: int, rich_style: Style) -> Strip:
-        """Render a line in to a Strip.
-
-        Args:
-            y: Y offset of line.
-            rich_style: Rich style of line.
-
-        Returns:
-            An uncropped Strip.
-        """
-        if y in self._render_line_cache:
-            return self._render_line_cache[y]
-
-        _line = self._process_line(self._lines[y])
-
-        if self.highlight:
-            line_text = self.highlighter(Text(_line, style=rich_style, no_wrap=True))
-            line = Strip(line_text.render(self.app.console), cell_len(_line))
-        else:
-            line = Strip([Segment(_line, rich_style)], cell_len(_line))
-
-        self._render_line_cache[y] = line
-        return line
-
-    def refresh_lines(self, y_start: int, line_count: int = 1) -> None:
-        """Refresh one or more lines.
-
-        Args:
-            y_start: First line to refresh.
-            line_count: Total number of lines to refresh.
-        """
-        for y in range(y_start, y_start + line_count):
-            self._render_line_cache.discard(y)
-        super().refresh_lines(y_start, line_count=line_count)
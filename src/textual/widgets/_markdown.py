@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
+from asyncio import Future, wait
 from pathlib import Path, PurePath
-from typing import Callable, Iterable, Optional
+from typing import Any, Callable, Iterable, NamedTuple, Optional
 
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
@@ -28,6 +30,60 @@ TableOfContentsType: TypeAlias = "list[tuple[int, str, str | None]]"
 The triples encode the level, the label, and the optional block id of each heading.
 """
 
+_NEWLINE = re.compile(r"\r\n?|\n")
+"""Matches the line endings recognized by the Markdown parser."""
+
+
+def _find_last_blank_line(markdown: str) -> int:
+    """Find the last blank line in Markdown.
+
+    Args:
+        markdown: A string containing Markdown.
+
+    Returns:
+        The offset of the last blank line, or -1 if there is no blank line. The last
+            line is only blank if it ends with a new line.
+    """
+    end = markdown.rfind("\n")
+    while end >= 0:
+        start = markdown.rfind("\n", 0, end) + 1
+        if not markdown[start:end].strip(" \t\r"):
+            return start
+        end = start - 1
+    return -1
+
+
+def _link_targets(references: dict[str, dict[str, Any]]) -> dict[str, tuple[str, str]]:
+    """Get the targets of link references, to compare link references without the
+    location of their definitions.
+
+    Args:
+        references: Link references, as stored by the parser.
+
+    Returns:
+        A dict which maps each label on to its URL and title.
+    """
+    return {
+        label: (reference["href"], reference["title"])
+        for label, reference in references.items()
+    }
+
+
+class _TopLevelBlock(NamedTuple):
+    """A top level block of a Markdown document, and the widgets built from it."""
+
+    key: tuple[object, ...]
+    """The tokens of the block (and the IDs of its headings), to find unchanged
+    blocks."""
+    offset: int
+    """The offset of the first line of the block in the source."""
+    block_id: int
+    """The number of headings before the block."""
+    blocks: list[MarkdownBlock]
+    """The widgets built from the block."""
+    table_of_contents: TableOfContentsType
+    """The headings in the block."""
+
 
 class Navigator:
     """Manages a stack of paths like a browser."""
@@ -115,6 +171,40 @@ class MarkdownBlock(Static):
         self._text = text
         self.update(text)
 
+    def _update_from(self, block: MarkdownBlock) -> bool:
+        """Update this block in place with the content of a new block.
+
+        Args:
+            block: A block built from a new version of the document, which won't be
+                mounted.
+
+        Returns:
+            `True` if the block was updated, or `False` if it should be replaced by
+                the new block.
+        """
+        return False
+
+    def _update_from_token(self, block: MarkdownBlock) -> bool:
+        """Update a block, which has no child blocks, from the token of a new block.
+
+        Args:
+            block: A block built from a new version of the document.
+
+        Returns:
+            `True` if the block was updated, or `False` if it should be replaced by
+                the new block.
+        """
+        if (
+            type(self) is not type(block)
+            or self.id != block.id
+            or block._token is None
+            or block._blocks
+            or self.children
+        ):
+            return False
+        self.build_from_token(block._token)
+        return True
+
     async def action_link(self, href: str) -> None:
         """Called on link click."""
         self.post_message(Markdown.LinkClicked(self._markdown, href))
@@ -218,6 +308,9 @@ class MarkdownHeader(MarkdownBlock):
     }
     """
 
+    def _update_from(self, block: MarkdownBlock) -> bool:
+        return self._update_from_token(block)
+
 
 class MarkdownH1(MarkdownHeader):
     """An H1 Markdown header."""
@@ -325,6 +418,9 @@ class MarkdownParagraph(MarkdownBlock):
     }
     """
 
+    def _update_from(self, block: MarkdownBlock) -> bool:
+        return self._update_from_token(block)
+
 
 class MarkdownBlockQuote(MarkdownBlock):
     """A block quote Markdown block."""
@@ -612,6 +708,16 @@ class MarkdownFence(MarkdownBlock):
         """Watch app theme switching."""
         self.watch(self.app, "dark", self._retheme)
 
+    def _update_from(self, block: MarkdownBlock) -> bool:
+        if not isinstance(block, MarkdownFence) or type(self) is not type(block):
+            return False
+        if block.lexer != self.lexer:
+            return False
+        self.code = block.code
+        if self.children:
+            self.get_child_by_type(Static).update(self._block())
+        return True
+
     def _retheme(self) -> None:
         """Rerender when the theme changes."""
         self.theme = (
@@ -704,7 +810,18 @@ class Markdown(Widget):
         super().__init__(name=name, id=id, classes=classes)
         self._markdown = markdown
         self._parser_factory = parser_factory
+        self._parser: MarkdownIt | None = None
+        """The parser, created when it is first used."""
         self._table_of_contents: TableOfContentsType | None = None
+        self._source = ""
+        """The Markdown in the document."""
+        self._top_level_blocks: list[_TopLevelBlock] = []
+        """The top level blocks of the document."""
+        self._references: dict[str, dict[str, Any]] = {}
+        """The link reference definitions in the document (with the offset of each
+        definition in the source)."""
+        self._pending_update: Future[Any] | None = None
+        """Completes when the widgets of the most recent update have been mounted."""
 
     class TableOfContentsUpdated(Message):
         """The table of contents was updated."""
@@ -769,6 +886,11 @@ class Markdown(Widget):
         if self._markdown is not None:
             self.update(self._markdown)
 
+    @property
+    def source(self) -> str:
+        """The Markdown in the document."""
+        return self._source
+
     def _watch_code_dark_theme(self) -> None:
         """React to the dark theme being changed."""
         if self.app.dark:
@@ -853,24 +975,150 @@ class Markdown(Widget):
     def update(self, markdown: str) -> AwaitComplete:
         """Update the document with new Markdown.
 
+        Only the blocks which have changed are updated, mounted, or removed.
+
         Args:
             markdown: A string containing Markdown.
 
         Returns:
             An optionally awaitable object. Await this to ensure that all children have been mounted.
         """
-        output: list[MarkdownBlock] = []
-        stack: list[MarkdownBlock] = []
-        parser = (
-            MarkdownIt("gfm-like")
-            if self._parser_factory is None
-            else self._parser_factory()
+        self._source = markdown
+        env: dict[str, Any] = {}
+        parsed_blocks = self._parse(markdown, 0, 0, env)
+        references = env.get("references", {})
+        # Links in any block may refer to a link reference.
+        rebuild = _link_targets(references) != _link_targets(self._references)
+        self._references = references
+        return self._update_blocks(0, parsed_blocks, rebuild)
+
+    def append(self, markdown: str) -> AwaitComplete:
+        """Append Markdown to the end of the document.
+
+        Only the blocks after the last blank line of the document (and the block
+        which contains it) are parsed again, along with the new Markdown, so this is
+        much faster than calling [`update`][textual.widgets.Markdown.update] with the
+        whole document when Markdown is streamed in small pieces. The result is the
+        same as calling `update` with the whole document.
+
+        Args:
+            markdown: A string containing Markdown.
+
+        Returns:
+            An optionally awaitable object. Await this to ensure that all children have been mounted.
+        """
+        top_level_blocks = self._top_level_blocks
+        blank_line = _find_last_blank_line(self._source)
+        self._source += markdown
+        # The blocks before a blank line can't be changed by the lines after it,
+        # except for a block which continues past the blank line (such as a list or
+        # a code fence).
+        index = len(top_level_blocks) - 1
+        while index >= 0 and top_level_blocks[index].offset > blank_line:
+            index -= 1
+        if index < 0:
+            return self.update(self._source)
+        first_block = top_level_blocks[index]
+        # Link references defined in the blocks which are parsed again are defined
+        # by parsing them.
+        env: dict[str, Any] = {
+            "references": {
+                label: reference
+                for label, reference in self._references.items()
+                if reference["offset"] < first_block.offset
+            }
+        }
+        parsed_blocks = self._parse(
+            self._source[first_block.offset :],
+            first_block.offset,
+            first_block.block_id,
+            env,
         )
+        if _link_targets(env["references"]) != _link_targets(self._references):
+            # A new or changed link reference may change any block.
+            return self.update(self._source)
+        self._references = env["references"]
+        return self._update_blocks(index, parsed_blocks)
+
+    def _parse(
+        self, markdown: str, offset: int, block_id: int, env: dict[str, Any]
+    ) -> list[tuple[_TopLevelBlock, list[Token]]]:
+        """Parse Markdown into top level blocks.
+
+        Args:
+            markdown: Markdown which starts at the beginning of a line.
+            offset: The offset of the Markdown in the source.
+            block_id: The number of headings before the Markdown.
+            env: The environment for the parser, which stores link references (and
+                the offset in the source of each reference defined by the Markdown).
+
+        Returns:
+            The top level blocks (without widgets), and the tokens of each block.
+        """
+        parser = self._parser
+        if parser is None:
+            parser = self._parser = (
+                MarkdownIt("gfm-like")
+                if self._parser_factory is None
+                else self._parser_factory()
+            )
+        groups: list[list[Token]] = []
+        for token in parser.parse(markdown, env):
+            if (token.level == 0 and token.nesting >= 0) or not groups:
+                groups.append([token])
+            else:
+                groups[-1].append(token)
 
-        block_id: int = 0
-        self._table_of_contents = []
+        line_offsets = [offset]
+        line_offsets.extend(
+            offset + match.end() for match in _NEWLINE.finditer(markdown)
+        )
+        for reference in env.get("references", {}).values():
+            if "map" in reference:
+                reference["offset"] = line_offsets[reference.pop("map")[0]]
+        parsed_blocks: list[tuple[_TopLevelBlock, list[Token]]] = []
+        for tokens in groups:
+            token_map = tokens[0].map
+            if token_map is not None:
+                offset = line_offsets[token_map[0]]
+            heading_count = sum(token.type == "heading_open" for token in tokens)
+            key = (
+                block_id if heading_count else None,
+                *[
+                    (
+                        token.type,
+                        token.tag,
+                        token.info,
+                        token.markup,
+                        token.content,
+                        token.hidden,
+                        tuple(token.attrs.items()),
+                    )
+                    for token in tokens
+                ],
+            )
+            top_level_block = _TopLevelBlock(key, offset, block_id, [], [])
+            parsed_blocks.append((top_level_block, tokens))
+            block_id += heading_count
+        return parsed_blocks
+
+    def _build_blocks(
+        self, tokens: list[Token], block_id: int
+    ) -> tuple[list[MarkdownBlock], TableOfContentsType]:
+        """Build the widgets for the tokens of a top level block.
+
+        Args:
+            tokens: The tokens of a top level block.
+            block_id: The number of headings before the block.
+
+        Returns:
+            The widgets, and the headings in the block.
+        """
+        output: list[MarkdownBlock] = []
+        stack: list[MarkdownBlock] = []
+        table_of_contents: TableOfContentsType = []
 
-        for token in parser.parse(markdown):
+        for token in tokens:
             if token.type == "heading_open":
                 block_id += 1
                 stack.append(HEADINGS[token.tag](self, id=f"block{block_id}"))
@@ -917,7 +1165,7 @@ class Markdown(Widget):
                 if token.type == "heading_close":
                     heading = block._text.plain
                     level = int(token.tag[1:])
-                    self._table_of_contents.append((level, heading, block.id))
+                    table_of_contents.append((level, heading, block.id))
                 if stack:
                     stack[-1]._blocks.append(block)
                 else:
@@ -933,21 +1181,141 @@ class Markdown(Widget):
                 if external is not None:
                     (stack[-1]._blocks if stack else output).append(external)
 
-        self.post_message(
-            Markdown.TableOfContentsUpdated(self, self._table_of_contents).set_sender(
-                self
+        return output, table_of_contents
+
+    def _update_blocks(
+        self,
+        start: int,
+        parsed_blocks: list[tuple[_TopLevelBlock, list[Token]]],
+        rebuild: bool = False,
+    ) -> AwaitComplete:
+        """Replace the top level blocks from a given index, updating only the widgets
+        of blocks which have changed.
+
+        Args:
+            start: The index of the first top level block to replace.
+            parsed_blocks: The new top level blocks, and their tokens.
+            rebuild: Rebuild all the blocks, even if they haven't changed.
+
+        Returns:
+            An optionally awaitable object. Await this to ensure that all children have been mounted.
+        """
+        old_blocks = self._top_level_blocks[start:]
+        old_count = len(old_blocks)
+        new_count = len(parsed_blocks)
+
+        # Blocks at the start and the end which haven't changed are kept.
+        prefix = 0
+        while (
+            not rebuild
+            and prefix < min(old_count, new_count)
+            and old_blocks[prefix].key == parsed_blocks[prefix][0].key
+        ):
+            prefix += 1
+        suffix = 0
+        while (
+            not rebuild
+            and suffix < min(old_count, new_count) - prefix
+            and old_blocks[old_count - suffix - 1].key
+            == parsed_blocks[new_count - suffix - 1][0].key
+        ):
+            suffix += 1
+
+        def keep(
+            old_block: _TopLevelBlock, new_block: _TopLevelBlock
+        ) -> _TopLevelBlock:
+            return new_block._replace(
+                blocks=old_block.blocks, table_of_contents=old_block.table_of_contents
             )
-        )
-        markdown_block = self.query("MarkdownBlock")
+
+        kept_prefix = [
+            keep(old_block, new_block)
+            for old_block, (new_block, _) in zip(
+                old_blocks[:prefix], parsed_blocks[:prefix]
+            )
+        ]
+        kept_suffix = [
+            keep(old_block, new_block)
+            for old_block, (new_block, _) in zip(
+                old_blocks[old_count - suffix :], parsed_blocks[new_count - suffix :]
+            )
+        ]
+        changed_blocks = old_blocks[prefix : old_count - suffix]
+
+        # Build the widgets of the changed blocks, updating widgets in place where
+        # possible, and work out where the new widgets should be mounted.
+        updated_blocks: list[_TopLevelBlock] = []
+        removed: list[Widget] = []
+        mounts: list[tuple[list[MarkdownBlock], MarkdownBlock | None]] = []
+        pending: list[MarkdownBlock] = []
+        for index, (new_block, tokens) in enumerate(
+            parsed_blocks[prefix : new_count - suffix]
+        ):
+            blocks, table_of_contents = self._build_blocks(tokens, new_block.block_id)
+            previous_blocks = (
+                changed_blocks[index].blocks if index < len(changed_blocks) else []
+            )
+            if len(blocks) == len(previous_blocks) == 1 and previous_blocks[
+                0
+            ]._update_from(blocks[0]):
+                blocks = previous_blocks
+                if pending:
+                    mounts.append((pending, blocks[0]))
+                    pending = []
+            else:
+                removed.extend(previous_blocks)
+                pending.extend(blocks)
+            updated_blocks.append(
+                new_block._replace(blocks=blocks, table_of_contents=table_of_contents)
+            )
+        for changed_block in changed_blocks[len(updated_blocks) :]:
+            removed.extend(changed_block.blocks)
+        if pending:
+            before = next(
+                (block.blocks[0] for block in kept_suffix if block.blocks), None
+            )
+            mounts.append((pending, before))
+
+        self._top_level_blocks[start:] = kept_prefix + updated_blocks + kept_suffix
+
+        old_headings = [
+            heading
+            for changed_block in changed_blocks
+            for heading in changed_block.table_of_contents
+        ]
+        new_headings = [
+            heading
+            for updated_block in updated_blocks
+            for heading in updated_block.table_of_contents
+        ]
+        if self._table_of_contents is None or old_headings != new_headings:
+            self._table_of_contents = [
+                heading
+                for top_level_block in self._top_level_blocks
+                for heading in top_level_block.table_of_contents
+            ]
+            self.post_message(
+                Markdown.TableOfContentsUpdated(
+                    self, self._table_of_contents
+                ).set_sender(self)
+            )
+
+        previous_update = self._pending_update
 
         async def await_update() -> None:
             """Update in a single batch."""
-
+            if previous_update is not None and not previous_update.done():
+                # Widgets are mounted relative to the widgets of previous updates.
+                await wait([previous_update])
             with self.app.batch_update():
-                await markdown_block.remove()
-                await self.mount_all(output)
-
-        return AwaitComplete(await_update())
+                if removed:
+                    await self.app._remove_nodes(removed, self)
+                for blocks, before in mounts:
+                    await self.mount_all(blocks, before=before)
+
+        await_complete = AwaitComplete(await_update())
+        self._pending_update = await_complete._future
+        return await_complete
 
 
 class MarkdownTableOfContents(Widget, can_focus_children=True):
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence, cast
 
 from rich.console import RenderableType
 from rich.highlighter import Highlighter, ReprHighlighter
@@ -12,6 +12,7 @@ from rich.protocol import is_renderable
 from rich.segment import Segment
 from rich.text import Text
 
+from .._ring_buffer import RingBuffer
 from ..cache import LRUCache
 from ..geometry import Region, Size
 from ..reactive import var
@@ -71,8 +72,9 @@ class RichLog(ScrollView, can_focus=True):
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self.max_lines = max_lines
         """Maximum number of lines in the log or `None` for no maximum."""
-        self._start_line: int = 0
-        self.lines: list[Strip] = []
+        self._lines: RingBuffer[Strip] = RingBuffer(max_lines)
+        """The rendered lines, which discards lines over `max_lines` as lines are
+        added."""
         self._line_cache: LRUCache[tuple[int, int, int, int], Strip]
         self._line_cache = LRUCache(1024)
         self.max_width: int = 0
@@ -92,6 +94,15 @@ class RichLog(ScrollView, can_focus=True):
         self._last_container_width: int = min_width
         """Record the last width we rendered content at."""
 
+    @property
+    def lines(self) -> Sequence[Strip]:
+        """The rendered lines in the log.
+
+        Note that this attribute is read only.
+        Changing the lines will not update the log's contents.
+        """
+        return self._lines
+
     def notify_style_update(self) -> None:
         self._line_cache.clear()
 
@@ -148,7 +159,78 @@ class RichLog(ScrollView, can_focus=True):
         """
 
         auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
+        strips = self._render_item(content, width, expand, shrink)
+        self._add_strips(strips)
+        if auto_scroll:
+            self.scroll_end(animate=False)
+
+        return self
 
+    def write_many(
+        self,
+        contents: Iterable[RenderableType | object],
+        width: int | None = None,
+        expand: bool = False,
+        shrink: bool = True,
+        scroll_end: bool | None = None,
+    ) -> Self:
+        """Write several items of text or rich renderables.
+
+        Equivalent to calling [`write`][textual.widgets.RichLog.write] for each item,
+        but the log is updated (and scrolled) once. If there is a maximum number of
+        lines, items which would be removed immediately aren't rendered.
+
+        Args:
+            contents: Rich renderables (or text).
+            width: Width to render or `None` to use optimal width.
+            expand: Enable expand to widget width, or `False` to use `width`.
+            shrink: Enable shrinking of content to fit width.
+            scroll_end: Enable automatic scroll to end, or `None` to use `self.auto_scroll`.
+
+        Returns:
+            The `RichLog` instance.
+        """
+        auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
+        max_lines = self.max_lines
+        rendered: list[list[Strip]] = []
+        if max_lines is None:
+            rendered = [
+                self._render_item(content, width, expand, shrink)
+                for content in contents
+            ]
+        else:
+            # Render from the end, until there are enough lines to fill the log
+            line_count = 0
+            for content in reversed(list(contents)):
+                if line_count >= max_lines:
+                    break
+                strips = self._render_item(content, width, expand, shrink)
+                rendered.append(strips)
+                line_count += len(strips)
+            rendered.reverse()
+        self._add_strips([strip for strips in rendered for strip in strips])
+        if auto_scroll:
+            self.scroll_end(animate=False)
+        return self
+
+    def _render_item(
+        self,
+        content: RenderableType | object,
+        width: int | None,
+        expand: bool,
+        shrink: bool,
+    ) -> list[Strip]:
+        """Render content in to strips.
+
+        Args:
+            content: Rich renderable (or text).
+            width: Width to render or `None` to use optimal width.
+            expand: Enable expand to widget width, or `False` to use `width`.
+            shrink: Enable shrinking of content to fit width.
+
+        Returns:
+            A list of strips, one per line.
+        """
         console = self.app.console
         render_options = console.options
 
@@ -182,26 +264,29 @@ class RichLog(ScrollView, can_focus=True):
         )
         lines = list(Segment.split_lines(segments))
         if not lines:
-            self.lines.append(Strip.blank(render_width))
-        else:
-            self.max_width = max(
-                self.max_width,
-                max(sum([segment.cell_length for segment in _line]) for _line in lines),
-            )
-            strips = Strip.from_lines(lines)
-            for strip in strips:
-                strip.adjust_cell_length(render_width)
-            self.lines.extend(strips)
-
-            if self.max_lines is not None and len(self.lines) > self.max_lines:
-                self._start_line += len(self.lines) - self.max_lines
-                self.refresh()
-                self.lines = self.lines[-self.max_lines :]
-        self.virtual_size = Size(self.max_width, len(self.lines))
-        if auto_scroll:
-            self.scroll_end(animate=False)
+            return [Strip.blank(render_width)]
+        self.max_width = max(
+            self.max_width,
+            max(sum([segment.cell_length for segment in _line]) for _line in lines),
+        )
+        strips = Strip.from_lines(lines)
+        for strip in strips:
+            strip.adjust_cell_length(render_width)
+        return strips
 
-        return self
+    def _add_strips(self, strips: list[Strip]) -> None:
+        """Add rendered lines to the log, which removes any lines over the maximum.
+
+        Args:
+            strips: Strips to add.
+        """
+        lines = self._lines
+        lines.max_length = self.max_lines
+        start_line = lines.offset
+        lines.extend(strips)
+        if lines.offset != start_line:
+            self.refresh()
+        self.virtual_size = Size(self.max_width, len(self._lines))
 
     def clear(self) -> Self:
         """Clear the text log.
@@ -209,11 +294,10 @@ class RichLog(ScrollView, can_focus=True):
         Returns:
             The `RichLog` instance.
         """
-        self.lines.clear()
+        self._lines.clear()
         self._line_cache.clear()
-        self._start_line = 0
         self.max_width = 0
-        self.virtual_size = Size(self.max_width, len(self.lines))
+        self.virtual_size = Size(self.max_width, len(self._lines))
         self.refresh()
         return self
 
@@ -236,14 +320,14 @@ class RichLog(ScrollView, can_focus=True):
         return lines
 
     def _render_line(self, y: int, scroll_x: int, width: int) -> Strip:
-        if y >= len(self.lines):
+        if y >= len(self._lines):
             return Strip.blank(width, self.rich_style)
 
-        key = (y + self._start_line, scroll_x, width, self.max_width)
+        key = (y + self._lines.offset, scroll_x, width, self.max_width)
         if key in self._line_cache:
             return self._line_cache[key]
 
-        line = self.lines[y].crop_extend(scroll_x, scroll_x + width, self.rich_style)
+        line = self._lines[y].crop_extend(scroll_x, scroll_x + width, self.rich_style)
 
         self._line_cache[key] = line
         return line
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import codecs
 import dataclasses
+import os
 import re
 from collections import defaultdict
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, ClassVar, Iterable, Optional, Sequence, Tuple
 
 from rich.style import Style
@@ -27,17 +30,20 @@ from textual.document._document_navigator import DocumentNavigator
 from textual.document._edit import Edit
 from textual.document._history import EditHistory
 from textual.document._languages import BUILTIN_LANGUAGES
+from textual.document._rope_document import RopeDocument
 from textual.document._syntax_aware_document import (
     SyntaxAwareDocument,
     SyntaxAwareDocumentError,
+    SyntaxAwareRopeDocument,
 )
 from textual.document._wrapped_document import WrappedDocument
 from textual.expand_tabs import expand_tabs_inline, expand_text_tabs_from_widths
 
 if TYPE_CHECKING:
     from tree_sitter import Language
+    from tree_sitter.binding import Query
 
-from textual import events, log
+from textual import events, log, work
 from textual._cells import cell_len, cell_width_to_column_index
 from textual.binding import Binding
 from textual.events import Message, MouseEvent
@@ -45,11 +51,28 @@ from textual.geometry import Offset, Region, Size, Spacing, clamp
 from textual.reactive import Reactive, reactive
 from textual.scroll_view import ScrollView
 from textual.strip import Strip
+from textual.timer import Timer
+from textual.worker import Worker, get_current_worker
 
 _OPENING_BRACKETS = {"{": "}", "[": "]", "(": ")"}
 _CLOSING_BRACKETS = {v: k for k, v in _OPENING_BRACKETS.items()}
 _TREE_SITTER_PATH = Path(__file__).parent / "../tree-sitter/"
 _HIGHLIGHTS_PATH = _TREE_SITTER_PATH / "highlights/"
+_MIN_HIGHLIGHT_ROWS = 50
+"""Minimum number of rows highlighted by a query."""
+_MAX_HIGHLIGHTED_ROWS = 5000
+"""Maximum number of rows in the highlight map before it is cleared."""
+_WRAP_INTERVAL = 1 / 30
+"""Seconds between wrapping batches of lines in the background."""
+_WRAP_BUDGET = 0.01
+"""Maximum time (in seconds) spent wrapping lines in each batch."""
+_WRAP_BATCH_SIZE = 200
+"""Number of lines wrapped between checks of the time spent wrapping."""
+_LOAD_FIRST_CHUNK_SIZE = 64 * 1024
+"""Number of bytes of a file which are read (and displayed) before the rest of the
+file, by `TextArea.load_file`."""
+_LOAD_CHUNK_SIZE = 1024 * 1024
+"""Number of bytes read at a time by `TextArea.load_file`."""
 
 StartColumn = int
 EndColumn = Optional[int]
@@ -359,6 +382,47 @@ TextArea {
         def control(self) -> TextArea:
             return self.text_area
 
+    @dataclass
+    class LoadProgress(Message):
+        """Posted as a file is read by `TextArea.load_file`.
+
+        Handle this message using the `on` decorator - `@on(TextArea.LoadProgress)`
+        or a method named `on_text_area_load_progress`.
+        """
+
+        text_area: TextArea
+        """The `text_area` that sent this message."""
+        loaded: int
+        """The number of bytes read."""
+        total: int
+        """The size of the file in bytes."""
+
+        @property
+        def control(self) -> TextArea:
+            """The `TextArea` that sent this message."""
+            return self.text_area
+
+    @dataclass
+    class Loaded(Message):
+        """Posted when `TextArea.load_file` has loaded a file, and parsed it (if
+        it is highlighted).
+
+        Handle this message using the `on` decorator - `@on(TextArea.Loaded)`
+        or a method named `on_text_area_loaded`.
+        """
+
+        text_area: TextArea
+        """The `text_area` that sent this message."""
+        path: Path
+        """The path of the file."""
+        highlighted: bool
+        """True if the file is highlighted."""
+
+        @property
+        def control(self) -> TextArea:
+            """The `TextArea` that sent this message."""
+            return self.text_area
+
     def __init__(
         self,
         text: str = "",
@@ -370,6 +434,7 @@ TextArea {
         read_only: bool = False,
         show_line_numbers: bool = False,
         max_checkpoints: int = 50,
+        storage: Literal["lines", "rope"] = "lines",
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -386,6 +451,8 @@ TextArea {
             read_only: Enable read-only mode. This prevents edits using the keyboard.
             show_line_numbers: Show line numbers on the left edge.
             max_checkpoints: The maximum number of undo history checkpoints to retain.
+            storage: How the document stores its text. Use "rope" for large files,
+                to store text in chunks which are quicker to load and edit.
             name: The name of the `TextArea` widget.
             id: The ID of the widget, used to refer to it from Textual CSS.
             classes: One or more Textual CSS compatible class names separated by spaces.
@@ -402,6 +469,9 @@ TextArea {
         self.indent_type: Literal["tabs", "spaces"] = "spaces"
         """Whether to indent using tabs or spaces."""
 
+        self._storage = storage
+        """How the document stores its text."""
+
         self._word_pattern = re.compile(r"(?<=\W)(?=\w)|(?<=\w)(?=\W)")
         """Compiled regular expression for what we consider to be a 'word'."""
 
@@ -420,13 +490,17 @@ TextArea {
         cursor is currently at. If the cursor is at a bracket, or there's no matching
         bracket, this will be `None`."""
 
-        self._highlights: dict[int, list[Highlight]] = defaultdict(list)
-        """Mapping line numbers to the set of highlights for that line."""
+        self._highlights: dict[int, list[Highlight]] = {}
+        """Mapping line numbers to the set of highlights for that line (if any)."""
+
+        self._highlighted_rows: set[int] = set()
+        """The rows which have been highlighted (which are the keys of `_highlights`,
+        and rows which have no highlights)."""
 
         self._highlight_query: "Query | None" = None
         """The query that's currently being used for highlighting."""
 
-        self.document: DocumentBase = Document(text)
+        self.document: DocumentBase = Document("")
         """The document this widget is currently editing."""
 
         self.wrapped_document: WrappedDocument = WrappedDocument(self.document)
@@ -439,6 +513,13 @@ TextArea {
         self._cursor_offset = (0, 0)
         """The virtual offset of the cursor (not screen-space offset)."""
 
+        self._wrap_timer: Timer | None = None
+        """Timer which wraps lines in the background, after the width changes."""
+
+        self._read_only_before_load: bool | None = None
+        """The value of `read_only` before a file was loaded by `load_file`, or
+        `None` if a file isn't being loaded."""
+
         self._set_document(text, language)
 
         self.language = language
@@ -470,6 +551,7 @@ TextArea {
         read_only: bool = False,
         show_line_numbers: bool = True,
         max_checkpoints: int = 50,
+        storage: Literal["lines", "rope"] = "lines",
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -487,6 +569,8 @@ TextArea {
             soft_wrap: Enable soft wrapping.
             tab_behavior: If 'focus', pressing tab will switch focus. If 'indent', pressing tab will insert a tab.
             show_line_numbers: Show line numbers on the left edge.
+            storage: How the document stores its text. Use "rope" for large files,
+                to store text in chunks which are quicker to load and edit.
             name: The name of the `TextArea` widget.
             id: The ID of the widget, used to refer to it from Textual CSS.
             classes: One or more Textual CSS compatible class names separated by spaces.
@@ -501,6 +585,7 @@ TextArea {
             read_only=read_only,
             show_line_numbers=show_line_numbers,
             max_checkpoints=max_checkpoints,
+            storage=storage,
             name=name,
             id=id,
             classes=classes,
@@ -529,33 +614,143 @@ TextArea {
         return highlight_query
 
     def _build_highlight_map(self) -> None:
-        """Query the tree for ranges to highlights, and update the internal highlights mapping."""
-        highlights = self._highlights
-        highlights.clear()
+        """Reset the internal highlights mapping, and highlight the first rows.
+
+        Other rows are highlighted as they are rendered.
+        """
+        self._highlights.clear()
+        self._highlighted_rows.clear()
+        if not self._highlight_query:
+            return
+        document = self.document
+        if isinstance(document, SyntaxAwareDocument):
+            document.pop_syntax_changes()
+        self._highlight_rows(0, max(self.size.height, _MIN_HIGHLIGHT_ROWS))
+
+    def _update_highlight_map(self) -> None:
+        """Update the internal highlights mapping after edits.
+
+        Rows which were edited, or whose syntax changed (according to tree-sitter),
+        are removed from the mapping so they are highlighted again when rendered, and
+        the rows after edits which added or removed lines are moved.
+        """
         if not self._highlight_query:
             return
+        document = self.document
+        assert isinstance(document, SyntaxAwareDocument)
+        changes = document.pop_syntax_changes()
+        if changes is None:
+            self._build_highlight_map()
+            return
+        highlights = self._highlights
+        highlighted_rows = self._highlighted_rows
+        for top, old_bottom, new_bottom, changed_rows in changes:
+            line_delta = new_bottom - old_bottom
+            if line_delta:
+                highlights = {
+                    (row + line_delta if row > old_bottom else row): line_highlights
+                    for row, line_highlights in highlights.items()
+                    if not top <= row <= old_bottom
+                }
+                highlighted_rows = {
+                    row + line_delta if row > old_bottom else row
+                    for row in highlighted_rows
+                    if not top <= row <= old_bottom
+                }
+            else:
+                changed_rows = [*changed_rows, (top, old_bottom)]
+            for first_row, last_row in changed_rows:
+                if last_row - first_row < len(highlighted_rows):
+                    for row in range(first_row, last_row + 1):
+                        highlights.pop(row, None)
+                    highlighted_rows.difference_update(range(first_row, last_row + 1))
+                else:
+                    highlighted_rows = {
+                        row
+                        for row in highlighted_rows
+                        if not first_row <= row <= last_row
+                    }
+                    highlights = {
+                        row: line_highlights
+                        for row, line_highlights in highlights.items()
+                        if row in highlighted_rows
+                    }
+        self._highlights = highlights
+        self._highlighted_rows = highlighted_rows
+
+    def _highlight_rows(self, start_row: int, end_row: int) -> None:
+        """Query the tree for ranges to highlight in a range of rows, and update the
+        internal highlights mapping.
 
-        captures = self.document.query_syntax_tree(self._highlight_query)
+        Args:
+            start_row: The first row to highlight.
+            end_row: The row after the last row to highlight.
+        """
+        if self._highlight_query is None:
+            return
+        end_row = min(end_row, self.document.line_count)
+        if start_row >= end_row:
+            return
+        if len(self._highlighted_rows) > _MAX_HIGHLIGHTED_ROWS:
+            self._highlights.clear()
+            self._highlighted_rows.clear()
+        rows: defaultdict[int, list[Highlight]] = defaultdict(list)
+        captures = self.document.query_syntax_tree(
+            self._highlight_query,
+            start_point=(start_row, 0),
+            end_point=(end_row, 0),
+        )
         for capture in captures:
             node, highlight_name = capture
             node_start_row, node_start_column = node.start_point
             node_end_row, node_end_column = node.end_point
 
             if node_start_row == node_end_row:
-                highlight = (node_start_column, node_end_column, highlight_name)
-                highlights[node_start_row].append(highlight)
+                if start_row <= node_start_row < end_row:
+                    highlight = (node_start_column, node_end_column, highlight_name)
+                    rows[node_start_row].append(highlight)
             else:
                 # Add the first line of the node range
-                highlights[node_start_row].append(
-                    (node_start_column, None, highlight_name)
-                )
+                if start_row <= node_start_row:
+                    rows[node_start_row].append(
+                        (node_start_column, None, highlight_name)
+                    )
 
                 # Add the middle lines - entire row of this node is highlighted
-                for node_row in range(node_start_row + 1, node_end_row):
-                    highlights[node_row].append((0, None, highlight_name))
+                for node_row in range(
+                    max(node_start_row + 1, start_row), min(node_end_row, end_row)
+                ):
+                    rows[node_row].append((0, None, highlight_name))
 
                 # Add the last line of the node range
-                highlights[node_end_row].append((0, node_end_column, highlight_name))
+                if node_end_row < end_row:
+                    rows[node_end_row].append((0, node_end_column, highlight_name))
+
+        highlights = self._highlights
+        for row in range(start_row, end_row):
+            if row in rows:
+                highlights[row] = rows[row]
+            else:
+                highlights.pop(row, None)
+        self._highlighted_rows.update(range(start_row, end_row))
+
+    def _get_line_highlights(self, line_index: int) -> list[Highlight]:
+        """Get the highlights for a line, querying the tree if required.
+
+        Rows from the line to the bottom of the TextArea are highlighted with a
+        single query, so rendering a page only queries the tree once.
+
+        Args:
+            line_index: The index of the line.
+
+        Returns:
+            The highlights for the line.
+        """
+        if line_index not in self._highlighted_rows:
+            self._highlight_rows(
+                line_index, line_index + max(self.size.height, _MIN_HIGHLIGHT_ROWS)
+            )
+        return self._highlights.get(line_index, [])
 
     def _watch_has_focus(self, focus: bool) -> None:
         self._cursor_visible = focus
@@ -674,6 +869,9 @@ TextArea {
                 f"To use a custom language, register it first using `register_language`, "
                 f"then switch to it by setting the `TextArea.language` attribute."
             )
+        if self._read_only_before_load is not None:
+            # The file being loaded will be parsed with the new language
+            return
 
         self._set_document(self.document.text, language)
 
@@ -815,16 +1013,35 @@ TextArea {
         if language_name == self.language:
             self._set_document(self.text, language_name)
 
-    def _set_document(self, text: str, language: str | None) -> None:
-        """Construct and return an appropriate document.
+    def _create_plain_document(self, text: str) -> DocumentBase:
+        """Create a document without syntax, using the storage of this TextArea.
+
+        Args:
+            text: The text of the document.
+
+        Returns:
+            A new document.
+        """
+        if self._storage == "rope":
+            return RopeDocument(text)
+        return Document(text)
+
+    def _create_document(
+        self, text: str, language: str | None
+    ) -> tuple[DocumentBase, Query | None]:
+        """Construct an appropriate document (which may be done in a thread).
 
         Args:
             text: The text of the document.
             language: The name of the language to use. This must either be a
                 built-in supported language, or a language previously registered
                 via the `register_language` method.
+
+        Returns:
+            The document, and the query to highlight it with (if it is syntax aware).
         """
-        self._highlight_query = None
+        highlight_query: str
+        document_highlight_query: Query | None = None
         if TREE_SITTER and language:
             # Attempt to get the override language.
             text_area_language = self._languages.get(language, None)
@@ -837,24 +1054,49 @@ TextArea {
                 highlight_query = self._get_builtin_highlight_query(language)
             document: DocumentBase
             try:
-                document = SyntaxAwareDocument(text, document_language)
+                if self._storage == "rope":
+                    document = SyntaxAwareRopeDocument(text, document_language)
+                else:
+                    document = SyntaxAwareDocument(text, document_language)
             except SyntaxAwareDocumentError:
-                document = Document(text)
+                document = self._create_plain_document(text)
                 log.warning(
                     f"Parser not found for language {document_language!r}. Parsing disabled."
                 )
             else:
-                self._highlight_query = document.prepare_query(highlight_query)
+                document_highlight_query = document.prepare_query(highlight_query)
         elif language and not TREE_SITTER:
             log.warning(
                 "tree-sitter not available in this environment. Parsing disabled.\n"
                 "You may need to install the `syntax` extras alongside textual.\n"
                 "Try `pip install 'textual[syntax]'` or '`poetry add textual[syntax]'."
             )
-            document = Document(text)
+            document = self._create_plain_document(text)
         else:
-            document = Document(text)
+            document = self._create_plain_document(text)
+        return document, document_highlight_query
+
+    def _set_document(self, text: str, language: str | None) -> None:
+        """Construct and set an appropriate document.
 
+        Args:
+            text: The text of the document.
+            language: The name of the language to use. This must either be a
+                built-in supported language, or a language previously registered
+                via the `register_language` method.
+        """
+        self._install_document(*self._create_document(text, language))
+
+    def _install_document(
+        self, document: DocumentBase, highlight_query: Query | None
+    ) -> None:
+        """Set the document, and move the cursor to the start.
+
+        Args:
+            document: The new document.
+            highlight_query: The query to highlight the document with.
+        """
+        self._highlight_query = highlight_query
         self.document = document
         self.wrapped_document = WrappedDocument(document, tab_width=self.indent_width)
         self.navigator = DocumentNavigator(self.wrapped_document)
@@ -886,12 +1128,194 @@ TextArea {
         Args:
             text: The text to load into the TextArea.
         """
+        self._cancel_load()
         self.history.clear()
         self._set_document(text, self.language)
         self.post_message(self.Changed(self).set_sender(self))
 
+    def load_file(
+        self,
+        path: str | Path,
+        *,
+        encoding: str = "utf-8",
+        max_highlight_size: int | None = None,
+    ) -> Worker[None]:
+        """Load a file into the TextArea, without blocking the app.
+
+        The file is read in a thread. The start of the file is displayed as soon as it
+        is read, and the rest when the whole file has been read. If the TextArea has a
+        language, the file is then parsed in the thread, and highlighted when the
+        parse completes.
+
+        The TextArea is read-only until the file is loaded (and parsed). A
+        [LoadProgress][textual.widgets._text_area.TextArea.LoadProgress] message
+        is posted as the file is read, and a
+        [Loaded][textual.widgets._text_area.TextArea.Loaded] message when it is
+        loaded. The edit history is cleared.
+
+        The file is opened before this method returns, so an error opening it is
+        raised here. If the file can't be read or decoded, the worker fails (see
+        [Worker.StateChanged][textual.worker.Worker.StateChanged]) and `read_only` is
+        restored.
+
+        Args:
+            path: The path of the file.
+            encoding: The encoding of the file.
+            max_highlight_size: Files larger than this (in bytes) are not parsed or
+                highlighted, or `None` for no limit.
+
+        Returns:
+            The worker which loads the file.
+
+        Raises:
+            OSError: If the file can't be opened.
+            LookupError: If the encoding isn't known.
+        """
+        path = Path(path)
+        # Raise errors opening the file here, rather than in the worker
+        codecs.lookup(encoding)
+        with open(path, "rb"):
+            pass
+        if self._read_only_before_load is None:
+            self._read_only_before_load = self.read_only
+        self.read_only = True
+        self.history.clear()
+        return self._load_file(path, encoding, max_highlight_size)
+
+    @work(thread=True, exclusive=True, group="load_file", exit_on_error=False)
+    def _load_file(
+        self, path: Path, encoding: str, max_highlight_size: int | None
+    ) -> None:
+        """Read a file in chunks, and parse it.
+
+        Args:
+            path: The path of the file.
+            encoding: The encoding of the file.
+            max_highlight_size: Files larger than this (in bytes) are not highlighted.
+        """
+        worker = get_current_worker()
+        call_from_thread = self.app.call_from_thread
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            chunks: list[str] = []
+            with open(path, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                data = file.read(_LOAD_FIRST_CHUNK_SIZE)
+                loaded = len(data)
+                text = decoder.decode(data, final=not data)
+                chunks.append(text)
+                if worker.is_cancelled:
+                    return
+                # Display the complete lines, while the rest of the file is read
+                call_from_thread(
+                    self._set_document, text[: text.rfind("\n") + 1] or text, None
+                )
+                self.post_message(self.LoadProgress(self, loaded, size))
+                while data := file.read(_LOAD_CHUNK_SIZE):
+                    if worker.is_cancelled:
+                        return
+                    chunks.append(decoder.decode(data))
+                    loaded += len(data)
+                    self.post_message(
+                        self.LoadProgress(self, loaded, max(size, loaded))
+                    )
+                chunks.append(decoder.decode(b"", final=True))
+
+            text = "".join(chunks)
+            del chunks
+            document = self._create_plain_document(text)
+            if worker.is_cancelled:
+                return
+            call_from_thread(self._show_loaded_document, document)
+
+            language = self.language
+            highlighted = bool(language) and (
+                max_highlight_size is None or loaded <= max_highlight_size
+            )
+            if highlighted:
+                syntax_document, highlight_query = self._create_document(text, language)
+                if worker.is_cancelled:
+                    return
+                call_from_thread(
+                    self._highlight_loaded_document,
+                    syntax_document,
+                    highlight_query,
+                    language,
+                )
+        except Exception:
+            if not worker.is_cancelled:
+                call_from_thread(self._restore_read_only)
+            raise
+        if not worker.is_cancelled:
+            call_from_thread(self._finish_load, path, highlighted)
+
+    def _show_loaded_document(
+        self, document: DocumentBase, highlight_query: Query | None = None
+    ) -> None:
+        """Set the document of a file loaded by `load_file`, keeping the cursor and
+        scroll position.
+
+        Args:
+            document: The new document, whose text begins with the current text.
+            highlight_query: The query to highlight the document with.
+        """
+        selection = self.selection
+        scroll_x, scroll_y = self.scroll_offset
+        self._install_document(document, highlight_query)
+        self.selection = selection
+        self.scroll_to(scroll_x, scroll_y, animate=False)
+
+    def _highlight_loaded_document(
+        self,
+        document: DocumentBase,
+        highlight_query: Query | None,
+        language: str | None,
+    ) -> None:
+        """Replace the document of a file loaded by `load_file` with a (syntax aware)
+        document with the same text.
+
+        Args:
+            document: The new document.
+            highlight_query: The query to highlight the document with.
+            language: The language of the document.
+        """
+        if language != self.language:
+            # The language changed while the file was parsed
+            selection = self.selection
+            self._set_document(self.document.text, self.language)
+            self.selection = selection
+            return
+        self._show_loaded_document(document, highlight_query)
+
+    def _finish_load(self, path: Path, highlighted: bool) -> None:
+        """Called when `load_file` has loaded a file.
+
+        Args:
+            path: The path of the file.
+            highlighted: True if the file is highlighted.
+        """
+        self._restore_read_only()
+        self.post_message(self.Loaded(self, path, highlighted))
+        self.post_message(self.Changed(self).set_sender(self))
+
+    def _restore_read_only(self) -> None:
+        """Restore `read_only` after loading a file."""
+        if self._read_only_before_load is not None:
+            self.read_only = self._read_only_before_load
+            self._read_only_before_load = None
+
+    def _cancel_load(self) -> None:
+        """Cancel loading a file."""
+        if self._read_only_before_load is not None:
+            self.workers.cancel_group(self, "load_file")
+            self._restore_read_only()
+
     def _on_resize(self) -> None:
-        self._rewrap_and_refresh_virtual_size()
+        # A change of height doesn't require the document to be wrapped again
+        if self.wrap_width != self.wrapped_document.width:
+            self._rewrap_and_refresh_virtual_size()
+        else:
+            self._refresh_size()
 
     def _watch_soft_wrap(self) -> None:
         self._rewrap_and_refresh_virtual_size()
@@ -912,6 +1336,41 @@ TextArea {
     def _rewrap_and_refresh_virtual_size(self) -> None:
         self.wrapped_document.wrap(self.wrap_width, tab_width=self.indent_width)
         self._refresh_size()
+        if (
+            self.wrapped_document.unwrapped_line_count
+            and self._wrap_timer is None
+            and self.is_mounted
+        ):
+            self._wrap_timer = self.set_interval(
+                _WRAP_INTERVAL, self._wrap_in_background
+            )
+
+    def _wrap_in_background(self) -> None:
+        """Wrap a batch of the lines which haven't been wrapped yet.
+
+        Lines are wrapped when they are displayed, so this corrects the estimated
+        heights of the other lines. The line at the top of the view is kept in place.
+        """
+        wrapped_document = self.wrapped_document
+        scroll_y = self.scroll_offset.y
+        top = wrapped_document.get_line_info(scroll_y)
+
+        deadline = perf_counter() + _WRAP_BUDGET
+        while not (complete := wrapped_document.wrap_pending(_WRAP_BATCH_SIZE)):
+            if perf_counter() > deadline:
+                break
+        if complete and self._wrap_timer is not None:
+            self._wrap_timer.stop()
+            self._wrap_timer = None
+
+        self._refresh_size()
+        if top is not None:
+            line_index, section_offset = top
+            new_scroll_y = wrapped_document.get_line_offset(line_index) + section_offset
+            if new_scroll_y != scroll_y:
+                self.scroll_to(y=new_scroll_y, animate=False)
+        self._recompute_cursor_offset()
+        self.refresh()
 
     @property
     def is_syntax_aware(self) -> bool:
@@ -995,10 +1454,7 @@ TextArea {
             return Strip.blank(self.size.width)
 
         # Get the line corresponding to this offset
-        try:
-            line_info = wrapped_document._offset_to_line_info[y_offset]
-        except IndexError:
-            line_info = None
+        line_info = wrapped_document.get_line_info(y_offset)
 
         if line_info is None:
             return Strip.blank(self.size.width)
@@ -1055,12 +1511,13 @@ TextArea {
                         else:
                             line.stylize(selection_style, end=line_character_count)
 
-        highlights = self._highlights
-        if highlights and theme:
+        line_highlights = (
+            self._get_line_highlights(line_index) if self._highlight_query else []
+        )
+        if line_highlights and theme:
             line_bytes = _utf8_encode(line_string)
             byte_to_codepoint = build_byte_to_codepoint_dict(line_bytes)
             get_highlight_from_theme = theme.syntax_styles.get
-            line_highlights = highlights[line_index]
             for highlight_start, highlight_end, highlight_name in line_highlights:
                 node_style = get_highlight_from_theme(highlight_name)
                 if node_style is not None:
@@ -1244,7 +1701,7 @@ TextArea {
         new_gutter_width = self.gutter_width
 
         if old_gutter_width != new_gutter_width:
-            self.wrapped_document.wrap(self.wrap_width, self.indent_width)
+            self._rewrap_and_refresh_virtual_size()
         else:
             self.wrapped_document.wrap_range(
                 edit.top,
@@ -1254,7 +1711,7 @@ TextArea {
 
         self._refresh_size()
         edit.after(self)
-        self._build_highlight_map()
+        self._update_highlight_map()
         self.post_message(self.Changed(self))
         return result
 
@@ -1308,7 +1765,7 @@ TextArea {
 
         new_gutter_width = self.gutter_width
         if old_gutter_width != new_gutter_width:
-            self.wrapped_document.wrap(self.wrap_width, self.indent_width)
+            self._rewrap_and_refresh_virtual_size()
         else:
             self.wrapped_document.wrap_range(
                 minimum_from, maximum_old_end, maximum_new_end
@@ -1317,7 +1774,7 @@ TextArea {
         self._refresh_size()
         for edit in reversed(edits):
             edit.after(self)
-        self._build_highlight_map()
+        self._update_highlight_map()
         self.post_message(self.Changed(self))
 
     def _redo_batch(self, edits: Sequence[Edit]) -> None:
@@ -1354,7 +1811,7 @@ TextArea {
 
         new_gutter_width = self.gutter_width
         if old_gutter_width != new_gutter_width:
-            self.wrapped_document.wrap(self.wrap_width, self.indent_width)
+            self._rewrap_and_refresh_virtual_size()
         else:
             self.wrapped_document.wrap_range(
                 minimum_from,
@@ -1365,7 +1822,7 @@ TextArea {
         self._refresh_size()
         for edit in edits:
             edit.after(self)
-        self._build_highlight_map()
+        self._update_highlight_map()
         self.post_message(self.Changed(self))
 
     async def _on_key(self, event: events.Key) -> None:
@@ -3,15 +3,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, ClassVar, Generic, Iterable, NewType, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterable,
+    NewType,
+    Sequence,
+    TypeVar,
+    cast,
+    overload,
+)
 
 import rich.repr
 from rich.style import NULL_STYLE, Style
 from rich.text import Text, TextType
 
 from .. import events
+from .._fenwick_tree import FenwickTree
 from .._immutable_sequence_view import ImmutableSequenceView
-from .._loop import loop_last
 from .._segment_tools import line_pad
 from ..binding import Binding, BindingType
 from ..cache import LRUCache
@@ -79,6 +91,77 @@ class _TreeLine(Generic[TreeDataType]):
         return guides
 
 
+class _TreeLines(Sequence["_TreeLine[TreeDataType]"]):
+    """A view of the lines of a tree, which are created as they are accessed.
+
+    Lines are found from the line counts of each node's children, so getting a line
+    takes O(depth * log(siblings)) time, regardless of the size of the tree.
+    """
+
+    def __init__(self, tree: Tree[TreeDataType]) -> None:
+        """
+        Args:
+            tree: The tree.
+        """
+        self._root = tree.root
+        self._show_root = tree.show_root
+
+    def __len__(self) -> int:
+        root = self._root
+        if self._show_root:
+            return root._line_count
+        # Children of a hidden root are displayed, even if the root is collapsed
+        if root._child_line_counts is None:
+            return 0
+        return root._child_line_counts.total
+
+    @overload
+    def __getitem__(self, index: int) -> _TreeLine[TreeDataType]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_TreeLine[TreeDataType]]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> _TreeLine[TreeDataType] | list[_TreeLine[TreeDataType]]:
+        if isinstance(index, slice):
+            return [self[line] for line in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("tree line index out of range")
+        root = self._root
+        node = root
+        offset = index
+        if self._show_root:
+            if offset == 0:
+                return _TreeLine([root], True)
+            offset -= 1
+        while True:
+            child_line_counts = node._child_line_counts
+            assert child_line_counts is not None
+            # The child whose lines contain the offset
+            child_index = child_line_counts.find(offset)
+            offset -= child_line_counts.prefix_sum(child_index)
+            node = node._children[child_index]
+            if offset == 0:
+                break
+            offset -= 1
+        path = [node]
+        parent = node._parent
+        while parent is not None:
+            path.append(parent)
+            parent = parent._parent
+        if not self._show_root:
+            path.pop()
+            if len(path) == 1:
+                return _TreeLine(path, True)
+        path.reverse()
+        assert node._parent is not None
+        return _TreeLine(path, node._child_index == len(node._parent._children) - 1)
+
+
 class TreeNodes(ImmutableSequenceView["TreeNode[TreeDataType]"]):
     """An immutable collection of `TreeNode`."""
 
@@ -122,7 +205,17 @@ class TreeNode(Generic[TreeDataType]):
         self._selected_ = False
         self._allow_expand = allow_expand
         self._updates: int = 0
-        self._line: int = -1
+        self._depth: int = 0 if parent is None else parent._depth + 1
+        """The depth of the node (the root has a depth of zero)."""
+        self._child_index = 0
+        """The index of the node in its parent's children."""
+        self._line_count = 1
+        """The number of lines used by the node and its visible descendants."""
+        self._child_line_counts: FenwickTree | None = None
+        """The line count of each child, or `None` if there are no children."""
+        self._width: tuple[int, int] | None = None
+        """The width generation and the width of the widest line used by the node
+        and its visible descendants, or `None` if the width must be calculated."""
 
     def __rich_repr__(self) -> rich.repr.Result:
         yield self._label.plain
@@ -148,6 +241,63 @@ class TreeNode(Generic[TreeDataType]):
         """The line number for this node, or -1 if it is not displayed."""
         return self._line
 
+    @property
+    def _line(self) -> int:
+        """The line number for this node, or -1 if it is not displayed.
+
+        Calculated from the line counts of the node's preceding siblings, and
+        those of its ancestors, in O(depth * log(siblings)) time.
+        """
+        tree = self._tree
+        if tree._tree_nodes.get(self._id) is not self:
+            # The node has been removed
+            return -1
+        root = tree.root
+        show_root = tree.show_root
+        line = 0
+        node = self
+        parent = node._parent
+        while parent is not None:
+            if not parent._expanded and (show_root or parent is not root):
+                return -1
+            assert parent._child_line_counts is not None
+            # The parent's line, and the lines of the preceding siblings
+            line += 1 + parent._child_line_counts.prefix_sum(node._child_index)
+            node = parent
+            parent = node._parent
+        if node is not root:
+            return -1
+        if not show_root:
+            # The root doesn't have a line
+            line -= 1
+        return line
+
+    def _update_line_count(self) -> None:
+        """Update the line count of the node (after it has been expanded or collapsed,
+        or its children have changed), and the line counts of its ancestors."""
+        node = self
+        line_count = 1
+        if node._expanded and node._child_line_counts is not None:
+            line_count += node._child_line_counts.total
+        while line_count != node._line_count:
+            node._line_count = line_count
+            parent = node._parent
+            if parent is None:
+                break
+            assert parent._child_line_counts is not None
+            parent._child_line_counts[node._child_index] = line_count
+            if not parent._expanded:
+                break
+            node = parent
+            line_count = 1 + parent._child_line_counts.total
+
+    def _invalidate_width(self) -> None:
+        """Invalidate the width of the node, and the widths of its ancestors."""
+        node: TreeNode[TreeDataType] | None = self
+        while node is not None and node._width is not None:
+            node._width = None
+            node = node._parent
+
     @property
     def _hover(self) -> bool:
         """Check if the mouse is over the node."""
@@ -206,6 +356,7 @@ class TreeNode(Generic[TreeDataType]):
     def allow_expand(self, allow_expand: bool) -> None:
         self._allow_expand = allow_expand
         self._updates += 1
+        self._invalidate_width()
 
     def _expand(self, expand_all: bool) -> None:
         """Mark the node as expanded (its children are shown).
@@ -213,12 +364,16 @@ class TreeNode(Generic[TreeDataType]):
         Args:
             expand_all: If `True` expand all offspring at all depths.
         """
-        self._expanded = True
         self._updates += 1
         self._tree.post_message(Tree.NodeExpanded(self).set_sender(self._tree))
         if expand_all:
+            # Children are expanded first, so that their line counts needn't be
+            # propagated beyond this node.
             for child in self.children:
                 child._expand(expand_all)
+        self._expanded = True
+        self._update_line_count()
+        self._invalidate_width()
 
     def expand(self) -> Self:
         """Expand the node (show its children).
@@ -252,6 +407,8 @@ class TreeNode(Generic[TreeDataType]):
         if collapse_all:
             for child in self.children:
                 child._collapse(collapse_all)
+        self._update_line_count()
+        self._invalidate_width()
 
     def collapse(self) -> Self:
         """Collapse the node (hide its children).
@@ -315,6 +472,7 @@ class TreeNode(Generic[TreeDataType]):
         self._updates += 1
         text_label = self._tree.process_label(label)
         self._label = text_label
+        self._invalidate_width()
         self._tree.call_later(self._tree._refresh_node, self)
 
     def add(
@@ -327,6 +485,33 @@ class TreeNode(Generic[TreeDataType]):
     ) -> TreeNode[TreeDataType]:
         """Add a node to the sub-tree.
 
+        Args:
+            label: The new node's label.
+            data: Data associated with the new node.
+            expand: Node should be expanded.
+            allow_expand: Allow use to expand the node via keyboard or mouse.
+
+        Returns:
+            A new Tree node
+        """
+        node = self._add(label, data, expand=expand, allow_expand=allow_expand)
+        self._tree._invalidate()
+        return node
+
+    def _add(
+        self,
+        label: TextType,
+        data: TreeDataType | None = None,
+        *,
+        expand: bool = False,
+        allow_expand: bool = True,
+    ) -> TreeNode[TreeDataType]:
+        """Add a node to the sub-tree.
+
+        Note:
+            This is the internal support method for `add`. Call `add` to ensure
+            the tree gets refreshed.
+
         Args:
             label: The new node's label.
             data: Data associated with the new node.
@@ -341,8 +526,13 @@ class TreeNode(Generic[TreeDataType]):
         node._expanded = expand
         node._allow_expand = allow_expand
         self._updates += 1
+        node._child_index = len(self._children)
         self._children.append(node)
-        self._tree._invalidate()
+        if self._child_line_counts is None:
+            self._child_line_counts = FenwickTree()
+        self._child_line_counts.append(node._line_count)
+        self._update_line_count()
+        self._invalidate_width()
         return node
 
     def add_leaf(
@@ -367,8 +557,16 @@ class TreeNode(Generic[TreeDataType]):
             This is the internal support method for `remove_children`. Call
             `remove_children` to ensure the tree gets refreshed.
         """
-        for child in reversed(self._children):
-            child._remove()
+        tree_nodes = self._tree._tree_nodes
+        descendants = list(self._children)
+        while descendants:
+            node = descendants.pop()
+            descendants.extend(node._children)
+            del tree_nodes[node.id]
+        self._children.clear()
+        self._child_line_counts = None
+        self._update_line_count()
+        self._invalidate_width()
 
     def _remove(self) -> None:
         """Remove the current node and all its children.
@@ -378,9 +576,18 @@ class TreeNode(Generic[TreeDataType]):
             to ensure the tree gets refreshed.
         """
         self._remove_children()
-        assert self._parent is not None
-        del self._parent._children[self._parent._children.index(self)]
+        parent = self._parent
+        assert parent is not None
+        siblings = parent._children
+        del siblings[self._child_index]
+        for index in range(self._child_index, len(siblings)):
+            siblings[index]._child_index = index
+        parent._child_line_counts = FenwickTree(
+            [sibling._line_count for sibling in siblings]
+        )
         del self._tree._tree_nodes[self.id]
+        parent._update_line_count()
+        parent._invalidate_width()
 
     def remove(self) -> None:
         """Remove this node from the tree.
@@ -398,6 +605,25 @@ class TreeNode(Generic[TreeDataType]):
         self._remove_children()
         self._tree._invalidate()
 
+    def _sort_children(self, key: Callable[[TreeNode[TreeDataType]], Any]) -> None:
+        """Sort the child nodes of this node.
+
+        Note:
+            Call `Tree._invalidate` to ensure the tree gets refreshed.
+
+        Args:
+            key: A function to get the sort key of a node.
+        """
+        children = self._children
+        children.sort(key=key)
+        for index, child in enumerate(children):
+            child._child_index = index
+        if children:
+            self._child_line_counts = FenwickTree(
+                [child._line_count for child in children]
+            )
+        self._updates += 1
+
     def refresh(self) -> None:
         """Initiate a refresh (repaint) of this node."""
         self._updates += 1
@@ -615,7 +841,9 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         self.root = self._add_node(None, text_label, data)
         """The root node of the tree."""
         self._line_cache: LRUCache[LineCacheKey, Strip] = LRUCache(1024)
-        self._tree_lines_cached: list[_TreeLine[TreeDataType]] | None = None
+        self._tree_lines_cached: _TreeLines[TreeDataType] | None = None
+        self._width_generation = 0
+        """Incremented when the cached widths of nodes are no longer valid."""
         self._cursor_node: TreeNode[TreeDataType] | None = None
 
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
@@ -702,6 +930,35 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         label = self.render_label(node, NULL_STYLE, NULL_STYLE)
         return label.cell_len
 
+    def _get_subtree_width(self, node: TreeNode[TreeDataType]) -> int:
+        """Get the width of the widest line used by a node and its visible descendants.
+
+        Widths are cached by the nodes, and invalidated when nodes change.
+
+        Args:
+            node: A node.
+
+        Returns:
+            Width in cells (including guides).
+        """
+        generation = self._width_generation
+        if node._width is not None and node._width[0] == generation:
+            return node._width[1]
+        path_length = node._depth + 1 if self.show_root else node._depth
+        width = 0
+        if path_length:
+            width = (
+                self.get_label_width(node)
+                + 2
+                + (max(0, path_length - 1) * self.guide_depth)
+            )
+        if node._expanded or (node is self.root and not self.show_root):
+            get_subtree_width = self._get_subtree_width
+            for child in node._children:
+                width = max(width, get_subtree_width(child))
+        node._width = (generation, width)
+        return width
+
     def _clear_line_cache(self) -> None:
         """Clear line cache."""
         self._line_cache.clear()
@@ -718,6 +975,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         root_label = self.root._label
         root_data = self.root.data
         root_expanded = self.root.is_expanded
+        self._tree_nodes.clear()
         self.root = TreeNode(
             self,
             None,
@@ -726,6 +984,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
             root_data,
             expanded=root_expanded,
         )
+        self._tree_nodes[self.root._id] = self.root
         self._updates += 1
         self.refresh()
         return self
@@ -890,10 +1149,12 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
             self._cursor_node = None
 
     def watch_guide_depth(self, guide_depth: int) -> None:
+        self._width_generation += 1
         self._invalidate()
 
     def watch_show_root(self, show_root: bool) -> None:
         self.cursor_line = -1
+        self._width_generation += 1
         self._invalidate()
 
     def scroll_to_line(self, line: int, animate: bool = True) -> None:
@@ -948,7 +1209,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
                 self._refresh_line(line_no)
 
     @property
-    def _tree_lines(self) -> list[_TreeLine[TreeDataType]]:
+    def _tree_lines(self) -> _TreeLines[TreeDataType]:
         if self._tree_lines_cached is None:
             self._build()
         assert self._tree_lines_cached is not None
@@ -961,50 +1222,26 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
             self._tree_lines
 
     def _build(self) -> None:
-        """Builds the tree by traversing nodes, and creating tree lines."""
-
-        TreeLine = _TreeLine
-        lines: list[_TreeLine[TreeDataType]] = []
-        add_line = lines.append
-
-        root = self.root
-
-        def add_node(
-            path: list[TreeNode[TreeDataType]], node: TreeNode[TreeDataType], last: bool
-        ) -> None:
-            child_path = [*path, node]
-            node._line = len(lines)
-            add_line(TreeLine(child_path, last))
-            if node._expanded:
-                for last, child in loop_last(node._children):
-                    add_node(child_path, child, last)
-
-        if self.show_root:
-            add_node([], root, True)
-        else:
-            for node in self.root._children:
-                add_node([], node, True)
-        self._tree_lines_cached = lines
-
-        guide_depth = self.guide_depth
-        show_root = self.show_root
-        get_label_width = self.get_label_width
-
-        def get_line_width(line: _TreeLine[TreeDataType]) -> int:
-            return get_label_width(line.node) + line._get_guide_width(
-                guide_depth, show_root
-            )
+        """Updates the virtual size and the cursor, after the tree has changed.
 
-        if lines:
-            width = max([get_line_width(line) for line in lines])
+        Lines are created as they are accessed, and line counts and widths are
+        maintained by the nodes as they change, so this doesn't traverse the tree.
+        """
+        lines = _TreeLines(self)
+        self._tree_lines_cached = lines
+        line_count = len(lines)
+        if line_count:
+            width = self._get_subtree_width(self.root)
         else:
             width = self.size.width
 
-        self.virtual_size = Size(width, len(lines))
+        self.virtual_size = Size(width, line_count)
         if self.cursor_line != -1:
             if self.cursor_node is not None:
-                self.cursor_line = self.cursor_node._line
-            if self.cursor_line >= len(lines):
+                cursor_line = self.cursor_node._line
+                if cursor_line != -1:
+                    self.cursor_line = cursor_line
+            if self.cursor_line >= line_count:
                 self.cursor_line = -1
         self.refresh()
 
@@ -6,22 +6,40 @@ from ._data_table import (
     ColumnDoesNotExist,
     ColumnKey,
     CursorType,
+    DataTableSource,
     DuplicateKey,
+    ReadOnlyRows,
     Row,
     RowDoesNotExist,
     RowKey,
 )
+from ._data_table_columns import (
+    BoolColumn,
+    ColumnarSource,
+    FloatColumn,
+    IntColumn,
+    StrColumn,
+    TypedColumn,
+)
 
 __all__ = [
+    "BoolColumn",
     "CellDoesNotExist",
     "CellKey",
     "CellType",
     "Column",
     "ColumnDoesNotExist",
     "ColumnKey",
+    "ColumnarSource",
     "CursorType",
+    "DataTableSource",
     "DuplicateKey",
+    "FloatColumn",
+    "IntColumn",
+    "ReadOnlyRows",
     "Row",
     "RowDoesNotExist",
     "RowKey",
+    "StrColumn",
+    "TypedColumn",
 ]
@@ -0,0 +1,3 @@
+from ._log import LogStats
+
+__all__ = ["LogStats"]
@@ -10,7 +10,11 @@ from textual.document._document_navigator import DocumentNavigator
 from textual.document._edit import Edit
 from textual.document._history import EditHistory
 from textual.document._languages import BUILTIN_LANGUAGES
-from textual.document._syntax_aware_document import SyntaxAwareDocument
+from textual.document._rope_document import RopeDocument, RopeSnapshot
+from textual.document._syntax_aware_document import (
+    SyntaxAwareDocument,
+    SyntaxAwareRopeDocument,
+)
 from textual.document._wrapped_document import WrappedDocument
 from textual.widgets._text_area import (
     EndColumn,
@@ -34,9 +38,12 @@ __all__ = [
     "HighlightName",
     "LanguageDoesNotExist",
     "Location",
+    "RopeDocument",
+    "RopeSnapshot",
     "Selection",
     "StartColumn",
     "SyntaxAwareDocument",
+    "SyntaxAwareRopeDocument",
     "TextAreaTheme",
     "ThemeDoesNotExist",
     "WrappedDocument",
@@ -0,0 +1,81 @@
+import pytest
+
+from textual.app import App, ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.css.match import (
+    _check_compiled_selectors,
+    _check_selectors,
+    compile_selector_set,
+    get_bloom,
+)
+from textual.css.parse import parse_selectors
+from textual.widgets import Label, Static
+
+
+class MatchApp(App):
+    def compose(self) -> ComposeResult:
+        with Vertical(id="outer", classes="a"):
+            with Horizontal(classes="b"):
+                yield Label("1", id="one", classes="a")
+                with Vertical(classes="c"):
+                    yield Static("2", id="two", classes="b")
+            yield Label("3", id="three", classes="c")
+
+
+@pytest.mark.parametrize(
+    "selector",
+    [
+        "Label",
+        "Vertical Label",
+        "Vertical > Label",
+        "Screen > Vertical",
+        "Horizontal Static",
+        "Horizontal > Static",
+        ".a .b",
+        ".a > .b > .a",
+        ".a Vertical > Static.b",
+        "#outer > Label",
+        "#outer > .b > Vertical Static",
+        "Vertical Vertical Static",
+        "Vertical > Vertical > Static",
+        "* > Label.a",
+        ".c Label",
+        "Horizontal > Label.c",
+        "Screen Static:hover",
+    ],
+)
+async def test_compiled_selectors_match(selector: str) -> None:
+    """Compiled selectors should match the same nodes as the selectors."""
+    app = MatchApp()
+    async with app.run_test():
+        nodes = list(app.screen.walk_children(with_self=True))
+        for selector_set in parse_selectors(selector):
+            compiled = compile_selector_set(selector_set)
+            assert compiled.specificity == selector_set.specificity
+            for node in nodes:
+                css_path_nodes = node.css_path_nodes
+                expected = _check_selectors(selector_set.selectors, css_path_nodes)
+                assert (
+                    _check_compiled_selectors(compiled.compounds, css_path_nodes)
+                    == expected
+                )
+                if expected:
+                    # The bloom filter must never reject a matching node
+                    ancestor_bloom = get_bloom(
+                        name
+                        for path_node in css_path_nodes[:-1]
+                        for name in path_node._selector_names
+                    )
+                    assert not compiled.bloom & ~ancestor_bloom
+
+
+def test_selector_bloom_updates() -> None:
+    """The selector bloom of a node should update when its classes or id change."""
+    label = Label()
+    assert label._selector_bloom == get_bloom(label._selector_names)
+    label.add_class("foo")
+    assert label._selector_bloom == get_bloom(label._selector_names)
+    label.id = "bar"
+    assert label._selector_bloom == get_bloom(label._selector_names)
+    label.set_classes("baz")
+    assert label._selector_bloom == get_bloom(label._selector_names)
@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from textual.color import Color
+from textual.css._persistent_cache import PersistentParseCache
+from textual.css.stylesheet import Stylesheet, StylesheetParseError
+from textual.dom import DOMNode
+
+CSS = """
+$accent: red;
+.foo { color: $accent; }
+"""
+
+
+def make_stylesheet(path: Path, css: str = CSS) -> Stylesheet:
+    stylesheet = Stylesheet()
+    stylesheet._persistent_cache = PersistentParseCache(path)
+    stylesheet.add_source(css, read_from=("test.tcss", ""))
+    stylesheet.parse()
+    return stylesheet
+
+
+def test_persistent_cache(tmp_path: Path) -> None:
+    stylesheet = make_stylesheet(tmp_path)
+    assert stylesheet._persistent_cache.hits == 0
+    assert stylesheet._persistent_cache.misses == 1
+
+    stylesheet = make_stylesheet(tmp_path)
+    assert stylesheet._persistent_cache.hits == 1
+    assert stylesheet._persistent_cache.misses == 0
+
+    node = DOMNode(classes="foo")
+    stylesheet.apply(node)
+    assert node.styles.color == Color.parse("red")
+
+
+def test_persistent_cache_key() -> None:
+    cache = PersistentParseCache(Path("."))
+    key = cache.get_key(CSS, ("test.tcss", ""), False, 0, "", {})
+    assert key == cache.get_key(CSS, ("test.tcss", ""), False, 0, "", {})
+    assert key != cache.get_key(CSS + " ", ("test.tcss", ""), False, 0, "", {})
+    assert key != cache.get_key(CSS, ("test.tcss", ""), True, 0, "", {})
+    assert key != cache.get_key(CSS, ("test.tcss", ""), False, 0, "", {"foo": "1"})
+
+
+def test_persistent_cache_invalid_file(tmp_path: Path) -> None:
+    make_stylesheet(tmp_path)
+    (cache_file,) = tmp_path.iterdir()
+    cache_file.write_bytes(b"not a pickle")
+
+    stylesheet = make_stylesheet(tmp_path)
+    assert stylesheet._persistent_cache.misses == 1
+    node = DOMNode(classes="foo")
+    stylesheet.apply(node)
+    assert node.styles.color == Color.parse("red")
+
+    # The invalid file was replaced
+    stylesheet = make_stylesheet(tmp_path)
+    assert stylesheet._persistent_cache.hits == 1
+
+
+def test_persistent_cache_skips_errors(tmp_path: Path) -> None:
+    stylesheet = Stylesheet()
+    stylesheet._persistent_cache = PersistentParseCache(tmp_path)
+    stylesheet.add_source(".foo { color: not-a-color; }")
+    with pytest.raises(StylesheetParseError):
+        stylesheet.parse()
+    assert not list(tmp_path.iterdir())
+
+
+def test_persistent_cache_removes_least_recently_used(tmp_path: Path) -> None:
+    cache = PersistentParseCache(tmp_path)
+    cache.set("first", [])
+    cache.set("second", [])
+    cache.max_size = len((tmp_path / "first").read_bytes()) * 2
+    os.utime(tmp_path / "first", ns=(0, 0))
+    os.utime(tmp_path / "second", ns=(1, 1))
+    assert cache.get("first") == []
+
+    # "second" is now the least recently used entry
+    cache.set("third", [])
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["first", "third"]
@@ -0,0 +1,56 @@
+from textual.app import App, ComposeResult
+from textual.color import Color
+from textual.containers import Vertical
+from textual.widgets import Label
+
+
+class RestyleApp(App):
+    CSS = """
+    Label.self { color: red; }
+    .parent Label { color: blue; }
+    Label:hover { color: green; }
+    """
+
+    def compose(self) -> ComposeResult:
+        with Vertical():
+            yield Label("foo")
+            yield Label("bar")
+
+
+async def test_get_restyle_nodes() -> None:
+    app = RestyleApp()
+    async with app.run_test():
+        vertical = app.query_one(Vertical)
+        label = app.query(Label).first()
+        stylesheet = app.stylesheet
+        assert list(stylesheet.get_restyle_nodes(label, [".unused"])) == []
+        assert list(stylesheet.get_restyle_nodes(label, [".self"])) == [label]
+        assert list(stylesheet.get_restyle_nodes(label, [":hover"])) == [label]
+        assert list(stylesheet.get_restyle_nodes(vertical, [".parent"])) == [
+            vertical,
+            *vertical.query(Label),
+        ]
+        assert list(stylesheet.get_restyle_nodes(vertical, [".self", ".parent"])) == [
+            vertical,
+            *vertical.query(Label),
+        ]
+
+
+async def test_class_changes_restyle() -> None:
+    app = RestyleApp()
+    async with app.run_test():
+        vertical = app.query_one(Vertical)
+        label = app.query(Label).first()
+        label.add_class("self")
+        assert label.styles.color == Color.parse("red")
+        vertical.add_class("parent")
+        assert all(
+            label.styles.color == Color.parse("blue") for label in app.query(Label)
+        )
+        vertical.remove_class("parent")
+        label = app.query(Label).first()
+        assert label.styles.color == Color.parse("red")
+        vertical.set_classes("parent")
+        assert label.styles.color == Color.parse("blue")
+        vertical.toggle_class("parent")
+        assert label.styles.color == Color.parse("red")
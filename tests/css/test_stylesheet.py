@@ -27,6 +27,24 @@ def test_stylesheet_apply_highest_specificity_wins():
     assert node.styles.color == Color(255, 0, 0)
 
 
+def test_stylesheet_apply_after_add_source():
+    """Adding a source should be reflected in the rules applied to a node."""
+    stylesheet = _make_user_stylesheet(".class {color: blue;}")
+    node = DOMNode(classes="class", id="id")
+    stylesheet.apply(node)
+    assert node.styles.color == Color(0, 0, 255)
+
+    stylesheet.add_source("DOMNode > #id {color: red;}")
+    stylesheet.parse()
+    stylesheet.apply(node)
+    assert node.styles.color == Color(0, 0, 255)
+
+    stylesheet.add_source("#id {color: red;}")
+    stylesheet.parse()
+    stylesheet.apply(node)
+    assert node.styles.color == Color(255, 0, 0)
+
+
 def test_stylesheet_apply_doesnt_override_defaults():
     css = "#id {color: red;}"
     stylesheet = _make_user_stylesheet(css)
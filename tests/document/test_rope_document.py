@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from textual.app import App, ComposeResult
+from textual.document import _rope_document
+from textual.widgets import TextArea
+from textual.widgets.text_area import Document, RopeDocument
+
+CHARACTERS = ["a", "b", " ", "\t", "é", "漢", "\n", "\n"]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    """Use small chunks, so edits span several chunks."""
+    monkeypatch.setattr(_rope_document, "_CHUNK_SIZE", 8)
+    monkeypatch.setattr(_rope_document, "_MAX_CHUNK_SIZE", 16)
+    monkeypatch.setattr(_rope_document, "_MIN_CHUNK_SIZE", 2)
+
+
+def random_text(random: random.Random, size: int) -> str:
+    return "".join(random.choice(CHARACTERS) for _ in range(size))
+
+
+def check_document(rope: RopeDocument, document: Document) -> None:
+    """Check a RopeDocument has the same content as a Document."""
+    assert rope.text == document.text
+    assert rope.line_count == document.line_count
+    assert rope.lines == document.lines
+    assert rope.get_size(4) == document.get_size(4)
+    for row, line in enumerate(document.lines):
+        assert rope[row] == line
+        assert rope._row_to_byte_offset(row) == document._row_to_byte_offset(row)
+        for column in (0, len(line)):
+            index = document.get_index_from_location((row, column))
+            assert rope.get_index_from_location((row, column)) == index
+            assert rope.get_location_from_index(index) == (row, column)
+    assert rope.lines[1:-1] == document.lines[1:-1]
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("seed", range(10))
+def test_edits_match_document(newline: str, seed: int) -> None:
+    """A RopeDocument should behave like a Document under random edits."""
+    rng = random.Random(seed)
+    text = random_text(rng, 60).replace("\n", newline)
+    document = Document(text)
+    rope = RopeDocument(text)
+    check_document(rope, document)
+
+    for _ in range(30):
+        locations = []
+        for _ in range(2):
+            row = rng.randrange(document.line_count)
+            locations.append((row, rng.randrange(len(document[row]) + 1)))
+        start, end = locations
+        insert = rng.choice(["", "\n", "a\rb", "x\x0c", random_text(rng, 20)])
+        assert rope.get_text_range(start, end) == document.get_text_range(start, end)
+        assert rope.replace_range(start, end, insert) == document.replace_range(
+            start, end, insert
+        )
+        check_document(rope, document)
+
+
+def test_snapshot_and_restore() -> None:
+    """Restoring a snapshot should restore the text, and not affect other
+    snapshots."""
+    rope = RopeDocument("one\ntwo\nthree\nfour\nfive\n")
+    snapshot = rope.snapshot()
+    rope.replace_range((1, 0), (3, 2), "2\n3\n")
+    edited_snapshot = rope.snapshot()
+    rope.replace_range((0, 0), (0, 0), "zero\n")
+
+    rope.restore(snapshot)
+    assert rope.text == "one\ntwo\nthree\nfour\nfive\n"
+    rope.restore(edited_snapshot)
+    assert rope.text == "one\n2\n3\nur\nfive\n"
+    assert rope.line_count == 6
+
+
+class TextAreaApp(App):
+    def compose(self) -> ComposeResult:
+        yield TextArea("hello\nworld", storage="rope")
+
+
+async def test_text_area_with_rope_storage() -> None:
+    app = TextAreaApp()
+    async with app.run_test() as pilot:
+        text_area = app.query_one(TextArea)
+        assert isinstance(text_area.document, RopeDocument)
+        text_area.move_cursor((1, 5))
+        await pilot.press("!", "enter")
+        assert text_area.text == "hello\nworld!\n"
+        text_area.undo()
+        assert text_area.text == "hello\nworld!"
+        text_area.undo()
+        assert text_area.text == "hello\nworld"
@@ -202,3 +202,43 @@ def test_get_offsets_invalid_line_index(line_index):
 
     with pytest.raises(ValueError):
         wrapped_document.get_offsets(line_index)
+
+
+def test_wrap_is_lazy():
+    """Heights are estimated until lines are wrapped, and lines are wrapped when
+    they are queried."""
+    document = Document("a b c d e f g h\n" * 10)
+    wrapped_document = WrappedDocument(document, width=5)
+
+    # "a b c d e f g h" is estimated to take 3 lines, but wraps on to 4
+    assert wrapped_document.unwrapped_line_count == 11
+    assert wrapped_document.height == 31
+
+    assert wrapped_document.location_to_offset((2, 14)) == Offset(2, 9)
+    assert wrapped_document.get_line_info(9) == (2, 3)
+    assert wrapped_document.unwrapped_line_count == 10
+    assert wrapped_document.height == 32
+
+    assert not wrapped_document.wrap_pending(4)
+    assert wrapped_document.wrap_pending(100)
+    assert wrapped_document.unwrapped_line_count == 0
+    assert wrapped_document.height == 41
+    assert wrapped_document.get_line_info(40) == (10, 0)
+    assert wrapped_document.get_line_info(41) is None
+
+
+def test_wrap_range_while_wrapping_is_pending():
+    document = Document("a b c d e f g h\n" * 10)
+    wrapped_document = WrappedDocument(document, width=5)
+    wrapped_document.get_offsets(0)
+
+    result = document.replace_range((3, 0), (5, 0), "x\ny\nz\n")
+    wrapped_document.wrap_range((3, 0), (5, 0), result.end_location)
+
+    assert wrapped_document.location_to_offset((6, 0)).y == (
+        wrapped_document.get_line_offset(6)
+    )
+    wrapped_document.wrap_pending(100)
+    assert wrapped_document.height == 4 * 8 + 3 + 1
+    assert wrapped_document.get_line_info(12) == (3, 0)
+    assert wrapped_document.get_line_info(15) == (6, 0)
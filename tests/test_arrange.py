@@ -1,7 +1,7 @@
 import pytest
 
 from textual._arrange import TOP_Z, arrange
-from textual._layout import WidgetPlacement
+from textual._layout import DockArrangeResult, WidgetPlacement
 from textual.app import App
 from textual.geometry import Region, Size, Spacing
 from textual.widget import Widget
@@ -93,3 +93,27 @@ def test_arrange_dock_badly():
     child.styles.dock = "nowhere"
     with pytest.raises(AssertionError):
         _ = arrange(Widget(), [child], Size(80, 24), Size(80, 24))
+
+
+def test_spatial_map_updated_from_previous_arrangement():
+    """A spatial map may be derived from a previous arrangement, if few placements changed."""
+    widgets = [Widget() for _ in range(16)]
+    placements = [
+        WidgetPlacement(Region(0, y, 10, 1), Spacing(), widget)
+        for y, widget in enumerate(widgets)
+    ]
+    previous = DockArrangeResult(placements, set(widgets), Spacing())
+    previous.spatial_map
+
+    new_placements = placements.copy()
+    new_placements[3] = WidgetPlacement(Region(0, 3, 10, 20), Spacing(), widgets[3])
+    arrangement = DockArrangeResult(new_placements, set(widgets), Spacing())
+    arrangement._previous = previous
+
+    assert arrangement._update_spatial_map(previous) is not None
+    assert arrangement.get_visible_placements(Region(0, 10, 10, 1)) == [
+        new_placements[3],
+        new_placements[10],
+    ]
+    # The previous arrangement is unchanged
+    assert previous.get_visible_placements(Region(0, 10, 10, 1)) == [placements[10]]
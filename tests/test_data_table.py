@@ -17,7 +17,9 @@ from textual.widgets.data_table import (
     CellKey,
     ColumnDoesNotExist,
     ColumnKey,
+    DataTableSource,
     DuplicateKey,
+    ReadOnlyRows,
     Row,
     RowDoesNotExist,
     RowKey,
@@ -1420,3 +1422,292 @@ async def test_move_cursor_respects_animate_parameter():
         await pilot.press("s")
 
     assert scrolls == [True, False]
+
+
+class CountingSource(DataTableSource):
+    def __init__(self, row_count: int, column_widths: list[int] | None = None):
+        self._row_count = row_count
+        self.column_widths = column_widths
+        self.fetched: list[tuple[int, int]] = []
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def get_rows(self, start: int, stop: int) -> list[list[str]]:
+        self.fetched.append((start, stop))
+        return [[f"{row}/0", f"{row}/1" * (row % 3)] for row in range(start, stop)]
+
+    def get_column_widths(self) -> list[int] | None:
+        return self.column_widths
+
+
+async def test_source_fetches_visible_rows():
+    app = DataTableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        table.add_columns("A", "B")
+        source = CountingSource(2_000_000)
+        table.set_source(source)
+        await pilot.pause()
+
+        assert table.row_count == 2_000_000
+        assert table.virtual_size.height == 2_000_000 + table.header_height
+        assert source.fetched == [(0, 256)]
+        assert table.get_cell_at(Coordinate(1, 0)) == "1/0"
+        assert table.get_row("5") == ["5/0", "5/1" * 2]
+        assert table.get_row_index("100") == 100
+        # Column widths are measured from the fetched rows
+        assert table.ordered_columns[1].content_width == max(
+            len(f"{row}/1" * (row % 3)) for row in range(256)
+        )
+
+        table.action_scroll_end()
+        await pilot.pause()
+        assert table.cursor_row == 1_999_999
+        assert table.get_cell_at(table.cursor_coordinate) == "1999999/0"
+        assert source.fetched[-1] == (1_999_872, 2_000_000)
+        assert len(source.fetched) <= 3
+        assert app.message_names[-1] == "CellHighlighted"
+
+
+async def test_source_column_widths():
+    app = DataTableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        table.add_column("A", key="A")
+        table.add_column("B", key="B", width=3)
+        table.set_source(CountingSource(10, column_widths=[20, 30]))
+        await pilot.pause()
+        assert table.columns["A"].content_width == 20
+        assert table.columns["B"].width == 3
+
+
+async def test_source_rows_read_only():
+    app = DataTableApp()
+    async with app.run_test():
+        table = app.query_one(DataTable)
+        table.add_columns("A", "B")
+        table.set_source(CountingSource(10))
+        with pytest.raises(ReadOnlyRows):
+            table.add_row("foo", "bar")
+        with pytest.raises(ReadOnlyRows):
+            table.update_cell("0", "A", "foo")
+        with pytest.raises(ReadOnlyRows):
+            table.sort("A")
+        with pytest.raises(ReadOnlyRows):
+            table.remove_row("0")
+
+
+async def test_source_row_mappings():
+    """The rows of a table with a source should behave like the rows of any table."""
+    app = DataTableApp()
+    async with app.run_test():
+        table = app.query_one(DataTable)
+        column_a, column_b = table.add_columns("A", "B")
+        table.set_source(CountingSource(3))
+        assert isinstance(table.rows, dict)
+        assert list(table.rows) == [RowKey("0"), RowKey("1"), RowKey("2")]
+        assert len(table.rows) == 3
+        assert "2" in table.rows
+        assert "3" not in table.rows
+        assert table.rows.get(RowKey("3")) is None
+        assert table.rows[RowKey("1")] == Row(RowKey("1"), 1)
+        assert table._data[RowKey("1")] == {column_a: "1/0", column_b: "1/1"}
+        assert table._row_locations.get(RowKey("2")) == 2
+        assert table._row_locations.get_key(3) is None
+        with pytest.raises(ReadOnlyRows):
+            table.rows[RowKey("3")] = Row(RowKey("3"), 1)
+        with pytest.raises(ReadOnlyRows):
+            del table._row_locations[RowKey("0")]
+
+
+async def test_refresh_source():
+    app = DataTableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        table.add_columns("A", "B")
+        source = CountingSource(10)
+        table.set_source(source)
+        await pilot.pause()
+        source._row_count = 20
+        assert table.row_count == 10
+        table.refresh_source()
+        await pilot.pause()
+        assert table.row_count == 20
+        assert table.get_cell_at(Coordinate(19, 0)) == "19/0"
+
+        table.clear()
+        assert table.source is None
+        assert table.row_count == 0
+        table.add_row("foo", "bar")
+        assert table.get_row_at(0) == ["foo", "bar"]
+
+
+async def test_row_offsets_with_variable_heights():
+    app = DataTableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        table.add_column("A", key="A")
+        table.add_row(3, height=1, key="three")
+        table.add_row(1, height=3, key="one")
+        table.add_row(2, height=2, key="two")
+        await pilot.pause()
+
+        def get_lines() -> list[tuple[str, int]]:
+            lines = []
+            for y in range(table.header_height, table.virtual_size.height):
+                row_key, offset = table._get_offsets(y)
+                lines.append((row_key.value, offset))
+            return lines
+
+        assert get_lines() == [
+            ("three", 0),
+            ("one", 0),
+            ("one", 1),
+            ("one", 2),
+            ("two", 0),
+            ("two", 1),
+        ]
+        assert table._get_row_region(2).y == table.header_height + 4
+
+        table.sort("A")
+        await pilot.pause()
+        assert get_lines() == [
+            ("one", 0),
+            ("one", 1),
+            ("one", 2),
+            ("two", 0),
+            ("two", 1),
+            ("three", 0),
+        ]
+
+        table.remove_row("two")
+        table.add_row(4, height=2, key="four")
+        await pilot.pause()
+        assert get_lines() == [
+            ("one", 0),
+            ("one", 1),
+            ("one", 2),
+            ("three", 0),
+            ("four", 0),
+            ("four", 1),
+        ]
+        with pytest.raises(LookupError):
+            table._get_offsets(table.virtual_size.height)
+
+
+async def test_filter_rows():
+    """Rows which don't match a filter are hidden, but keep their data."""
+    app = DataTableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        name, score = table.add_columns("Name", "Score")
+        for index in range(6):
+            table.add_row(f"row{index}", index, key=str(index))
+
+        table.filter(score, predicate=lambda value: value % 2 == 0)
+        assert table.row_count == 3
+        assert [table.get_row_at(index)[1] for index in range(3)] == [0, 2, 4]
+        assert table.get_row("1") == ["row1", 1]
+
+        # New rows and updated rows are checked against the filter
+        table.add_row("row6", 6, key="6")
+        table.add_row("row7", 7, key="7")
+        table.update_cell("1", score, 10)
+        assert [table.get_row_at(index)[1] for index in range(table.row_count)] == [
+            0,
+            10,
+            2,
+            4,
+            6,
+        ]
+
+        table.remove_row("3")
+        table.filter()
+        await pilot.pause()
+        assert table.row_count == 7
+        assert table.get_row_at(6) == ["row7", 7]
+        assert table.virtual_size.height == table.header_height + 7
+
+
+async def test_update_cell_keeps_rows_sorted():
+    """Updating a sorted column moves the row to keep the rows in order."""
+    app = DataTableApp()
+    async with app.run_test():
+        table = app.query_one(DataTable)
+        name, score = table.add_columns("Name", "Score")
+        for index, value in enumerate([5, 1, 4, 2, 3]):
+            table.add_row(f"row{index}", value, key=str(index))
+        table.sort(score)
+
+        def scores() -> list[int]:
+            return [table.get_row_at(index)[1] for index in range(table.row_count)]
+
+        assert scores() == [1, 2, 3, 4, 5]
+        table.update_cell("1", score, 10)
+        assert scores() == [2, 3, 4, 5, 10]
+        # Equal keys are placed after existing rows, like a stable sort
+        table.update_cell("0", score, 2)
+        assert scores() == [2, 2, 3, 4, 10]
+        assert table.get_row_at(1) == ["row0", 2]
+        # Updating another column doesn't move the row
+        table.update_cell("2", name, "renamed")
+        assert table.get_row_at(3) == ["renamed", 4]
+
+        table.sort(score, reverse=True)
+        table.update_cell("3", score, 20)
+        assert scores() == [20, 10, 4, 3, 2]
+
+
+async def test_remove_rows_keeps_rows_sorted():
+    """Removed (and re-added) rows shouldn't affect the order of sorted rows."""
+    app = DataTableApp()
+    async with app.run_test():
+        table = app.query_one(DataTable)
+        name, score = table.add_columns("Name", "Score")
+        for index, value in enumerate([5, 1, 4, 2, 3]):
+            table.add_row(f"row{index}", value, key=str(index))
+        table.sort(score)
+
+        def scores() -> list[int]:
+            return [table.get_row_at(index)[1] for index in range(table.row_count)]
+
+        table.remove_row("1")
+        table.remove_row(RowKey("2"))
+        table.add_row("again", 0, key="1")
+        assert scores() == [2, 3, 5, 0]
+        table.update_cell("0", score, 1)
+        assert scores() == [2, 3, 1, 0]
+        table.sort(score)
+        table.remove_row("4")
+        table.update_cell("3", score, -1)
+        assert scores() == [-1, 0, 1]
+        assert table._row_order == [RowKey("3"), RowKey("1"), RowKey("0")]
+
+
+async def test_background_sort_and_filter():
+    """Sorting and filtering in the background applies the latest request."""
+    app = DataTableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        name, score = table.add_columns("Name", "Score")
+        for index in range(100):
+            table.add_row(f"row{index}", (index * 37) % 100, key=str(index))
+
+        table.sort(score, background=True)
+        # The rows aren't reordered until the sort is complete
+        assert table.get_row_at(0) == ["row0", 0]
+        table.sort(score, reverse=True, background=True)
+        table.filter(score, predicate=lambda value: value < 50, background=True)
+        # Updated while the sort is calculated
+        table.update_cell("1", score, 1000)
+        await app.workers.wait_for_complete(
+            [worker for worker in app.workers if not worker.is_cancelled]
+        )
+        await pilot.pause()
+
+        values = [table.get_row_at(index)[1] for index in range(table.row_count)]
+        # Row "1" (score 37) no longer matches the filter once updated
+        assert values == [value for value in range(49, -1, -1) if value != 37]
+        assert table.cursor_row == 0
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import pytest
+from rich.text import Text
+
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable
+from textual.widgets.data_table import (
+    BoolColumn,
+    ColumnarSource,
+    FloatColumn,
+    IntColumn,
+    StrColumn,
+)
+
+
+def test_typed_columns():
+    ints = IntColumn([1, -200, 30])
+    floats = FloatColumn([1.5, 1234.567])
+    bools = BoolColumn([True, True])
+    strings = StrColumn(["foo", "[b]bar[/b]", "a\nbaz!"])
+
+    assert list(ints.values()) == [1, -200, 30]
+    assert [text.plain for text in ints.render(1, 3)] == ["-200", "30"]
+    assert [text.plain for text in floats.render(0, 2)] == ["1.50", "1234.57"]
+    assert bools.values() == [True, True]
+    assert strings.render(0, 2) == ["foo", "[b]bar[/b]"]
+
+    assert ints.content_width == 4
+    assert floats.content_width == 7
+    assert bools.content_width == 4
+    assert strings.content_width == 4
+
+
+def test_content_width_updates():
+    ints = IntColumn([1, 22, 333])
+    assert ints.content_width == 3
+    ints.append(-4444)
+    assert ints.content_width == 5
+    ints[1] = 55555
+    assert ints.content_width == 5
+    # Replacing the widest value requires measuring again
+    ints[3] = 4
+    ints[1] = 5
+    assert ints.content_width == 3
+    ints.extend([10**6, 7])
+    assert ints.content_width == 7
+
+    bools = BoolColumn([True])
+    bools.append(False)
+    assert bools.content_width == 5
+    bools[1] = True
+    assert bools.content_width == 4
+    assert bools[1] is True
+
+
+@pytest.mark.parametrize(
+    "format_spec, content_width",
+    [(".2f", 4), ("", len(str(0.1 + 0.2))), ("g", len("0.3")), ("e", 12)],
+)
+def test_float_content_width(format_spec, content_width):
+    """Every value should be measured, unless the values have fixed decimal places."""
+    floats = FloatColumn([0.0, 0.1 + 0.2, 1.0], format_spec=format_spec)
+    assert floats.content_width == content_width
+
+
+def test_float_content_width_with_nan():
+    floats = FloatColumn([1.0, float("nan"), 2.0, float("-inf")])
+    assert floats.content_width == len("-inf")
+
+
+def test_columnar_source_rows():
+    source = ColumnarSource(StrColumn(), IntColumn(), FloatColumn(format_spec=",.1f"))
+    source.add_row("foo", 1, 1000.0)
+    source.add_rows([("bar", 2, 2.25), ("baz", 3, 3.0)])
+    assert source.row_count == 3
+    rows = source.get_rows(1, 10)
+    assert [[str(cell) for cell in row] for row in rows] == [
+        ["bar", "2", "2.2"],
+        ["baz", "3", "3.0"],
+    ]
+    assert source.get_column_widths() == [3, 1, 7]
+    source.update_cell(0, 1, 100)
+    assert [str(cell) for cell in source.get_column(1)] == ["100", "2", "3"]
+    assert list(source.columns[1].values()) == [100, 2, 3]
+    with pytest.raises(ValueError):
+        source.add_row("foo", 1)
+
+
+class ColumnarApp(App):
+    def compose(self) -> ComposeResult:
+        yield DataTable()
+
+
+async def test_data_table_with_columnar_source():
+    app = ColumnarApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        name, price = table.add_columns("Name", "Price")
+        source = ColumnarSource(StrColumn(), FloatColumn())
+        source.add_rows((f"item{index}", index * 1.5) for index in range(1000))
+        table.set_source(source)
+        await pilot.pause()
+
+        assert table.row_count == 1000
+        assert table.columns[price].content_width == len("1498.50")
+        assert table.get_row_at(3)[0] == "item3"
+        assert isinstance(table.get_row_at(3)[1], Text)
+        assert [cell.plain for cell in table.get_column(price)][:3] == [
+            "0.00",
+            "1.50",
+            "3.00",
+        ]
+
+        source.update_cell(0, 1, 123456.0)
+        table.refresh_source()
+        await pilot.pause()
+        assert table.columns[price].content_width == len("123456.00")
+        assert table.get_row_at(0)[1].plain == "123456.00"
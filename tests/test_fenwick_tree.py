@@ -0,0 +1,54 @@
+import random
+
+from textual._fenwick_tree import FenwickTree
+
+
+def test_empty():
+    tree = FenwickTree()
+    assert len(tree) == 0
+    assert tree.total == 0
+    assert tree.find(0) == 0
+
+
+def test_prefix_sum_and_find():
+    heights = [1, 3, 0, 2, 1]
+    tree = FenwickTree(heights)
+    assert tree.total == 7
+    assert [tree.prefix_sum(index) for index in range(6)] == [0, 1, 4, 4, 6, 7]
+    assert [tree.find(y) for y in range(8)] == [0, 1, 1, 1, 3, 3, 4, 5]
+
+
+def test_update_and_append():
+    tree = FenwickTree([1, 1, 1])
+    tree[1] = 5
+    assert tree[1] == 5
+    assert tree.total == 7
+    assert tree.find(6) == 2
+    tree.append(2)
+    tree.append(0)
+    tree.append(3)
+    assert len(tree) == 6
+    assert tree.total == 12
+    assert tree.find(11) == 5
+
+
+def test_random():
+    random.seed(42)
+    heights = []
+    tree = FenwickTree()
+    for _ in range(500):
+        height = random.randint(0, 3)
+        heights.append(height)
+        tree.append(height)
+        if random.random() < 0.3:
+            index = random.randrange(len(heights))
+            heights[index] = random.randint(0, 3)
+            tree[index] = heights[index]
+    assert tree.total == sum(heights)
+    assert list(FenwickTree(heights)._tree) == list(tree._tree)
+    y = 0
+    for index, height in enumerate(heights):
+        assert tree.prefix_sum(index) == sum(heights[:index])
+        for line in range(height):
+            assert tree.find(y + line) == index
+        y += height
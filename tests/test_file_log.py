@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Callable
+
+from textual.app import App, ComposeResult
+from textual.geometry import Size
+from textual.widgets import FileLog
+
+
+class FileLogApp(App):
+    def __init__(self, path: Path, follow: bool = False) -> None:
+        self.path = path
+        self.follow = follow
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        yield FileLog(self.path, follow=self.follow, poll_interval=0.01)
+
+
+async def wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    """Wait for a condition to be true."""
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("timed out")
+
+
+async def test_file_log(tmp_path: Path):
+    path = tmp_path / "test.log"
+    lines = [f"line {index}" for index in range(100_000)]
+    path.write_bytes(("\n".join(lines) + "\r\nlast \xe9").encode("utf-8"))
+    app = FileLogApp(path)
+    async with app.run_test() as pilot:
+        file_log = app.query_one(FileLog)
+        await wait_for(lambda: not file_log.indexing)
+        await pilot.pause()
+        assert file_log.line_count == 100_001
+        assert file_log.lines[0] == "line 0"
+        assert file_log.lines[99_998] == "line 99998"
+        # Carriage returns are removed
+        assert file_log.lines[99_999] == "line 99999"
+        assert file_log.lines[-1] == "last \xe9"
+        assert file_log.virtual_size == Size(11, 100_001)
+        assert file_log._render_line(1, 0, 10).text == "line 1    "
+        # A FileLog displays its file, and can't be written to
+        assert not hasattr(file_log, "write")
+
+
+async def test_file_log_follow(tmp_path: Path):
+    path = tmp_path / "test.log"
+    path.write_text("one\ntw")
+    app = FileLogApp(path, follow=True)
+    async with app.run_test():
+        file_log = app.query_one(FileLog)
+        await wait_for(lambda: file_log.line_count == 2)
+        assert list(file_log.lines) == ["one", "tw"]
+
+        with open(path, "a") as file:
+            file.write("o\nthree\n")
+        await wait_for(lambda: file_log.line_count == 3)
+        assert list(file_log.lines) == ["one", "two", "three", ""]
+
+        # A truncated file is loaded again
+        path.write_text("four\n")
+        await wait_for(lambda: list(file_log.lines) == ["four", ""])
+
+
+async def test_file_log_truncated_while_displayed(tmp_path: Path):
+    """Lines removed from a file after they are indexed should be displayed as blank."""
+    path = tmp_path / "test.log"
+    path.write_text("one\ntwo\nthree\n")
+    app = FileLogApp(path)
+    async with app.run_test():
+        file_log = app.query_one(FileLog)
+        await wait_for(lambda: not file_log.indexing and file_log.line_count == 3)
+        path.write_text("on")
+        assert list(file_log.lines) == ["on", "", "", ""]
+
+
+async def test_file_log_missing_file(tmp_path: Path):
+    """A missing file should be displayed when it is created."""
+    path = tmp_path / "missing.log"
+    app = FileLogApp(path, follow=True)
+    async with app.run_test() as pilot:
+        file_log = app.query_one(FileLog)
+        await pilot.pause()
+        assert file_log.line_count == 0
+        path.write_text("one\ntwo\n")
+        await wait_for(lambda: list(file_log.lines) == ["one", "two", ""])
+
+        # A replaced file is loaded again
+        replacement = tmp_path / "replacement.log"
+        replacement.write_text("one\ntwo\nthree\nfour\n")
+        path.unlink()
+        replacement.rename(path)
+        await wait_for(lambda: file_log.line_count == 4)
+        assert list(file_log.lines) == ["one", "two", "three", "four", ""]
+
+
+async def test_file_log_empty(tmp_path: Path):
+    path = tmp_path / "empty.log"
+    path.write_text("")
+    app = FileLogApp(path)
+    async with app.run_test() as pilot:
+        file_log = app.query_one(FileLog)
+        await pilot.pause()
+        assert file_log.line_count == 0
+        assert not file_log.indexing
@@ -0,0 +1,104 @@
+from rich.segment import Segment
+from rich.style import Style
+
+from textual._front_buffer import FrontBuffer
+from textual.geometry import Size
+from textual.strip import Strip
+
+RED = Style(color="red")
+BLUE = Style(color="blue")
+
+
+def make_buffer(*lines: Strip) -> FrontBuffer:
+    front_buffer = FrontBuffer(run_gap=0)
+    front_buffer.reset(Size(10, len(lines)))
+    front_buffer.update_lines(0, lines)
+    return front_buffer
+
+
+def test_unwritten_line_is_changed():
+    front_buffer = FrontBuffer()
+    front_buffer.reset(Size(10, 2))
+    strip = Strip([Segment("hello", RED)])
+    assert front_buffer.diff(2, 1, strip) == [(2, strip)]
+    # Second time around nothing has changed
+    assert front_buffer.diff(2, 1, strip) == []
+
+
+def test_unchanged():
+    front_buffer = make_buffer(Strip([Segment("0123456789", RED)]))
+    assert front_buffer.diff(0, 0, Strip([Segment("01234", RED)])) == []
+    assert front_buffer.diff(5, 0, Strip([Segment("56789", RED)])) == []
+
+
+def test_changed_character():
+    front_buffer = make_buffer(Strip([Segment("12:00:00", RED)]))
+    updates = front_buffer.diff(0, 0, Strip([Segment("12:00:01", RED)]))
+    assert updates == [(7, Strip([Segment("1", RED)], 1))]
+
+
+def test_changed_style():
+    front_buffer = make_buffer(Strip([Segment("foo bar", RED)]))
+    updates = front_buffer.diff(
+        0, 0, Strip([Segment("foo ", RED), Segment("bar", BLUE)])
+    )
+    assert updates == [(4, Strip([Segment("bar", BLUE)], 3))]
+
+
+def test_multiple_runs():
+    front_buffer = make_buffer(Strip([Segment("abcdefghij", RED)]))
+    updates = front_buffer.diff(0, 0, Strip([Segment("Abcdefghij", RED)]))
+    assert updates == [(0, Strip([Segment("A", RED)], 1))]
+    updates = front_buffer.diff(0, 0, Strip([Segment("AbcdEfghiJ", RED)]))
+    assert updates == [
+        (4, Strip([Segment("E", RED)], 1)),
+        (9, Strip([Segment("J", RED)], 1)),
+    ]
+
+
+def test_runs_combined_within_gap():
+    front_buffer = make_buffer(Strip([Segment("abcdefghij", RED)]))
+    front_buffer.run_gap = 4
+    updates = front_buffer.diff(0, 0, Strip([Segment("Abcdefghij", RED)]))
+    updates = front_buffer.diff(0, 0, Strip([Segment("XbcdEfghij", RED)]))
+    assert updates == [(0, Strip([Segment("XbcdE", RED)], 5))]
+
+
+def test_wide_characters_not_split():
+    front_buffer = make_buffer(Strip([Segment("ab💩cd", RED)]))
+    updates = front_buffer.diff(0, 0, Strip([Segment("ab💩cd", BLUE)]))
+    assert updates == [(0, Strip([Segment("ab💩cd", BLUE)], 6))]
+    updates = front_buffer.diff(0, 0, Strip([Segment("ab🐍cd", BLUE)]))
+    assert updates == [(2, Strip([Segment("🐍", BLUE)], 2))]
+
+
+async def test_damage_tracking_writes_changed_cells(monkeypatch):
+    from textual import constants
+    from textual._compositor import DeltaUpdate
+    from textual.app import App, ComposeResult
+    from textual.widgets import Label
+
+    monkeypatch.setattr(constants, "DAMAGE_TRACKING", True)
+
+    class ClockApp(App):
+        def compose(self) -> ComposeResult:
+            yield Label("12:00:00")
+
+    app = ClockApp()
+    updates = []
+    async with app.run_test() as pilot:
+        display = app._display
+
+        def capture_display(screen, renderable):
+            updates.append(renderable)
+            display(screen, renderable)
+
+        monkeypatch.setattr(app, "_display", capture_display)
+        app.query_one(Label).update("12:00:01")
+        await pilot.pause()
+
+    delta_updates = [update for update in updates if isinstance(update, DeltaUpdate)]
+    assert len(delta_updates) == 1
+    [(x, y, strip)] = delta_updates[0].runs
+    assert (x, y) == (7, 0)
+    assert strip.text == "1"
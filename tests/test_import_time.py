@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+DEFERRED_MODULES = [
+    "markdown_it",
+    "textual._system_commands",
+    "textual._tree_sitter",
+    "textual.command",
+    "textual.drivers.web_driver",
+    "textual.drivers.windows_driver",
+    "textual.widgets._input",
+    "textual.widgets._markdown",
+    "textual.widgets._text_area",
+    "tree_sitter",
+]
+"""Modules which shouldn't be imported until they are used."""
+
+BASELINE_IMPORTS = "import asyncio, inspect, rich.console, rich.markup, rich.traceback"
+"""Imports to time alongside textual.app, to calibrate for the speed of the machine."""
+
+APP_IMPORT_BUDGET = 2.2
+"""Maximum import time of textual.app, relative to the import time of BASELINE_IMPORTS.
+
+textual.app imports in about 2.0 times the baseline, so the budget fails the test if
+the import gets around 10% (about 50ms on a typical machine) slower.
+"""
+
+IMPORT_TIME_RUNS = 3
+"""Number of times to time each import (the fastest time is used)."""
+
+
+def _read_import_times(statement: str) -> list[tuple[str, int]]:
+    """Run a statement in a new interpreter, and read the output of `-X importtime`.
+
+    Args:
+        statement: Python statement to run.
+
+    Returns:
+        A list of the (indented) module column and cumulative import time, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times: list[tuple[str, int]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            import_times.append((module, int(cumulative)))
+    return import_times
+
+
+def get_import_times(statement: str) -> dict[str, int]:
+    """Run a statement in a new interpreter, and get the cumulative import times.
+
+    Args:
+        statement: Python statement to run.
+
+    Returns:
+        A mapping of module name on to cumulative import time, in microseconds.
+    """
+    return {
+        module.strip(): cumulative
+        for module, cumulative in _read_import_times(statement)
+    }
+
+
+def get_total_import_time(statement: str) -> int:
+    """Run a statement in a new interpreter, and get the total import time.
+
+    Args:
+        statement: Python statement to run.
+
+    Returns:
+        The sum of the cumulative times of the top-level imports, in microseconds.
+    """
+    return sum(
+        cumulative
+        for module, cumulative in _read_import_times(statement)
+        if not module.startswith("  ")
+    )
+
+
+def test_app_import_defers_modules():
+    import_times = get_import_times("from textual.app import App")
+    assert "textual.app" in import_times
+    assert not [module for module in DEFERRED_MODULES if module in import_times]
+
+
+def test_app_import_time():
+    app_times: list[int] = []
+    baseline_times: list[int] = []
+    for _ in range(IMPORT_TIME_RUNS):
+        app_times.append(get_import_times("from textual.app import App")["textual.app"])
+        baseline_times.append(get_total_import_time(BASELINE_IMPORTS))
+    assert min(app_times) < min(baseline_times) * APP_IMPORT_BUDGET
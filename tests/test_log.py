@@ -1,4 +1,7 @@
+from textual.app import App, ComposeResult
+from textual.geometry import Size
 from textual.widgets import Log
+from textual.widgets.log import LogStats
 
 
 def test_process_line():
@@ -6,3 +9,82 @@ def test_process_line():
     assert log._process_line("foo") == "foo"
     assert log._process_line("foo\t") == "foo     "
     assert log._process_line("\0foo") == "�foo"
+
+
+class LogApp(App):
+    def compose(self) -> ComposeResult:
+        yield Log()
+
+
+async def test_write_many():
+    app = LogApp()
+    async with app.run_test() as pilot:
+        log = app.query_one(Log)
+        log.write("start ")
+        log.write_many(["foo\nb", "ar\n", "baz\r\nqux"])
+        # Written on the next flush
+        assert log.lines == ["start "]
+        assert log.stats == LogStats(written=0, queued=3, dropped=0)
+        await pilot.pause(0.1)
+        assert log.lines == ["start foo", "bar", "baz", "qux"]
+        assert log.stats == LogStats(written=3, queued=0, dropped=0)
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert log.virtual_size == Size(9, 4)
+        assert log.scroll_offset.y == log.max_scroll_y
+
+
+async def test_write_many_max_lines():
+    app = LogApp()
+    async with app.run_test():
+        log = app.query_one(Log)
+        log.max_lines = 5
+        log.write("one\ntwo\nthree\n")
+        log.write_many(f"{line}\n" for line in range(10))
+        log.flush()
+        assert log.lines == ["6", "7", "8", "9", ""]
+        assert log.stats.written == 10
+        assert log.stats.dropped == 9
+        log.write_many(["10\n", "11"])
+        log.flush()
+        assert log.lines == ["7", "8", "9", "10", "11"]
+        assert log.stats.dropped == 10
+
+
+async def test_write_after_write_many():
+    """Data from write_many should be added before data from a later write."""
+    app = LogApp()
+    async with app.run_test():
+        log = app.query_one(Log)
+        log.write_many(["A"])
+        log.write("B")
+        assert log.lines == ["AB"]
+        log.write_many(["C"])
+        log.write_lines(["D"])
+        assert log.lines == ["ABC", "D"]
+
+
+async def test_flush_refreshes_continued_line():
+    app = LogApp()
+    async with app.run_test():
+        log = app.query_one(Log)
+        log.auto_scroll = False
+        log.write("foo")
+        assert log._render_line_strip(0, log.rich_style).text == "foo"
+        log.write_many(["bar"])
+        log.flush()
+        assert log._render_line_strip(0, log.rich_style).text == "foobar"
+
+
+async def test_max_lines_keeps_render_cache():
+    app = LogApp()
+    async with app.run_test():
+        log = app.query_one(Log)
+        log.max_lines = 3
+        log.write_lines(["one", "two", "three"])
+        strip = log._render_line_strip(2, log.rich_style)
+        log.write_lines(["four", "five"])
+        assert log.lines == ["three", "four", "five"]
+        assert log.lines.offset == 2
+        # The line numbers in the cache are absolute, so they remain valid
+        assert log._render_line_strip(0, log.rich_style) is strip
@@ -8,7 +8,7 @@ from typing import Iterator
 import pytest
 from markdown_it.token import Token
 from rich.style import Style
-from rich.text import Span
+from rich.text import Span, Text
 
 import textual.widgets._markdown as MD
 from textual import on
@@ -165,3 +165,92 @@ async def test_update_of_document_posts_table_of_content_update_message() -> Non
         pilot.app.query_one(Markdown).update("")
         await pilot.pause()
         assert messages == ["TableOfContentsUpdated", "TableOfContentsUpdated"]
+
+
+async def test_append_matches_update() -> None:
+    """Appending Markdown in pieces should build the same blocks as updating with
+    the whole document, and keep the blocks which didn't change."""
+    document = (
+        "# Title\n\nA paragraph\ncontinued [link][ref].\n\n- One\n- Two\n\n"
+        "```python\nx = 1\n```\n\n## Next\n\n[ref]: https://example.com\n"
+    )
+
+    def markdown_nodes(root: Widget) -> list[tuple[str, str | None, str]]:
+        return [
+            (node.__class__.__name__, node.id, node._text.plain)
+            for node in root.query(MarkdownBlock)
+        ]
+
+    class StreamApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Markdown(id="streamed")
+            yield Markdown(document, id="updated")
+
+    async with StreamApp().run_test() as pilot:
+        streamed = pilot.app.query_one("#streamed", Markdown)
+        await streamed.append(document[:10])
+        heading = streamed.children[0]
+        for offset in range(10, len(document), 7):
+            await streamed.append(document[offset : offset + 7])
+        await pilot.pause()
+        updated = pilot.app.query_one("#updated", Markdown)
+        assert streamed.source == document
+        assert markdown_nodes(streamed) == markdown_nodes(updated)
+        assert streamed._table_of_contents == updated._table_of_contents
+        assert streamed.children[0] is heading
+        assert streamed.children[1]._text.plain == "A paragraph continued link."
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        # A partial last line may decide whether the previous block ends
+        ["Some text\n", "```python", "```\n"],
+        ["Some text\n", "--", "-\n\nMore\n"],
+        # A link reference defined in the parsed region may become invalid
+        ["# H\n\n", "[ref]: http://a.com", " junk\n\nsee [ref]\n"],
+        # ...or change
+        ["# H\n\n", "[ref]: http://a.co", "m\n\nsee [ref]\n"],
+        ["[ref]: http://a.com\n\n", "[ref]: http://b.com\n\n", "see [ref]\n"],
+        # A list or a fence may continue after a blank line
+        ["- One\n\n", "  continued\n", "- Two\n"],
+        ["```\ncode\n\n", "more code\n", "```\n\nText\n"],
+    ],
+)
+async def test_append_is_equivalent_to_update(chunks: list[str]) -> None:
+    """Appending Markdown should give the same document as updating with the whole
+    Markdown, however it is split."""
+
+    def markdown_nodes(root: Widget) -> list[tuple[str, str | None, Text]]:
+        return [
+            (node.__class__.__name__, node.id, node._text)
+            for node in root.query(MarkdownBlock)
+        ]
+
+    class StreamApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Markdown(id="streamed")
+            yield Markdown("".join(chunks), id="updated")
+
+    async with StreamApp().run_test() as pilot:
+        streamed = pilot.app.query_one("#streamed", Markdown)
+        for chunk in chunks:
+            await streamed.append(chunk)
+        await pilot.pause()
+        updated = pilot.app.query_one("#updated", Markdown)
+        assert markdown_nodes(streamed) == markdown_nodes(updated)
+        assert streamed._references == updated._references
+
+
+async def test_update_only_replaces_changed_blocks() -> None:
+    """Updating the document should only replace blocks which changed."""
+    async with MarkdownApp("# One\n\nFirst\n\n- A\n- B\n\nLast\n").run_test() as pilot:
+        markdown = pilot.app.query_one(Markdown)
+        heading, first, bullets, last = markdown.children
+        await markdown.update("# One\n\nFirst, edited\n\n- A\n- C\n\nLast\n")
+        await pilot.pause()
+        assert markdown.children[:2] == [heading, first]
+        assert first._text.plain == "First, edited"
+        assert markdown.children[2] is not bullets
+        assert not bullets.is_attached
+        assert markdown.children[3] is last
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from textual import _profile
+from textual import app as app_module
+from textual._profile import StartupTrace, trace_startup
+from textual.app import App, ComposeResult
+from textual.widgets import Label
+
+
+def test_startup_trace(tmp_path: Path) -> None:
+    path = tmp_path / "trace.json"
+    trace = StartupTrace(str(path))
+    with trace.phase("foo"):
+        pass
+    trace.add_phase("bar", trace.start, trace.start + 0.5)
+    trace.finish()
+    with trace.phase("baz"):
+        pass
+    trace.save()
+
+    report = json.loads(path.read_text())
+    assert [event["name"] for event in report["traceEvents"]] == [
+        "foo",
+        "bar",
+        "first frame",
+    ]
+    phases = report["otherData"]["phases_ms"]
+    assert phases.keys() == {"foo", "bar"}
+    assert phases["bar"] == pytest.approx(500)
+    assert report["otherData"]["time_to_first_frame_ms"] > 0
+
+
+def test_trace_startup_disabled() -> None:
+    def function() -> None:
+        pass
+
+    assert _profile.startup_trace is None
+    assert trace_startup("function")(function) is function
+
+
+async def test_app_startup_trace(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "trace.json"
+    trace = StartupTrace(str(path))
+    monkeypatch.setattr(_profile, "startup_trace", trace)
+    monkeypatch.setattr(app_module, "startup_trace", trace)
+
+    class TraceApp(App):
+        def compose(self) -> ComposeResult:
+            yield Label("Hello")
+
+    app = TraceApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+
+    report = json.loads(path.read_text())
+    phases = report["otherData"]["phases_ms"]
+    assert {
+        "imports",
+        "compose",
+        "mount",
+        "App._on_compose",
+        "App._process_messages",
+        "App._display",
+    } <= phases.keys()
+    assert report["otherData"]["time_to_first_frame_ms"] is not None
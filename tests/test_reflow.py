@@ -0,0 +1,74 @@
+from textual.app import App, ComposeResult
+from textual.containers import Vertical, VerticalScroll
+from textual.widgets import Label
+
+
+class GroupsApp(App):
+    CSS = """
+    Vertical { height: auto; }
+    """
+
+    def compose(self) -> ComposeResult:
+        with VerticalScroll():
+            for group in range(3):
+                with Vertical(id=f"group{group}"):
+                    for label in range(3):
+                        yield Label(f"{group}.{label}", id=f"label{group}{label}")
+
+
+def full_arrangement(app: App) -> dict:
+    """Arrange the screen without any cached layout."""
+    compositor = app.screen._compositor
+    compositor._layout_blocks.clear()
+    for widget in app.screen.walk_children(with_self=True):
+        widget._box_model_cache.clear()
+    map, _widgets = compositor._arrange_root(
+        app.screen, app.screen.size, visible_only=False
+    )
+    return map
+
+
+async def test_reflow_reuses_unchanged_containers():
+    app = GroupsApp()
+    async with app.run_test() as pilot:
+        compositor = app.screen._compositor
+        blocks = compositor._layout_blocks.copy()
+
+        label = app.query_one("#label11", Label)
+        label.update("A\nlonger\nlabel")
+        await pilot.pause()
+
+        # The groups which weren't updated are re-used
+        assert compositor._layout_blocks[app.query_one("#group0")] is (
+            blocks[app.query_one("#group0")]
+        )
+        assert compositor._layout_blocks[app.query_one("#group1")] is not (
+            blocks[app.query_one("#group1")]
+        )
+
+        # The group after the update has moved down
+        assert label.region.height == 3
+        assert app.query_one("#label20").region.y == 8
+
+        assert compositor.full_map == full_arrangement(app)
+
+
+async def test_reflow_scrolled_containers():
+    app = GroupsApp()
+    async with app.run_test(size=(80, 5)) as pilot:
+        app.query_one(VerticalScroll).scroll_to(y=3, animate=False)
+        await pilot.pause()
+        app.query_one("#label00", Label).update("Updated")
+        await pilot.pause()
+        assert app.query_one("#label10").region.y == 0
+        assert app.screen._compositor.full_map == full_arrangement(app)
+
+
+async def test_reflow_absolute_offset():
+    app = GroupsApp()
+    async with app.run_test() as pilot:
+        label = app.query_one("#label22", Label)
+        label._absolute_offset = app.screen.region.offset + (10, 10)
+        app.screen.refresh(layout=True)
+        await pilot.pause()
+        assert label.region.offset == (10, 10)
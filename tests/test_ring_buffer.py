@@ -0,0 +1,48 @@
+import pytest
+
+from textual._ring_buffer import RingBuffer
+
+
+def test_unbounded():
+    buffer = RingBuffer[int]()
+    buffer.extend(range(5))
+    buffer.append(5)
+    assert buffer == [0, 1, 2, 3, 4, 5]
+    assert buffer.offset == 0
+    assert buffer[-1] == 5
+    assert buffer[1:3] == [1, 2]
+
+
+def test_bounded():
+    buffer = RingBuffer[int](3)
+    for value in range(5):
+        buffer.append(value)
+    assert buffer == [2, 3, 4]
+    assert buffer.offset == 2
+    assert list(buffer) == [2, 3, 4]
+    assert [buffer[index] for index in range(-3, 3)] == [2, 3, 4, 2, 3, 4]
+    buffer[-1] = 40
+    assert buffer == (2, 3, 40)
+    with pytest.raises(IndexError):
+        buffer[3]
+
+    buffer.extend([5, 6])
+    assert buffer == [40, 5, 6]
+    assert buffer.offset == 4
+    buffer.extend(range(10))
+    assert buffer == [7, 8, 9]
+    assert buffer.offset == 14
+
+
+def test_change_max_length():
+    buffer = RingBuffer[int](4, range(6))
+    assert buffer == [2, 3, 4, 5]
+    buffer.max_length = 2
+    assert buffer == [4, 5]
+    assert buffer.offset == 4
+    buffer.max_length = None
+    buffer.extend(range(3))
+    assert buffer == [4, 5, 0, 1, 2]
+    buffer.clear()
+    assert buffer == []
+    assert buffer.offset == 9
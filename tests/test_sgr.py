@@ -0,0 +1,116 @@
+import re
+from itertools import product
+
+import pytest
+from rich.color import ColorSystem
+from rich.segment import Segment
+from rich.style import Style
+
+from textual._sgr import SGREncoder
+from textual.strip import Strip
+
+SGR_OR_LINK = re.compile(r"\x1b\[([0-9;]*)m|\x1b\]8;(?:id=[^;]*)?;([^\x1b]*)\x1b\\")
+
+OFF_CODES = {22: {1, 2}, 23: {3}, 24: {4, 21}, 25: {5, 6}, 27: {7}, 28: {8}, 29: {9}}
+OFF_CODES.update({54: {51, 52}, 55: {53}})
+
+
+def interpret(output: str) -> list[tuple[str, frozenset, str, str, str]]:
+    """A minimal terminal, which returns the character and attributes of each cell."""
+    attributes: set[int] = set()
+    foreground = background = link = ""
+    cells = []
+    position = 0
+    for match in SGR_OR_LINK.finditer(output + "\x1b[m"):
+        for character in output[position : match.start()]:
+            cells.append(
+                (character, frozenset(attributes), foreground, background, link)
+            )
+        position = match.end()
+        codes, url = match.groups()
+        if codes is None:
+            link = url
+            continue
+        iter_codes = iter(int(code) if code else 0 for code in codes.split(";"))
+        for code in iter_codes:
+            if code == 0:
+                attributes.clear()
+                foreground = background = ""
+            elif code in OFF_CODES:
+                attributes -= OFF_CODES[code]
+            elif code in (38, 48):
+                color_type = next(iter_codes)
+                parts = [next(iter_codes) for _ in range(1 if color_type == 5 else 3)]
+                color = f"{color_type}:{parts}"
+                if code == 38:
+                    foreground = color
+                else:
+                    background = color
+            elif code == 39:
+                foreground = ""
+            elif code == 49:
+                background = ""
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                foreground = str(code)
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                background = str(code)
+            else:
+                attributes.add(code)
+    return cells
+
+
+STYLES = [
+    Style(),
+    Style(bold=True),
+    Style(bold=True, dim=True),
+    Style(dim=True, italic=True, color="red"),
+    Style(underline=True, color="#ff0000", bgcolor="blue"),
+    Style(underline2=True, bgcolor="blue"),
+    Style(reverse=True, strike=True, color="color(200)"),
+    Style(color="red", bgcolor="green"),
+    Style(bold=False, color="green"),
+    Style(color="red", link="https://textualize.io"),
+    Style(bold=True, link="https://example.org"),
+]
+
+
+@pytest.mark.parametrize(
+    "color_system",
+    [ColorSystem.STANDARD, ColorSystem.EIGHT_BIT, ColorSystem.TRUECOLOR],
+)
+def test_encoder_matches_rich(color_system):
+    """Every pair of styles should produce the same cells as rendering with Rich."""
+    for first, second in product(STYLES, STYLES):
+        segments = [Segment("ab", first), Segment("cd", second), Segment("ef", first)]
+        expected = "".join(
+            style.render(text, color_system=color_system) for text, style, _ in segments
+        )
+        encoder = SGREncoder(color_system)
+        first_style, text, last_style = encoder.encode_segments(segments)
+        output = encoder.write((first_style, text, last_style)) + encoder.finish()
+        assert interpret(output) == interpret(expected), (first, second)
+
+
+def test_encoder_minimal_delta():
+    encoder = SGREncoder(ColorSystem.TRUECOLOR)
+    red = Style(color="#ff0000", bgcolor="#000000", bold=True)
+    green = Style(color="#00ff00", bgcolor="#000000", bold=True)
+    assert encoder.transition(red, green) == "\x1b[38;2;0;255;0m"
+    assert encoder.transition(green, green) == ""
+
+
+def test_strip_render_sgr_tracks_pen():
+    red = Style(color="red")
+    strip = Strip([Segment("foo", red), Segment("bar", red)])
+    encoder = SGREncoder(ColorSystem.STANDARD)
+    assert strip.render_sgr(encoder) == "\x1b[31mfoobar"
+    # The pen is already red, so there is no need to set the style again
+    assert strip.render_sgr(encoder) == "foobar"
+    assert encoder.finish() == "\x1b[0m"
+
+
+def test_no_color_system():
+    strip = Strip([Segment("foo", Style(color="red")), Segment("bar", Style())])
+    encoder = SGREncoder(None)
+    assert strip.render_sgr(encoder) == "foobar"
+    assert encoder.finish() == ""
@@ -1,6 +1,6 @@
 import pytest
 
-from textual._spatial_map import SpatialMap
+from textual._spatial_map import IntervalSpatialMap, SpatialMap
 from textual.geometry import Region
 
 
@@ -62,3 +62,74 @@ def test_get_values_in_region() -> None:
         "foo",
         "bar",
     ]
+
+
+def test_interval_get_values_in_region() -> None:
+    spatial_map: IntervalSpatialMap[str] = IntervalSpatialMap()
+
+    spatial_map.insert(
+        [
+            (Region(10, 5, 5, 5), False, False, "foo"),
+            (Region(5, 20, 5, 5), False, False, "bar"),
+            (Region(0, 0, 40, 1), True, False, "title"),
+        ]
+    )
+
+    assert spatial_map.get_values_in_region(Region(0, 0, 10, 5)) == ["title"]
+    assert spatial_map.get_values_in_region(Region(0, 0, 11, 6)) == ["title", "foo"]
+    assert spatial_map.get_values_in_region(Region(0, 10, 10, 5)) == ["title"]
+    assert spatial_map.get_values_in_region(Region(0, 20, 10, 5)) == ["title", "bar"]
+    assert spatial_map.get_values_in_region(Region(5, 5, 50, 50)) == [
+        "title",
+        "foo",
+        "bar",
+    ]
+    assert spatial_map.total_region == Region(0, 0, 15, 25)
+
+
+def test_interval_mixed_heights() -> None:
+    spatial_map: IntervalSpatialMap[str] = IntervalSpatialMap()
+    spatial_map.insert(
+        [
+            (Region(0, 0, 10, 1000), False, False, "tall"),
+            *[(Region(10, y, 10, 1), False, False, f"row{y}") for y in range(1000)],
+        ]
+    )
+    assert spatial_map.get_values_in_region(Region(0, 500, 20, 2)) == [
+        "tall",
+        "row500",
+        "row501",
+    ]
+    assert spatial_map.get_values_in_region(Region(15, 998, 5, 10)) == [
+        "row998",
+        "row999",
+    ]
+
+
+def test_interval_remove_and_move() -> None:
+    spatial_map: IntervalSpatialMap[str] = IntervalSpatialMap()
+    spatial_map.insert(
+        [
+            (Region(0, 0, 10, 2), False, False, "foo"),
+            (Region(0, 2, 10, 2), False, False, "bar"),
+            (Region(0, 4, 10, 2), False, False, "baz"),
+        ]
+    )
+    assert len(spatial_map) == 3
+    spatial_map.remove("bar")
+    assert "bar" not in spatial_map
+    assert spatial_map.get_values_in_region(Region(0, 0, 10, 10)) == ["foo", "baz"]
+
+    spatial_map.move("foo", Region(0, 100, 10, 30))
+    assert spatial_map.get_values_in_region(Region(0, 0, 10, 10)) == ["baz"]
+    assert spatial_map.get_values_in_region(Region(0, 120, 10, 1)) == ["foo"]
+    assert spatial_map.total_region == Region(0, 0, 10, 130)
+
+    # Moved values keep their original order
+    spatial_map.move("baz", Region(0, 110, 10, 1))
+    assert spatial_map.get_values_in_region(Region(0, 0, 10, 200)) == ["foo", "baz"]
+
+    copy = spatial_map.copy()
+    copy.remove("foo")
+    assert "foo" in spatial_map
+    assert "foo" not in copy
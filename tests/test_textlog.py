@@ -1,5 +1,6 @@
 from rich.text import Text
 
+from textual.app import App, ComposeResult
 from textual.widgets import RichLog
 
 
@@ -9,3 +10,42 @@ def test_make_renderable_expand_tabs():
     renderable = text_log._make_renderable("\tfoo")
     assert isinstance(renderable, Text)
     assert renderable.plain == "        foo"
+
+
+class RichLogApp(App):
+    def compose(self) -> ComposeResult:
+        yield RichLog()
+
+
+async def test_write_many():
+    app = RichLogApp()
+    async with app.run_test():
+        rich_log = app.query_one(RichLog)
+        rich_log.write_many(["foo", "bar\nbaz", Text("qux")])
+        assert [strip.text.rstrip() for strip in rich_log.lines] == [
+            "foo",
+            "bar",
+            "baz",
+            "qux",
+        ]
+        assert rich_log.virtual_size.height == 4
+
+
+async def test_write_many_max_lines():
+    app = RichLogApp()
+    async with app.run_test():
+        rich_log = app.query_one(RichLog)
+        rich_log.max_lines = 3
+        rendered: list[object] = []
+        make_renderable = rich_log._make_renderable
+
+        def record_renderable(content: object):
+            rendered.append(content)
+            return make_renderable(content)
+
+        rich_log._make_renderable = record_renderable
+        rich_log.write_many(str(line) for line in range(100))
+        assert [strip.text.rstrip() for strip in rich_log.lines] == ["97", "98", "99"]
+        # Lines which would be removed aren't rendered
+        assert rendered == ["99", "98", "97"]
+        assert rich_log._lines.offset == 0
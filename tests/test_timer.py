@@ -0,0 +1,179 @@
+import asyncio
+from contextvars import Context, ContextVar
+from typing import Callable
+
+from textual._callback import invoke
+from textual.app import App
+from textual.timer import Timer, get_timer_scheduler, get_timer_stats
+
+context_value: ContextVar[str] = ContextVar("context_value", default="")
+
+
+class TimerApp(App):
+    pass
+
+
+async def wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    """Wait for a condition to be true (timers are slower on a loaded machine)."""
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("timed out")
+
+
+def is_running(timer: Timer) -> bool:
+    return timer in get_timer_scheduler()._timers
+
+
+async def test_timers_share_scheduler():
+    app = TimerApp()
+    async with app.run_test() as pilot:
+        counts = [0] * 20
+        before = get_timer_stats()
+
+        def make_callback(index: int):
+            def callback() -> None:
+                counts[index] += 1
+
+            return callback
+
+        timers = [app.set_interval(0.05, make_callback(index)) for index in range(20)]
+        assert get_timer_stats().active_timers == before.active_timers + 20
+        await wait_for(lambda: min(counts) >= 3)
+        for timer in timers:
+            timer.stop()
+        stats = get_timer_stats()
+        assert stats.active_timers == before.active_timers
+        # Timers which are due together run in a single wakeup
+        assert stats.wakeups - before.wakeups < sum(counts)
+        await pilot.pause()
+
+
+async def test_timer_repeat():
+    app = TimerApp()
+    async with app.run_test():
+        ticks: list[int] = []
+        timer = Timer(app, 0.01, callback=lambda: ticks.append(1), repeat=3, skip=False)
+        timer._start()
+        await wait_for(lambda: not is_running(timer))
+        assert len(ticks) == 4
+
+
+async def test_timer_pause_resume():
+    app = TimerApp()
+    async with app.run_test():
+        ticks: list[int] = []
+        timer = app.set_interval(0.01, lambda: ticks.append(1), pause=True)
+        await asyncio.sleep(0.05)
+        assert ticks == []
+        timer.resume()
+        await wait_for(lambda: len(ticks) > 0)
+        timer.pause()
+        count = len(ticks)
+        await asyncio.sleep(0.05)
+        assert len(ticks) == count
+        timer.resume()
+        await wait_for(lambda: len(ticks) > count)
+        timer.stop()
+        assert not is_running(timer)
+
+
+async def test_timer_async_callback_and_context():
+    app = TimerApp()
+    async with app.run_test():
+        values: list[str] = []
+
+        async def callback() -> None:
+            await asyncio.sleep(0)
+            values.append(context_value.get())
+
+        context_value.set("foo")
+        timer = Timer(app, 0.01, callback=callback, repeat=1, skip=False)
+        timer._start()
+        context_value.set("bar")
+        await wait_for(lambda: not is_running(timer))
+        assert values == ["foo", "foo"]
+
+
+async def test_timer_event():
+    timer_events: list[int] = []
+
+    class EventApp(App):
+        def on_timer(self, event) -> None:
+            timer_events.append(event.count)
+
+    app = EventApp()
+    async with app.run_test() as pilot:
+        timer = Timer(app, 0.01, repeat=2, skip=False)
+        timer._start()
+        await wait_for(lambda: not is_running(timer))
+        await pilot.pause()
+        assert timer_events == [1, 2, 3]
+
+
+async def test_timer_invokes_callbacks_in_debug_mode(monkeypatch):
+    """In debug mode, callbacks should be run by invoke, which warns if they are
+    slow."""
+    invoked: list[Callable] = []
+
+    async def record_invoke(callback: Callable) -> None:
+        invoked.append(callback)
+        await invoke(callback)
+
+    monkeypatch.setattr("textual.timer.invoke", record_invoke)
+    app = TimerApp()
+    async with app.run_test():
+        app.features = frozenset({"debug"})
+        ticks: list[int] = []
+
+        def callback() -> None:
+            ticks.append(1)
+
+        timer = Timer(app, 0.01, callback=callback, repeat=1, skip=False)
+        timer._start()
+        await wait_for(lambda: not is_running(timer))
+        assert ticks == [1, 1]
+        assert [function for function in invoked if function is callback] == [
+            callback,
+            callback,
+        ]
+
+
+async def test_timer_error_does_not_stop_other_timers():
+    """A timer which raises shouldn't stop the scheduler, even with no active app."""
+
+    class Target:
+        def post_message(self, message) -> None:
+            raise RuntimeError("post_message failed")
+
+    errors: list[BaseException] = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(
+        lambda loop, context: errors.append(context["exception"])
+    )
+    try:
+        target = Target()
+        ticks: list[int] = []
+
+        def fail() -> None:
+            raise ValueError("callback failed")
+
+        failing_event = Timer(target, 0.01)
+        failing_callback = Timer(target, 0.01, callback=fail, repeat=1, skip=False)
+        counting = Timer(target, 0.01, callback=lambda: ticks.append(1))
+        # Start the timers in an empty context, where no app is active
+        context = Context()
+        for timer in (failing_event, failing_callback, counting):
+            context.run(timer._start)
+        await wait_for(lambda: len(ticks) >= 3)
+        counting.stop()
+        assert not is_running(failing_event)
+        assert not is_running(failing_callback)
+        assert sorted(type(error).__name__ for error in errors) == [
+            "RuntimeError",
+            "ValueError",
+            "ValueError",
+        ]
+    finally:
+        loop.set_exception_handler(None)
@@ -0,0 +1,49 @@
+import pytest
+
+from textual.app import App, ComposeResult
+from textual.widgets import TextArea
+
+PYTHON = "\n".join(
+    f"def function_{index}(value):\n    return value * {index}  # comment\n"
+    for index in range(200)
+)
+
+
+class TextAreaApp(App):
+    def compose(self) -> ComposeResult:
+        yield TextArea(PYTHON, language="python")
+
+
+def full_highlights(text_area: TextArea) -> dict:
+    """Highlight every row of a new TextArea with the same text."""
+    fresh = TextArea(text_area.text, language="python")
+    fresh._highlight_rows(0, fresh.document.line_count)
+    return fresh._highlights
+
+
+@pytest.mark.syntax
+async def test_highlights_are_updated_incrementally():
+    """Highlights should match highlighting the whole document, after edits which
+    change the number of lines and the syntax of later rows."""
+    app = TextAreaApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        text_area = app.query_one(TextArea)
+        await pilot.pause()
+        assert text_area._highlighted_rows
+        assert 300 not in text_area._highlighted_rows
+
+        edits = [
+            ("\n\n", (3, 0), (3, 0)),
+            ("x", (1, 4), (1, 4)),
+            ('"""', (10, 0), (10, 0)),
+            ("", (0, 0), (5, 0)),
+            ('"""', (40, 0), (40, 0)),
+        ]
+        for text, start, end in edits:
+            text_area.replace(text, start, end)
+            # Rows are highlighted as they are rendered
+            for row in range(0, text_area.document.line_count, 37):
+                text_area._get_line_highlights(row)
+            expected = full_highlights(text_area)
+            for row in text_area._highlighted_rows:
+                assert text_area._highlights.get(row, []) == expected.get(row, [])
@@ -341,3 +341,55 @@ async def test_redo_stack(pilot: Pilot, text_area: TextArea):
     text_area.redo()
     assert len(text_area.history.undo_stack) == 2
     assert len(text_area.history.redo_stack) == 0
+
+
+async def test_adjacent_edits_are_coalesced(pilot: Pilot, text_area: TextArea):
+    await pilot.press(*"hello")
+    assert [edit.text for edit in text_area.history.undo_stack[-1]] == ["hello"]
+    text_area.history.checkpoint()
+    await pilot.press("left", "left", "backspace", "backspace", "delete")
+    assert text_area.text == "ho"
+    [deletion] = text_area.history.undo_stack[-1]
+    assert deletion._edit_result.replaced_text == "ell"
+    text_area.undo()
+    assert text_area.text == "hello"
+    assert text_area.selection == Selection.cursor((0, 3))
+    text_area.redo()
+    assert text_area.text == "ho"
+    text_area.undo()
+    text_area.undo()
+    assert text_area.text == ""
+
+
+async def test_large_replaced_text_is_compressed(pilot: Pilot, text_area: TextArea):
+    text = "hello, world\n" * 10_000
+    text_area.history.compress_characters = 1000
+    text_area.insert(text)
+    memory_usage = text_area.history.memory_usage
+    text_area.delete((0, 0), (10_000, 0))
+    assert text_area.text == ""
+    # The deleted text is compressed, so uses less memory than the inserted text
+    assert text_area.history.memory_usage - memory_usage < len(text) // 10
+    text_area.undo()
+    assert text_area.text == text
+    text_area.redo()
+    assert text_area.text == ""
+    text_area.undo()
+    assert text_area.text == text
+
+
+async def test_max_memory(pilot: Pilot, text_area: TextArea):
+    text_area.history.max_memory = 50_000
+    for _ in range(3):
+        text_area.insert("x" * 20_000)
+    # The oldest batch is discarded to keep the history within its memory budget
+    assert len(text_area.history.undo_stack) == 2
+    assert 40_000 < text_area.history.memory_usage <= 50_000
+    text_area.insert("y" * 100_000)
+    # The latest batch is always kept
+    assert len(text_area.history.undo_stack) == 1
+    assert text_area.history.memory_usage > 100_000
+    text_area.undo()
+    assert text_area.text == "x" * 60_000
+    text_area.history.clear()
+    assert text_area.history.memory_usage == 0
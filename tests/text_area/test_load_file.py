@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import pytest
+
+from textual import on
+from textual.app import App, ComposeResult
+from textual.widgets import TextArea, _text_area
+from textual.widgets.text_area import SyntaxAwareDocument
+from textual.worker import WorkerFailed, WorkerState
+
+PYTHON = "".join(
+    f"def function_{index}():\n    return {index}\n" for index in range(5000)
+)
+
+
+class LoadFileApp(App):
+    def __init__(self, language: str | None = None) -> None:
+        self.language = language
+        self.messages: list[TextArea.LoadProgress | TextArea.Loaded] = []
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        yield TextArea(language=self.language, storage="rope")
+
+    @on(TextArea.LoadProgress)
+    @on(TextArea.Loaded)
+    def record(self, event: TextArea.LoadProgress | TextArea.Loaded) -> None:
+        if not self.messages:
+            # The first screen has been shown, so the cursor may be moved
+            self.query_one(TextArea).move_cursor((1, 4))
+        self.messages.append(event)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(_text_area, "_LOAD_FIRST_CHUNK_SIZE", 1000)
+    monkeypatch.setattr(_text_area, "_LOAD_CHUNK_SIZE", 10_000)
+
+
+async def test_load_file(tmp_path):
+    """Loading a file should report progress, then restore the read only state."""
+    path = tmp_path / "example.txt"
+    path.write_text(PYTHON)
+    app = LoadFileApp()
+    async with app.run_test() as pilot:
+        text_area = app.query_one(TextArea)
+        await text_area.load_file(path).wait()
+        await pilot.pause()
+        assert text_area.text == PYTHON
+        assert not text_area.read_only
+        assert text_area.cursor_location == (1, 4)
+
+        *progress, loaded = app.messages
+        assert isinstance(loaded, TextArea.Loaded)
+        assert loaded.path == path
+        assert not loaded.highlighted
+        sizes = range(1000, len(PYTHON) + 10_000, 10_000)
+        assert [message.loaded for message in progress] == [
+            min(size, len(PYTHON)) for size in sizes
+        ]
+        assert all(message.total == len(PYTHON) for message in progress)
+
+
+@pytest.mark.syntax
+@pytest.mark.parametrize(
+    "max_highlight_size, highlighted", [(None, True), (len(PYTHON) - 1, False)]
+)
+async def test_load_file_with_language(tmp_path, max_highlight_size, highlighted):
+    """A file should be parsed after it is loaded, unless it is too large."""
+    path = tmp_path / "example.py"
+    path.write_text(PYTHON)
+    app = LoadFileApp(language="python")
+    async with app.run_test() as pilot:
+        text_area = app.query_one(TextArea)
+        worker = text_area.load_file(path, max_highlight_size=max_highlight_size)
+        assert text_area.read_only
+        await worker.wait()
+        await pilot.pause()
+        assert text_area.text == PYTHON
+        assert text_area.cursor_location == (1, 4)
+        assert isinstance(text_area.document, SyntaxAwareDocument) == highlighted
+        assert bool(text_area._highlights) == highlighted
+        assert app.messages[-1].highlighted == highlighted
+        assert not text_area.read_only
+
+
+@pytest.mark.syntax
+async def test_move_cursor_after_highlighted_load(tmp_path):
+    """The cursor should move through lines added after a file is highlighted."""
+    path = tmp_path / "example.py"
+    path.write_text("a = 1\nb = 2")
+    app = LoadFileApp(language="python")
+    async with app.run_test() as pilot:
+        text_area = app.query_one(TextArea)
+        await text_area.load_file(path).wait()
+        await pilot.pause()
+        assert app.messages[-1].highlighted
+        text_area.move_cursor((1, 5))
+        await pilot.press("enter", "c", "enter", "d", "enter", "e")
+        assert text_area.document.line_count == 5
+        text_area.move_cursor((0, 0))
+        await pilot.press(*["down"] * 5)
+        assert text_area.cursor_location == (4, 1)
+
+
+async def test_load_missing_file(tmp_path):
+    """An error opening the file should be raised by load_file."""
+    app = LoadFileApp()
+    async with app.run_test():
+        text_area = app.query_one(TextArea)
+        with pytest.raises(FileNotFoundError):
+            text_area.load_file(tmp_path / "missing.txt")
+        with pytest.raises(LookupError):
+            text_area.load_file(__file__, encoding="not-an-encoding")
+        assert not text_area.read_only
+
+
+async def test_load_file_decode_error(tmp_path):
+    """A file which can't be decoded should fail the worker, rather than the app."""
+    path = tmp_path / "example.txt"
+    path.write_bytes(b"hello\n\xff\n")
+    app = LoadFileApp()
+    async with app.run_test() as pilot:
+        text_area = app.query_one(TextArea)
+        worker = text_area.load_file(path)
+        with pytest.raises(WorkerFailed):
+            await worker.wait()
+        await pilot.pause()
+        assert worker.state == WorkerState.ERROR
+        assert isinstance(worker.error, UnicodeDecodeError)
+        assert not text_area.read_only
+        assert app.is_running
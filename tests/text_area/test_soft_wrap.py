@@ -0,0 +1,40 @@
+from textual.app import App, ComposeResult
+from textual.widgets import TextArea
+
+TEXT = "".join(f"{index} " + "word " * 30 + "\n" for index in range(3000))
+
+
+class TextAreaApp(App):
+    def compose(self) -> ComposeResult:
+        yield TextArea(TEXT, soft_wrap=True)
+
+
+async def test_lines_are_wrapped_in_the_background():
+    """Lines should be wrapped in the background after the width changes, while the
+    line at the top of the view stays in place."""
+    app = TextAreaApp()
+    async with app.run_test(size=(60, 20)) as pilot:
+        text_area = app.query_one(TextArea)
+        wrapped_document = text_area.wrapped_document
+        for _ in range(100):
+            if not wrapped_document.unwrapped_line_count:
+                break
+            await pilot.pause(0.05)
+        assert wrapped_document.unwrapped_line_count == 0
+        assert text_area._wrap_timer is None
+        height = wrapped_document.height
+
+        # Estimated heights are too small, since lines wrap at word boundaries
+        wrapped_document.wrap(wrapped_document.width)
+        assert wrapped_document.height < height
+        text_area.scroll_to(y=wrapped_document.get_line_offset(1000), animate=False)
+        assert wrapped_document.get_line_info(text_area.scroll_offset.y) == (1000, 0)
+
+        while wrapped_document.unwrapped_line_count:
+            text_area._wrap_in_background()
+            assert wrapped_document.get_line_info(text_area.scroll_offset.y) == (
+                1000,
+                0,
+            )
+        assert wrapped_document.height == height
+        assert text_area.virtual_size.height == height
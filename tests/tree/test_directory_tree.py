@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import time
 from pathlib import Path
+from typing import Callable, Iterable
 
 from rich.text import Text
 
@@ -28,6 +32,15 @@ class DirectoryTreeApp(App[None]):
         self.messages.append(event.__class__.__name__)
 
 
+async def wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    """Wait for a condition to be true."""
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("timed out")
+
+
 async def test_directory_tree_file_selected_message(tmp_path: Path) -> None:
     """Selecting a file should result in a file selected message being emitted."""
 
@@ -201,3 +214,118 @@ async def test_directory_tree_reloading_preserves_state(tmp_path: Path) -> None:
         directory_tree.clear_node(directory_tree.root)
         await pilot.pause()
         assert not directory_tree.root.children
+
+
+async def test_directory_tree_streams_large_directory(tmp_path: Path) -> None:
+    """A large directory should be added in batches, and then sorted."""
+    names = [f"File{index:04d}.txt" for index in range(500)]
+    for name in names:
+        (tmp_path / name).touch()
+    for name in ("zdir", "Adir"):
+        (tmp_path / name).mkdir()
+
+    batches: list[int] = []
+    app = DirectoryTreeApp(tmp_path)
+    async with app.run_test() as pilot:
+        tree = app.query_one(DirectoryTree)
+        add_entries = tree._add_entries
+
+        def record_batch(node, paths, entries, first) -> None:
+            batches.append(len(paths))
+            add_entries(node, paths, entries, first)
+
+        tree._add_entries = record_batch
+        await tree.reload()
+        await pilot.pause()
+
+        assert len(batches) > 1
+        assert sum(batches) == len(names) + 2
+        assert [str(child.label) for child in tree.root.children] == [
+            "Adir",
+            "zdir",
+            *names,
+        ]
+
+
+async def test_directory_tree_filters_every_entry_at_once(tmp_path: Path) -> None:
+    """An overridden filter_paths should be called once, with every entry."""
+    names = [f"File{index:04d}.txt" for index in range(500)]
+    for name in names:
+        (tmp_path / name).touch()
+
+    calls: list[int] = []
+
+    class FilteredDirectoryTree(DirectoryTree):
+        def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
+            paths = list(paths)
+            calls.append(len(paths))
+            # Keep the last 10 files
+            return sorted(paths)[-10:]
+
+    class FilteredApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FilteredDirectoryTree(tmp_path)
+
+    app = FilteredApp()
+    async with app.run_test() as pilot:
+        tree = app.query_one(FilteredDirectoryTree)
+        await wait_for(lambda: len(tree.root.children) == 10)
+        await pilot.pause()
+        assert calls == [len(names)]
+        assert [str(child.label) for child in tree.root.children] == names[-10:]
+
+
+async def test_directory_tree_reload_reuses_unchanged_listing(tmp_path: Path) -> None:
+    """Reloading a directory which hasn't changed shouldn't scan it again."""
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    (directory / "one.txt").touch()
+    # Listings of recently modified directories aren't re-used
+    past = time.time() - 60
+    os.utime(directory, (past, past))
+
+    app = DirectoryTreeApp(directory)
+    async with app.run_test() as pilot:
+        tree = app.query_one(DirectoryTree)
+        await pilot.pause()
+        assert [str(child.label) for child in tree.root.children] == ["one.txt"]
+
+        scanned: list[Path] = []
+        scan_directory = tree._scan_directory
+
+        def record_scan(location, worker=None):
+            scanned.append(location)
+            return scan_directory(location, worker)
+
+        tree._scan_directory = record_scan
+        await tree.reload_node(tree.root)
+        assert scanned == []
+
+        (directory / "two.txt").touch()
+        await tree.reload_node(tree.root)
+        assert scanned == [directory]
+        assert [str(child.label) for child in tree.root.children] == [
+            "one.txt",
+            "two.txt",
+        ]
+
+
+async def test_directory_tree_prefetch(tmp_path: Path) -> None:
+    """Sub-directories should be read in the background if prefetch is enabled."""
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "file.txt").touch()
+
+    class PrefetchApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield DirectoryTree(tmp_path, prefetch=True)
+
+    app = PrefetchApp()
+    async with app.run_test():
+        tree = app.query_one(DirectoryTree)
+        await wait_for(
+            lambda: all(
+                tree._stat_cache.get_is_dir(tmp_path / name / "file.txt") is False
+                for name in ("one", "two")
+            )
+        )
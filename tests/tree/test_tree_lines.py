@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import pytest
+
+from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
+
+
+def flatten(tree: Tree[None]) -> list[tuple[list[TreeNode[None]], bool]]:
+    """Flatten a tree in to lines, the way the tree used to build its lines."""
+    lines: list[tuple[list[TreeNode[None]], bool]] = []
+
+    def add_node(path: list[TreeNode[None]], node: TreeNode[None], last: bool) -> None:
+        child_path = [*path, node]
+        lines.append((child_path, last))
+        if node.is_expanded:
+            for index, child in enumerate(node.children):
+                add_node(child_path, child, index == len(node.children) - 1)
+
+    if tree.show_root:
+        add_node([], tree.root, True)
+    else:
+        for node in tree.root.children:
+            add_node([], node, True)
+    return lines
+
+
+def check_lines(tree: Tree[None]) -> None:
+    """Check the lines of the tree, and the line of every node."""
+    tree._invalidate()
+    expected = flatten(tree)
+    assert len(tree._tree_lines) == len(expected)
+    for line_no, (path, last) in enumerate(expected):
+        line = tree._tree_lines[line_no]
+        assert line.path == path
+        assert line.last == last
+        assert line.node.line == line_no
+        assert tree.get_node_at_line(line_no) is line.node
+    assert tree.get_node_at_line(len(expected)) is None
+    displayed = {id(path[-1]) for path, _ in expected}
+    for node in tree._tree_nodes.values():
+        if id(node) not in displayed:
+            assert node.line == -1
+
+
+@pytest.mark.parametrize("show_root", [True, False])
+def test_tree_lines_are_updated_incrementally(show_root: bool) -> None:
+    """Lines should match a full traversal as nodes are added, removed, expanded
+    and collapsed."""
+    tree = Tree[None]("root")
+    tree.show_root = show_root
+    tree.root.expand()
+    check_lines(tree)
+
+    branches = [tree.root.add(f"branch {index}", expand=True) for index in range(4)]
+    for branch in branches:
+        for index in range(3):
+            leaf_branch = branch.add(f"{branch.label} {index}")
+            leaf_branch.add_leaf("leaf")
+    check_lines(tree)
+
+    branches[1].children[2].expand()
+    branches[2].collapse()
+    check_lines(tree)
+
+    # Nodes added below a collapsed node change its line count when expanded
+    branches[2].children[0].add_leaf("hidden leaf")
+    branches[2].children[0].expand()
+    check_lines(tree)
+    branches[2].expand()
+    check_lines(tree)
+
+    branches[1].children[0].remove()
+    branches[3].remove()
+    check_lines(tree)
+
+    branches[0].remove_children()
+    check_lines(tree)
+
+    tree.root.collapse_all()
+    check_lines(tree)
+    tree.root.expand_all()
+    check_lines(tree)
+
+    tree.clear()
+    check_lines(tree)
+    tree.root.add_leaf("new leaf")
+    check_lines(tree)
+
+
+def test_tree_width_is_updated_incrementally() -> None:
+    """The virtual width should be that of the widest displayed line."""
+    tree = Tree[None]("root")
+    tree.root.expand()
+    branch = tree.root.add("branch", expand=True)
+    leaf = branch.add_leaf("a leaf with a long label")
+    tree._build()
+    assert tree.virtual_size.width == 2 + 2 * tree.guide_depth + 24
+
+    branch.collapse()
+    tree._build()
+    assert tree.virtual_size.width == 2 + tree.guide_depth + 8
+
+    branch.expand()
+    leaf.set_label("short")
+    tree._build()
+    assert tree.virtual_size.width == 2 + 2 * tree.guide_depth + 5
@@ -0,0 +1,107 @@
+"""
+Benchmark the bytes written per frame, with and without damage tracking.
+
+Each app is run headless, and the updates produced by the compositor are rendered to
+terminal sequences exactly as they would be for a real terminal.
+
+Run with:
+
+    python tools/benchmarks/damage_tracking.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from textual import constants
+from textual._compositor import CompositorUpdate
+from textual.app import App, ComposeResult
+from textual.pilot import Pilot
+from textual.widgets import DataTable, Digits, Footer, Header, Label, ProgressBar
+
+FRAMES = 100
+
+
+class ClockApp(App):
+    CSS = "Digits { width: auto; }"
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Digits("12:00:00")
+        yield Footer()
+
+    async def frame(self, frame: int) -> None:
+        now = datetime(2024, 1, 1, 12) + timedelta(seconds=frame)
+        self.query_one(Digits).update(now.strftime("%H:%M:%S"))
+
+
+class TableApp(App):
+    def compose(self) -> ComposeResult:
+        yield DataTable()
+
+    def on_mount(self) -> None:
+        table = self.query_one(DataTable)
+        table.add_columns("Symbol", "Price", "Change", "Volume")
+        for row in range(50):
+            table.add_row(f"SYM{row}", f"{row * 1.5:.2f}", "+0.00", row * 1000)
+
+    async def frame(self, frame: int) -> None:
+        table = self.query_one(DataTable)
+        table.update_cell_at((frame % 50, 1), f"{frame * 0.25:.2f}")
+
+
+class ProgressApp(App):
+    def compose(self) -> ComposeResult:
+        yield Label("Downloading...")
+        yield ProgressBar(total=FRAMES, show_eta=False)
+
+    async def frame(self, frame: int) -> None:
+        self.query_one(ProgressBar).advance(1)
+
+
+async def measure(app_class: type[App], damage_tracking: bool) -> float:
+    """Measure the average bytes per frame for an app.
+
+    Args:
+        app_class: App class with a `frame` method to update the app.
+        damage_tracking: Enable damage tracking.
+
+    Returns:
+        Average bytes written per frame.
+    """
+    constants.DAMAGE_TRACKING = damage_tracking  # type: ignore
+    app = app_class()
+    written: list[int] = []
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+
+        def display(screen, renderable) -> None:
+            if isinstance(renderable, CompositorUpdate):
+                written.append(len(renderable.render_segments(app.console).encode()))
+
+        app._display = display  # type: ignore
+        frame: Callable[[int], Awaitable[None]] = app.frame  # type: ignore
+        for frame_number in range(FRAMES):
+            await frame(frame_number)
+            await pilot.pause()
+            await pilot.wait_for_scheduled_animations()
+
+    return sum(written) / FRAMES
+
+
+async def run_benchmarks() -> None:
+    print(f"{'App':<16}{'Bytes/frame':>14}{'Damage tracking':>18}{'Reduction':>12}")
+    for app_class in (ClockApp, TableApp, ProgressApp):
+        without_tracking = await measure(app_class, False)
+        with_tracking = await measure(app_class, True)
+        reduction = without_tracking / with_tracking if with_tracking else 0
+        print(
+            f"{app_class.__name__:<16}{without_tracking:>14.1f}{with_tracking:>18.1f}{reduction:>11.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmarks())
@@ -0,0 +1,54 @@
+"""
+Benchmark appending rows to a DataTable while rendering the end of the table.
+
+Compares updating the index of row heights as rows are added, with rebuilding
+it after every change (which is the cost of the old list of y offsets).
+
+Run with:
+
+    python tools/benchmarks/datatable_append.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+from textual.app import App, ComposeResult
+from textual.geometry import Region
+from textual.widgets import DataTable
+
+ROWS = 50_000
+RENDER_EVERY = 100
+
+
+class TableApp(App):
+    def compose(self) -> ComposeResult:
+        yield DataTable()
+
+
+async def run_benchmark() -> None:
+    for name, rebuild in (("Rebuild", True), ("Incremental", False)):
+        app = TableApp()
+        async with app.run_test(size=(80, 40)) as pilot:
+            table = app.query_one(DataTable)
+            table.add_columns("Time", "Level", "Message")
+            await pilot.pause()
+            width, height = table.size
+            start = perf_counter()
+            for row in range(ROWS):
+                table.add_row(f"{row:06d}", "INFO", f"Message number {row}")
+                if rebuild:
+                    table._row_heights = None
+                if row % RENDER_EVERY == 0:
+                    # Render the last page of rows
+                    total_height = table._total_row_height + table.header_height
+                    y = max(0, total_height - height)
+                    for line in range(y, y + height):
+                        table._render_line(line, 0, width, table.rich_style)
+            elapsed = perf_counter() - start
+            print(f"{name:<12} {ROWS} rows {elapsed * 1000:8.0f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,88 @@
+"""
+Benchmark loading, editing, and reading large documents.
+
+Compares a RopeDocument (which stores text in chunks) with a Document (which stores
+a list of lines), for a 10MB and a 100MB document. Run with:
+
+    python tools/benchmarks/document_rope.py
+"""
+
+from __future__ import annotations
+
+import random
+from time import perf_counter
+from typing import Callable
+
+from textual.document._document import Document, DocumentBase
+from textual.document._rope_document import RopeDocument
+
+SIZES = (10_000_000, 100_000_000)
+EDITS = 1000
+LOOKUPS = 10
+
+LINE = "    value = function(argument, {index})  # a comment about line {index}\n"
+
+
+def make_text(size: int) -> str:
+    lines: list[str] = []
+    length = 0
+    index = 0
+    while length < size:
+        line = LINE.format(index=index)
+        lines.append(line)
+        length += len(line)
+        index += 1
+    return "".join(lines)
+
+
+def timed(callable: Callable[[], object]) -> float:
+    start = perf_counter()
+    callable()
+    return perf_counter() - start
+
+
+def run_benchmark() -> None:
+    for size in SIZES:
+        text = make_text(size)
+        print(f"{size / 1_000_000:.0f}MB, {text.count(chr(10))} lines")
+        for document_type in (RopeDocument, Document):
+            document: DocumentBase
+
+            def load() -> None:
+                nonlocal document
+                document = document_type(text)
+
+            load_time = timed(load)
+            rng = random.Random(0)
+
+            def edit() -> None:
+                for _ in range(EDITS):
+                    row = rng.randrange(document.line_count)
+                    column = rng.randrange(len(document[row]) + 1)
+                    if rng.random() < 0.1:
+                        document.replace_range((row, column), (row + 1, 0), "")
+                    else:
+                        document.replace_range((row, column), (row, column), "x\n")
+
+            edit_time = timed(edit) / EDITS
+
+            def lookup() -> None:
+                for _ in range(LOOKUPS):
+                    row = rng.randrange(document.line_count)
+                    index = document.get_index_from_location((row, 0))
+                    document.get_location_from_index(index)
+
+            lookup_time = timed(lookup) / LOOKUPS
+            text_time = timed(lambda: document.text)
+            print(
+                f"  {document_type.__name__:<13}"
+                f" load {load_time * 1000:9.1f} ms"
+                f"  edit {edit_time * 1000:8.3f} ms"
+                f"  index {lookup_time * 1000:8.3f} ms"
+                f"  text {text_time * 1000:8.1f} ms"
+            )
+            del document
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,66 @@
+"""
+Benchmark a full reflow of a large widget tree after updating a single label.
+
+Compares a reflow which reuses the box models and arranged children of unchanged
+containers, with a reflow which re-arranges every container.
+
+Run with:
+
+    python tools/benchmarks/incremental_reflow.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+from textual.app import App, ComposeResult
+from textual.containers import Vertical, VerticalScroll
+from textual.widgets import Label
+
+GROUPS = 100
+LABELS_PER_GROUP = 20
+REPEAT = 20
+
+
+class TreeApp(App):
+    CSS = """
+    Vertical { height: auto; }
+    Label { width: auto; }
+    """
+
+    def compose(self) -> ComposeResult:
+        with VerticalScroll():
+            for group in range(GROUPS):
+                with Vertical():
+                    for label in range(LABELS_PER_GROUP):
+                        yield Label(f"Label {group}.{label}")
+
+
+async def run_benchmark() -> None:
+    app = TreeApp()
+    async with app.run_test(size=(120, 50)) as pilot:
+        await pilot.pause()
+        screen = app.screen
+        compositor = screen._compositor
+        label = app.query(Label).last()
+        widget_count = len(compositor.full_map)
+
+        for name, reuse in (("Re-arrange", False), ("Incremental", True)):
+            elapsed = 0.0
+            for update in range(REPEAT):
+                label.update(f"Updated {update}")
+                if not reuse:
+                    compositor._layout_blocks.clear()
+                    for widget in screen.walk_children(with_self=True):
+                        widget._box_model_cache.clear()
+                start = perf_counter()
+                compositor.reflow(screen, screen.size)
+                elapsed += perf_counter() - start
+            print(
+                f"{name:<12} {widget_count} widgets {elapsed / REPEAT * 1000:8.2f} ms/reflow"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,74 @@
+"""
+Benchmark the throughput of a Log (in lines per second) with auto scroll enabled.
+
+Simulates tailing a busy process, which produces chunks of lines (which may end
+part way through a line). Compares calling `Log.write` for each chunk, with
+`Log.write_many`, which adds the lines at most once per frame.
+
+Run with:
+
+    python tools/benchmarks/log_throughput.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+from textual.app import App, ComposeResult
+from textual.widgets import Log
+
+LINES = 200_000
+LINES_PER_CHUNK = 50
+CHUNKS_PER_READ = 20
+MAX_LINES = 50_000
+
+
+class LogApp(App):
+    def compose(self) -> ComposeResult:
+        yield Log(max_lines=MAX_LINES)
+
+
+def make_chunks() -> list[str]:
+    """Make chunks of log data."""
+    lines = [
+        f"2024-03-20 12:00:{line % 60:02d} INFO worker.{line % 8} request {line}\n"
+        for line in range(LINES)
+    ]
+    data = "".join(lines)
+    # Split in to chunks which don't end on a line boundary
+    chunk_size = len(data) // (LINES // LINES_PER_CHUNK)
+    return [
+        data[start : start + chunk_size] for start in range(0, len(data), chunk_size)
+    ]
+
+
+async def run_benchmark() -> None:
+    chunks = make_chunks()
+    for name in ("write", "write_many"):
+        app = LogApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            log = app.query_one(Log)
+            await pilot.pause()
+            start = perf_counter()
+            for read in range(0, len(chunks), CHUNKS_PER_READ):
+                read_chunks = chunks[read : read + CHUNKS_PER_READ]
+                if name == "write":
+                    for chunk in read_chunks:
+                        log.write(chunk)
+                else:
+                    log.write_many(read_chunks)
+                # Give the app a chance to process messages, as it would between reads
+                await asyncio.sleep(0)
+            log.flush()
+            await pilot.pause()
+            elapsed = perf_counter() - start
+            assert log.lines[-2].endswith(f"request {LINES - 1}")
+            print(
+                f"{name:<12} {LINES} lines {elapsed * 1000:8.0f} ms "
+                f"{LINES / elapsed:10.0f} lines/s"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
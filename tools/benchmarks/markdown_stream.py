@@ -0,0 +1,108 @@
+"""
+Benchmark streaming a 5,000 line Markdown document in small chunks.
+
+Measures the time per chunk to add the chunk with `Markdown.append` (which parses the
+blocks from the last blank line again), to call `Markdown.update` with the whole document so far (which
+parses the whole document, but only updates the blocks which changed), and to remove
+and mount every block, which is what `Markdown.update` did before blocks were diffed.
+The Markdown widget isn't displayed, so the times don't include laying out the
+document, which costs the same with each approach. Run with:
+
+    python tools/benchmarks/markdown_stream.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+from textual.app import App, ComposeResult
+from textual.widgets import Markdown
+
+LINES = 5000
+CHUNK_SIZE = 40
+SAMPLES = 20
+
+SECTION = """\
+## Section {index}
+
+Some text with *emphasis*, **strong** text, and `code` in section {index}.
+It continues on a second line, with a [link](https://example.com/{index}).
+
+- A list item
+- Another list item
+
+```python
+def function_{index}():
+    return {index}
+```
+
+"""
+
+
+def make_markdown() -> str:
+    sections: list[str] = []
+    lines = 0
+    index = 0
+    while lines < LINES:
+        section = SECTION.format(index=index)
+        sections.append(section)
+        lines += section.count("\n")
+        index += 1
+    return "".join(sections)
+
+
+class StreamApp(App):
+    CSS = """
+    Markdown {
+        display: none;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        yield Markdown()
+
+
+async def run_benchmark() -> None:
+    markdown = make_markdown()
+    chunks = [
+        markdown[offset : offset + CHUNK_SIZE]
+        for offset in range(0, len(markdown), CHUNK_SIZE)
+    ]
+    app = StreamApp()
+    async with app.run_test() as pilot:
+        document = app.query_one(Markdown)
+
+        start = perf_counter()
+        for chunk in chunks:
+            await document.append(chunk)
+        await pilot.pause()
+        append_time = (perf_counter() - start) / len(chunks)
+        assert document.source == markdown
+
+        # Time the chunks at the end of the document, which are the slowest to add
+        # by parsing the whole document.
+        prefix = "".join(chunks[:-SAMPLES])
+        await document.update(prefix)
+        start = perf_counter()
+        for chunk in chunks[-SAMPLES:]:
+            prefix += chunk
+            await document.update(prefix)
+        await pilot.pause()
+        update_time = (perf_counter() - start) / SAMPLES
+
+        start = perf_counter()
+        for _ in range(SAMPLES // 4):
+            await document.update("")
+            await document.update(markdown)
+        await pilot.pause()
+        remount_time = (perf_counter() - start) / (SAMPLES // 4)
+
+    print(f"{markdown.count(chr(10))} lines, {len(chunks)} chunks of {CHUNK_SIZE}")
+    print(f"{'append':<8} {append_time * 1000:9.2f} ms per chunk")
+    print(f"{'update':<8} {update_time * 1000:9.2f} ms per chunk (at the end)")
+    print(f"{'remount':<8} {remount_time * 1000:9.2f} ms per chunk (at the end)")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,81 @@
+"""
+Benchmark the output size and time to render a full screen update, comparing Rich's
+per-segment style rendering with the delta encoding of the SGR encoder.
+
+Run with:
+
+    python tools/benchmarks/sgr_encoding.py
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+from rich.console import Console
+from rich.control import Control
+from rich.segment import Segment
+from rich.style import Style
+
+from textual._compositor import LayoutUpdate
+from textual._loop import loop_last
+from textual.geometry import Region
+from textual.strip import Strip
+
+WIDTH = 256
+HEIGHT = 60
+REPEAT = 50
+
+
+def make_strips() -> list[Strip]:
+    """Make strips resembling a zebra striped table, with many small segments."""
+    even = Style(color="#e0e0e0", bgcolor="#1e1e1e")
+    odd = Style(color="#e0e0e0", bgcolor="#262626")
+    number = Style(color="#50c878", bold=True)
+    strips: list[Strip] = []
+    for y in range(HEIGHT):
+        background = even if y % 2 else odd
+        highlight = background + number
+        segments: list[Segment] = []
+        for x in range(0, WIDTH, 8):
+            segments.append(Segment("cell", background))
+            segments.append(Segment("1234", highlight))
+        strips.append(Strip(segments, WIDTH))
+    return strips
+
+
+def render_rich(update: LayoutUpdate, console: Console) -> str:
+    """Render with `Strip.render` (a full style and reset per segment)."""
+    sequences: list[str] = []
+    append = sequences.append
+    x = update.region.x
+    move_to = Control.move_to
+    for last, (y, line) in loop_last(enumerate(update.strips, update.region.y)):
+        append(move_to(x, y).segment.text)
+        append(line.render(console))
+        if not last:
+            append("\n")
+    return "".join(sequences)
+
+
+def run_benchmark() -> None:
+    console = Console(color_system="truecolor", force_terminal=True)
+    for name, render in (
+        ("Per segment", render_rich),
+        ("SGR encoder", LayoutUpdate.render_segments),
+    ):
+        total_bytes = 0
+        elapsed = 0.0
+        for _ in range(REPEAT):
+            # New strips each time, so nothing is served from the strip caches
+            update = LayoutUpdate(make_strips(), Region(0, 0, WIDTH, HEIGHT))
+            start = perf_counter()
+            total_bytes = len(render(update, console).encode())
+            elapsed += perf_counter() - start
+        elapsed /= REPEAT
+        print(
+            f"{name:<12} {total_bytes:>10} bytes/frame {elapsed * 1000:8.2f} ms/frame"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
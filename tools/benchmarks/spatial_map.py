@@ -0,0 +1,93 @@
+"""
+Compare the grid based SpatialMap with the IntervalSpatialMap.
+
+Simulates a vertical list of widgets, measuring the time to build the map, to query the
+visible region while scrolling, and to update the map when a single widget changes.
+
+Run with:
+
+    python tools/benchmarks/spatial_map.py
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable
+
+from textual._spatial_map import IntervalSpatialMap, SpatialMap
+from textual.geometry import Region
+
+WIDTH = 80
+ITEM_HEIGHT = 3
+VIEWPORT_HEIGHT = 50
+REPEAT = 20
+
+
+def timed(callable: Callable[[], object]) -> float:
+    """Get the average time to run a callable, in milliseconds."""
+    start = perf_counter()
+    for _ in range(REPEAT):
+        callable()
+    return (perf_counter() - start) / REPEAT * 1000
+
+
+def run_benchmark() -> None:
+    print(
+        f"{'Widgets':>8} {'Map':<10} {'Build ms':>10} {'Query ms':>10} {'Update ms':>10}"
+    )
+    for count in (100, 1_000, 10_000):
+        regions = [
+            (Region(0, index * ITEM_HEIGHT, WIDTH, ITEM_HEIGHT), False, False, index)
+            for index in range(count)
+        ]
+        total_height = count * ITEM_HEIGHT
+        viewports = [
+            Region(0, y, WIDTH, VIEWPORT_HEIGHT)
+            for y in range(0, total_height, max(1, total_height // 100))
+        ]
+        moved_region = Region(0, (count // 2) * ITEM_HEIGHT, WIDTH, ITEM_HEIGHT * 2)
+        moved_regions = [
+            (moved_region, False, False, index) if index == count // 2 else entry
+            for index, entry in enumerate(regions)
+        ]
+
+        def build_grid() -> SpatialMap[int]:
+            spatial_map: SpatialMap[int] = SpatialMap()
+            spatial_map.insert(regions)
+            return spatial_map
+
+        def build_interval() -> IntervalSpatialMap[int]:
+            spatial_map: IntervalSpatialMap[int] = IntervalSpatialMap()
+            spatial_map.insert(regions)
+            return spatial_map
+
+        grid_map = build_grid()
+        interval_map = build_interval()
+
+        def query_grid() -> None:
+            for viewport in viewports:
+                grid_map.get_values_in_region(viewport)
+
+        def query_interval() -> None:
+            for viewport in viewports:
+                interval_map.get_values_in_region(viewport)
+
+        def update_grid() -> None:
+            # The grid map can only be rebuilt
+            spatial_map: SpatialMap[int] = SpatialMap()
+            spatial_map.insert(moved_regions)
+
+        def update_interval() -> None:
+            interval_map.move(count // 2, moved_region)
+
+        for name, build, query, update in (
+            ("grid", build_grid, query_grid, update_grid),
+            ("interval", build_interval, query_interval, update_interval),
+        ):
+            print(
+                f"{count:>8} {name:<10} {timed(build):>10.3f} {timed(query) / len(viewports):>10.4f} {timed(update):>10.4f}"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
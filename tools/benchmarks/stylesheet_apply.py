@@ -0,0 +1,75 @@
+"""
+Benchmark restyling a large DOM with a large stylesheet.
+
+Restyles 5,000 widgets with a stylesheet of 500 rules, as happens when the theme is
+toggled or CSS is refreshed.
+
+Run with:
+
+    python tools/benchmarks/stylesheet_apply.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+from textual.app import App, ComposeResult
+from textual.containers import Container, Vertical
+from textual.widgets import Label, Static
+
+SECTIONS = 50
+ROWS_PER_SECTION = 50
+RULES = 500
+REPEAT = 3
+
+
+def make_css() -> str:
+    """Make a stylesheet with a mixture of simple, descendant, and child selectors."""
+    rules: list[str] = []
+    for index in range(RULES):
+        section = index % SECTIONS
+        kind = index % 5
+        if kind == 0:
+            selector = f".row-{index % 97}"
+        elif kind == 1:
+            selector = f"#section-{section} Label"
+        elif kind == 2:
+            selector = f".section-{section} > Vertical > .cell-{index % 3}"
+        elif kind == 3:
+            selector = f"Screen .missing-{index} Static"
+        else:
+            selector = f"Container.section-{section} .row-{index % 97}:hover"
+        rules.append(f"{selector} {{ padding: {index % 3}; }}")
+    return "\n".join(rules)
+
+
+class StyleApp(App):
+    CSS = make_css()
+
+    def compose(self) -> ComposeResult:
+        for section in range(SECTIONS):
+            with Container(id=f"section-{section}", classes=f"section-{section}"):
+                for row in range(ROWS_PER_SECTION):
+                    with Vertical(classes=f"row-{row}"):
+                        yield Label("label", classes=f"cell-{row % 3}")
+
+
+async def run_benchmark() -> None:
+    app = StyleApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        node_count = len(list(app.screen.walk_children(with_self=True)))
+        stylesheet = app.stylesheet
+        start = perf_counter()
+        for _ in range(REPEAT):
+            stylesheet.update(app)
+        elapsed = (perf_counter() - start) / REPEAT
+        print(
+            f"{node_count} nodes, {len(stylesheet.rules)} rules: "
+            f"{elapsed * 1000:.1f} ms/update"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
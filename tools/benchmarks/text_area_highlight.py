@@ -0,0 +1,81 @@
+"""
+Benchmark the latency of typing in a large Python file in a TextArea.
+
+Measures the time to insert a character and render the visible lines (which
+highlights rows whose syntax changed), compared with highlighting the whole
+document after each edit, which is what the TextArea did before highlights were
+updated incrementally.
+
+Requires the `syntax` extras. Run with:
+
+    python tools/benchmarks/text_area_highlight.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+from textual._tree_sitter import TREE_SITTER
+from textual.app import App, ComposeResult
+from textual.widgets import TextArea
+
+LINES = (2_000, 20_000)
+KEYSTROKES = 50
+
+SOURCE = '''\
+class Widget{index}:
+    """A docstring for widget {index}."""
+
+    def method(self, value: int = {index}) -> str:
+        # Format the value
+        return f"{{value!r}} and {{self}}"
+
+'''
+
+
+class TextAreaApp(App):
+    def __init__(self, text: str) -> None:
+        self.text = text
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        yield TextArea(self.text, language="python")
+
+
+async def run_benchmark() -> None:
+    for line_count in LINES:
+        text = "".join(SOURCE.format(index=index) for index in range(line_count // 7))
+        app = TextAreaApp(text)
+        async with app.run_test(size=(100, 50)) as pilot:
+            text_area = app.query_one(TextArea)
+            await pilot.pause()
+            row = line_count // 2
+            text_area.move_cursor((row, 0), center=True)
+            await pilot.pause()
+            height = text_area.size.height
+
+            def render() -> None:
+                for y in range(height):
+                    text_area.render_line(y)
+
+            for name in ("incremental", "full"):
+                start = perf_counter()
+                for _ in range(KEYSTROKES):
+                    text_area.insert("x")
+                    if name == "full":
+                        text_area._build_highlight_map()
+                        text_area._highlight_rows(0, text_area.document.line_count)
+                    render()
+                elapsed = (perf_counter() - start) / KEYSTROKES
+                print(
+                    f"{line_count:>6} lines {name:<12} "
+                    f"{elapsed * 1000:8.2f} ms per keystroke"
+                )
+
+
+if __name__ == "__main__":
+    if TREE_SITTER:
+        asyncio.run(run_benchmark())
+    else:
+        print("tree-sitter is required (install the `syntax` extras)")
@@ -0,0 +1,73 @@
+"""
+Benchmark loading a large file into a TextArea.
+
+Measures the time until the start of a 50MB file is displayed, and until the whole
+file is loaded, with `TextArea.load_file`, compared with reading the file and calling
+`TextArea.load_text` (which blocks the app until the document is built). Run with:
+
+    python tools/benchmarks/text_area_load.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from textual.app import App, ComposeResult
+from textual.widgets import TextArea
+
+SIZE = 50_000_000
+
+LINE = "    value = function(argument, {index})  # a comment about line {index}\n"
+
+
+def write_file(path: Path) -> None:
+    lines: list[str] = []
+    length = 0
+    index = 0
+    while length < SIZE:
+        line = LINE.format(index=index)
+        lines.append(line)
+        length += len(line)
+        index += 1
+    path.write_text("".join(lines))
+
+
+class LoadApp(App):
+    def compose(self) -> ComposeResult:
+        yield TextArea(storage="rope")
+
+
+async def run_benchmark(path: Path) -> None:
+    app = LoadApp()
+    async with app.run_test() as pilot:
+        text_area = app.query_one(TextArea)
+
+        start = perf_counter()
+        text_area.load_text(path.read_text())
+        await pilot.pause()
+        blocking = perf_counter() - start
+
+        text_area.load_text("")
+        start = perf_counter()
+        worker = text_area.load_file(path)
+        while not text_area.document.line_count > 1:
+            await asyncio.sleep(0)
+        first_screen = perf_counter() - start
+        await worker.wait()
+        await pilot.pause()
+        loaded = perf_counter() - start
+
+    print(f"{SIZE / 1_000_000:.0f}MB")
+    print(f"{'load_text':<12} {blocking * 1000:9.1f} ms (blocking)")
+    print(f"{'load_file':<12} {first_screen * 1000:9.1f} ms to first screen")
+    print(f"{'':<12} {loaded * 1000:9.1f} ms to load")
+
+
+if __name__ == "__main__":
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / "large.txt"
+        write_file(path)
+        asyncio.run(run_benchmark(path))
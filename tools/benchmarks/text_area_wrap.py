@@ -0,0 +1,62 @@
+"""
+Benchmark soft wrapping a large document when the width changes.
+
+Measures the time to wrap a document at a new width and map the lines of a screen
+(which is all that is done before the TextArea is refreshed), compared with wrapping
+every line, which is what the WrappedDocument did on every resize before lines were
+wrapped lazily. Also measures the time to update wrapping after inserting a line.
+
+Run with:
+
+    python tools/benchmarks/text_area_wrap.py
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+from textual.document._document import Document
+from textual.document._wrapped_document import WrappedDocument
+
+LINES = 200_000
+SCREEN_HEIGHT = 50
+RESIZES = 5
+EDITS = 100
+
+LINE = "    value = function(argument, {index})  # a comment about line {index}"
+
+
+def run_benchmark() -> None:
+    document = Document("\n".join(LINE.format(index=index) for index in range(LINES)))
+    wrapped_document = WrappedDocument(document)
+    widths = [40 + resize for resize in range(RESIZES)]
+
+    start = perf_counter()
+    for width in widths:
+        wrapped_document.wrap(width)
+        top = wrapped_document.height // 2
+        for y in range(top, top + SCREEN_HEIGHT):
+            wrapped_document.get_line_info(y)
+    lazy = (perf_counter() - start) / RESIZES
+
+    start = perf_counter()
+    for width in widths:
+        wrapped_document.wrap(width)
+        wrapped_document.wrap_pending(LINES)
+    full = (perf_counter() - start) / RESIZES
+
+    start = perf_counter()
+    for edit in range(EDITS):
+        location = (LINES // 2 + edit, 0)
+        result = document.replace_range(location, location, "new line\n")
+        wrapped_document.wrap_range(location, location, result.end_location)
+    edit_time = (perf_counter() - start) / EDITS
+
+    print(f"{LINES} lines")
+    print(f"{'lazy':<8} {lazy * 1000:9.2f} ms per resize")
+    print(f"{'full':<8} {full * 1000:9.2f} ms per resize")
+    print(f"{'edit':<8} {edit_time * 1000:9.2f} ms per inserted line")
+
+
+if __name__ == "__main__":
+    run_benchmark()
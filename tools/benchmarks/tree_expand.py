@@ -0,0 +1,75 @@
+"""
+Benchmark expanding and collapsing a node in a large Tree.
+
+Compares the time to update the tree's lines after toggling a node (and to get the
+lines of a screen), with the time to flatten the whole tree, which is what the Tree
+did after every change before its lines were updated incrementally.
+
+Run with:
+
+    python tools/benchmarks/tree_expand.py
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
+
+BRANCHES = 200
+LEAVES = 500
+TOGGLES = 100
+SCREEN_HEIGHT = 50
+
+
+def flatten(tree: Tree[None]) -> list[list[TreeNode[None]]]:
+    """Flatten the tree in to lines by traversing every displayed node."""
+    lines: list[list[TreeNode[None]]] = []
+
+    def add_node(path: list[TreeNode[None]], node: TreeNode[None]) -> None:
+        child_path = [*path, node]
+        lines.append(child_path)
+        if node.is_expanded:
+            for child in node.children:
+                add_node(child_path, child)
+
+    add_node([], tree.root)
+    return lines
+
+
+def run_benchmark() -> None:
+    tree = Tree[None]("root")
+    tree.root.expand()
+    branches = []
+    for branch_index in range(BRANCHES):
+        branch = tree.root.add(f"branch {branch_index}", expand=True)
+        for leaf_index in range(LEAVES):
+            branch.add_leaf(f"leaf {branch_index}.{leaf_index}")
+        branches.append(branch)
+    node_count = BRANCHES * (LEAVES + 1) + 1
+    tree._build()
+    tree._get_subtree_width(tree.root)
+
+    start = perf_counter()
+    for toggle in range(TOGGLES):
+        branch = branches[toggle * BRANCHES // TOGGLES]
+        branch.toggle()
+        tree._invalidate()
+        line = branch.line
+        lines = tree._tree_lines[line : line + SCREEN_HEIGHT]
+        assert lines[0].node is branch
+    incremental = (perf_counter() - start) / TOGGLES
+
+    start = perf_counter()
+    for toggle in range(TOGGLES // 10):
+        flatten(tree)
+    full = (perf_counter() - start) / (TOGGLES // 10)
+
+    print(f"{node_count} nodes")
+    print(f"{'incremental':<12} {incremental * 1000:8.3f} ms per toggle")
+    print(f"{'flatten':<12} {full * 1000:8.3f} ms per toggle")
+
+
+if __name__ == "__main__":
+    run_benchmark()